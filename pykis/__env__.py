@@ -14,6 +14,21 @@ WEBSOCKET_MAX_SUBSCRIPTIONS = 40
 REAL_API_REQUEST_PER_SECOND = 20 - 1
 VIRTUAL_API_REQUEST_PER_SECOND = 2
 
+REAL_API_REQUEST_LIMIT = 20
+"""실전도메인 초당 최대 호출 횟수 (adaptive 호출 유량 제한 방식의 상한)"""
+VIRTUAL_API_REQUEST_LIMIT = 2
+"""모의도메인 초당 최대 호출 횟수 (adaptive 호출 유량 제한 방식의 상한)"""
+
+API_RETRY_LIMIT = 10
+"""API 요청 기본 최대 재시도 횟수"""
+API_RETRY_BACKOFF = 0.1
+"""네트워크 오류 재시도 기본 대기 시간(초). 재시도마다 2배씩 늘어나며 0부터 해당 시간 사이에서 무작위로 대기합니다."""
+API_RETRY_BACKOFF_MAX = 2
+"""네트워크 오류 재시도 최대 대기 시간(초)"""
+
+API_REQUEST_TIMEOUT: tuple[float, float] = (3.05, 10)
+"""API 요청 기본 (연결, 읽기) 제한 시간(초)"""
+
 TRACE_DETAIL_ERROR: bool = False
 """
 경고: 해당 기능은 HTTPStatusCode 200이 아닌 경우. 상세한 요청, 응답을 출력합니다.
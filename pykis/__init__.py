@@ -6,18 +6,22 @@ from pykis.__env__ import (
     __url__,
     __version__,
 )
+from pykis.aio import AsyncPyKis
 from pykis.exceptions import *
 from pykis.kis import PyKis
 from pykis.types import *
 
 __all__ = [
     "PyKis",
+    "AsyncPyKis",
     ################################
     ##          Exceptions        ##
     ################################
     "KisException",
     "KisHTTPError",
     "KisAPIError",
+    "KisTimeoutError",
+    "KisNetworkError",
     "KisMarketNotOpenedError",
     "KisNotFoundError",
     ################################
@@ -57,7 +61,9 @@ __all__ = [
     "KisWebsocketRequest",
     "KisWebsocketTR",
     "KisWebsocketEncryptionKey",
+    "KisWebsocketClientBase",
     "KisWebsocketClient",
+    "KisShardedWebsocketClient",
     ################################
     ##            Events          ##
     ################################
@@ -70,6 +76,7 @@ __all__ = [
     "KisLambdaEventCallback",
     "KisLambdaEventFilter",
     "KisMultiEventFilter",
+    "KisConflatingCallback",
     "KisSubscribedEventArgs",
     "KisUnsubscribedEventArgs",
     "KisSubscriptionEventArgs",
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Protocol, runtime_checkable
+from typing import Iterable, Protocol, runtime_checkable
 
 from pykis.api.account.balance import KisBalance
 from pykis.api.account.daily_order import KisDailyOrders
@@ -20,6 +20,7 @@ class KisQuotableAccount(Protocol):
     def balance(
         self: KisAccountProtocol,
         country: COUNTRY_TYPE | None = None,
+        fields: Iterable[str] | None = None,
     ) -> KisBalance:
         """
         한국투자증권 통합주식 잔고 조회
@@ -31,6 +32,7 @@ class KisQuotableAccount(Protocol):
 
         Args:
             country (COUNTRY_TYPE, optional): 국가코드
+            fields (Iterable[str], optional): 보유종목과 예수금에서 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"quantity", "amount"}`
 
         Raises:
             KisAPIError: API 호출에 실패한 경우
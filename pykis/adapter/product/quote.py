@@ -1,5 +1,5 @@
 from datetime import date, time, timedelta
-from typing import Literal, Protocol, runtime_checkable
+from typing import Iterable, Literal, Protocol, runtime_checkable
 
 from pykis.api.account.order import ORDER_CONDITION
 from pykis.api.base.product import KisProductProtocol
@@ -74,6 +74,7 @@ class KisQuotableProduct(Protocol):
     def orderbook(
         self,
         condition: ORDER_CONDITION | None = None,
+        fields: Iterable[str] | None = None,
     ) -> KisOrderbookResponse:
         """
         한국투자증권 호가 조회
@@ -83,6 +84,7 @@ class KisQuotableProduct(Protocol):
 
         Args:
             condition (ORDER_CONDITION, optional): 주문조건. Defaults to None.
+            fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"asks", "bids"}`
 
         Raises:
             KisAPIError: API 호출에 실패한 경우
@@ -94,6 +96,7 @@ class KisQuotableProduct(Protocol):
     def quote(
         self,
         extended: bool = False,
+        fields: Iterable[str] | None = None,
     ) -> KisQuoteResponse:
         """
         한국투자증권 주식 현재가 조회
@@ -103,6 +106,7 @@ class KisQuotableProduct(Protocol):
 
         Args:
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"price", "volume"}`
 
         Raises:
             KisAPIError: API 호출에 실패한 경우
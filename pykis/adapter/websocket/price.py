@@ -25,6 +25,7 @@ class KisWebsocketQuotableProduct(Protocol):
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None = None,
         once: bool = False,
         extended: bool = False,
+        conflate: bool = False,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -38,6 +39,7 @@ class KisWebsocketQuotableProduct(Protocol):
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             once (bool, optional): 한번만 실행할지 여부. Defaults to False.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            conflate (bool, optional): 최신 값만 전달할지 여부. 콜백이 실행 중인 동안 새 이벤트가 도착하면 전달되지 않은 이전 이벤트를 교체합니다.
         """
         ...
 
@@ -49,6 +51,7 @@ class KisWebsocketQuotableProduct(Protocol):
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]] | None = None,
         once: bool = False,
         extended: bool = False,
+        conflate: bool = False,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -63,6 +66,7 @@ class KisWebsocketQuotableProduct(Protocol):
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             once (bool, optional): 한번만 실행할지 여부. Defaults to False.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            conflate (bool, optional): 최신 값만 전달할지 여부. 콜백이 실행 중인 동안 새 이벤트가 도착하면 전달되지 않은 이전 이벤트를 교체합니다.
         """
         ...
 
@@ -80,6 +84,7 @@ class KisWebsocketQuotableProduct(Protocol):
         ) = None,
         once: bool = False,
         extended: bool = False,
+        conflate: bool = False,
     ) -> (
         KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]
         | KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]
@@ -160,6 +165,7 @@ class KisWebsocketQuotableProductMixin:
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None = None,
         once: bool = False,
         extended: bool = False,
+        conflate: bool = False,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -173,6 +179,7 @@ class KisWebsocketQuotableProductMixin:
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             once (bool, optional): 한번만 실행할지 여부. Defaults to False.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            conflate (bool, optional): 최신 값만 전달할지 여부. 콜백이 실행 중인 동안 새 이벤트가 도착하면 전달되지 않은 이전 이벤트를 교체합니다.
         """
 
     @overload
@@ -183,6 +190,7 @@ class KisWebsocketQuotableProductMixin:
         where: KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]] | None = None,
         once: bool = False,
         extended: bool = False,
+        conflate: bool = False,
     ) -> KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]:
         """
         웹소켓 이벤트 핸들러 등록
@@ -197,6 +205,7 @@ class KisWebsocketQuotableProductMixin:
             where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
             once (bool, optional): 한번만 실행할지 여부. Defaults to False.
             extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+            conflate (bool, optional): 최신 값만 전달할지 여부. 콜백이 실행 중인 동안 새 이벤트가 도착하면 전달되지 않은 이전 이벤트를 교체합니다.
         """
 
     def on(
@@ -213,6 +222,7 @@ class KisWebsocketQuotableProductMixin:
         ) = None,
         once: bool = False,
         extended: bool = False,
+        conflate: bool = False,
     ) -> (
         KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]]
         | KisEventTicket[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]]
@@ -226,6 +236,7 @@ class KisWebsocketQuotableProductMixin:
                 where=where,  # type: ignore
                 once=once,
                 extended=extended,
+                conflate=conflate,
             )
         elif event == "orderbook":
             from pykis.api.websocket.order_book import (
@@ -238,6 +249,7 @@ class KisWebsocketQuotableProductMixin:
                 where=where,  # type: ignore
                 once=once,
                 extended=extended,
+                conflate=conflate,
             )
 
         raise ValueError(f"Unknown event: {event}")
@@ -0,0 +1,5 @@
+from pykis.aio.kis import AsyncPyKis
+
+__all__ = [
+    "AsyncPyKis",
+]
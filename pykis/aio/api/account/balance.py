@@ -0,0 +1,126 @@
+from typing import TYPE_CHECKING, Iterable
+
+from pykis.api.account.balance import (
+    KisBalance,
+    KisDomesticBalance,
+    KisForeignPresentBalance,
+    balance_plan,
+    domestic_balance_plan,
+    foreign_balance_plan,
+    orderable_quantity_plan,
+)
+from pykis.api.account.order import ORDER_QUANTITY
+from pykis.api.stock.info import COUNTRY_TYPE
+from pykis.client.account import KisAccountNumber
+from pykis.client.page import KisPage
+
+if TYPE_CHECKING:
+    from pykis.aio.kis import AsyncPyKis
+
+__all__ = [
+    "balance",
+]
+
+
+async def domestic_balance(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    page: KisPage | None = None,
+    continuous: bool = True,
+    fields: Iterable[str] | None = None,
+) -> KisDomesticBalance:
+    """
+    한국투자증권 국내 주식 잔고 조회 (비동기)
+
+    국내주식주문 -> 주식잔고조회[v1_국내주식-006]
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        page (KisPage, optional): 페이지 정보
+        continuous (bool, optional): 연속조회 여부
+        fields (Iterable[str], optional): 보유종목과 예수금에서 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"quantity", "amount"}`
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return await self.execute(domestic_balance_plan(self.kis, account, page=page, continuous=continuous, fields=fields))
+
+
+async def foreign_balance(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+    fields: Iterable[str] | None = None,
+) -> KisForeignPresentBalance:
+    """
+    한국투자증권 해외 주식 잔고 조회 (비동기)
+
+    해외주식주문 -> 해외주식 체결기준현재잔고[v1_해외주식-008] (실전투자, 모의투자)
+    해외주식주문 -> 해외주식 잔고[v1_해외주식-006] (모의투자)
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        country (COUNTRY_TYPE, optional): 국가코드
+        fields (Iterable[str], optional): 보유종목과 예수금에서 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"quantity", "amount"}`
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return await self.execute(foreign_balance_plan(self.kis, account, country=country, fields=fields))
+
+
+async def balance(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+    fields: Iterable[str] | None = None,
+) -> KisBalance:
+    """
+    한국투자증권 통합주식 잔고 조회 (비동기)
+
+    통합 잔고 조회시 국내, 해외 잔고를 동시에 조회합니다.
+
+    국내주식주문 -> 주식잔고조회[v1_국내주식-006]
+    해외주식주문 -> 해외주식 체결기준현재잔고[v1_해외주식-008] (실전투자, 모의투자)
+    해외주식주문 -> 해외주식 잔고[v1_해외주식-006] (모의투자)
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        country (COUNTRY_TYPE, optional): 국가코드
+        fields (Iterable[str], optional): 보유종목과 예수금에서 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"quantity", "amount"}`
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return await self.execute(balance_plan(self.kis, account, country=country, fields=fields))
+
+
+async def orderable_quantity(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    symbol: str,
+    country: COUNTRY_TYPE,
+) -> ORDER_QUANTITY | None:
+    """
+    한국투자증권 매도가능수량 조회 (비동기)
+
+    국내주식주문 -> 주식잔고조회[v1_국내주식-006]
+    해외주식주문 -> 해외주식 체결기준현재잔고[v1_해외주식-008] (실전투자, 모의투자)
+    해외주식주문 -> 해외주식 잔고[v1_해외주식-006] (모의투자)
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        symbol (str): 종목코드
+        country (COUNTRY_TYPE): 국가코드
+
+    Returns:
+        ORDER_QUANTITY: 매도가능수량
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return await self.execute(orderable_quantity_plan(self.kis, account, symbol, country=country))
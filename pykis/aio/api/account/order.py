@@ -0,0 +1,218 @@
+from typing import TYPE_CHECKING
+
+from pykis.api.account.order import (
+    FOREIGN_ORDER_CONDITION,
+    IN_ORDER_QUANTITY,
+    ORDER_CONDITION,
+    ORDER_EXECUTION,
+    ORDER_PRICE,
+    ORDER_TYPE,
+    KisDomesticOrder,
+    KisForeignDaytimeOrder,
+    KisForeignOrder,
+    KisOrder,
+    domestic_order_plan,
+    foreign_daytime_order_plan,
+    foreign_order_plan,
+    order_plan,
+)
+from pykis.api.stock.market import MARKET_TYPE
+from pykis.client.account import KisAccountNumber
+
+if TYPE_CHECKING:
+    from pykis.aio.kis import AsyncPyKis
+
+__all__ = [
+    "order",
+]
+
+
+async def domestic_order(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    symbol: str,
+    order: ORDER_TYPE = "buy",
+    price: ORDER_PRICE | None = None,
+    qty: IN_ORDER_QUANTITY | None = None,
+    condition: ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    include_foreign: bool = False,
+) -> KisDomesticOrder:
+    """
+    한국투자증권 국내 주식 주문 (비동기)
+
+    국내주식주문 -> 주식주문(현금)[v1_국내주식-001]
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        symbol (str): 종목코드
+        order (ORDER_TYPE, optional): 주문종류
+        price (ORDER_PRICE, optional): 주문가격
+        qty (IN_ORDER_QUANTITY, optional): 주문수량
+        condition (ORDER_CONDITION, optional): 주문조건
+        execution (ORDER_EXECUTION_CONDITION, optional): 체결조건
+        include_foreign (bool, optional): 전량 주문시 외화 주문가능금액 포함 여부
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        KisMarketNotOpenedError: 시장이 열리지 않은 경우
+        ValueError: 종목 코드가 올바르지 않은 경우
+    """
+    return await self.execute(
+        domestic_order_plan(
+            self.kis,
+            account,
+            symbol,
+            order=order,
+            price=price,
+            qty=qty,
+            condition=condition,
+            execution=execution,
+            include_foreign=include_foreign,
+        )
+    )
+
+
+async def foreign_order(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE,
+    symbol: str,
+    order: ORDER_TYPE = "buy",
+    price: ORDER_PRICE | None = None,
+    qty: IN_ORDER_QUANTITY | None = None,
+    condition: FOREIGN_ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    include_foreign: bool = False,
+) -> KisForeignOrder:
+    """
+    한국투자증권 해외 주식 주문 (비동기)
+
+    해외주식주문 -> 해외주식 주문[v1_해외주식-001]
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        market (MARKET_TYPE): 시장
+        symbol (str): 종목코드
+        order (ORDER_TYPE, optional): 주문종류
+        price (ORDER_PRICE, optional): 주문가격
+        qty (IN_ORDER_QUANTITY, optional): 주문수량
+        condition (FOREIGN_ORDER_CONDITION, optional): 주문조건
+        execution (ORDER_EXECUTION_CONDITION, optional): 체결조건
+        include_foreign (bool, optional): 전량 주문시 외화 주문가능금액 포함 여부
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        KisMarketNotOpenedError: 시장이 열리지 않은 경우
+        ValueError: 종목 코드가 올바르지 않은 경우
+    """
+    return await self.execute(
+        foreign_order_plan(
+            self.kis,
+            account,
+            market,
+            symbol,
+            order=order,
+            price=price,
+            qty=qty,
+            condition=condition,
+            execution=execution,
+            include_foreign=include_foreign,
+        )
+    )
+
+
+async def foreign_daytime_order(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE,
+    symbol: str,
+    order: ORDER_TYPE = "buy",
+    price: ORDER_PRICE | None = None,
+    qty: IN_ORDER_QUANTITY | None = None,
+    include_foreign: bool = False,
+) -> KisForeignDaytimeOrder:
+    """
+    한국투자증권 해외주식 주간거래 주문 (비동기, 주간, 모의투자 미지원)
+
+    해외주식주문 -> 해외주식 미국주간주문[v1_해외주식-026]
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        market (MARKET_TYPE): 시장
+        symbol (str): 종목코드
+        order (ORDER_TYPE, optional): 주문종류
+        price (ORDER_PRICE, optional): 주문가격
+        qty (IN_ORDER_QUANTITY, optional): 주문수량
+        include_foreign (bool, optional): 전량 주문시 외화 주문가능금액 포함 여부
+    """
+    return await self.execute(
+        foreign_daytime_order_plan(
+            self.kis,
+            account,
+            market,
+            symbol,
+            order=order,
+            price=price,
+            qty=qty,
+            include_foreign=include_foreign,
+        )
+    )
+
+
+async def order(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE,
+    symbol: str,
+    order: ORDER_TYPE,
+    price: ORDER_PRICE | None = None,
+    qty: IN_ORDER_QUANTITY | None = None,
+    condition: ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    include_foreign: bool = False,
+) -> KisOrder:
+    """
+    한국투자증권 통합주식 주문 (비동기)
+
+    국내주식주문 -> 주식주문(현금)[v1_국내주식-001]
+    해외주식주문 -> 해외주식 주문[v1_해외주식-001]
+    해외주식주문 -> 해외주식 미국주간주문[v1_해외주식-026]
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        market (MARKET_TYPE): 시장
+        symbol (str): 종목코드
+        order (ORDER_TYPE): 주문종류
+        price (ORDER_PRICE, optional): 주문가격
+        qty (IN_ORDER_QUANTITY, optional): 주문수량
+        condition (ORDER_CONDITION, optional): 주문조건
+        execution (ORDER_EXECUTION_CONDITION, optional): 체결조건
+        include_foreign (bool, optional): 전량 주문시 외화 주문가능금액 포함 여부
+
+    Examples:
+        >>> await aio.order(account, 'KRX', code, order='buy', price=100) # 지정가 매수
+        >>> await aio.order(account, 'NASDAQ', code, order='sell', price=None) # 나스닥 시장가 매도
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        KisMarketNotOpenedError: 시장이 열리지 않은 경우
+        ValueError: 종목 코드가 올바르지 않은 경우
+    """
+    return await self.execute(
+        order_plan(
+            self.kis,
+            account,
+            market,
+            symbol,
+            order,
+            price=price,
+            qty=qty,
+            condition=condition,
+            execution=execution,
+            include_foreign=include_foreign,
+        )
+    )
@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING
+
+from pykis.api.account.order import KisOrder, KisOrderNumber
+from pykis.api.account.order_modify import (
+    KisDomesticModifyOrder,
+    KisForeignModifyOrder,
+    cancel_order_plan,
+    domestic_cancel_order_plan,
+    foreign_cancel_order_plan,
+)
+
+if TYPE_CHECKING:
+    from pykis.aio.kis import AsyncPyKis
+
+__all__ = [
+    "cancel_order",
+]
+
+
+async def domestic_cancel_order(
+    self: "AsyncPyKis",
+    order: KisOrderNumber,
+) -> KisDomesticModifyOrder:
+    """
+    한국투자증권 국내 주식 주문취소 (비동기)
+
+    국내주식주문 -> 주식주문(정정취소)[v1_국내주식-003]
+
+    Args:
+        order (KisOrderNumber): 주문번호
+    """
+    return await self.execute(domestic_cancel_order_plan(self.kis, order))
+
+
+async def foreign_cancel_order(
+    self: "AsyncPyKis",
+    order: KisOrderNumber,
+) -> KisForeignModifyOrder:
+    """
+    한국투자증권 해외 주식 주문취소 (비동기)
+
+    국내주식주문 -> 해외주식 정정취소주문[v1_해외주식-003]
+
+    Args:
+        order (KisOrderNumber): 주문번호
+    """
+    return await self.execute(foreign_cancel_order_plan(self.kis, order))
+
+
+async def cancel_order(
+    self: "AsyncPyKis",
+    order: KisOrderNumber,
+) -> KisOrder:
+    """
+    한국투자증권 통합 주식 주문취소 (비동기, 해외 주간거래 모의투자 미지원)
+
+    국내주식주문 -> 주식주문(정정취소)[v1_국내주식-003]
+    국내주식주문 -> 해외주식 정정취소주문[v1_해외주식-003]
+
+    Args:
+        order (KisOrderNumber): 주문번호
+    """
+    return await self.execute(cancel_order_plan(self.kis, order))
@@ -0,0 +1,149 @@
+from typing import TYPE_CHECKING
+
+from pykis.api.account.order import (
+    DOMESTIC_ORDER_CONDITION,
+    ORDER_CONDITION,
+    ORDER_EXECUTION,
+    ORDER_PRICE,
+)
+from pykis.api.account.orderable_amount import (
+    KisDomesticOrderableAmount,
+    KisForeignOrderableAmount,
+    KisOrderableAmountResponse,
+    domestic_orderable_amount_plan,
+    foreign_orderable_amount_plan,
+    orderable_amount_plan,
+)
+from pykis.api.stock.market import MARKET_TYPE
+from pykis.client.account import KisAccountNumber
+
+if TYPE_CHECKING:
+    from pykis.aio.kis import AsyncPyKis
+
+__all__ = [
+    "orderable_amount",
+]
+
+
+async def domestic_orderable_amount(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    symbol: str,
+    price: ORDER_PRICE | None = None,
+    condition: DOMESTIC_ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    foreign: bool = False,
+) -> KisDomesticOrderableAmount:
+    """
+    한국투자증권 국내 주식 주문가능금액 조회 (비동기)
+
+    국내주식주문 -> 매수가능조회[v1_국내주식-007]
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        symbol (str): 종목코드
+        price (int | None, optional): 주문가격. None인 경우 시장가 주문
+        condition (DOMESTIC_ORDER_CONDITION | None, optional): 주문조건
+        execution (ORDER_EXECUTION_CONDITION | None, optional): 체결조건
+        foreign (bool, optional): 통합 주문가능수량(`foreign_quantity`)을 함께 조회할지 여부
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 주문조건이 잘못된 경우
+    """
+    return await self.execute(
+        domestic_orderable_amount_plan(
+            self.kis,
+            account,
+            symbol,
+            price=price,
+            condition=condition,
+            execution=execution,
+            foreign=foreign,
+        )
+    )
+
+
+async def foreign_orderable_amount(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE,
+    symbol: str,
+    price: ORDER_PRICE | None = None,
+    condition: ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+) -> KisForeignOrderableAmount:
+    """
+    한국투자증권 해외 주식 주문가능금액 조회 (비동기)
+
+    해외주식주문 -> 해외주식 매수가능금액조회[v1_해외주식-014]
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        market (MARKET_TYPE): 시장코드
+        symbol (str): 종목코드
+        price (int | None, optional): 주문가격. None인 경우 시장가 주문
+        condition (ORDER_CONDITION | None, optional): 주문조건
+        execution (ORDER_EXECUTION_CONDITION | None, optional): 체결조건
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 주문조건이 잘못된 경우
+    """
+    return await self.execute(
+        foreign_orderable_amount_plan(
+            self.kis,
+            account,
+            market,
+            symbol,
+            price=price,
+            condition=condition,
+            execution=execution,
+        )
+    )
+
+
+async def orderable_amount(
+    self: "AsyncPyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE,
+    symbol: str,
+    price: ORDER_PRICE | None = None,
+    condition: ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    foreign: bool = False,
+) -> KisOrderableAmountResponse:
+    """
+    한국투자증권 주문가능금액 조회 (비동기)
+
+    국내주식주문 -> 매수가능조회[v1_국내주식-007]
+    해외주식주문 -> 해외주식 매수가능금액조회[v1_해외주식-014]
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        market (MARKET_TYPE): 시장코드
+        symbol (str): 종목코드
+        price (int | None, optional): 주문가격. None인 경우 시장가 주문
+        condition (ORDER_CONDITION | None, optional): 주문조건
+        execution (ORDER_EXECUTION_CONDITION | None, optional): 체결조건
+        foreign (bool, optional): 국내 주문시 통합 주문가능수량을 함께 조회할지 여부
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 주문조건이 잘못된 경우
+    """
+    return await self.execute(
+        orderable_amount_plan(
+            self.kis,
+            account,
+            market,
+            symbol,
+            price=price,
+            condition=condition,
+            execution=execution,
+            foreign=foreign,
+        )
+    )
@@ -0,0 +1,114 @@
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Literal
+
+from pykis.api.stock.chart import KisChart
+from pykis.api.stock.daily_chart import (
+    KisDomesticDailyChart,
+    KisForeignDailyChart,
+    daily_chart_plan,
+    domestic_daily_chart_plan,
+    foreign_daily_chart_plan,
+)
+from pykis.api.stock.market import MARKET_TYPE
+
+if TYPE_CHECKING:
+    from pykis.aio.kis import AsyncPyKis
+
+__all__ = [
+    "daily_chart",
+]
+
+
+async def domestic_daily_chart(
+    self: "AsyncPyKis",
+    symbol: str,
+    start: date | timedelta | None = None,
+    end: date | None = None,
+    period: Literal["day", "week", "month", "year"] = "day",
+    adjust: bool = False,
+) -> KisDomesticDailyChart:
+    """
+    한국투자증권 국내 기간 차트 조회 (비동기)
+
+    국내주식시세 -> 국내주식기간별시세(일/주/월/년)[v1_국내주식-016]
+
+    Args:
+        symbol (str): 종목 코드
+        start (date, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
+        end (date, optional): 조회 종료 시간. Defaults to None.
+        period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
+        adjust (bool, optional): 수정 주가 여부. Defaults to False.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 조회 파라미터가 올바르지 않은 경우
+    """
+    return await self.execute(
+        domestic_daily_chart_plan(self.kis, symbol, start=start, end=end, period=period, adjust=adjust)
+    )
+
+
+async def foreign_daily_chart(
+    self: "AsyncPyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    start: date | timedelta | None = None,
+    end: date | None = None,
+    period: Literal["day", "week", "month", "year"] = "day",
+    adjust: bool = False,
+) -> KisForeignDailyChart:
+    """
+    한국투자증권 해외 기간 차트 조회 (비동기)
+
+    해외주식현재가 -> 해외주식 기간별시세[v1_해외주식-010]
+
+    Args:
+        symbol (str): 종목 코드
+        market (MARKET_TYPE): 시장 구분
+        start (date, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
+        end (date, optional): 조회 종료 시간. Defaults to None.
+        period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
+        adjust (bool, optional): 수정 주가 여부. Defaults to False.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 조회 파라미터가 올바르지 않은 경우
+    """
+    return await self.execute(
+        foreign_daily_chart_plan(self.kis, symbol, market, start=start, end=end, period=period, adjust=adjust)
+    )
+
+
+async def daily_chart(
+    self: "AsyncPyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    start: date | timedelta | None = None,
+    end: date | None = None,
+    period: Literal["day", "week", "month", "year"] = "day",
+    adjust: bool = False,
+) -> KisChart:
+    """
+    한국투자증권 기간 차트 조회 (비동기)
+
+    국내주식시세 -> 국내주식기간별시세(일/주/월/년)[v1_국내주식-016]
+    해외주식현재가 -> 해외주식 기간별시세[v1_해외주식-010]
+
+    Args:
+        symbol (str): 종목 코드
+        market (MARKET_TYPE): 시장 구분
+        start (date, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
+        end (date, optional): 조회 종료 시간. Defaults to None.
+        period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
+        adjust (bool, optional): 수정 주가 여부. Defaults to False.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 조회 파라미터가 올바르지 않은 경우
+    """
+    return await self.execute(
+        daily_chart_plan(self.kis, symbol, market, start=start, end=end, period=period, adjust=adjust)
+    )
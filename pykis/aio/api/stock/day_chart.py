@@ -0,0 +1,109 @@
+from datetime import time, timedelta
+from typing import TYPE_CHECKING
+
+from pykis.api.stock.chart import KisChart
+from pykis.api.stock.day_chart import (
+    KisDomesticDayChart,
+    KisForeignDayChart,
+    day_chart_plan,
+    domestic_day_chart_plan,
+    foreign_day_chart_plan,
+)
+from pykis.api.stock.market import MARKET_TYPE
+
+if TYPE_CHECKING:
+    from pykis.aio.kis import AsyncPyKis
+
+__all__ = [
+    "day_chart",
+]
+
+
+async def domestic_day_chart(
+    self: "AsyncPyKis",
+    symbol: str,
+    start: time | timedelta | None = None,
+    end: time | None = None,
+    period: int = 1,
+) -> KisDomesticDayChart:
+    """
+    한국투자증권 국내 당일 봉 차트 조회 (비동기)
+
+    국내주식시세 -> 주식당일분봉조회[v1_국내주식-022]
+
+    Args:
+        symbol (str): 종목코드
+        start (time | timedelta, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
+        end (time, optional): 조회 종료 시간. Defaults to None.
+        period (int, optional): 조회 간격 (분). Defaults to 1.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 조회 파라미터가 올바르지 않은 경우
+    """
+    return await self.execute(domestic_day_chart_plan(self.kis, symbol, start=start, end=end, period=period))
+
+
+async def foreign_day_chart(
+    self: "AsyncPyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    start: time | timedelta | None = None,
+    end: time | None = None,
+    period: int = 1,
+    once: bool = False,
+) -> KisForeignDayChart:
+    """
+    한국투자증권 해외 당일 봉 차트 조회 (비동기)
+
+    해당 조회 시스템은 한국투자증권 API의 한계로 인해 (24 * 60 / 최대 레코드 수)번 호출하여 원하는 영역의 근접 값을 채워넣습니다.
+
+    해외주식현재가 -> 해외주식 현재가상세[v1_해외주식-029]
+    해외주식현재가 -> 해외주식분봉조회[v1_해외주식-030]
+
+    Args:
+        symbol (str): 종목코드
+        market (MARKET_TYPE): 시장 종류
+        start (time | timedelta, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
+        end (time, optional): 조회 종료 시간. Defaults to None.
+        period (int, optional): 조회 간격 (분). Defaults to 1.
+        once (bool, optional): 한 번만 조회할지 여부. Defaults to False.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 조회 파라미터가 올바르지 않은 경우
+    """
+    return await self.execute(
+        foreign_day_chart_plan(self.kis, symbol, market, start=start, end=end, period=period, once=once)
+    )
+
+
+async def day_chart(
+    self: "AsyncPyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    start: time | timedelta | None = None,
+    end: time | None = None,
+    period: int = 1,
+) -> KisChart:
+    """
+    한국투자증권 당일 봉 차트 조회 (비동기)
+
+    국내주식시세 -> 주식당일분봉조회[v1_국내주식-022]
+    해외주식현재가 -> 해외주식분봉조회[v1_해외주식-030]
+
+    Args:
+        symbol (str): 종목코드
+        market (MARKET_TYPE): 시장 종류
+        start (time | timedelta, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
+        end (time, optional): 조회 종료 시간. Defaults to None.
+        period (int, optional): 조회 간격 (분). Defaults to 1.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 조회 파라미터가 올바르지 않은 경우
+    """
+    return await self.execute(day_chart_plan(self.kis, symbol, market, start=start, end=end, period=period))
@@ -0,0 +1,94 @@
+from typing import TYPE_CHECKING, Iterable
+
+from pykis.api.account.order import ORDER_CONDITION
+from pykis.api.stock.market import MARKET_TYPE
+from pykis.api.stock.order_book import (
+    KisDomesticOrderbook,
+    KisForeignOrderbook,
+    KisOrderbookResponse,
+    domestic_orderbook_plan,
+    foreign_orderbook_plan,
+    orderbook_plan,
+)
+
+if TYPE_CHECKING:
+    from pykis.aio.kis import AsyncPyKis
+
+__all__ = [
+    "orderbook",
+]
+
+
+async def domestic_orderbook(
+    self: "AsyncPyKis",
+    symbol: str,
+    fields: Iterable[str] | None = None,
+) -> KisDomesticOrderbook:
+    """
+    한국투자증권 국내 주식 호가 조회 (비동기)
+
+    [국내주식] 기본시세 -> 주식현재가 호가/예상체결[v1_국내주식-011]
+
+    Args:
+        symbol (str): 종목코드
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"asks", "bids"}`
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 종목 코드가 올바르지 않은 경우
+    """
+    return await self.execute(domestic_orderbook_plan(self.kis, symbol, fields=fields))
+
+
+async def foreign_orderbook(
+    self: "AsyncPyKis",
+    market: MARKET_TYPE,
+    symbol: str,
+    condition: ORDER_CONDITION | None = None,
+    fields: Iterable[str] | None = None,
+) -> KisForeignOrderbook:
+    """
+    한국투자증권 해외 주식 호가 조회 (비동기)
+
+    [해외주식] 기본시세 -> 해외주식 현재가 10호가 [해외주식-033]
+
+    Args:
+        market (MARKET_TYPE): 상품유형타입
+        symbol (str): 종목코드
+        condition (ORDER_CONDITION, optional): 주문조건. Defaults to None.
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"asks", "bids"}`
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 종목 코드가 올바르지 않은 경우
+    """
+    return await self.execute(foreign_orderbook_plan(self.kis, market, symbol, condition=condition, fields=fields))
+
+
+async def orderbook(
+    self: "AsyncPyKis",
+    market: MARKET_TYPE,
+    symbol: str,
+    condition: ORDER_CONDITION | None = None,
+    fields: Iterable[str] | None = None,
+) -> KisOrderbookResponse:
+    """
+    한국투자증권 호가 조회 (비동기)
+
+    [국내주식] 기본시세 -> 주식현재가 호가/예상체결[v1_국내주식-011]
+    [해외주식] 기본시세 -> 해외주식 현재가 10호가 [해외주식-033]
+
+    Args:
+        market (MARKET_TYPE): 상품유형타입
+        symbol (str): 종목코드
+        condition (ORDER_CONDITION, optional): 주문조건. Defaults to None.
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"asks", "bids"}`
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 종목 코드가 올바르지 않은 경우
+    """
+    return await self.execute(orderbook_plan(self.kis, market, symbol, condition=condition, fields=fields))
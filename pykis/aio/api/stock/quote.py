@@ -0,0 +1,93 @@
+from typing import TYPE_CHECKING, Iterable
+
+from pykis.api.stock.market import MARKET_TYPE
+from pykis.api.stock.quote import (
+    KisDomesticQuote,
+    KisForeignQuote,
+    KisQuoteResponse,
+    domestic_quote_plan,
+    foreign_quote_plan,
+    quote_plan,
+)
+
+if TYPE_CHECKING:
+    from pykis.aio.kis import AsyncPyKis
+
+__all__ = [
+    "quote",
+]
+
+
+async def domestic_quote(
+    self: "AsyncPyKis",
+    symbol: str,
+    fields: Iterable[str] | None = None,
+) -> KisDomesticQuote:
+    """
+    한국투자증권 국내 주식 현재가 조회 (비동기)
+
+    국내주식시세 -> 주식현재가 시세[v1_국내주식-008]
+
+    Args:
+        symbol (str): 종목코드
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"price", "volume"}`
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 종목 코드가 올바르지 않은 경우
+    """
+    return await self.execute(domestic_quote_plan(self.kis, symbol, fields=fields))
+
+
+async def foreign_quote(
+    self: "AsyncPyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    extended: bool = False,
+    fields: Iterable[str] | None = None,
+) -> KisForeignQuote:
+    """
+    한국투자증권 해외 주식 현재가 조회 (비동기)
+
+    해외주식현재가 -> 해외주식 현재가상세[v1_해외주식-029]
+
+    Args:
+        symbol (str): 종목코드
+        market (MARKET_TYPE): 시장구분
+        extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"price", "volume"}`
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 종목 코드가 올바르지 않은 경우
+    """
+    return await self.execute(foreign_quote_plan(self.kis, symbol, market, extended=extended, fields=fields))
+
+
+async def quote(
+    self: "AsyncPyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    extended: bool = False,
+    fields: Iterable[str] | None = None,
+) -> KisQuoteResponse:
+    """
+    한국투자증권 주식 현재가 조회 (비동기)
+
+    국내주식시세 -> 주식현재가 시세[v1_국내주식-008]
+    해외주식현재가 -> 해외주식 현재가상세[v1_해외주식-029]
+
+    Args:
+        symbol (str): 종목코드
+        market (MARKET_TYPE): 시장구분
+        extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"price", "volume"}`
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 종목 코드가 올바르지 않은 경우
+    """
+    return await self.execute(quote_plan(self.kis, symbol, market, extended=extended, fields=fields))
@@ -0,0 +1,397 @@
+import asyncio
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, TypeVar
+
+from pykis import logging
+from pykis.__env__ import USER_AGENT
+from pykis.api.auth.token import KisAccessToken
+from pykis.client.exceptions import KisTimeoutError
+from pykis.client.form import KisForm
+from pykis.client.priority import (
+    REQUEST_PRIORITIES,
+    REQUEST_PRIORITY_TYPE,
+    get_request_priority,
+)
+from pykis.client.session import KisSessionConfig
+from pykis.client.spec import KisRequestPlan, KisRequestSpec, execute_plan_async
+from pykis.client.token_manager import TOKEN_REFRESH_MARGIN
+from pykis.client.transport import KisHTTPRequest, KisHTTPResponse
+from pykis.responses.dynamic import RAW_RETENTION_TYPE, TDynamic
+from pykis.responses.types import KisDynamicDict
+
+if TYPE_CHECKING:
+    import httpx
+
+    from pykis.kis import PyKis
+
+__all__ = [
+    "AsyncPyKis",
+]
+
+T = TypeVar("T")
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "비동기 API를 사용하려면 httpx 패키지가 필요합니다. `pip install python-kis[async]` 명령어로 설치해주세요."
+        ) from None
+
+    return httpx
+
+
+def _to_response(response: "httpx.Response") -> KisHTTPResponse:
+    """httpx 응답을 `KisHTTPResponse`로 변환합니다."""
+    return KisHTTPResponse(
+        status_code=response.status_code,
+        reason=response.reason_phrase,
+        headers=response.headers,
+        content=response.content,
+        request=KisHTTPRequest(
+            response.request.method,
+            str(response.request.url),
+            dict(response.request.headers),
+            response.request.content or None,
+        ),
+        encoding=response.encoding,
+    )
+
+
+class AsyncPyKis:
+    """
+    한국투자증권 비동기 API
+
+    `PyKis` 객체의 인증 정보, 토큰, 캐시, 호출 유량 제한을 공유하며, 요청을 asyncio 이벤트 루프에서 처리합니다.
+    응답 객체는 동기 API와 동일한 모델을 사용합니다.
+
+    Examples:
+        >>> kis = PyKis("pykis_auth.json", keep_token=True)
+        >>> async with AsyncPyKis(kis) as aio:
+        ...     quote = await aio.quote("005930", "KRX")
+    """
+
+    kis: "PyKis"
+    """동기 한국투자증권 API"""
+
+    _httpx: Any
+    """httpx 모듈"""
+    _clients: dict[Literal["real", "virtual"], "httpx.AsyncClient"]
+    """API 세션"""
+    _token_lock: asyncio.Lock
+    """API 접속 토큰 발급 Lock"""
+
+    def __init__(self, kis: "PyKis"):
+        """
+        비동기 한국투자증권 API를 생성합니다.
+
+        Args:
+            kis (PyKis): 인증 정보를 공유할 한국투자증권 API
+
+        Raises:
+            ImportError: httpx 패키지가 설치되지 않은 경우
+        """
+        httpx = _import_httpx()
+
+        self.kis = kis
+        self._httpx = httpx
+        self._clients = {
+            domain: self._create_client(httpx, kis._session_config) for domain in ("real", "virtual")
+        }
+        self._token_lock = asyncio.Lock()
+
+    @staticmethod
+    def _create_client(httpx, config: KisSessionConfig) -> "httpx.AsyncClient":
+        """`PyKis`의 HTTP 세션 설정에 맞는 비동기 HTTP 클라이언트를 생성합니다."""
+        headers = {"User-Agent": USER_AGENT}
+
+        if not config.keep_alive:
+            headers["Connection"] = "close"
+
+        return httpx.AsyncClient(
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=config.pool_maxsize if config.pool_block else None,
+                max_keepalive_connections=config.pool_maxsize if config.keep_alive else 0,
+            ),
+        )
+
+    def _to_timeout(self, timeout: float | tuple[float, float] | None) -> "httpx.Timeout":
+        """`requests` 형식의 (연결, 읽기) 제한 시간을 httpx 제한 시간으로 변환합니다."""
+        if isinstance(timeout, tuple):
+            return self._httpx.Timeout(timeout[1], connect=timeout[0])
+
+        return self._httpx.Timeout(timeout)
+
+    @property
+    def virtual(self) -> bool:
+        """모의도메인 여부"""
+        return self.kis.virtual
+
+    async def _get_token(self, domain: Literal["real", "virtual"]) -> KisAccessToken:
+        """도메인의 API 접속 토큰을 반환합니다. 만료가 임박한 경우 비동기로 재발급합니다."""
+        if domain == "virtual" and not self.virtual:
+            domain = "real"
+
+        def current() -> KisAccessToken | None:
+            self.kis._poll_token_store(domain)
+            token = self.kis._token if domain == "real" else self.kis._virtual_token
+
+            if token is None or token.remaining < TOKEN_REFRESH_MARGIN:
+                return None
+
+            return token
+
+        if token := current():
+            return token
+
+        async with self._token_lock:
+            if token := current():
+                return token
+
+            if self.kis._token_store is not None:
+                # 프로세스 간 발급 Lock 대기가 이벤트 루프를 막지 않도록 별도의 스레드에서 발급합니다.
+                return await asyncio.to_thread(self.kis._issue_token, domain)
+
+            token = await self.fetch(
+                "/oauth2/tokenP",
+                body={
+                    "grant_type": "client_credentials",
+                },
+                appkey_location="body",
+                response_type=KisAccessToken,
+                method="POST",
+                domain=domain,
+                auth=False,
+                verbose=False,
+                # 토큰 파일 저장에 원본 응답 데이터가 필요합니다.
+                raw_retention="full",
+            )
+
+            if domain == "real":
+                self.kis.token = token
+            else:
+                self.kis.primary_token = token
+
+            logging.logger.debug(f"{'실전' if domain == 'real' else '모의'}도메인 API 접속 토큰을 발급했습니다.")
+
+            return token
+
+    async def request(
+        self,
+        path: str,
+        *,
+        method: Literal["GET", "POST"] = "GET",
+        params: dict[str, str] | None = None,
+        body: dict[str, str] | None = None,
+        form: Iterable[KisForm | None] | None = None,
+        headers: dict[str, str] | None = None,
+        domain: Literal["real", "virtual"] | None = None,
+        appkey_location: Literal["header", "body"] | None = "header",
+        form_location: Literal["header", "params", "body"] | None = None,
+        auth: bool = True,
+        priority: REQUEST_PRIORITY_TYPE | None = None,
+        timeout: float | tuple[float, float] | None = None,
+        deadline: float | None = None,
+    ) -> KisHTTPResponse:
+        """
+        API 요청을 보냅니다.
+
+        Args:
+            timeout: 요청 (연결, 읽기) 제한 시간(초). None일 경우 `PyKis.timeout`을 사용합니다.
+            deadline: 호출 유량 대기와 재시도를 포함한 전체 제한 시간(초). None일 경우 `PyKis.deadline`을 사용합니다.
+
+        Raises:
+            KisTimeoutError: 전체 제한 시간을 초과했거나 재시도할 수 없는 요청의 응답 시간이 초과된 경우
+            KisHTTPError: 재시도할 수 없는 오류 응답을 받은 경우
+        """
+        domain, url, request_headers, params, body = self.kis._prepare_request(
+            path,
+            method=method,
+            params=params,
+            body=body,
+            form=form,
+            headers=headers,
+            domain=domain,
+            appkey_location=appkey_location,
+            form_location=form_location,
+        )
+
+        content = None
+
+        if body is not None:
+            request_headers["Content-Type"] = "application/json"
+            content = self.kis.json_codec.dumps(body)
+
+        client = self._clients[domain]
+        rate_limit = self.kis._rate_limiters[domain]
+        lane = priority or get_request_priority(path)
+        start = monotonic()
+        deadline = self.kis.deadline if deadline is None else deadline
+        end = None if deadline is None else start + deadline
+        retry_deadline = self.kis._retry_deadline()
+        retries = 0
+
+        while True:
+            if not await rate_limit.acquire_async(
+                blocking_callback=self.kis._rate_limit_exceeded,
+                priority=REQUEST_PRIORITIES[lane],
+                lane=lane,
+                timeout=None if end is None else max(end - monotonic(), 0),
+            ):
+                raise KisTimeoutError("호출 유량 대기 중 요청 제한 시간이 초과되었습니다.", monotonic() - start, deadline, path)
+
+            if auth:
+                (await self._get_token(domain)).build(request_headers)
+
+            try:
+                resp = _to_response(
+                    await client.request(
+                        method=method,
+                        url=url,
+                        headers=request_headers,
+                        params=params,
+                        content=content,
+                        timeout=self._to_timeout(self.kis._attempt_timeout(timeout, end)),
+                    )
+                )
+            except self._httpx.TransportError as e:
+                retries += 1
+                delay = self.kis._handle_network_error(
+                    e,
+                    method=method,
+                    path=path,
+                    retries=retries,
+                    timed_out=isinstance(e, self._httpx.TimeoutException),
+                    start=start,
+                    end=end,
+                    retry_deadline=retry_deadline,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if resp.ok:
+                rate_limit.on_success()
+                return resp
+
+            delay = self.kis._handle_error_response(resp, domain)
+            retries += 1
+            self.kis._check_retry(resp, retries, retry_deadline, delay)
+            self.kis._check_deadline(path, delay, start, end)
+
+            if delay:
+                await asyncio.sleep(delay)
+
+    async def fetch(
+        self,
+        path: str,
+        *,
+        method: Literal["GET", "POST"] = "GET",
+        params: dict[str, str] | None = None,
+        body: dict[str, str] | None = None,
+        form: Iterable[KisForm | None] | None = None,
+        headers: dict[str, str] | None = None,
+        domain: Literal["real", "virtual"] | None = None,
+        appkey_location: Literal["header", "body"] | None = "header",
+        form_location: Literal["header", "params", "body"] | None = None,
+        auth: bool = True,
+        priority: REQUEST_PRIORITY_TYPE | None = None,
+        timeout: float | tuple[float, float] | None = None,
+        deadline: float | None = None,
+        api: str | None = None,
+        continuous: bool = False,
+        response_type: TDynamic | type[TDynamic] | Callable[[], TDynamic] = KisDynamicDict,
+        verbose: bool = True,
+        lazy: bool | None = None,
+        fields: Iterable[str] | None = None,
+        raw_retention: RAW_RETENTION_TYPE | None = None,
+    ) -> TDynamic:
+        if api is not None:
+            if headers is None:
+                headers = {}
+
+            headers["tr_id"] = api
+
+        if continuous:
+            if headers is None:
+                headers = {}
+
+            headers["tr_cont"] = "N"
+
+        async def fetch() -> TDynamic:
+            response = await self.request(
+                path,
+                method=method,
+                params=params,
+                body=body,
+                form=form,
+                headers=headers,
+                domain=domain,
+                appkey_location=appkey_location,
+                form_location=form_location,
+                auth=auth,
+                priority=priority,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+            return self.kis._transform_response(
+                response,
+                path=path,
+                params=params,
+                body=body,
+                api=api,
+                response_type=response_type,
+                verbose=verbose,
+                lazy=lazy,
+                fields=fields,
+                raw_retention=raw_retention,
+            )
+
+        if coalesce := self.kis._get_coalesce_key(
+            path,
+            method=method,
+            params=params,
+            form=form,
+            headers=headers,
+            domain=domain,
+            response_type=response_type,
+            fields=fields,
+            raw_retention=raw_retention,
+        ):
+            group, key = coalesce
+            return await self.kis._single_flight.do_async(key, fetch, group=group)
+
+        return await fetch()
+
+    async def execute(self, plan: KisRequestSpec[T] | KisRequestPlan[T]) -> T:
+        """
+        API 요청 명세 또는 요청 계획을 실행합니다.
+
+        동기 API(`PyKis.execute`)와 같은 요청 계획을 공유하며, 튜플로 묶은 요청은 동시에 실행합니다.
+
+        Args:
+            plan: 요청 명세 또는 요청 계획
+        """
+        return await execute_plan_async(plan, self.fetch)
+
+    async def close(self) -> None:
+        """API 세션을 종료합니다."""
+        for client in self._clients.values():
+            await client.aclose()
+
+    async def __aenter__(self) -> "AsyncPyKis":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    from pykis.aio.api.account.balance import balance
+    from pykis.aio.api.account.order import order
+    from pykis.aio.api.account.order_modify import cancel_order
+    from pykis.aio.api.account.orderable_amount import orderable_amount
+    from pykis.aio.api.stock.daily_chart import daily_chart
+    from pykis.aio.api.stock.day_chart import day_chart
+    from pykis.aio.api.stock.order_book import orderbook
+    from pykis.aio.api.stock.quote import quote
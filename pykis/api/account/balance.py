@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import cached_property
-from typing import TYPE_CHECKING, Iterator, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Iterable, Iterator, Protocol, runtime_checkable
 
 from pykis.adapter.account_product.order import (
     KisOrderableAccountProduct,
@@ -25,6 +25,7 @@ from pykis.api.stock.market import (
 )
 from pykis.client.account import KisAccountNumber
 from pykis.client.page import KisPage
+from pykis.client.spec import KisRequestPlan, KisRequestSpec
 from pykis.responses.dynamic import KisDynamic, KisList, KisObject, KisTransform
 from pykis.responses.response import KisAPIResponse, KisPaginationAPIResponse
 from pykis.responses.types import KisAny, KisDecimal, KisString
@@ -847,27 +848,28 @@ class KisIntegrationBalance(KisBalanceBase):
                 self.deposits[currency] = deposit
 
 
-def domestic_balance(
+BALANCE_REQUIRED_FIELDS = ("symbol", "market", "account_number", "currency")
+"""필드 선택 시에도 항상 변환하는 보유종목과 예수금 필드 (주문, 종목 조회 등에 사용)"""
+
+
+def _balance_fields(fields: Iterable[str] | None) -> list[str] | None:
+    """보유종목과 예수금에서 변환할 필드를 잔고 응답의 필드 선택으로 변환합니다."""
+    if fields is None:
+        return None
+
+    fields = {*([fields] if isinstance(fields, str) else fields), *BALANCE_REQUIRED_FIELDS}
+
+    return ["*", *(f"{name}.{field}" for name in ("stocks", "deposits") for field in fields)]
+
+
+def domestic_balance_plan(
     self: "PyKis",
     account: str | KisAccountNumber,
     page: KisPage | None = None,
     continuous: bool = True,
-) -> KisDomesticBalance:
-    """
-    한국투자증권 국내 주식 잔고 조회
-
-    국내주식주문 -> 주식잔고조회[v1_국내주식-006]
-    (업데이트 날짜: 2024/03/29)
-
-    Args:
-        account (str | KisAccountNumber): 계좌번호
-        page (KisPage, optional): 페이지 정보
-        continuous (bool, optional): 연속조회 여부
-
-    Raises:
-        KisAPIError: API 호출에 실패한 경우
-        ValueError: 계좌번호가 잘못된 경우
-    """
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisDomesticBalance]:
+    """국내 주식 잔고 조회 요청 계획 (`domestic_balance`)"""
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
@@ -875,7 +877,7 @@ def domestic_balance(
     first = None
 
     while True:
-        result = self.fetch(
+        result = yield KisRequestSpec(
             "/uapi/domestic-stock/v1/trading/inquire-balance",
             api="VTTC8434R" if self.virtual else "TTTC8434R",
             params={
@@ -892,6 +894,7 @@ def domestic_balance(
                 page,
             ],
             continuous=not page.is_first,
+            fields=_balance_fields(fields),
             response_type=KisDomesticBalance(
                 account_number=account,
             ),
@@ -910,29 +913,41 @@ def domestic_balance(
     return first
 
 
-def _internal_foreign_balance(
+def domestic_balance(
     self: "PyKis",
     account: str | KisAccountNumber,
-    market: MARKET_TYPE | None = None,
     page: KisPage | None = None,
     continuous: bool = True,
-) -> KisForeignBalance:
+    fields: Iterable[str] | None = None,
+) -> KisDomesticBalance:
     """
-    한국투자증권 해외 주식 잔고 조회
+    한국투자증권 국내 주식 잔고 조회
 
-    해외주식주문 -> 해외주식 잔고[v1_해외주식-006]
-    (업데이트 날짜: 2024/03/30)
+    국내주식주문 -> 주식잔고조회[v1_국내주식-006]
+    (업데이트 날짜: 2024/03/29)
 
     Args:
         account (str | KisAccountNumber): 계좌번호
-        market (str, optional): 시장코드
         page (KisPage, optional): 페이지 정보
         continuous (bool, optional): 연속조회 여부
+        fields (Iterable[str], optional): 보유종목과 예수금에서 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"quantity", "amount"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         ValueError: 계좌번호가 잘못된 경우
     """
+    return self.execute(domestic_balance_plan(self, account, page=page, continuous=continuous, fields=fields))
+
+
+def _internal_foreign_balance_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE | None = None,
+    page: KisPage | None = None,
+    continuous: bool = True,
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisForeignBalance]:
+    """해외 주식 잔고 조회 요청 계획 (`_internal_foreign_balance`)"""
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
@@ -940,7 +955,7 @@ def _internal_foreign_balance(
     first = None
 
     while True:
-        result = self.fetch(
+        result = yield KisRequestSpec(
             "/uapi/overseas-stock/v1/trading/inquire-balance",
             api="VTTS3012R" if self.virtual else "TTTS3012R",
             params={
@@ -952,6 +967,7 @@ def _internal_foreign_balance(
                 page,
             ],
             continuous=not page.is_first,
+            fields=_balance_fields(fields),
             response_type=KisForeignBalance(
                 account_number=account,
             ),
@@ -970,22 +986,13 @@ def _internal_foreign_balance(
     return first
 
 
-FOREIGN_COUNTRY_MARKET_MAP: dict[tuple[bool | None, COUNTRY_TYPE | None], list[MARKET_TYPE | None]] = {
-    # 실전투자여부, 국가코드 -> 조회시장코드
-    (None, None): [None],
-    (None, "US"): ["NASDAQ"],
-    (False, "US"): ["NASDAQ", "NYSE", "AMEX"],
-    (None, "HK"): ["HKEX"],
-    (None, "CN"): ["SSE", "SZSE"],
-    (None, "JP"): ["TYO"],
-    (None, "VN"): ["HSX", "HNX"],
-}
-
-
-def _foreign_balance(
+def _internal_foreign_balance(
     self: "PyKis",
     account: str | KisAccountNumber,
-    country: COUNTRY_TYPE | None = None,
+    market: MARKET_TYPE | None = None,
+    page: KisPage | None = None,
+    continuous: bool = True,
+    fields: Iterable[str] | None = None,
 ) -> KisForeignBalance:
     """
     한국투자증권 해외 주식 잔고 조회
@@ -995,18 +1002,45 @@ def _foreign_balance(
 
     Args:
         account (str | KisAccountNumber): 계좌번호
-        country (COUNTRY_TYPE, optional): 국가코드
+        market (str, optional): 시장코드
+        page (KisPage, optional): 페이지 정보
+        continuous (bool, optional): 연속조회 여부
+        fields (Iterable[str], optional): 보유종목과 예수금에서 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"quantity", "amount"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         ValueError: 계좌번호가 잘못된 경우
     """
+    return self.execute(
+        _internal_foreign_balance_plan(self, account, market, page=page, continuous=continuous, fields=fields)
+    )
+
+
+FOREIGN_COUNTRY_MARKET_MAP: dict[tuple[bool | None, COUNTRY_TYPE | None], list[MARKET_TYPE | None]] = {
+    # 실전투자여부, 국가코드 -> 조회시장코드
+    (None, None): [None],
+    (None, "US"): ["NASDAQ"],
+    (False, "US"): ["NASDAQ", "NYSE", "AMEX"],
+    (None, "HK"): ["HKEX"],
+    (None, "CN"): ["SSE", "SZSE"],
+    (None, "JP"): ["TYO"],
+    (None, "VN"): ["HSX", "HNX"],
+}
+
+
+def _foreign_balance_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisForeignBalance]:
+    """해외 주식 시장별 잔고 조회 요청 계획 (`_foreign_balance`)"""
     markets = FOREIGN_COUNTRY_MARKET_MAP.get((not self.virtual, country), FOREIGN_COUNTRY_MARKET_MAP[(None, country)])
 
     first = None
 
     for market in markets:
-        result = _internal_foreign_balance(self, account, market)
+        result = yield _internal_foreign_balance_plan(self, account, market, fields=fields)
 
         if first is None:
             first = result
@@ -1019,41 +1053,51 @@ def _foreign_balance(
     return first
 
 
-FOREIGN_COUNTRY_MAP = {
-    None: "000",
-    "US": "840",
-    "HK": "344",
-    "CN": "156",
-    "JP": "392",
-    "VN": "704",
-}
-
-
-def foreign_balance(
+def _foreign_balance(
     self: "PyKis",
     account: str | KisAccountNumber,
     country: COUNTRY_TYPE | None = None,
-) -> KisForeignPresentBalance:
+    fields: Iterable[str] | None = None,
+) -> KisForeignBalance:
     """
     한국투자증권 해외 주식 잔고 조회
 
-    해외주식주문 -> 해외주식 체결기준현재잔고[v1_해외주식-008] (실전투자, 모의투자)
-    해외주식주문 -> 해외주식 잔고[v1_해외주식-006] (모의투자)
+    해외주식주문 -> 해외주식 잔고[v1_해외주식-006]
     (업데이트 날짜: 2024/03/30)
 
     Args:
         account (str | KisAccountNumber): 계좌번호
         country (COUNTRY_TYPE, optional): 국가코드
+        fields (Iterable[str], optional): 보유종목과 예수금에서 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"quantity", "amount"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         ValueError: 계좌번호가 잘못된 경우
     """
+    return self.execute(_foreign_balance_plan(self, account, country=country, fields=fields))
+
 
+FOREIGN_COUNTRY_MAP = {
+    None: "000",
+    "US": "840",
+    "HK": "344",
+    "CN": "156",
+    "JP": "392",
+    "VN": "704",
+}
+
+
+def foreign_balance_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisForeignPresentBalance]:
+    """해외 주식 잔고 조회 요청 계획 (`foreign_balance`)"""
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
-    result = self.fetch(
+    result = yield KisRequestSpec(
         "/uapi/overseas-stock/v1/trading/inquire-present-balance",
         api="VTRP6504R" if self.virtual else "CTRP6504R",
         params={
@@ -1063,6 +1107,7 @@ def foreign_balance(
             "INQR_DVSN_CD": "00",
         },
         form=[account],
+        fields=_balance_fields(fields),
         response_type=KisForeignPresentBalance(
             account_number=account,
             country=country,
@@ -1070,10 +1115,13 @@ def foreign_balance(
     )
 
     if self.virtual:
-        result.stocks = _foreign_balance(
-            self,
-            account=account,
-            country=country,
+        result.stocks = (
+            yield _foreign_balance_plan(
+                self,
+                account=account,
+                country=country,
+                fields=fields,
+            )
         ).stocks
 
     for stock in result.stocks:
@@ -1083,15 +1131,15 @@ def foreign_balance(
     return result
 
 
-def balance(
+def foreign_balance(
     self: "PyKis",
     account: str | KisAccountNumber,
     country: COUNTRY_TYPE | None = None,
-) -> KisBalance:
+    fields: Iterable[str] | None = None,
+) -> KisForeignPresentBalance:
     """
-    한국투자증권 통합주식 잔고 조회
+    한국투자증권 해외 주식 잔고 조회
 
-    국내주식주문 -> 주식잔고조회[v1_국내주식-006]
     해외주식주문 -> 해외주식 체결기준현재잔고[v1_해외주식-008] (실전투자, 모의투자)
     해외주식주문 -> 해외주식 잔고[v1_해외주식-006] (모의투자)
     (업데이트 날짜: 2024/03/30)
@@ -1099,30 +1147,74 @@ def balance(
     Args:
         account (str | KisAccountNumber): 계좌번호
         country (COUNTRY_TYPE, optional): 국가코드
+        fields (Iterable[str], optional): 보유종목과 예수금에서 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"quantity", "amount"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         ValueError: 계좌번호가 잘못된 경우
     """
+    return self.execute(foreign_balance_plan(self, account, country=country, fields=fields))
+
+
+def balance_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisBalance]:
+    """통합주식 잔고 조회 요청 계획 (`balance`)"""
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
     if country is None:
+        # 비동기 API에서는 국내, 해외 잔고를 동시에 조회합니다.
+        domestic, foreign = yield (
+            domestic_balance_plan(self, account, fields=fields),
+            foreign_balance_plan(self, account, fields=fields),
+        )
+
         return KisIntegrationBalance(
             self,
             account,
-            domestic_balance(self, account),
-            foreign_balance(self, account),
+            domestic,
+            foreign,
         )
     elif country == "KR":
-        return domestic_balance(self, account)
+        return (yield domestic_balance_plan(self, account, fields=fields))
     else:
-        return foreign_balance(self, account, country)
+        return (yield foreign_balance_plan(self, account, country, fields=fields))
+
+
+def balance(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+    fields: Iterable[str] | None = None,
+) -> KisBalance:
+    """
+    한국투자증권 통합주식 잔고 조회
+
+    국내주식주문 -> 주식잔고조회[v1_국내주식-006]
+    해외주식주문 -> 해외주식 체결기준현재잔고[v1_해외주식-008] (실전투자, 모의투자)
+    해외주식주문 -> 해외주식 잔고[v1_해외주식-006] (모의투자)
+    (업데이트 날짜: 2024/03/30)
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        country (COUNTRY_TYPE, optional): 국가코드
+        fields (Iterable[str], optional): 보유종목과 예수금에서 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"quantity", "amount"}`
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return self.execute(balance_plan(self, account, country=country, fields=fields))
 
 
 def account_balance(
     self: "KisAccountProtocol",
     country: COUNTRY_TYPE | None = None,
+    fields: Iterable[str] | None = None,
 ) -> KisBalance:
     """
     한국투자증권 통합주식 잔고 조회
@@ -1134,6 +1226,7 @@ def account_balance(
 
     Args:
         country (COUNTRY_TYPE, optional): 국가코드
+        fields (Iterable[str], optional): 보유종목과 예수금에서 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"quantity", "amount"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -1143,9 +1236,34 @@ def account_balance(
         self.kis,
         account=self.account_number,
         country=country,
+        fields=fields,
     )
 
 
+def orderable_quantity_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    symbol: str,
+    country: COUNTRY_TYPE | None = None,
+) -> KisRequestPlan[ORDER_QUANTITY | None]:
+    """매도가능수량 조회 요청 계획 (`orderable_quantity`)"""
+    if not country:
+        country = get_market_country(resolve_market(self, symbol=symbol))
+
+    stock = (
+        yield balance_plan(
+            self,
+            account=account,
+            country=country,
+        )
+    ).stock(symbol)
+
+    if stock:
+        return stock.orderable
+
+    return None
+
+
 def orderable_quantity(
     self: "PyKis",
     account: str | KisAccountNumber,
@@ -1173,19 +1291,7 @@ def orderable_quantity(
         KisAPIError: API 호출에 실패한 경우
         ValueError: 계좌번호가 잘못된 경우
     """
-    if not country:
-        country = get_market_country(resolve_market(self, symbol=symbol))
-
-    stock = balance(
-        self,
-        account=account,
-        country=country,
-    ).stock(symbol)
-
-    if stock:
-        return stock.orderable
-
-    return None
+    return self.execute(orderable_quantity_plan(self, account, symbol, country=country))
 
 
 def account_orderable_quantity(
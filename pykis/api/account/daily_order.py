@@ -29,7 +29,7 @@ from pykis.client.account import KisAccountNumber
 from pykis.client.page import KisPage
 from pykis.responses.dynamic import KisDynamic, KisList, KisTransform
 from pykis.responses.response import KisPaginationAPIResponse
-from pykis.responses.types import KisAny, KisDecimal, KisString
+from pykis.responses.types import KisAny, KisDecimal, KisString, parse_datetime
 from pykis.utils.repr import kis_repr
 from pykis.utils.timezone import TIMEZONE
 
@@ -348,7 +348,7 @@ class KisDomesticDailyOrder(KisDynamic, KisDailyOrderBase):
     time: datetime
     """시간 (현지시간)"""
     time_kst: datetime = KisTransform(
-        lambda x: datetime.strptime(x["ord_dt"] + x["ord_tmd"], "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE)
+        lambda x: parse_datetime(x["ord_dt"] + x["ord_tmd"], "%Y%m%d%H%M%S", TIMEZONE)
     )()
     """시간 (한국시간)"""
     timezone: ZoneInfo = TIMEZONE
@@ -471,7 +471,7 @@ class KisForeignDailyOrder(KisDynamic, KisDailyOrderBase):
     time: datetime
     """시간 (현지시간)"""
     time_kst: datetime = KisTransform(
-        lambda x: datetime.strptime(x["ord_dt"] + x["ord_tmd"], "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE)
+        lambda x: parse_datetime(x["ord_dt"] + x["ord_tmd"], "%Y%m%d%H%M%S", TIMEZONE)
     )()
     """시간 (한국시간)"""
     timezone: ZoneInfo = KisAny(get_market_code_timezone)["ovrs_excg_cd"]
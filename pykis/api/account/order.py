@@ -34,8 +34,9 @@ from pykis.api.stock.market import (
     get_market_name,
     get_market_timezone,
 )
-from pykis.api.stock.quote import quote
+from pykis.api.stock.quote import quote_plan
 from pykis.client.account import KisAccountNumber
+from pykis.client.spec import KisRequestPlan, KisRequestSpec
 from pykis.event.filters.order import KisOrderNumberEventFilter
 from pykis.event.handler import KisEventFilter
 from pykis.event.subscription import KisSubscriptionEventArgs
@@ -902,7 +903,7 @@ DOMESTIC_ORDER_API_CODES: dict[tuple[bool, ORDER_TYPE], str] = {
 }
 
 
-def _orderable_quantity(
+def _orderable_quantity_plan(
     self: "PyKis",
     account: str | KisAccountNumber,
     market: MARKET_TYPE,
@@ -913,9 +914,9 @@ def _orderable_quantity(
     execution: ORDER_EXECUTION | None = None,
     include_foreign: bool = False,
     throw_no_qty: bool = True,
-) -> tuple[ORDER_QUANTITY, Decimal | None]:
+) -> KisRequestPlan[tuple[ORDER_QUANTITY, Decimal | None]]:
     """
-    주문 가능 수량 조회
+    주문 가능 수량 조회 요청 계획
 
     국내주식주문 -> 매수가능조회[v1_국내주식-007]
     해외주식주문 -> 해외주식 매수가능금액조회[v1_해외주식-014]
@@ -945,9 +946,9 @@ def _orderable_quantity(
         KisNotFoundError: 조회 결과가 없는 경우
     """
     if order == "buy":
-        from pykis.api.account.orderable_amount import orderable_amount
+        from pykis.api.account.orderable_amount import orderable_amount_plan
 
-        amount = orderable_amount(
+        amount = yield orderable_amount_plan(
             self,
             account=account,
             market="KRX",
@@ -955,6 +956,7 @@ def _orderable_quantity(
             price=price,
             condition=condition,
             execution=execution,
+            foreign=include_foreign,
         )
 
         if include_foreign:
@@ -967,9 +969,9 @@ def _orderable_quantity(
 
         return qty, amount.unit_price
     else:
-        from pykis.api.account.balance import orderable_quantity
+        from pykis.api.account.balance import orderable_quantity_plan
 
-        qty = orderable_quantity(
+        qty = yield orderable_quantity_plan(
             self,
             account=account,
             symbol=symbol,
@@ -982,13 +984,14 @@ def _orderable_quantity(
         return qty or Decimal(0), None
 
 
-def _get_order_price(
+def _get_order_price_plan(
     self: "PyKis",
     market: MARKET_TYPE,
     symbol: str,
     price_setting: Literal["lower", "upper"],
-) -> Decimal:
-    quote_data = quote(self, symbol=symbol, market=market)
+) -> KisRequestPlan[Decimal]:
+    """주문 가격 상한, 하한 조회 요청 계획"""
+    quote_data = yield quote_plan(self, symbol=symbol, market=market)
 
     if price_setting == "upper":
         return quote_data.high_limit or (quote_data.close * Decimal(1.5))
@@ -996,6 +999,83 @@ def _get_order_price(
         return quote_data.low_limit or (quote_data.close * Decimal(0.5))
 
 
+def domestic_order_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    symbol: str,
+    order: ORDER_TYPE = "buy",
+    price: ORDER_PRICE | None = None,
+    qty: IN_ORDER_QUANTITY | None = None,
+    condition: ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    include_foreign: bool = False,
+) -> KisRequestPlan[KisDomesticOrder]:
+    """국내 주식 주문 요청 계획 (`domestic_order`)"""
+    if not account:
+        raise ValueError("계좌번호를 입력해주세요.")
+
+    if not symbol:
+        raise ValueError("종목코드를 입력해주세요.")
+
+    if qty != None and qty <= 0:
+        raise ValueError("수량은 0보다 커야합니다.")
+
+    price = None if price is None else ensure_price(price, 0)
+
+    condition_code, price_setting, _ = order_condition(
+        virtual=self.virtual,
+        market="KRX",
+        order=order,
+        price=price,
+        condition=condition,
+        execution=execution,
+    )
+
+    if not isinstance(account, KisAccountNumber):
+        account = KisAccountNumber(account)
+
+    if price_setting:
+        price = yield _get_order_price_plan(
+            self,
+            market="KRX",
+            symbol=symbol,
+            price_setting=price_setting,
+        )
+
+    if qty is None:
+        qty, _ = yield _orderable_quantity_plan(
+            self,
+            account=account,
+            market="KRX",
+            symbol=symbol,
+            order=order,
+            price=None if price_setting else price,
+            condition=condition,
+            execution=execution,
+            include_foreign=include_foreign,
+        )
+
+    return (
+        yield KisRequestSpec(
+            "/uapi/domestic-stock/v1/trading/order-cash",
+            api=DOMESTIC_ORDER_API_CODES[(not self.virtual, order)],
+            body={
+                "PDNO": symbol,
+                "ORD_DVSN": condition_code,
+                "ORD_QTY": str(int(qty)),
+                "ORD_UNPR": str(price or 0),
+            },
+            form=[account],
+            response_type=KisDomesticOrder(
+                account_number=account,
+                symbol=symbol,
+                market="KRX",
+            ),
+            method="POST",
+        )
+    )
+
+
 def domestic_order(
     self: "PyKis",
     account: str | KisAccountNumber,
@@ -1059,66 +1139,18 @@ def domestic_order(
         KisMarketNotOpenedError: 시장이 열리지 않은 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
-    if not account:
-        raise ValueError("계좌번호를 입력해주세요.")
-
-    if not symbol:
-        raise ValueError("종목코드를 입력해주세요.")
-
-    if qty != None and qty <= 0:
-        raise ValueError("수량은 0보다 커야합니다.")
-
-    price = None if price is None else ensure_price(price, 0)
-
-    condition_code, price_setting, _ = order_condition(
-        virtual=self.virtual,
-        market="KRX",
-        order=order,
-        price=price,
-        condition=condition,
-        execution=execution,
-    )
-
-    if not isinstance(account, KisAccountNumber):
-        account = KisAccountNumber(account)
-
-    if price_setting:
-        price = _get_order_price(
-            self,
-            market="KRX",
-            symbol=symbol,
-            price_setting=price_setting,
-        )
-
-    if qty is None:
-        qty, _ = _orderable_quantity(
+    return self.execute(
+        domestic_order_plan(
             self,
-            account=account,
-            market="KRX",
-            symbol=symbol,
+            account,
+            symbol,
             order=order,
-            price=None if price_setting else price,
+            price=price,
+            qty=qty,
             condition=condition,
             execution=execution,
             include_foreign=include_foreign,
         )
-
-    return self.fetch(
-        "/uapi/domestic-stock/v1/trading/order-cash",
-        api=DOMESTIC_ORDER_API_CODES[(not self.virtual, order)],
-        body={
-            "PDNO": symbol,
-            "ORD_DVSN": condition_code,
-            "ORD_QTY": str(int(qty)),
-            "ORD_UNPR": str(price or 0),
-        },
-        form=[account],
-        response_type=KisDomesticOrder(
-            account_number=account,
-            symbol=symbol,
-            market="KRX",
-        ),
-        method="POST",
     )
 
 
@@ -1163,6 +1195,90 @@ FOREIGN_ORDER_API_CODES: dict[tuple[bool, MARKET_TYPE, ORDER_TYPE], str] = {
 }
 
 
+def foreign_order_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE,
+    symbol: str,
+    order: ORDER_TYPE = "buy",
+    price: ORDER_PRICE | None = None,
+    qty: IN_ORDER_QUANTITY | None = None,
+    condition: FOREIGN_ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    include_foreign: bool = False,
+) -> KisRequestPlan[KisForeignOrder]:
+    """해외 주식 주문 요청 계획 (`foreign_order`)"""
+    if not account:
+        raise ValueError("계좌번호를 입력해주세요.")
+
+    if not market:
+        raise ValueError("시장을 입력해주세요.")
+
+    if not symbol:
+        raise ValueError("종목코드를 입력해주세요.")
+
+    if qty != None and qty <= 0:
+        raise ValueError("수량은 0보다 커야합니다.")
+
+    price = None if price is None else ensure_price(price)
+
+    condition_code, price_setting, _ = order_condition(
+        virtual=self.virtual,
+        market=market,
+        order=order,
+        price=price,
+        condition=condition,
+        execution=execution,
+    )
+
+    if not isinstance(account, KisAccountNumber):
+        account = KisAccountNumber(account)
+
+    if price_setting:
+        price = yield _get_order_price_plan(
+            self,
+            market=market,
+            symbol=symbol,
+            price_setting=price_setting,
+        )
+
+    if qty is None:
+        qty, _ = yield _orderable_quantity_plan(
+            self,
+            account=account,
+            market=market,
+            symbol=symbol,
+            order=order,
+            price=None if price_setting else price,
+            condition=condition,
+            execution=execution,
+            include_foreign=include_foreign,
+        )
+
+    return (
+        yield KisRequestSpec(
+            "/uapi/overseas-stock/v1/trading/order",
+            api=FOREIGN_ORDER_API_CODES[(not self.virtual, market, order)],
+            body={
+                "OVRS_EXCG_CD": get_market_code(market),
+                "PDNO": symbol,
+                "ORD_QTY": str(int(qty)),
+                "OVRS_ORD_UNPR": str(price or 0),
+                "SLL_TYPE": "00" if order == "sell" else "",
+                "ORD_SVR_DVSN_CD": "0",
+                "ORD_DVSN": condition_code,
+            },
+            form=[account],
+            response_type=KisForeignOrder(
+                account_number=account,
+                symbol=symbol,
+                market=market,
+            ),
+            method="POST",
+        )
+    )
+
+
 def foreign_order(
     self: "PyKis",
     account: str | KisAccountNumber,
@@ -1228,12 +1344,42 @@ def foreign_order(
         KisMarketNotOpenedError: 시장이 열리지 않은 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
+    return self.execute(
+        foreign_order_plan(
+            self,
+            account,
+            market,
+            symbol,
+            order=order,
+            price=price,
+            qty=qty,
+            condition=condition,
+            execution=execution,
+            include_foreign=include_foreign,
+        )
+    )
+
+
+def foreign_daytime_order_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE,
+    symbol: str,
+    order: ORDER_TYPE = "buy",
+    price: ORDER_PRICE | None = None,
+    qty: IN_ORDER_QUANTITY | None = None,
+    include_foreign: bool = False,
+) -> KisRequestPlan[KisForeignDaytimeOrder]:
+    """해외 주식 주간거래 주문 요청 계획 (`foreign_daytime_order`)"""
+    if self.virtual:
+        raise NotImplementedError("주간거래 주문은 모의투자를 지원하지 않습니다.")
+
+    if market not in DAYTIME_MARKET_SHORT_TYPE_MAP:
+        raise ValueError(f"주간거래가 지원되지 않는 시장입니다. ({market})")
+
     if not account:
         raise ValueError("계좌번호를 입력해주세요.")
 
-    if not market:
-        raise ValueError("시장을 입력해주세요.")
-
     if not symbol:
         raise ValueError("종목코드를 입력해주세요.")
 
@@ -1242,58 +1388,46 @@ def foreign_order(
 
     price = None if price is None else ensure_price(price)
 
-    condition_code, price_setting, _ = order_condition(
-        virtual=self.virtual,
-        market=market,
-        order=order,
-        price=price,
-        condition=condition,
-        execution=execution,
-    )
-
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
-    if price_setting:
-        price = _get_order_price(
-            self,
-            market=market,
-            symbol=symbol,
-            price_setting=price_setting,
-        )
-
     if qty is None:
-        qty, _ = _orderable_quantity(
+        qty, price = yield _orderable_quantity_plan(
             self,
             account=account,
             market=market,
             symbol=symbol,
             order=order,
-            price=None if price_setting else price,
-            condition=condition,
-            execution=execution,
+            price=price,
+            condition="extended",
             include_foreign=include_foreign,
         )
 
-    return self.fetch(
-        "/uapi/overseas-stock/v1/trading/order",
-        api=FOREIGN_ORDER_API_CODES[(not self.virtual, market, order)],
-        body={
-            "OVRS_EXCG_CD": get_market_code(market),
-            "PDNO": symbol,
-            "ORD_QTY": str(int(qty)),
-            "OVRS_ORD_UNPR": str(price or 0),
-            "SLL_TYPE": "00" if order == "sell" else "",
-            "ORD_SVR_DVSN_CD": "0",
-            "ORD_DVSN": condition_code,
-        },
-        form=[account],
-        response_type=KisForeignOrder(
-            account_number=account,
-            symbol=symbol,
-            market=market,
-        ),
-        method="POST",
+    if not price:
+        quote_data = yield quote_plan(self, symbol=symbol, market=market, extended=True)
+        price = quote_data.high_limit if order == "buy" else quote_data.low_limit
+
+    return (
+        yield KisRequestSpec(
+            "/uapi/overseas-stock/v1/trading/daytime-order",
+            api="TTTS6036U" if order == "buy" else "TTTS6037U",
+            body={
+                "OVRS_EXCG_CD": get_market_code(market),
+                "PDNO": symbol,
+                "ORD_QTY": str(int(qty)),
+                "OVRS_ORD_UNPR": str(price),
+                "ORD_SVR_DVSN_CD": "0",
+                "ORD_DVSN": "00",
+            },
+            form=[account],
+            response_type=KisForeignDaytimeOrder(
+                account_number=account,
+                symbol=symbol,
+                market=market,
+            ),
+            method="POST",
+            domain="real",
+        )
     )
 
 
@@ -1322,62 +1456,79 @@ def foreign_daytime_order(
         qty (IN_ORDER_QUANTITY, optional): 주문수량
         include_foreign (bool, optional): 전량 주문시 외화 주문가능금액 포함 여부
     """
-    if self.virtual:
-        raise NotImplementedError("주간거래 주문은 모의투자를 지원하지 않습니다.")
-
-    if market not in DAYTIME_MARKET_SHORT_TYPE_MAP:
-        raise ValueError(f"주간거래가 지원되지 않는 시장입니다. ({market})")
-
-    if not account:
-        raise ValueError("계좌번호를 입력해주세요.")
-
-    if not symbol:
-        raise ValueError("종목코드를 입력해주세요.")
-
-    if qty != None and qty <= 0:
-        raise ValueError("수량은 0보다 커야합니다.")
-
-    price = None if price is None else ensure_price(price)
-
-    if not isinstance(account, KisAccountNumber):
-        account = KisAccountNumber(account)
-
-    if qty is None:
-        qty, price = _orderable_quantity(
+    return self.execute(
+        foreign_daytime_order_plan(
             self,
-            account=account,
-            market=market,
-            symbol=symbol,
+            account,
+            market,
+            symbol,
             order=order,
             price=price,
-            condition="extended",
+            qty=qty,
             include_foreign=include_foreign,
         )
+    )
 
-    if not price:
-        quote_data = quote(self, symbol=symbol, market=market, extended=True)
-        price = quote_data.high_limit if order == "buy" else quote_data.low_limit
 
-    return self.fetch(
-        "/uapi/overseas-stock/v1/trading/daytime-order",
-        api="TTTS6036U" if order == "buy" else "TTTS6037U",
-        body={
-            "OVRS_EXCG_CD": get_market_code(market),
-            "PDNO": symbol,
-            "ORD_QTY": str(int(qty)),
-            "OVRS_ORD_UNPR": str(price),
-            "ORD_SVR_DVSN_CD": "0",
-            "ORD_DVSN": "00",
-        },
-        form=[account],
-        response_type=KisForeignDaytimeOrder(
-            account_number=account,
-            symbol=symbol,
-            market=market,
-        ),
-        method="POST",
-        domain="real",
-    )
+def order_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE,
+    symbol: str,
+    order: ORDER_TYPE,
+    price: ORDER_PRICE | None = None,
+    qty: IN_ORDER_QUANTITY | None = None,
+    condition: ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    include_foreign: bool = False,
+) -> KisRequestPlan[KisOrder]:
+    """통합주식 주문 요청 계획 (`order`)"""
+    if market == "KRX":
+        return (
+            yield domestic_order_plan(
+                self,
+                account=account,
+                symbol=symbol,
+                order=order,
+                price=price,
+                qty=qty,
+                condition=condition,
+                execution=execution,
+                include_foreign=include_foreign,
+            )  # type: ignore
+        )
+    else:
+        if condition == "extended":
+            if execution is not None:
+                raise ValueError("주간거래 주문에서는 체결조건을 지정할 수 없습니다.")
+
+            return (
+                yield foreign_daytime_order_plan(
+                    self,
+                    account=account,
+                    market=market,
+                    symbol=symbol,
+                    order=order,
+                    price=price,
+                    qty=qty,
+                    include_foreign=include_foreign,
+                )  # type: ignore
+            )
+
+        return (
+            yield foreign_order_plan(
+                self,
+                account=account,
+                market=market,
+                symbol=symbol,
+                order=order,
+                price=price,
+                qty=qty,
+                condition=condition,  # type: ignore
+                execution=execution,
+                include_foreign=include_foreign,
+            )  # type: ignore
+        )
 
 
 def order(
@@ -1485,46 +1636,20 @@ def order(
         KisMarketNotOpenedError: 시장이 열리지 않은 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
-    if market == "KRX":
-        return domestic_order(
+    return self.execute(
+        order_plan(
             self,
-            account=account,
-            symbol=symbol,
-            order=order,
+            account,
+            market,
+            symbol,
+            order,
             price=price,
             qty=qty,
             condition=condition,
             execution=execution,
             include_foreign=include_foreign,
-        )  # type: ignore
-    else:
-        if condition == "extended":
-            if execution is not None:
-                raise ValueError("주간거래 주문에서는 체결조건을 지정할 수 없습니다.")
-
-            return foreign_daytime_order(
-                self,
-                account=account,
-                market=market,
-                symbol=symbol,
-                order=order,
-                price=price,
-                qty=qty,
-                include_foreign=include_foreign,
-            )  # type: ignore
-
-        return foreign_order(
-            self,
-            account=account,
-            market=market,
-            symbol=symbol,
-            order=order,
-            price=price,
-            qty=qty,
-            condition=condition,  # type: ignore
-            execution=execution,
-            include_foreign=include_foreign,
-        )  # type: ignore
+        )
+    )
 
 
 order_function = order
@@ -17,6 +17,7 @@ from pykis.api.stock.info import get_market_country
 from pykis.api.stock.market import DAYTIME_MARKETS, MARKET_TYPE, get_market_code
 from pykis.api.stock.quote import quote
 from pykis.client.exceptions import KisAPIError
+from pykis.client.spec import KisRequestPlan, KisRequestSpec
 from pykis.responses.response import KisAPIResponse
 from pykis.responses.types import KisString
 from pykis.utils.timezone import TIMEZONE
@@ -188,6 +189,35 @@ def domestic_modify_order(
     )
 
 
+def domestic_cancel_order_plan(
+    self: "PyKis",
+    order: KisOrderNumber,
+) -> KisRequestPlan[KisDomesticModifyOrder]:
+    """국내 주식 주문취소 요청 계획 (`domestic_cancel_order`)"""
+    return (
+        yield KisRequestSpec(
+            "/uapi/domestic-stock/v1/trading/order-rvsecncl",
+            api="VTTC0803U" if self.virtual else "TTTC0803U",
+            body={
+                "KRX_FWDG_ORD_ORGNO": order.branch,
+                "ORGN_ODNO": order.number,
+                "ORD_DVSN": "00",
+                "RVSE_CNCL_DVSN_CD": "02",
+                "ORD_QTY": "0",
+                "ORD_UNPR": "0",
+                "QTY_ALL_ORD_YN": "Y",
+            },
+            form=[order.account_number],
+            response_type=KisDomesticModifyOrder(
+                account_number=order.account_number,
+                symbol=order.symbol,
+                market="KRX",
+            ),
+            method="POST",
+        )
+    )
+
+
 def domestic_cancel_order(
     self: "PyKis",
     order: KisOrderNumber,
@@ -201,26 +231,7 @@ def domestic_cancel_order(
     Args:
         order (KisOrderNumber): 주문번호
     """
-    return self.fetch(
-        "/uapi/domestic-stock/v1/trading/order-rvsecncl",
-        api="VTTC0803U" if self.virtual else "TTTC0803U",
-        body={
-            "KRX_FWDG_ORD_ORGNO": order.branch,
-            "ORGN_ODNO": order.number,
-            "ORD_DVSN": "00",
-            "RVSE_CNCL_DVSN_CD": "02",
-            "ORD_QTY": "0",
-            "ORD_UNPR": "0",
-            "QTY_ALL_ORD_YN": "Y",
-        },
-        form=[order.account_number],
-        response_type=KisDomesticModifyOrder(
-            account_number=order.account_number,
-            symbol=order.symbol,
-            market="KRX",
-        ),
-        method="POST",
-    )
+    return self.execute(domestic_cancel_order_plan(self, order))
 
 
 FOREIGN_ORDER_MODIFY_API_CODES: dict[tuple[bool, MARKET_TYPE, Literal["modify", "cancel"]], str] = {
@@ -347,6 +358,39 @@ def foreign_modify_order(
     )
 
 
+def foreign_cancel_order_plan(
+    self: "PyKis",
+    order: KisOrderNumber,
+) -> KisRequestPlan[KisForeignModifyOrder]:
+    """해외 주식 주문취소 요청 계획 (`foreign_cancel_order`)"""
+    api = FOREIGN_ORDER_MODIFY_API_CODES.get((not self.virtual, order.market, "cancel"))
+
+    if not api:
+        raise ValueError("해당 시장은 취소 주문을 지원하지 않습니다.")
+
+    return (
+        yield KisRequestSpec(
+            "/uapi/overseas-stock/v1/trading/order-rvsecncl",
+            api=api,
+            body={
+                "OVRS_EXCG_CD": get_market_code(order.market),
+                "PDNO": order.symbol,
+                "ORGN_ODNO": order.number,
+                "RVSE_CNCL_DVSN_CD": "02",
+                "ORD_QTY": "0",
+                "OVRS_ORD_UNPR": "0",
+            },
+            form=[order.account_number],
+            response_type=KisForeignModifyOrder(
+                account_number=order.account_number,
+                symbol=order.symbol,
+                market=order.market,
+            ),
+            method="POST",
+        )
+    )
+
+
 def foreign_cancel_order(
     self: "PyKis",
     order: KisOrderNumber,
@@ -360,30 +404,7 @@ def foreign_cancel_order(
     Args:
         order (KisOrderNumber): 주문번호
     """
-    api = FOREIGN_ORDER_MODIFY_API_CODES.get((not self.virtual, order.market, "cancel"))
-
-    if not api:
-        raise ValueError("해당 시장은 취소 주문을 지원하지 않습니다.")
-
-    return self.fetch(
-        "/uapi/overseas-stock/v1/trading/order-rvsecncl",
-        api=api,
-        body={
-            "OVRS_EXCG_CD": get_market_code(order.market),
-            "PDNO": order.symbol,
-            "ORGN_ODNO": order.number,
-            "RVSE_CNCL_DVSN_CD": "02",
-            "ORD_QTY": "0",
-            "OVRS_ORD_UNPR": "0",
-        },
-        form=[order.account_number],
-        response_type=KisForeignModifyOrder(
-            account_number=order.account_number,
-            symbol=order.symbol,
-            market=order.market,
-        ),
-        method="POST",
-    )
+    return self.execute(foreign_cancel_order_plan(self, order))
 
 
 def foreign_daytime_modify_order(
@@ -464,60 +485,72 @@ def foreign_daytime_modify_order(
     )
 
 
-def foreign_daytime_cancel_order(
+def foreign_daytime_cancel_order_plan(
     self: "PyKis",
     order: KisOrderNumber,
-) -> KisForeignModifyOrder:
-    """
-    한국투자증권 해외 주식 주문취소
-
-    국내주식주문 -> 해외주식 미국주간정정취소[v1_해외주식-027] (모의투자 미지원)
-    (업데이트 날짜: 2024/04/02)
-
-    Args:
-        order (KisOrderNumber): 주문번호
-    """
+) -> KisRequestPlan[KisForeignModifyOrder]:
+    """해외 주간거래 주문취소 요청 계획 (`foreign_daytime_cancel_order`)"""
     if order.market not in DAYTIME_MARKETS:
         raise ValueError("해당 시장은 주간거래를 지원하지 않습니다.")
 
     if self.virtual:
         raise NotImplementedError("모의투자에서는 주간거래 정정 주문을 지원하지 않습니다.")
 
-    from pykis.api.account.pending_order import pending_orders
+    from pykis.api.account.pending_order import pending_orders_plan
 
-    order_info = pending_orders(
-        self,
-        account=order.account_number,
-        country=get_market_country(order.market),
+    order_info = (
+        yield pending_orders_plan(
+            self,
+            account=order.account_number,
+            country=get_market_country(order.market),
+        )
     ).order(order)
 
     if not order_info:
         raise ValueError("주문정보를 찾을 수 없습니다. 이미 체결되었거나 취소된 주문일 수 있습니다.")
 
-    return self.fetch(
-        "/uapi/overseas-stock/v1/trading/daytime-order-rvsecncl",
-        api="TTTS6038U",
-        body={
-            "OVRS_EXCG_CD": get_market_code(order.market),
-            "PDNO": order.symbol,
-            "ORGN_ODNO": order.number,
-            "RVSE_CNCL_DVSN_CD": "02",
-            "ORD_QTY": str(int(order_info.qty)),
-            "OVRS_ORD_UNPR": "0",
-            "CTAC_TLNO": "",
-            "MGCO_APTM_ODNO": "",
-            "ORD_SVR_DVSN_CD": "0",
-        },
-        form=[order.account_number],
-        response_type=KisForeignModifyOrder(
-            account_number=order.account_number,
-            symbol=order.symbol,
-            market=order.market,
-        ),
-        method="POST",
+    return (
+        yield KisRequestSpec(
+            "/uapi/overseas-stock/v1/trading/daytime-order-rvsecncl",
+            api="TTTS6038U",
+            body={
+                "OVRS_EXCG_CD": get_market_code(order.market),
+                "PDNO": order.symbol,
+                "ORGN_ODNO": order.number,
+                "RVSE_CNCL_DVSN_CD": "02",
+                "ORD_QTY": str(int(order_info.qty)),
+                "OVRS_ORD_UNPR": "0",
+                "CTAC_TLNO": "",
+                "MGCO_APTM_ODNO": "",
+                "ORD_SVR_DVSN_CD": "0",
+            },
+            form=[order.account_number],
+            response_type=KisForeignModifyOrder(
+                account_number=order.account_number,
+                symbol=order.symbol,
+                market=order.market,
+            ),
+            method="POST",
+        )
     )
 
 
+def foreign_daytime_cancel_order(
+    self: "PyKis",
+    order: KisOrderNumber,
+) -> KisForeignModifyOrder:
+    """
+    한국투자증권 해외 주식 주문취소
+
+    국내주식주문 -> 해외주식 미국주간정정취소[v1_해외주식-027] (모의투자 미지원)
+    (업데이트 날짜: 2024/04/02)
+
+    Args:
+        order (KisOrderNumber): 주문번호
+    """
+    return self.execute(foreign_daytime_cancel_order_plan(self, order))
+
+
 def modify_order(
     self: "PyKis",
     order: KisOrderNumber,
@@ -604,6 +637,23 @@ def account_modify_order(
     )
 
 
+def cancel_order_plan(
+    self: "PyKis",
+    order: KisOrderNumber,
+) -> KisRequestPlan[KisOrder]:
+    """통합 주식 주문취소 요청 계획 (`cancel_order`)"""
+    if order.market == "KRX":
+        return (yield domestic_cancel_order_plan(self, order=order))
+
+    try:
+        return (yield foreign_cancel_order_plan(self, order=order))
+    except KisAPIError as e:
+        if e.error_code != "APBK0918":
+            raise e
+
+        return (yield foreign_daytime_cancel_order_plan(self, order=order))
+
+
 def cancel_order(
     self: "PyKis",
     order: KisOrderNumber,
@@ -618,16 +668,7 @@ def cancel_order(
     Args:
         order (KisOrderNumber): 주문번호
     """
-    if order.market == "KRX":
-        return domestic_cancel_order(self, order=order)
-
-    try:
-        return foreign_cancel_order(self, order=order)
-    except KisAPIError as e:
-        if e.error_code != "APBK0918":
-            raise e
-
-        return foreign_daytime_cancel_order(self, order=order)
+    return self.execute(cancel_order_plan(self, order))
 
 
 def account_cancel_order(
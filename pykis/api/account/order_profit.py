@@ -21,7 +21,7 @@ from pykis.client.account import KisAccountNumber
 from pykis.client.page import KisPage
 from pykis.responses.dynamic import KisDynamic, KisList, KisTransform
 from pykis.responses.response import KisPaginationAPIResponse
-from pykis.responses.types import KisAny, KisDecimal, KisString
+from pykis.responses.types import KisAny, KisDecimal, KisString, parse_datetime
 from pykis.utils.math import safe_divide
 from pykis.utils.repr import kis_repr
 from pykis.utils.timezone import TIMEZONE
@@ -308,7 +308,7 @@ class KisDomesticOrderProfit(KisDynamic, KisOrderProfitBase):
 
     time: datetime
     """시간 (현지시간)"""
-    time_kst: datetime = KisTransform(lambda x: datetime.strptime(x["trad_dt"], "%Y%m%d").replace(tzinfo=TIMEZONE))()
+    time_kst: datetime = KisTransform(lambda x: parse_datetime(x["trad_dt"], "%Y%m%d", TIMEZONE))()
     """시간 (한국시간)"""
     timezone: ZoneInfo = TIMEZONE
     """시간대"""
@@ -387,7 +387,7 @@ class KisForeignOrderProfit(KisDynamic, KisOrderProfitBase):
 
     time: datetime
     """시간 (현지시간)"""
-    time_kst: datetime = KisTransform(lambda x: datetime.strptime(x["trad_day"], "%Y%m%d").replace(tzinfo=TIMEZONE))()
+    time_kst: datetime = KisTransform(lambda x: parse_datetime(x["trad_day"], "%Y%m%d", TIMEZONE))()
     """시간 (한국시간)"""
     timezone: ZoneInfo = KisAny(get_market_code_timezone)["ovrs_excg_cd"]
     """시간대"""
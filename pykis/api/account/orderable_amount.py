@@ -16,8 +16,9 @@ from pykis.api.base.account_product import (
     KisAccountProductProtocol,
 )
 from pykis.api.stock.market import MARKET_TYPE, get_market_code
-from pykis.api.stock.quote import quote
+from pykis.api.stock.quote import quote_plan
 from pykis.client.account import KisAccountNumber
+from pykis.client.spec import KisRequestPlan, KisRequestSpec
 from pykis.responses.response import (
     KisAPIResponse,
     KisResponseProtocol,
@@ -351,7 +352,7 @@ class KisForeignOrderableAmount(KisAPIResponse, KisOrderableAmountBase):
         super().__pre_init__(data)
 
 
-def _domestic_orderable_amount(
+def _domestic_orderable_amount_plan(
     self: "PyKis",
     account: str | KisAccountNumber,
     symbol: str,
@@ -359,7 +360,8 @@ def _domestic_orderable_amount(
     condition: DOMESTIC_ORDER_CONDITION | None = None,
     execution: ORDER_EXECUTION | None = None,
     foreign: bool = False,
-) -> KisDomesticOrderableAmount:
+) -> KisRequestPlan[KisDomesticOrderableAmount]:
+    """국내 주식 주문가능금액 조회 요청 계획 (`_domestic_orderable_amount`)"""
     if not account:
         raise ValueError("계좌번호를 입력해주세요.")
 
@@ -381,7 +383,7 @@ def _domestic_orderable_amount(
         account = KisAccountNumber(account)
 
     if price_setting:
-        price = quote(self, symbol=symbol, market="KRX").close
+        price = (yield quote_plan(self, symbol=symbol, market="KRX")).close
 
     result = KisDomesticOrderableAmount(
         account_number=account,
@@ -392,20 +394,84 @@ def _domestic_orderable_amount(
         execution=execution,
     )
 
-    return self.fetch(
-        "/uapi/domestic-stock/v1/trading/inquire-psbl-order",
-        api="VTTC8908R" if self.virtual else "TTTC8908R",
-        form=[account],
-        params={
-            "PDNO": symbol,
-            "ORD_UNPR": str(price) if price else "0",
-            "ORD_DVSN": condition_code,
-            "CMA_EVLU_AMT_ICLD_YN": "N",
-            "OVRS_ICLD_YN": "Y" if foreign else "N",
-        },
-        response_type=result,
+    return (
+        yield KisRequestSpec(
+            "/uapi/domestic-stock/v1/trading/inquire-psbl-order",
+            api="VTTC8908R" if self.virtual else "TTTC8908R",
+            form=[account],
+            params={
+                "PDNO": symbol,
+                "ORD_UNPR": str(price) if price else "0",
+                "ORD_DVSN": condition_code,
+                "CMA_EVLU_AMT_ICLD_YN": "N",
+                "OVRS_ICLD_YN": "Y" if foreign else "N",
+            },
+            response_type=result,
+        )
+    )
+
+
+def _domestic_orderable_amount(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    symbol: str,
+    price: ORDER_PRICE | None = None,
+    condition: DOMESTIC_ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    foreign: bool = False,
+) -> KisDomesticOrderableAmount:
+    return self.execute(
+        _domestic_orderable_amount_plan(
+            self,
+            account,
+            symbol,
+            price=price,
+            condition=condition,
+            execution=execution,
+            foreign=foreign,
+        )
+    )
+
+
+def domestic_orderable_amount_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    symbol: str,
+    price: ORDER_PRICE | None = None,
+    condition: DOMESTIC_ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    foreign: bool = False,
+) -> KisRequestPlan[KisDomesticOrderableAmount]:
+    """
+    국내 주식 주문가능금액 조회 요청 계획 (`domestic_orderable_amount`)
+
+    Args:
+        foreign (bool, optional): 통합 주문가능수량(`foreign_quantity`)을 함께 조회할지 여부
+    """
+    result = yield _domestic_orderable_amount_plan(
+        self,
+        account,
+        symbol,
+        price=price,
+        condition=condition,
+        execution=execution,
+        foreign=False,
     )
 
+    if foreign:
+        # 비동기 API에서 동기 API를 호출하는 cached_property를 미리 채워둡니다.
+        result.__dict__["_foreign"] = yield _domestic_orderable_amount_plan(
+            self,
+            account,
+            symbol,
+            price=price,
+            condition=condition,
+            execution=execution,
+            foreign=True,
+        )
+
+    return result
+
 
 def domestic_orderable_amount(
     self: "PyKis",
@@ -449,15 +515,78 @@ def domestic_orderable_amount(
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 주문조건이 잘못된 경우
     """
+    return self.execute(
+        domestic_orderable_amount_plan(self, account, symbol, price=price, condition=condition, execution=execution)
+    )
 
-    return _domestic_orderable_amount(
-        self,
-        account,
-        symbol,
+
+def foreign_orderable_amount_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE,
+    symbol: str,
+    price: ORDER_PRICE | None = None,
+    condition: ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+) -> KisRequestPlan[KisForeignOrderableAmount]:
+    """해외 주식 주문가능금액 조회 요청 계획 (`foreign_orderable_amount`)"""
+    if not account:
+        raise ValueError("계좌번호를 입력해주세요.")
+
+    if not symbol:
+        raise ValueError("종목코드를 입력해주세요.")
+
+    price = None if price is None else ensure_price(price)
+
+    # 주문조건보장
+    if condition != "extended":
+        order_condition(
+            virtual=self.virtual,
+            market=market,
+            order="buy",
+            price=price,
+            condition=condition,
+            execution=execution,
+        )
+
+    if not isinstance(account, KisAccountNumber):
+        account = KisAccountNumber(account)
+
+    unit_price = (
+        (
+            yield quote_plan(
+                self,
+                symbol=symbol,
+                market=market,
+                extended=condition == "extended",
+            )
+        ).close
+        if not price
+        else price
+    )
+
+    result = KisForeignOrderableAmount(
+        account_number=account,
+        symbol=symbol,
+        market=market,
         price=price,
+        unit_price=unit_price,
         condition=condition,
         execution=execution,
-        foreign=False,
+    )
+
+    return (
+        yield KisRequestSpec(
+            "/uapi/overseas-stock/v1/trading/inquire-psamount",
+            api="VTTS3007R" if self.virtual else "TTTS3007R",
+            form=[account],
+            params={
+                "OVRS_EXCG_CD": get_market_code(market),
+                "OVRS_ORD_UNPR": str(unit_price),
+                "ITEM_CD": symbol,
+            },
+            response_type=result,
+        )
     )
 
 
@@ -511,60 +640,59 @@ def foreign_orderable_amount(
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 주문조건이 잘못된 경우
     """
-    if not account:
-        raise ValueError("계좌번호를 입력해주세요.")
-
-    if not symbol:
-        raise ValueError("종목코드를 입력해주세요.")
-
-    price = None if price is None else ensure_price(price)
-
-    # 주문조건보장
-    if condition != "extended":
-        order_condition(
-            virtual=self.virtual,
-            market=market,
-            order="buy",
+    return self.execute(
+        foreign_orderable_amount_plan(
+            self,
+            account,
+            market,
+            symbol,
             price=price,
             condition=condition,
             execution=execution,
         )
-
-    if not isinstance(account, KisAccountNumber):
-        account = KisAccountNumber(account)
-
-    unit_price = (
-        quote(
-            self,
-            symbol=symbol,
-            market=market,
-            extended=condition == "extended",
-        ).close
-        if not price
-        else price
     )
 
-    result = KisForeignOrderableAmount(
-        account_number=account,
-        symbol=symbol,
-        market=market,
-        price=price,
-        unit_price=unit_price,
-        condition=condition,
-        execution=execution,
-    )
 
-    return self.fetch(
-        "/uapi/overseas-stock/v1/trading/inquire-psamount",
-        api="VTTS3007R" if self.virtual else "TTTS3007R",
-        form=[account],
-        params={
-            "OVRS_EXCG_CD": get_market_code(market),
-            "OVRS_ORD_UNPR": str(unit_price),
-            "ITEM_CD": symbol,
-        },
-        response_type=result,
-    )
+def orderable_amount_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE,
+    symbol: str,
+    price: ORDER_PRICE | None = None,
+    condition: ORDER_CONDITION | None = None,
+    execution: ORDER_EXECUTION | None = None,
+    foreign: bool = False,
+) -> KisRequestPlan[KisOrderableAmountResponse]:
+    """
+    주문가능금액 조회 요청 계획 (`orderable_amount`)
+
+    Args:
+        foreign (bool, optional): 국내 주식인 경우 통합 주문가능수량(`foreign_quantity`)을 함께 조회할지 여부
+    """
+    if market == "KRX":
+        return (
+            yield domestic_orderable_amount_plan(
+                self,
+                account,
+                symbol,
+                price=price,
+                condition=condition,  # type: ignore
+                execution=execution,
+                foreign=foreign,
+            )
+        )
+    else:
+        return (
+            yield foreign_orderable_amount_plan(
+                self,
+                account,
+                market,
+                symbol,
+                price=price,
+                condition=condition,  # type: ignore
+                execution=execution,
+            )
+        )
 
 
 def orderable_amount(
@@ -629,25 +757,9 @@ def orderable_amount(
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 주문조건이 잘못된 경우
     """
-    if market == "KRX":
-        return domestic_orderable_amount(
-            self,
-            account,
-            symbol,
-            price=price,
-            condition=condition,  # type: ignore
-            execution=execution,
-        )
-    else:
-        return foreign_orderable_amount(
-            self,
-            account,
-            market,
-            symbol,
-            price=price,
-            condition=condition,  # type: ignore
-            execution=execution,
-        )
+    return self.execute(
+        orderable_amount_plan(self, account, market, symbol, price=price, condition=condition, execution=execution)
+    )
 
 
 def account_orderable_amount(
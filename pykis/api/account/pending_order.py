@@ -36,10 +36,11 @@ from pykis.api.stock.market import (
 )
 from pykis.client.account import KisAccountNumber
 from pykis.client.page import KisPage
+from pykis.client.spec import KisRequestPlan, KisRequestSpec
 from pykis.event.filters.order import KisOrderNumberEventFilter
 from pykis.responses.dynamic import KisDynamic, KisList
 from pykis.responses.response import KisPaginationAPIResponse
-from pykis.responses.types import KisAny, KisDecimal, KisString
+from pykis.responses.types import KisAny, KisDecimal, KisString, parse_time, today
 from pykis.utils.repr import kis_repr
 from pykis.utils.timezone import TIMEZONE
 from pykis.utils.typing import Checkable
@@ -475,8 +476,8 @@ class KisDomesticPendingOrder(KisDynamic, KisPendingOrderBase):
         super().__pre_init__(data)
 
         self.time_kst = self.time = datetime.combine(
-            datetime.now(TIMEZONE).date(),
-            datetime.strptime(data["ord_tmd"], "%H%M%S").time(),
+            today(TIMEZONE),
+            parse_time(data["ord_tmd"], "%H%M%S"),
             tzinfo=TIMEZONE,
         )
 
@@ -579,8 +580,8 @@ class KisForeignPendingOrder(KisDynamic, KisPendingOrderBase):
         super().__pre_init__(data)
 
         self.time_kst = datetime.combine(
-            datetime.now(TIMEZONE).date(),
-            datetime.strptime(data["ord_tmd"], "%H%M%S").time(),
+            today(TIMEZONE),
+            parse_time(data["ord_tmd"], "%H%M%S"),
             tzinfo=TIMEZONE,
         )
 
@@ -671,27 +672,13 @@ class KisSimplePendingOrders(KisPendingOrdersBase):
         self.orders.sort(key=lambda x: x.time_kst, reverse=True)
 
 
-def domestic_pending_orders(
+def domestic_pending_orders_plan(
     self: "PyKis",
     account: str | KisAccountNumber,
     page: KisPage | None = None,
     continuous: bool = True,
-) -> KisDomesticPendingOrders:
-    """
-    한국투자증권 국내 주식 미체결 조회 (모의투자 미지원)
-
-    국내주식주문 -> 주식정정취소가능주문조회[v1_국내주식-004]
-    (업데이트 날짜: 2024/03/31)
-
-    Args:
-        account (str | KisAccountNumber): 계좌번호
-        page (KisPage, optional): 페이지 정보
-        continuous (bool, optional): 연속조회 여부
-
-    Raises:
-        KisAPIError: API 호출에 실패한 경우
-        ValueError: 계좌번호가 잘못된 경우
-    """
+) -> KisRequestPlan[KisDomesticPendingOrders]:
+    """국내 주식 미체결 조회 요청 계획 (`domestic_pending_orders`)"""
     if self.virtual:
         raise NotImplementedError("모의투자에서는 미체결 주문 조회를 지원하지 않습니다.")
 
@@ -702,7 +689,7 @@ def domestic_pending_orders(
     first = None
 
     while True:
-        result = self.fetch(
+        result = yield KisRequestSpec(
             "/uapi/domestic-stock/v1/trading/inquire-psbl-rvsecncl",
             api="TTTC8036R",
             params={
@@ -732,22 +719,20 @@ def domestic_pending_orders(
     return first
 
 
-def _foreign_pending_orders(
+def domestic_pending_orders(
     self: "PyKis",
     account: str | KisAccountNumber,
-    market: MARKET_TYPE | None = None,
     page: KisPage | None = None,
     continuous: bool = True,
-) -> KisForeignPendingOrders:
+) -> KisDomesticPendingOrders:
     """
-    한국투자증권 해외 주식 미체결 조회
+    한국투자증권 국내 주식 미체결 조회 (모의투자 미지원)
 
-    국내주식주문 -> 해외주식 미체결내역[v1_해외주식-005]
-    (업데이트 날짜: 2024/04/01)
+    국내주식주문 -> 주식정정취소가능주문조회[v1_국내주식-004]
+    (업데이트 날짜: 2024/03/31)
 
     Args:
         account (str | KisAccountNumber): 계좌번호
-        market (MARKET_TYPE, optional): 시장코드
         page (KisPage, optional): 페이지 정보
         continuous (bool, optional): 연속조회 여부
 
@@ -755,6 +740,17 @@ def _foreign_pending_orders(
         KisAPIError: API 호출에 실패한 경우
         ValueError: 계좌번호가 잘못된 경우
     """
+    return self.execute(domestic_pending_orders_plan(self, account, page=page, continuous=continuous))
+
+
+def _foreign_pending_orders_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    market: MARKET_TYPE | None = None,
+    page: KisPage | None = None,
+    continuous: bool = True,
+) -> KisRequestPlan[KisForeignPendingOrders]:
+    """해외 주식 미체결 조회 요청 계획 (`_foreign_pending_orders`)"""
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
@@ -762,7 +758,7 @@ def _foreign_pending_orders(
     first = None
 
     while True:
-        result = self.fetch(
+        result = yield KisRequestSpec(
             "/uapi/overseas-stock/v1/trading/inquire-nccs",
             api="VTTS3018R" if self.virtual else "TTTS3018R",
             params={
@@ -792,21 +788,12 @@ def _foreign_pending_orders(
     return first
 
 
-FOREIGN_COUNTRY_MARKET_MAP: dict[str | None, list[MARKET_TYPE | None]] = {
-    # 국가코드 -> 조회시장코드
-    None: [None],
-    "US": ["NASDAQ"],
-    "HK": ["HKEX"],
-    "CN": ["SSE", "SZSE"],
-    "JP": ["TYO"],
-    "VN": ["HSX", "HNX"],
-}
-
-
-def foreign_pending_orders(
+def _foreign_pending_orders(
     self: "PyKis",
     account: str | KisAccountNumber,
-    country: COUNTRY_TYPE | None = None,
+    market: MARKET_TYPE | None = None,
+    page: KisPage | None = None,
+    continuous: bool = True,
 ) -> KisForeignPendingOrders:
     """
     한국투자증권 해외 주식 미체결 조회
@@ -816,18 +803,40 @@ def foreign_pending_orders(
 
     Args:
         account (str | KisAccountNumber): 계좌번호
-        country (COUNTRY_TYPE, optional): 국가코드
+        market (MARKET_TYPE, optional): 시장코드
+        page (KisPage, optional): 페이지 정보
+        continuous (bool, optional): 연속조회 여부
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         ValueError: 계좌번호가 잘못된 경우
     """
+    return self.execute(_foreign_pending_orders_plan(self, account, market, page=page, continuous=continuous))
+
+
+FOREIGN_COUNTRY_MARKET_MAP: dict[str | None, list[MARKET_TYPE | None]] = {
+    # 국가코드 -> 조회시장코드
+    None: [None],
+    "US": ["NASDAQ"],
+    "HK": ["HKEX"],
+    "CN": ["SSE", "SZSE"],
+    "JP": ["TYO"],
+    "VN": ["HSX", "HNX"],
+}
+
+
+def foreign_pending_orders_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+) -> KisRequestPlan[KisForeignPendingOrders]:
+    """해외 주식 미체결 조회 요청 계획 (`foreign_pending_orders`)"""
     markets = FOREIGN_COUNTRY_MARKET_MAP.get(country, FOREIGN_COUNTRY_MARKET_MAP[None])
 
     first = None
 
     for market in markets:
-        result = _foreign_pending_orders(self, account, market)
+        result = yield _foreign_pending_orders_plan(self, account, market)
 
         if first is None:
             first = result
@@ -840,16 +849,15 @@ def foreign_pending_orders(
     return first
 
 
-def pending_orders(
+def foreign_pending_orders(
     self: "PyKis",
     account: str | KisAccountNumber,
     country: COUNTRY_TYPE | None = None,
-) -> KisPendingOrders:
+) -> KisForeignPendingOrders:
     """
-    한국투자증권 통합 미체결 조회
+    한국투자증권 해외 주식 미체결 조회
 
-    국내주식주문 -> 주식정정취소가능주문조회[v1_국내주식-004] (모의투자 미지원)
-    해외주식주문 -> 해외주식 미체결내역[v1_해외주식-005]
+    국내주식주문 -> 해외주식 미체결내역[v1_해외주식-005]
     (업데이트 날짜: 2024/04/01)
 
     Args:
@@ -860,20 +868,52 @@ def pending_orders(
         KisAPIError: API 호출에 실패한 경우
         ValueError: 계좌번호가 잘못된 경우
     """
+    return self.execute(foreign_pending_orders_plan(self, account, country))
+
+
+def pending_orders_plan(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+) -> KisRequestPlan[KisPendingOrders]:
+    """통합 미체결 조회 요청 계획 (`pending_orders`)"""
     if not isinstance(account, KisAccountNumber):
         account = KisAccountNumber(account)
 
     if country is None and not self.virtual:
-        return KisIntegrationPendingOrders(
-            self,
-            account,
-            domestic_pending_orders(self, account),
-            foreign_pending_orders(self, account),
+        # 비동기 API에서는 국내, 해외 미체결 주문을 동시에 조회합니다.
+        domestic, foreign = yield (
+            domestic_pending_orders_plan(self, account),
+            foreign_pending_orders_plan(self, account),
         )
+        return KisIntegrationPendingOrders(self, account, domestic, foreign)
     elif country == "KR":
-        return domestic_pending_orders(self, account)
+        return (yield domestic_pending_orders_plan(self, account))
     else:
-        return foreign_pending_orders(self, account, country)
+        return (yield foreign_pending_orders_plan(self, account, country))
+
+
+def pending_orders(
+    self: "PyKis",
+    account: str | KisAccountNumber,
+    country: COUNTRY_TYPE | None = None,
+) -> KisPendingOrders:
+    """
+    한국투자증권 통합 미체결 조회
+
+    국내주식주문 -> 주식정정취소가능주문조회[v1_국내주식-004] (모의투자 미지원)
+    해외주식주문 -> 해외주식 미체결내역[v1_해외주식-005]
+    (업데이트 날짜: 2024/04/01)
+
+    Args:
+        account (str | KisAccountNumber): 계좌번호
+        country (COUNTRY_TYPE, optional): 국가코드
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        ValueError: 계좌번호가 잘못된 경우
+    """
+    return self.execute(pending_orders_plan(self, account, country))
 
 
 def account_pending_orders(
@@ -1,4 +1,3 @@
-import json
 from datetime import datetime, timedelta
 from os import PathLike
 from typing import TYPE_CHECKING, Any, Literal
@@ -6,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Literal
 from pykis.client.form import KisForm
 from pykis.responses.dynamic import KisObject
 from pykis.responses.types import KisDatetime, KisDynamic, KisInt, KisString
+from pykis.utils.codec import KisJSONCodec, get_json_codec
 from pykis.utils.timezone import TIMEZONE
 
 if TYPE_CHECKING:
@@ -54,17 +54,29 @@ class KisAccessToken(KisDynamic, KisForm):
     def __repr__(self) -> str:
         return f"<KisAccessToken {self.type} expired_at={self.expired_at}>"
 
-    def save(self, path: str | PathLike[str]):
-        """접속 토큰을 파일로 저장합니다."""
-        with open(path, "w") as f:
-            json.dump(self.raw(), f)
+    def save(self, path: str | PathLike[str], codec: KisJSONCodec | None = None):
+        """
+        접속 토큰을 파일로 저장합니다.
+
+        Args:
+            path: 파일 경로
+            codec: JSON 변환 객체. None일 경우 기본 JSON 변환 객체를 사용합니다.
+        """
+        with open(path, "wb") as f:
+            f.write((codec or get_json_codec()).dumps(self.raw()))
 
     @classmethod
-    def load(cls, path: str | PathLike[str]):
-        """파일에서 접속 토큰을 불러옵니다."""
-        with open(path) as f:
+    def load(cls, path: str | PathLike[str], codec: KisJSONCodec | None = None):
+        """
+        파일에서 접속 토큰을 불러옵니다.
+
+        Args:
+            path: 파일 경로
+            codec: JSON 변환 객체. None일 경우 기본 JSON 변환 객체를 사용합니다.
+        """
+        with open(path, "rb") as f:
             return KisObject.transform_(
-                json.load(f),
+                (codec or get_json_codec()).loads(f.read()),
                 cls,
             )
 
@@ -87,6 +99,8 @@ def token_issue(self: "PyKis", domain: Literal["real", "virtual"] | None = None)
         domain=domain,
         auth=False,
         verbose=False,
+        # 토큰 파일 저장에 원본 응답 데이터가 필요합니다.
+        raw_retention="full",
     )
 
 
@@ -4,6 +4,7 @@ from pykis.responses.dynamic import KisDynamic
 from pykis.responses.types import KisString
 
 if TYPE_CHECKING:
+    from pykis.client.appkey import KisKey
     from pykis.kis import PyKis
 
 __all__ = [
@@ -20,15 +21,22 @@ class KisWebsocketApprovalKey(KisDynamic):
 
 
 def websocket_approval_key(
-    self: "PyKis", domain: Literal["real", "virtual"] | None = None
+    self: "PyKis",
+    domain: Literal["real", "virtual"] | None = None,
+    appkey: "KisKey | None" = None,
 ) -> KisWebsocketApprovalKey:
     """
     웹소켓 접속 키를 발급합니다.
 
     OAuth인증 -> 실시간 (웹소켓) 접속키 발급[실시간-000]
     (업데이트 날짜: 2024/04/04)
+
+    Args:
+        domain (Literal["real", "virtual"] | None): 도메인
+        appkey (KisKey | None): 접속 키를 발급할 앱 키. 기본값은 도메인의 앱 키입니다.
     """
-    appkey = self.appkey if domain == "real" else self.virtual_appkey
+    if appkey is None:
+        appkey = self.appkey if domain == "real" else self.virtual_appkey
 
     if appkey is None:
         raise ValueError("모의도메인 appkey가 없습니다.")
@@ -15,6 +15,7 @@ from pykis.api.stock.quote import (
     STOCK_SIGN_TYPE_KOR_MAP,
     STOCK_SIGN_TYPE_MAP,
 )
+from pykis.client.spec import KisRequestPlan, KisRequestSpec
 from pykis.responses.dynamic import KisDynamic, KisList
 from pykis.responses.response import KisResponse, raise_not_found
 from pykis.responses.types import KisAny, KisDatetime, KisDecimal, KisInt
@@ -225,32 +226,48 @@ def drop_after(
     return chart
 
 
-def domestic_daily_chart(
+def resample_yearly(chart: TChartBase, period_delta: timedelta) -> TChartBase:
+    """월봉 차트를 연봉 차트로 변환합니다."""
+    bars = []
+    best_bar = None
+    best_diff = 0
+    target_time = None
+
+    for bar in chart.bars:
+        if not target_time or not best_bar:
+            target_time = bar.time
+            best_bar = bar
+            best_diff = 0
+            continue
+
+        if bar.time.year != best_bar.time.year:
+            bars.append(best_bar)
+            target_time -= period_delta
+            best_diff = float("inf")
+
+        diff = abs((bar.time - target_time).days)
+
+        if diff < best_diff:
+            best_bar = bar
+            best_diff = diff
+
+    if best_bar != bars[-1]:
+        bars.append(best_bar)
+
+    chart.bars = bars
+
+    return chart
+
+
+def domestic_daily_chart_plan(
     self: "PyKis",
     symbol: str,
     start: date | timedelta | None = None,
     end: date | None = None,
     period: Literal["day", "week", "month", "year"] = "day",
     adjust: bool = False,
-) -> KisDomesticDailyChart:
-    """
-    한국투자증권 국내 기간 차트 조회
-
-    국내주식시세 -> 국내주식기간별시세(일/주/월/년)[v1_국내주식-016]
-    (업데이트 날짜: 2023-10-02)
-
-    Args:
-        symbol (str): 종목 코드
-        start (date, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
-        end (date, optional): 조회 종료 시간. Defaults to None.
-        period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
-        adjust (bool, optional): 수정 주가 여부. Defaults to False.
-
-    Raises:
-        KisAPIError: API 호출에 실패한 경우
-        KisNotFoundError: 조회 결과가 없는 경우
-        ValueError: 조회 파라미터가 올바르지 않은 경우
-    """
+) -> KisRequestPlan[KisDomesticDailyChart]:
+    """국내 기간 차트 조회 요청 계획 (`domestic_daily_chart`)"""
     if not symbol:
         raise ValueError("종목 코드를 입력해주세요.")
 
@@ -271,7 +288,7 @@ def domestic_daily_chart(
     period_delta = timedelta(days=1 if period == "day" else 7 if period == "week" else 30 if period == "month" else 365)
 
     while True:
-        result = self.fetch(
+        result = yield KisRequestSpec(
             "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice",
             api="FHKST03010100",
             params={
@@ -317,24 +334,22 @@ def domestic_daily_chart(
     )
 
 
-def foreign_daily_chart(
+def domestic_daily_chart(
     self: "PyKis",
     symbol: str,
-    market: MARKET_TYPE,
     start: date | timedelta | None = None,
     end: date | None = None,
     period: Literal["day", "week", "month", "year"] = "day",
     adjust: bool = False,
-) -> KisForeignDailyChart:
+) -> KisDomesticDailyChart:
     """
-    한국투자증권 해외 기간 차트 조회
+    한국투자증권 국내 기간 차트 조회
 
-    해외주식현재가 -> 해외주식 기간별시세[v1_해외주식-010]
-    (업데이트 날짜: 2023-10-03)
+    국내주식시세 -> 국내주식기간별시세(일/주/월/년)[v1_국내주식-016]
+    (업데이트 날짜: 2023-10-02)
 
     Args:
         symbol (str): 종목 코드
-        market (MARKET_TYPE): 시장 구분
         start (date, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
         end (date, optional): 조회 종료 시간. Defaults to None.
         period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
@@ -345,6 +360,19 @@ def foreign_daily_chart(
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 조회 파라미터가 올바르지 않은 경우
     """
+    return self.execute(domestic_daily_chart_plan(self, symbol, start=start, end=end, period=period, adjust=adjust))
+
+
+def foreign_daily_chart_plan(
+    self: "PyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    start: date | timedelta | None = None,
+    end: date | None = None,
+    period: Literal["day", "week", "month", "year"] = "day",
+    adjust: bool = False,
+) -> KisRequestPlan[KisForeignDailyChart]:
+    """해외 기간 차트 조회 요청 계획 (`foreign_daily_chart`)"""
     if not symbol:
         raise ValueError("종목 코드를 입력해주세요.")
 
@@ -362,7 +390,7 @@ def foreign_daily_chart(
     period_delta = timedelta(days=1 if period == "day" else 7 if period == "week" else 30)
 
     while True:
-        result = self.fetch(
+        result = yield KisRequestSpec(
             "/uapi/overseas-price/v1/quotations/dailyprice",
             api="HHDFS76240000",
             params={
@@ -403,33 +431,7 @@ def foreign_daily_chart(
         cursor = last - period_delta
 
     if period == "year":
-        bars = []
-        best_bar = None
-        best_diff = 0
-        target_time = None
-
-        for bar in chart.bars:
-            if not target_time or not best_bar:
-                target_time = bar.time
-                best_bar = bar
-                best_diff = 0
-                continue
-
-            if bar.time.year != best_bar.time.year:
-                bars.append(best_bar)
-                target_time -= period_delta
-                best_diff = float("inf")
-
-            diff = abs((bar.time - target_time).days)
-
-            if diff < best_diff:
-                best_bar = bar
-                best_diff = diff
-
-        if best_bar != bars[-1]:
-            bars.append(best_bar)
-
-        chart.bars = bars
+        resample_yearly(chart, period_delta)
 
     return drop_after(
         chart,
@@ -438,7 +440,7 @@ def foreign_daily_chart(
     )
 
 
-def daily_chart(
+def foreign_daily_chart(
     self: "PyKis",
     symbol: str,
     market: MARKET_TYPE,
@@ -446,12 +448,12 @@ def daily_chart(
     end: date | None = None,
     period: Literal["day", "week", "month", "year"] = "day",
     adjust: bool = False,
-) -> KisChart:
+) -> KisForeignDailyChart:
     """
-    한국투자증권 기간 차트 조회
+    한국투자증권 해외 기간 차트 조회
 
-    국내주식시세 -> 국내주식기간별시세(일/주/월/년)[v1_국내주식-016]
     해외주식현재가 -> 해외주식 기간별시세[v1_해외주식-010]
+    (업데이트 날짜: 2023-10-03)
 
     Args:
         symbol (str): 종목 코드
@@ -466,27 +468,77 @@ def daily_chart(
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 조회 파라미터가 올바르지 않은 경우
     """
+    return self.execute(
+        foreign_daily_chart_plan(self, symbol, market, start=start, end=end, period=period, adjust=adjust)
+    )
+
+
+def daily_chart_plan(
+    self: "PyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    start: date | timedelta | None = None,
+    end: date | None = None,
+    period: Literal["day", "week", "month", "year"] = "day",
+    adjust: bool = False,
+) -> KisRequestPlan[KisChart]:
+    """기간 차트 조회 요청 계획 (`daily_chart`)"""
     if market == "KRX":
-        return domestic_daily_chart(
-            self,
-            symbol,
-            start=start,
-            end=end,
-            period=period,
-            adjust=adjust,
+        return (
+            yield domestic_daily_chart_plan(
+                self,
+                symbol,
+                start=start,
+                end=end,
+                period=period,
+                adjust=adjust,
+            )
         )
     else:
-        return foreign_daily_chart(
-            self,
-            symbol,
-            market,
-            start=start,
-            end=end,
-            period=period,
-            adjust=adjust,
+        return (
+            yield foreign_daily_chart_plan(
+                self,
+                symbol,
+                market,
+                start=start,
+                end=end,
+                period=period,
+                adjust=adjust,
+            )
         )
 
 
+def daily_chart(
+    self: "PyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    start: date | timedelta | None = None,
+    end: date | None = None,
+    period: Literal["day", "week", "month", "year"] = "day",
+    adjust: bool = False,
+) -> KisChart:
+    """
+    한국투자증권 기간 차트 조회
+
+    국내주식시세 -> 국내주식기간별시세(일/주/월/년)[v1_국내주식-016]
+    해외주식현재가 -> 해외주식 기간별시세[v1_해외주식-010]
+
+    Args:
+        symbol (str): 종목 코드
+        market (MARKET_TYPE): 시장 구분
+        start (date, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
+        end (date, optional): 조회 종료 시간. Defaults to None.
+        period (Literal["day", "week", "month", "year"], optional): 조회 기간. Defaults to "day".
+        adjust (bool, optional): 수정 주가 여부. Defaults to False.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 조회 파라미터가 올바르지 않은 경우
+    """
+    return self.execute(daily_chart_plan(self, symbol, market, start=start, end=end, period=period, adjust=adjust))
+
+
 def product_daily_chart(
     self: "KisProductProtocol",
     start: date | timedelta | None = None,
@@ -7,9 +7,10 @@ from pykis.api.stock.chart import KisChart, KisChartBar, KisChartBarRepr, KisCha
 from pykis.api.stock.market import MARKET_SHORT_TYPE_MAP, MARKET_TYPE
 from pykis.api.stock.quote import STOCK_SIGN_TYPE, STOCK_SIGN_TYPE_KOR_MAP
 from pykis.api.stock.trading_hours import KisTradingHours, KisTradingHoursBase
+from pykis.client.spec import KisRequestPlan, KisRequestSpec
 from pykis.responses.dynamic import KisDynamic, KisList, KisObject, KisTransform
 from pykis.responses.response import KisAPIResponse, KisResponse, raise_not_found
-from pykis.responses.types import KisDecimal, KisInt, KisTime
+from pykis.responses.types import KisDecimal, KisInt, KisTime, parse_datetime
 from pykis.utils.timezone import TIMEZONE
 from pykis.utils.typing import Checkable
 
@@ -75,10 +76,11 @@ class KisDomesticDayChartBar(KisDynamic, KisDayChartBarBase):
     """한국투자증권 국내 당일 차트 봉"""
 
     time: datetime = KisTransform[
-        lambda x: datetime.strptime(
+        lambda x: parse_datetime(
             x["stck_bsop_date"] + x["stck_cntg_hour"],
             "%Y%m%d%H%M%S",
-        ).replace(tzinfo=TIMEZONE)
+            TIMEZONE,
+        )
     ]
     """시간"""
     time_kst: datetime  # __post_init__에서 값 설정
@@ -151,17 +153,18 @@ class KisForeignDayChartBar(KisDynamic, KisDayChartBarBase):
     """한국투자증권 해외 당일 차트 봉"""
 
     time: datetime = KisTransform[
-        lambda x: datetime.strptime(
+        lambda x: parse_datetime(
             x["xymd"] + x["xhms"],
             "%Y%m%d%H%M%S",
         )
     ]  #  KisForeignDayChart의 __post_init__에서 timezone 설정
     """시간 (현지시간)"""
     time_kst: datetime = KisTransform[
-        lambda x: datetime.strptime(
+        lambda x: parse_datetime(
             x["kymd"] + x["khms"],
             "%Y%m%d%H%M%S",
-        ).replace(tzinfo=TIMEZONE)
+            TIMEZONE,
+        )
     ]
     """시간 (한국시간)"""
     open: Decimal = KisDecimal["open"]
@@ -293,30 +296,14 @@ def drop_after(
     return chart
 
 
-def domestic_day_chart(
+def domestic_day_chart_plan(
     self: "PyKis",
     symbol: str,
     start: time | timedelta | None = None,
     end: time | None = None,
     period: int = 1,
-) -> KisDomesticDayChart:
-    """
-    한국투자증권 국내 당일 봉 차트 조회
-
-    국내주식시세 -> 주식당일분봉조회[v1_국내주식-022]
-    (업데이트 날짜: 2023/09/05)
-
-    Args:
-        symbol (str): 종목코드
-        start (time | timedelta, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
-        end (time, optional): 조회 종료 시간. Defaults to None.
-        period (int, optional): 조회 간격 (분). Defaults to 1.
-
-    Raises:
-        KisAPIError: API 호출에 실패한 경우
-        KisNotFoundError: 조회 결과가 없는 경우
-        ValueError: 조회 파라미터가 올바르지 않은 경우
-    """
+) -> KisRequestPlan[KisDomesticDayChart]:
+    """국내 당일 봉 차트 조회 요청 계획 (`domestic_day_chart`)"""
     if not symbol:
         raise ValueError("종목 코드를 입력해주세요.")
 
@@ -330,7 +317,7 @@ def domestic_day_chart(
     chart = None
 
     while True:
-        result = self.fetch(
+        result = yield KisRequestSpec(
             "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice",
             api="FHKST03010200",
             params={
@@ -387,43 +374,48 @@ def domestic_day_chart(
     )
 
 
-FOREIGN_MAX_RECORDS = 120
-FOREIGN_MAX_PERIODS = math.ceil(24 * 60 / FOREIGN_MAX_RECORDS)
-
-
-def foreign_day_chart(
+def domestic_day_chart(
     self: "PyKis",
     symbol: str,
-    market: MARKET_TYPE,
     start: time | timedelta | None = None,
     end: time | None = None,
     period: int = 1,
-    once: bool = False,
-) -> KisForeignDayChart:
+) -> KisDomesticDayChart:
     """
-    한국투자증권 해외 당일 봉 차트 조회
-
-    해당 조회 시스템은 한국투자증권 API의 한계로 인해 (24 * 60 / 최대 레코드 수)번 호출하여 원하는 영역의 근접 값을 채워넣습니다.
-    따라서, 누락된 봉이 존재할 수 있으며, n = (최대 레코드 수), I = {x | x = (i + 1) * (j + 1), 0 <= ceil(24 * 60 / n), 0 <= j < n}의 해상도를 가집니다.
+    한국투자증권 국내 당일 봉 차트 조회
 
-    해외주식현재가 -> 해외주식 현재가상세[v1_해외주식-029]
-    해외주식현재가 -> 해외주식분봉조회[v1_해외주식-030]
-    (업데이트 날짜: 2024/05/26)
+    국내주식시세 -> 주식당일분봉조회[v1_국내주식-022]
+    (업데이트 날짜: 2023/09/05)
 
     Args:
         symbol (str): 종목코드
-        market (MARKET_TYPE): 시장 종류
         start (time | timedelta, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
         end (time, optional): 조회 종료 시간. Defaults to None.
         period (int, optional): 조회 간격 (분). Defaults to 1.
-        once (bool, optional): 한 번만 조회할지 여부. Defaults to False.
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 조회 파라미터가 올바르지 않은 경우
     """
-    from pykis.api.stock.quote import quote
+    return self.execute(domestic_day_chart_plan(self, symbol, start=start, end=end, period=period))
+
+
+FOREIGN_MAX_RECORDS = 120
+FOREIGN_MAX_PERIODS = math.ceil(24 * 60 / FOREIGN_MAX_RECORDS)
+
+
+def foreign_day_chart_plan(
+    self: "PyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    start: time | timedelta | None = None,
+    end: time | None = None,
+    period: int = 1,
+    once: bool = False,
+) -> KisRequestPlan[KisForeignDayChart]:
+    """해외 당일 봉 차트 조회 요청 계획 (`foreign_day_chart`)"""
+    from pykis.api.stock.quote import quote_plan
 
     if not symbol:
         raise ValueError("종목 코드를 입력해주세요.")
@@ -437,10 +429,10 @@ def foreign_day_chart(
     chart = None
     bars: dict[time, KisChartBar] | list[KisChartBar] = {}
 
-    prev_price = quote(self, symbol, market).prev_price
+    prev_price = (yield quote_plan(self, symbol, market)).prev_price
 
     for i in range(FOREIGN_MAX_PERIODS):
-        result = self.fetch(
+        result = yield KisRequestSpec(
             "/uapi/overseas-price/v1/quotations/inquire-time-itemchartprice",
             api="HHDFS76950200",
             params={
@@ -503,22 +495,24 @@ def foreign_day_chart(
     )
 
 
-def day_chart(
+def foreign_day_chart(
     self: "PyKis",
     symbol: str,
     market: MARKET_TYPE,
     start: time | timedelta | None = None,
     end: time | None = None,
     period: int = 1,
-) -> KisChart:
+    once: bool = False,
+) -> KisForeignDayChart:
     """
-    한국투자증권 당일 봉 차트 조회
+    한국투자증권 해외 당일 봉 차트 조회
 
-    해외 당일 봉 차트 조회는 한국투자증권 API의 한계로 인해 (24 * 60 / 최대 레코드 수)번 호출하여 원하는 영역의 근접 값을 채워넣습니다.
+    해당 조회 시스템은 한국투자증권 API의 한계로 인해 (24 * 60 / 최대 레코드 수)번 호출하여 원하는 영역의 근접 값을 채워넣습니다.
     따라서, 누락된 봉이 존재할 수 있으며, n = (최대 레코드 수), I = {x | x = (i + 1) * (j + 1), 0 <= ceil(24 * 60 / n), 0 <= j < n}의 해상도를 가집니다.
 
-    국내주식시세 -> 주식당일분봉조회[v1_국내주식-022]
+    해외주식현재가 -> 해외주식 현재가상세[v1_해외주식-029]
     해외주식현재가 -> 해외주식분봉조회[v1_해외주식-030]
+    (업데이트 날짜: 2024/05/26)
 
     Args:
         symbol (str): 종목코드
@@ -526,14 +520,32 @@ def day_chart(
         start (time | timedelta, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
         end (time, optional): 조회 종료 시간. Defaults to None.
         period (int, optional): 조회 간격 (분). Defaults to 1.
+        once (bool, optional): 한 번만 조회할지 여부. Defaults to False.
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 조회 파라미터가 올바르지 않은 경우
     """
+    return self.execute(foreign_day_chart_plan(self, symbol, market, start=start, end=end, period=period, once=once))
+
+
+def day_chart_plan(
+    self: "PyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    start: time | timedelta | None = None,
+    end: time | None = None,
+    period: int = 1,
+) -> KisRequestPlan[KisChart]:
+    """당일 봉 차트 조회 요청 계획 (`day_chart`)"""
+    cache = self._get_response_cache("day_chart", market, symbol, start, end, period)
+
+    if cache and (cached := self.cache.get(cache[0], KisChart)):
+        return cached
+
     if market == "KRX":
-        return domestic_day_chart(
+        result = yield domestic_day_chart_plan(
             self,
             symbol,
             start=start,
@@ -541,7 +553,7 @@ def day_chart(
             period=period,
         )
     else:
-        return foreign_day_chart(
+        result = yield foreign_day_chart_plan(
             self,
             symbol,
             market,
@@ -550,6 +562,43 @@ def day_chart(
             period=period,
         )
 
+    if cache:
+        self.cache.set(cache[0], result, expire=cache[1])
+
+    return result
+
+
+def day_chart(
+    self: "PyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    start: time | timedelta | None = None,
+    end: time | None = None,
+    period: int = 1,
+) -> KisChart:
+    """
+    한국투자증권 당일 봉 차트 조회
+
+    해외 당일 봉 차트 조회는 한국투자증권 API의 한계로 인해 (24 * 60 / 최대 레코드 수)번 호출하여 원하는 영역의 근접 값을 채워넣습니다.
+    따라서, 누락된 봉이 존재할 수 있으며, n = (최대 레코드 수), I = {x | x = (i + 1) * (j + 1), 0 <= ceil(24 * 60 / n), 0 <= j < n}의 해상도를 가집니다.
+
+    국내주식시세 -> 주식당일분봉조회[v1_국내주식-022]
+    해외주식현재가 -> 해외주식분봉조회[v1_해외주식-030]
+
+    Args:
+        symbol (str): 종목코드
+        market (MARKET_TYPE): 시장 종류
+        start (time | timedelta, optional): 조회 시작 시간. timedelta인 경우 최근 timedelta만큼의 봉을 조회합니다. Defaults to None.
+        end (time, optional): 조회 종료 시간. Defaults to None.
+        period (int, optional): 조회 간격 (분). Defaults to 1.
+
+    Raises:
+        KisAPIError: API 호출에 실패한 경우
+        KisNotFoundError: 조회 결과가 없는 경우
+        ValueError: 조회 파라미터가 올바르지 않은 경우
+    """
+    return self.execute(day_chart_plan(self, symbol, market, start=start, end=end, period=period))
+
 
 def product_day_chart(
     self: "KisProductProtocol",
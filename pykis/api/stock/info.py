@@ -319,6 +319,9 @@ def quotable_market(
             ):
                 continue
 
+            if use_cache:
+                self.cache.set(f"quotable_market:{market}:{symbol}", market_type, expire=timedelta(days=1))
+
             return market_type
         except AttributeError:
             pass
@@ -364,6 +367,9 @@ def info(
         if cached:
             return cached
 
+    # 시세조회 가능한 상품유형명으로 바뀌기 전의 상품유형명으로도 캐시합니다.
+    requested = market
+
     if quotable:
         market = quotable_market(
             self,
@@ -390,6 +396,9 @@ def info(
             if use_cache:
                 self.cache.set(f"info:{market}:{symbol}", result, expire=timedelta(days=1))
 
+                if requested != market:
+                    self.cache.set(f"info:{requested}:{symbol}", result, expire=timedelta(days=1))
+
             return result
         except KisAPIError as e:
             if e.rt_cd == 7:
@@ -8,6 +8,7 @@ from pykis.api.stock.market import (
     MARKET_SHORT_TYPE_MAP,
     MARKET_TYPE,
 )
+from pykis.client.spec import KisRequestPlan, KisRequestSpec
 from pykis.responses.dynamic import KisTransform
 from pykis.responses.response import (
     KisAPIResponse,
@@ -301,9 +302,41 @@ class KisForeignOrderbook(KisAPIResponse, KisOrderbookBase):
         ]
 
 
+def domestic_orderbook_plan(
+    self: "PyKis",
+    symbol: str,
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisDomesticOrderbook]:
+    """국내 주식 호가 조회 요청 계획 (`domestic_orderbook`)"""
+    if not symbol:
+        raise ValueError("종목코드를 입력해주세요.")
+
+    cache = self._get_response_cache("domestic_orderbook", symbol, fields=fields)
+
+    if cache and (cached := self.cache.get(cache[0], KisDomesticOrderbook)):
+        return cached
+
+    result = yield KisRequestSpec(
+        "/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn",
+        api="FHKST01010200",
+        params={
+            "FID_COND_MRKT_DIV_CODE": "J",
+            "FID_INPUT_ISCD": symbol,
+        },
+        fields=fields,
+        response_type=KisDomesticOrderbook(symbol),
+    )
+
+    if cache:
+        self.cache.set(cache[0], result, expire=cache[1])
+
+    return result
+
+
 def domestic_orderbook(
     self: "PyKis",
     symbol: str,
+    fields: Iterable[str] | None = None,
 ) -> KisDomesticOrderbook:
     """
     한국투자증권 국내 주식 호가 조회
@@ -313,31 +346,58 @@ def domestic_orderbook(
 
     Args:
         symbol (str): 종목코드
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"asks", "bids"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
+    return self.execute(domestic_orderbook_plan(self, symbol, fields=fields))
+
+
+def foreign_orderbook_plan(
+    self: "PyKis",
+    market: MARKET_TYPE,
+    symbol: str,
+    condition: ORDER_CONDITION | None = None,
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisForeignOrderbook]:
+    """해외 주식 호가 조회 요청 계획 (`foreign_orderbook`)"""
     if not symbol:
         raise ValueError("종목코드를 입력해주세요.")
 
-    return self.fetch(
-        "/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn",
-        api="FHKST01010200",
+    cache = self._get_response_cache("foreign_orderbook", market, symbol, condition, fields=fields)
+
+    if cache and (cached := self.cache.get(cache[0], KisForeignOrderbook)):
+        return cached
+
+    result = yield KisRequestSpec(
+        "/uapi/overseas-price/v1/quotations/inquire-asking-price",
+        api="HHDFS76200100",
         params={
-            "FID_COND_MRKT_DIV_CODE": "J",
-            "FID_INPUT_ISCD": symbol,
+            "EXCD": (DAYTIME_MARKET_SHORT_TYPE_MAP[market] if condition == "extended" else MARKET_SHORT_TYPE_MAP[market]),
+            "SYMB": symbol,
         },
-        response_type=KisDomesticOrderbook(symbol),
+        fields=fields,
+        response_type=KisForeignOrderbook(
+            symbol=symbol,
+            market=market,
+        ),
     )
 
+    if cache:
+        self.cache.set(cache[0], result, expire=cache[1])
+
+    return result
+
 
 def foreign_orderbook(
     self: "PyKis",
     market: MARKET_TYPE,
     symbol: str,
     condition: ORDER_CONDITION | None = None,
+    fields: Iterable[str] | None = None,
 ) -> KisForeignOrderbook:
     """
     한국투자증권 해외 주식 호가 조회
@@ -349,27 +409,42 @@ def foreign_orderbook(
         market (MARKET_TYPE): 상품유형타입
         symbol (str): 종목코드
         condition (ORDER_CONDITION, optional): 주문조건. Defaults to None.
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"asks", "bids"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
-    if not symbol:
-        raise ValueError("종목코드를 입력해주세요.")
+    return self.execute(foreign_orderbook_plan(self, market, symbol, condition=condition, fields=fields))
 
-    return self.fetch(
-        "/uapi/overseas-price/v1/quotations/inquire-asking-price",
-        api="HHDFS76200100",
-        params={
-            "EXCD": (DAYTIME_MARKET_SHORT_TYPE_MAP[market] if condition == "extended" else MARKET_SHORT_TYPE_MAP[market]),
-            "SYMB": symbol,
-        },
-        response_type=KisForeignOrderbook(
-            symbol=symbol,
-            market=market,
-        ),
-    )
+
+def orderbook_plan(
+    self: "PyKis",
+    market: MARKET_TYPE,
+    symbol: str,
+    condition: ORDER_CONDITION | None = None,
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisOrderbookResponse]:
+    """호가 조회 요청 계획 (`orderbook`)"""
+    if market == "KRX":
+        return (
+            yield domestic_orderbook_plan(
+                self,
+                symbol=symbol,
+                fields=fields,
+            )
+        )
+    else:
+        return (
+            yield foreign_orderbook_plan(
+                self,
+                market=market,
+                symbol=symbol,
+                condition=condition,
+                fields=fields,
+            )
+        )
 
 
 def orderbook(
@@ -377,6 +452,7 @@ def orderbook(
     market: MARKET_TYPE,
     symbol: str,
     condition: ORDER_CONDITION | None = None,
+    fields: Iterable[str] | None = None,
 ) -> KisOrderbookResponse:
     """
     한국투자증권 호가 조회
@@ -388,29 +464,20 @@ def orderbook(
         market (MARKET_TYPE): 상품유형타입
         symbol (str): 종목코드
         condition (ORDER_CONDITION, optional): 주문조건. Defaults to None.
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"asks", "bids"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
-    if market == "KRX":
-        return domestic_orderbook(
-            self,
-            symbol=symbol,
-        )
-    else:
-        return foreign_orderbook(
-            self,
-            market=market,
-            symbol=symbol,
-            condition=condition,
-        )
+    return self.execute(orderbook_plan(self, market, symbol, condition=condition, fields=fields))
 
 
 def product_orderbook(
     self: "KisProductProtocol",
     condition: ORDER_CONDITION | None = None,
+    fields: Iterable[str] | None = None,
 ) -> KisOrderbookResponse:
     """
     한국투자증권 호가 조회
@@ -420,6 +487,7 @@ def product_orderbook(
 
     Args:
         condition (ORDER_CONDITION, optional): 주문조건. Defaults to None.
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"asks", "bids"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -431,4 +499,5 @@ def product_orderbook(
         market=self.market,
         symbol=self.symbol,
         condition=condition,
+        fields=fields,
     )
@@ -1,7 +1,7 @@
 from datetime import date
 from decimal import Decimal
 from functools import cached_property
-from typing import TYPE_CHECKING, Literal, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Iterable, Literal, Protocol, runtime_checkable
 
 from pykis.api.base.product import KisProductBase, KisProductProtocol
 from pykis.api.stock.market import (
@@ -9,6 +9,7 @@ from pykis.api.stock.market import (
     MARKET_SHORT_TYPE_MAP,
     MARKET_TYPE,
 )
+from pykis.client.spec import KisRequestPlan, KisRequestSpec
 from pykis.responses.dynamic import KisDynamic, KisObject, KisTransform
 from pykis.responses.response import (
     KisAPIResponse,
@@ -398,6 +399,8 @@ class KisDomesticIndicator(KisIndicatorRepr, KisDynamic):
 class KisDomesticQuote(KisQuoteBase, KisAPIResponse):
     """한국투자증권 국내 상품 시세"""
 
+    __lazy__ = True
+
     symbol: str = KisString["stck_shrn_iscd"]
     """종목코드"""
     market: MARKET_TYPE
@@ -512,6 +515,8 @@ class KisForeignIndicator(KisIndicatorRepr, KisDynamic):
 class KisForeignQuote(KisQuoteBase, KisAPIResponse):
     """한국투자증권 해외 상품 시세"""
 
+    __lazy__ = True
+
     symbol: str
     """종목코드"""
     market: MARKET_TYPE
@@ -615,9 +620,42 @@ class KisForeignQuote(KisQuoteBase, KisAPIResponse):
             )
 
 
+def domestic_quote_plan(
+    self: "PyKis",
+    symbol: str,
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisDomesticQuote]:
+    """국내 주식 현재가 조회 요청 계획 (`domestic_quote`)"""
+    if not symbol:
+        raise ValueError("종목코드를 입력해주세요.")
+
+    cache = self._get_response_cache("domestic_quote", symbol, fields=fields)
+
+    if cache and (cached := self.cache.get(cache[0], KisDomesticQuote)):
+        return cached
+
+    result = yield KisRequestSpec(
+        "/uapi/domestic-stock/v1/quotations/inquire-price",
+        api="FHKST01010100",
+        params={
+            "FID_COND_MRKT_DIV_CODE": "J",
+            "FID_INPUT_ISCD": symbol,
+        },
+        fields=fields,
+        response_type=KisDomesticQuote(symbol, "KRX"),
+        domain="real",
+    )
+
+    if cache:
+        self.cache.set(cache[0], result, expire=cache[1])
+
+    return result
+
+
 def domestic_quote(
     self: "PyKis",
     symbol: str,
+    fields: Iterable[str] | None = None,
 ) -> KisDomesticQuote:
     """
     한국투자증권 국내 주식 현재가 조회
@@ -629,34 +667,69 @@ def domestic_quote(
 
     Args:
         symbol (str): 종목코드
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"price", "volume"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
+    return self.execute(domestic_quote_plan(self, symbol, fields=fields))
+
+
+def foreign_quote_plan(
+    self: "PyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    extended: bool = False,
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisForeignQuote]:
+    """해외 주식 현재가 조회 요청 계획 (`foreign_quote`)"""
     if not symbol:
         raise ValueError("종목코드를 입력해주세요.")
 
-    result = KisDomesticQuote(symbol, "KRX")
+    if extended:
+        market_code = DAYTIME_MARKET_SHORT_TYPE_MAP.get(market)
 
-    return self.fetch(
-        "/uapi/domestic-stock/v1/quotations/inquire-price",
-        api="FHKST01010100",
+        if not market_code:
+            raise ValueError(f"주간거래 시세 조회가 불가능한 시장입니다. ({market})")
+    else:
+        market_code = MARKET_SHORT_TYPE_MAP[market]
+
+    cache = self._get_response_cache("foreign_quote", market, symbol, extended, fields=fields)
+
+    if cache and (cached := self.cache.get(cache[0], KisForeignQuote)):
+        return cached
+
+    result = yield KisRequestSpec(
+        "/uapi/overseas-price/v1/quotations/price-detail",
+        api="HHDFS76200200",
         params={
-            "FID_COND_MRKT_DIV_CODE": "J",
-            "FID_INPUT_ISCD": symbol,
+            "AUTH": "",
+            "EXCD": market_code,
+            "SYMB": symbol,
         },
-        response_type=result,
+        fields=fields,
+        response_type=KisForeignQuote(
+            symbol=symbol,
+            market=market,
+            extended=extended,
+        ),
         domain="real",
     )
 
+    if cache:
+        self.cache.set(cache[0], result, expire=cache[1])
+
+    return result
+
 
 def foreign_quote(
     self: "PyKis",
     symbol: str,
     market: MARKET_TYPE,
     extended: bool = False,
+    fields: Iterable[str] | None = None,
 ) -> KisForeignQuote:
     """
     한국투자증권 해외 주식 현재가 조회
@@ -668,38 +741,36 @@ def foreign_quote(
         symbol (str): 종목코드
         market (MARKET_TYPE): 시장구분
         extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"price", "volume"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
-    if not symbol:
-        raise ValueError("종목코드를 입력해주세요.")
+    return self.execute(foreign_quote_plan(self, symbol, market, extended=extended, fields=fields))
 
-    if extended:
-        market_code = DAYTIME_MARKET_SHORT_TYPE_MAP.get(market)
 
-        if not market_code:
-            raise ValueError(f"주간거래 시세 조회가 불가능한 시장입니다. ({market})")
+def quote_plan(
+    self: "PyKis",
+    symbol: str,
+    market: MARKET_TYPE,
+    extended: bool = False,
+    fields: Iterable[str] | None = None,
+) -> KisRequestPlan[KisQuoteResponse]:
+    """주식 현재가 조회 요청 계획 (`quote`)"""
+    if market == "KRX":
+        return (yield domestic_quote_plan(self, symbol=symbol, fields=fields))
     else:
-        market_code = MARKET_SHORT_TYPE_MAP[market]
-
-    return self.fetch(
-        "/uapi/overseas-price/v1/quotations/price-detail",
-        api="HHDFS76200200",
-        params={
-            "AUTH": "",
-            "EXCD": market_code,
-            "SYMB": symbol,
-        },
-        response_type=KisForeignQuote(
-            symbol=symbol,
-            market=market,
-            extended=extended,
-        ),
-        domain="real",
-    )
+        return (
+            yield foreign_quote_plan(
+                self,
+                symbol=symbol,
+                market=market,
+                extended=extended,
+                fields=fields,
+            )
+        )
 
 
 def quote(
@@ -707,6 +778,7 @@ def quote(
     symbol: str,
     market: MARKET_TYPE,
     extended: bool = False,
+    fields: Iterable[str] | None = None,
 ) -> KisQuoteResponse:
     """
     한국투자증권 주식 현재가 조회
@@ -718,26 +790,20 @@ def quote(
         symbol (str): 종목코드
         market (MARKET_TYPE): 시장구분
         extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"price", "volume"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
         KisNotFoundError: 조회 결과가 없는 경우
         ValueError: 종목 코드가 올바르지 않은 경우
     """
-    if market == "KRX":
-        return domestic_quote(self, symbol=symbol)
-    else:
-        return foreign_quote(
-            self,
-            symbol=symbol,
-            market=market,
-            extended=extended,
-        )
+    return self.execute(quote_plan(self, symbol, market, extended=extended, fields=fields))
 
 
 def product_quote(
     self: "KisProductProtocol",
     extended: bool = False,
+    fields: Iterable[str] | None = None,
 ) -> KisQuoteResponse:
     """
     한국투자증권 주식 현재가 조회
@@ -747,6 +813,7 @@ def product_quote(
 
     Args:
         extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        fields (Iterable[str], optional): 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다. 예) `{"price", "volume"}`
 
     Raises:
         KisAPIError: API 호출에 실패한 경우
@@ -758,4 +825,5 @@ def product_quote(
         symbol=self.symbol,
         market=self.market,
         extended=extended,
+        fields=fields,
     )
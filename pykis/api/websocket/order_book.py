@@ -413,6 +413,7 @@ def on_order_book(
     where: KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimeOrderbook]] | None = None,
     once: bool = False,
     extended: bool = False,
+    conflate: bool = False,
 ) -> KisEventTicket["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimeOrderbook]]:
     """
     웹소켓 이벤트 핸들러 등록
@@ -428,6 +429,7 @@ def on_order_book(
         where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]] | None, optional): 이벤트 필터. Defaults to None.
         once (bool, optional): 한번만 실행 여부. Defaults to False.
         extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        conflate (bool, optional): 최신 값만 전달할지 여부. 콜백이 실행 중인 동안 새 이벤트가 도착하면 전달되지 않은 이전 이벤트를 교체합니다.
     """
     filter = KisProductEventFilter(symbol=symbol, market=market)
 
@@ -449,6 +451,7 @@ def on_order_book(
         callback=callback,
         where=KisMultiEventFilter(filter, where) if where else filter,
         once=once,
+        conflate=conflate,
     )
 
 
@@ -458,6 +461,7 @@ def on_product_order_book(
     where: KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimeOrderbook]] | None = None,
     once: bool = False,
     extended: bool = False,
+    conflate: bool = False,
 ) -> KisEventTicket["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimeOrderbook]]:
     """
     웹소켓 이벤트 핸들러 등록
@@ -471,6 +475,7 @@ def on_product_order_book(
         where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimeOrderbook]] | None, optional): 이벤트 필터. Defaults to None.
         once (bool, optional): 한번만 실행 여부. Defaults to False.
         extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        conflate (bool, optional): 최신 값만 전달할지 여부. 콜백이 실행 중인 동안 새 이벤트가 도착하면 전달되지 않은 이전 이벤트를 교체합니다.
     """
     return on_order_book(
         self.kis.websocket,
@@ -480,4 +485,5 @@ def on_product_order_book(
         where=where,
         once=once,
         extended=extended,
+        conflate=conflate,
     )
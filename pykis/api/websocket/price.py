@@ -747,6 +747,7 @@ def on_price(
     where: KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimePrice]] | None = None,
     once: bool = False,
     extended: bool = False,
+    conflate: bool = False,
 ) -> KisEventTicket["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimePrice]]:
     """
     웹소켓 이벤트 핸들러 등록
@@ -761,6 +762,7 @@ def on_price(
         where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
         once (bool, optional): 한번만 실행 여부. Defaults to False.
         extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        conflate (bool, optional): 최신 값만 전달할지 여부. 콜백이 실행 중인 동안 새 이벤트가 도착하면 전달되지 않은 이전 이벤트를 교체합니다.
     """
     filter = KisProductEventFilter(symbol=symbol, market=market)
 
@@ -778,6 +780,7 @@ def on_price(
         callback=callback,
         where=KisMultiEventFilter(filter, where) if where else filter,
         once=once,
+        conflate=conflate,
     )
 
 
@@ -787,6 +790,7 @@ def on_product_price(
     where: KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimePrice]] | None = None,
     once: bool = False,
     extended: bool = False,
+    conflate: bool = False,
 ) -> KisEventTicket["KisWebsocketClient", KisSubscriptionEventArgs[KisRealtimePrice]]:
     """
     웹소켓 이벤트 핸들러 등록
@@ -799,6 +803,7 @@ def on_product_price(
         where (KisEventFilter[KisWebsocketClient, KisSubscriptionEventArgs[KisRealtimePrice]] | None, optional): 이벤트 필터. Defaults to None.
         once (bool, optional): 한번만 실행 여부. Defaults to False.
         extended (bool, optional): 주간거래 시세 조회 여부 (나스닥, 뉴욕, 아멕스)
+        conflate (bool, optional): 최신 값만 전달할지 여부. 콜백이 실행 중인 동안 새 이벤트가 도착하면 전달되지 않은 이전 이벤트를 교체합니다.
     """
     return on_price(
         self.kis.websocket,
@@ -808,4 +813,5 @@ def on_product_price(
         where=where,
         once=once,
         extended=extended,
+        conflate=conflate,
     )
@@ -1,9 +1,9 @@
-import json
 from dataclasses import asdict, dataclass
 from os import PathLike
 
 from pykis.client.account import KisAccountNumber
 from pykis.client.appkey import KisKey
+from pykis.utils.codec import KisJSONCodec, get_json_codec
 
 __all__ = [
     "KisAuth",
@@ -59,17 +59,29 @@ class KisAuth:
         """계좌번호"""
         return KisAccountNumber(self.account)
 
-    def save(self, path: str | PathLike[str]):
-        """계좌 및 인증 정보를 JSON 파일로 저장합니다."""
-        with open(path, "w") as f:
-            json.dump(asdict(self), f)
+    def save(self, path: str | PathLike[str], codec: KisJSONCodec | None = None):
+        """
+        계좌 및 인증 정보를 JSON 파일로 저장합니다.
+
+        Args:
+            path: 파일 경로
+            codec: JSON 변환 객체. None일 경우 기본 JSON 변환 객체를 사용합니다.
+        """
+        with open(path, "wb") as f:
+            f.write((codec or get_json_codec()).dumps(asdict(self)))
 
     @classmethod
-    def load(cls, path: str | PathLike[str]) -> "KisAuth":
-        """JSON 파일에서 계좌 및 인증 정보를 불러옵니다."""
+    def load(cls, path: str | PathLike[str], codec: KisJSONCodec | None = None) -> "KisAuth":
+        """
+        JSON 파일에서 계좌 및 인증 정보를 불러옵니다.
+
+        Args:
+            path: 파일 경로
+            codec: JSON 변환 객체. None일 경우 기본 JSON 변환 객체를 사용합니다.
+        """
         try:
-            with open(path) as f:
-                return cls(**json.load(f))
+            with open(path, "rb") as f:
+                return cls(**(codec or get_json_codec()).loads(f.read()))
         except Exception as e:
             raise ValueError("계좌 및 인증 정보를 불러오는데 실패했습니다.") from e
 
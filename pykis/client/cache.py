@@ -1,15 +1,25 @@
 from datetime import datetime, timedelta
 from multiprocessing import Lock
 from multiprocessing.synchronize import Lock as LockType
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 
 __all__ = [
     "TObject",
+    "RESPONSE_CACHE_TYPE",
     "KisCacheStorage",
 ]
 
 TObject = TypeVar("TObject")
 
+RESPONSE_CACHE_TYPE = Literal[
+    "domestic_quote",
+    "foreign_quote",
+    "domestic_orderbook",
+    "foreign_orderbook",
+    "day_chart",
+]
+"""응답 캐시 대상 API"""
+
 
 class KisCacheStorage:
     """캐시 저장소"""
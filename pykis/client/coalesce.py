@@ -0,0 +1,33 @@
+from typing import Literal
+
+__all__ = [
+    "COALESCE_TYPE",
+    "COALESCE_ENDPOINTS",
+    "get_coalesce_type",
+]
+
+COALESCE_TYPE = Literal["quote", "orderbook", "info"]
+"""요청 병합 대상 API 유형"""
+
+COALESCE_ENDPOINTS: dict[str, COALESCE_TYPE] = {
+    # 시세
+    "/uapi/domestic-stock/v1/quotations/inquire-price": "quote",
+    "/uapi/overseas-price/v1/quotations/price": "quote",
+    "/uapi/overseas-price/v1/quotations/price-detail": "quote",
+    # 호가
+    "/uapi/domestic-stock/v1/quotations/inquire-asking-price-exp-ccn": "orderbook",
+    "/uapi/overseas-price/v1/quotations/inquire-asking-price": "orderbook",
+    # 종목 정보
+    "/uapi/domestic-stock/v1/quotations/search-info": "info",
+}
+"""요청 병합이 가능한 조회 API 경로"""
+
+
+def get_coalesce_type(path: str) -> COALESCE_TYPE | None:
+    """
+    API 경로의 요청 병합 유형을 반환합니다. 병합할 수 없는 API인 경우 None을 반환합니다.
+
+    Args:
+        path: API 경로
+    """
+    return COALESCE_ENDPOINTS.get(path)
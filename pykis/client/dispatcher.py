@@ -0,0 +1,276 @@
+from collections import deque
+from dataclasses import dataclass
+from itertools import count
+from threading import Condition, Thread, current_thread
+from time import monotonic
+from typing import Callable, Hashable, Literal
+
+from pykis import logging
+
+__all__ = [
+    "DISPATCH_OVERFLOW_TYPE",
+    "KisDispatchConfig",
+    "KisDispatchStats",
+    "KisEventDispatcher",
+]
+
+DISPATCH_OVERFLOW_TYPE = Literal["block", "drop_oldest", "conflate"]
+"""
+이벤트 전달 큐가 가득 찼을 때의 처리 방식
+
+- `block`: 큐에 자리가 날 때까지 수신 스레드가 대기합니다.
+- `drop_oldest`: 가장 오래된 이벤트를 버립니다.
+- `conflate`: 같은 키의 이벤트가 대기 중인 경우 최신 이벤트로 교체하고, 가득 찬 경우 가장 오래된 이벤트를 버립니다.
+"""
+
+
+@dataclass
+class KisDispatchConfig:
+    """이벤트 전달 큐 설정"""
+
+    workers: int = 1
+    """콜백을 실행할 작업 스레드 수. 같은 키의 이벤트는 항상 같은 작업 스레드에서 순서대로 실행됩니다."""
+    maxsize: int = 10000
+    """작업 스레드별 최대 대기 이벤트 수"""
+    overflow: DISPATCH_OVERFLOW_TYPE = "block"
+    """큐가 가득 찼을 때의 처리 방식"""
+
+
+@dataclass
+class KisDispatchStats:
+    """이벤트 전달 큐 통계"""
+
+    depth: int = 0
+    """대기 중인 이벤트 수"""
+    max_depth: int = 0
+    """최대 대기 이벤트 수"""
+    enqueued: int = 0
+    """추가된 이벤트 수"""
+    dispatched: int = 0
+    """작업 스레드가 꺼낸 이벤트 수"""
+    dropped: int = 0
+    """버린 이벤트 수"""
+    conflated: int = 0
+    """최신 이벤트로 교체한 이벤트 수"""
+    lag: float = 0
+    """마지막으로 꺼낸 이벤트의 대기 시간(초)"""
+    max_lag: float = 0
+    """최대 이벤트 대기 시간(초)"""
+
+    def merge(self, other: "KisDispatchStats") -> None:
+        """다른 이벤트 전달 큐의 통계를 합칩니다."""
+        self.depth += other.depth
+        self.max_depth = max(self.max_depth, other.max_depth)
+        self.enqueued += other.enqueued
+        self.dispatched += other.dispatched
+        self.dropped += other.dropped
+        self.conflated += other.conflated
+        self.lag = max(self.lag, other.lag)
+        self.max_lag = max(self.max_lag, other.max_lag)
+
+
+class _KisDispatchEntry:
+    __slots__ = ["key", "time", "callback"]
+
+    key: Hashable | None
+    """이벤트 키"""
+    time: float
+    """추가 시각"""
+    callback: Callable[[], None]
+    """콜백"""
+
+    def __init__(self, key: Hashable | None, time: float, callback: Callable[[], None]):
+        self.key = key
+        self.time = time
+        self.callback = callback
+
+
+class _KisDispatchShard:
+    __slots__ = ["queue", "pending", "condition", "stats", "thread"]
+
+    queue: deque[_KisDispatchEntry]
+    """대기 중인 이벤트"""
+    pending: dict[Hashable, _KisDispatchEntry]
+    """키별 대기 중인 이벤트 (`conflate`에서만 사용)"""
+    condition: Condition
+    """큐 변경 알림"""
+    stats: KisDispatchStats
+    """통계"""
+    thread: Thread | None
+    """작업 스레드. 중지를 요청한 경우 None입니다."""
+
+    def __init__(self):
+        self.queue = deque()
+        self.pending = {}
+        self.condition = Condition()
+        self.stats = KisDispatchStats()
+        self.thread = None
+
+
+class KisEventDispatcher:
+    """
+    이벤트 전달 큐
+
+    수신 스레드는 이벤트를 큐에 넣기만 하고, 콜백은 별도의 작업 스레드에서 실행합니다.
+    느린 콜백이 다른 이벤트의 수신이나 PINGPONG 응답을 지연시키지 않습니다.
+
+    키가 있는 이벤트는 키별로 같은 작업 스레드에 전달되어 순서가 유지됩니다.
+    키가 없는 이벤트는 항상 첫 번째 작업 스레드에 순서대로 전달되며, 버리거나 교체하지 않습니다.
+    """
+
+    __slots__ = ["config", "name", "_shards", "_round"]
+
+    config: KisDispatchConfig
+    """이벤트 전달 큐 설정"""
+    name: str
+    """작업 스레드 이름"""
+
+    _shards: list[_KisDispatchShard]
+    """작업 스레드별 큐"""
+    _round: "count[int]"
+    """작업 스레드 시작 순번"""
+
+    def __init__(self, config: KisDispatchConfig | None = None, name: str = "pykis-dispatch"):
+        """
+        이벤트 전달 큐를 생성합니다. 작업 스레드는 처음 이벤트를 추가할 때 시작됩니다.
+
+        Args:
+            config: 이벤트 전달 큐 설정
+            name: 작업 스레드 이름
+        """
+        self.config = config = config or KisDispatchConfig()
+
+        if config.workers < 1:
+            raise ValueError("workers는 1 이상이어야 합니다.")
+
+        if config.maxsize < 1:
+            raise ValueError("maxsize는 1 이상이어야 합니다.")
+
+        self.name = name
+        self._shards = [_KisDispatchShard() for _ in range(config.workers)]
+        self._round = count()
+
+    @property
+    def stats(self) -> KisDispatchStats:
+        """이벤트 전달 큐 통계"""
+        result = KisDispatchStats()
+
+        for shard in self._shards:
+            with shard.condition:
+                shard.stats.depth = len(shard.queue)
+                result.merge(shard.stats)
+
+        return result
+
+    def put(self, callback: Callable[[], None], key: Hashable | None = None) -> None:
+        """
+        이벤트를 추가합니다.
+
+        Args:
+            callback: 작업 스레드에서 실행할 콜백
+            key: 이벤트 키. 같은 키의 이벤트는 순서대로 실행되며, `conflate`에서 최신 이벤트로 교체됩니다.
+                None일 경우 버리거나 교체하지 않습니다.
+        """
+        shard = self._shards[0 if key is None else hash(key) % len(self._shards)]
+        overflow = self.config.overflow
+
+        with shard.condition:
+            if shard.thread is None:
+                self._start(shard)
+
+            stats = shard.stats
+
+            if key is not None and overflow == "conflate" and (entry := shard.pending.get(key)) is not None:
+                # 대기 순서는 유지하고 값만 최신 이벤트로 교체합니다.
+                entry.callback = callback
+                stats.conflated += 1
+                return
+
+            while len(shard.queue) >= self.config.maxsize:
+                if overflow == "block" or not self._drop_oldest(shard):
+                    shard.condition.wait()
+
+            entry = _KisDispatchEntry(key, monotonic(), callback)
+            shard.queue.append(entry)
+
+            if key is not None and overflow == "conflate":
+                shard.pending[key] = entry
+
+            stats.enqueued += 1
+            stats.max_depth = max(stats.max_depth, len(shard.queue))
+            shard.condition.notify_all()
+
+    def _drop_oldest(self, shard: _KisDispatchShard) -> bool:
+        """가장 오래된 키가 있는 이벤트를 버립니다. 버릴 이벤트가 없는 경우 False를 반환합니다."""
+        for entry in shard.queue:
+            if entry.key is not None:
+                break
+        else:
+            return False
+
+        shard.queue.remove(entry)
+
+        if shard.pending.get(entry.key) is entry:
+            del shard.pending[entry.key]
+
+        shard.stats.dropped += 1
+        return True
+
+    def _start(self, shard: _KisDispatchShard) -> None:
+        shard.thread = Thread(
+            target=self._run,
+            args=(shard,),
+            name=f"{self.name}-{next(self._round)}",
+            daemon=True,
+        )
+        shard.thread.start()
+
+    def _run(self, shard: _KisDispatchShard) -> None:
+        thread = current_thread()
+
+        while True:
+            with shard.condition:
+                while not shard.queue and shard.thread is thread:
+                    shard.condition.wait()
+
+                # 중지 후 남은 이벤트를 모두 실행하거나, 새 작업 스레드가 시작된 경우 종료합니다.
+                if not shard.queue or shard.thread not in (thread, None):
+                    return
+
+                entry = shard.queue.popleft()
+
+                if entry.key is not None and shard.pending.get(entry.key) is entry:
+                    del shard.pending[entry.key]
+
+                stats = shard.stats
+                stats.dispatched += 1
+                stats.lag = monotonic() - entry.time
+                stats.max_lag = max(stats.max_lag, stats.lag)
+                shard.condition.notify_all()
+
+            try:
+                entry.callback()
+            except Exception as e:
+                logging.logger.exception("RTC Failed to dispatch event: %s", e)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        대기 중인 이벤트를 모두 실행한 뒤 작업 스레드를 중지합니다. 이후 이벤트를 추가하면 작업 스레드가 다시 시작됩니다.
+
+        Args:
+            timeout: 작업 스레드별 종료 대기 시간(초)
+        """
+        threads = []
+
+        for shard in self._shards:
+            with shard.condition:
+                if shard.thread is None:
+                    continue
+
+                threads.append(shard.thread)
+                shard.thread = None
+                shard.condition.notify_all()
+
+        for thread in threads:
+            if thread.is_alive() and thread is not current_thread():
+                thread.join(timeout)
@@ -1,19 +1,22 @@
 from collections import namedtuple
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import parse_qs, urlparse
 
-from requests import Response
-
 from pykis.__env__ import TRACE_DETAIL_ERROR
 
+if TYPE_CHECKING:
+    from pykis.client.transport import KisHTTPResponseProtocol
+
 __all__ = [
     "KisException",
     "KisHTTPError",
     "KisAPIError",
+    "KisTimeoutError",
+    "KisNetworkError",
 ]
 
 
-def safe_request_data(response: Response):
+def safe_request_data(response: "KisHTTPResponseProtocol"):
     header = dict(response.request.headers)
 
     if "appkey" in header:
@@ -33,7 +36,7 @@ def safe_request_data(response: Response):
             try:
                 body = body.decode("utf-8")
             except UnicodeDecodeError:
-                body = body.reason.decode("iso-8859-1")  # type: ignore
+                body = body.decode("iso-8859-1")
 
         if not TRACE_DETAIL_ERROR and ("appkey" in body or "appsecret" in body or "secretkey" in body):
             body = "[PROTECTED BODY]"
@@ -57,10 +60,10 @@ class KisException(Exception):
 
     status_code: int
     """HTTP 상태 코드"""
-    response: Response
+    response: "KisHTTPResponseProtocol"
     """응답 객체"""
 
-    def __init__(self, message: str, response: Response):
+    def __init__(self, message: str, response: "KisHTTPResponseProtocol"):
         super().__init__(message)
         self.status_code = response.status_code
         self.response = response
@@ -74,7 +77,7 @@ class KisHTTPError(KisException):
     text: str
     """응답 본문"""
 
-    def __init__(self, response: Response):
+    def __init__(self, response: "KisHTTPResponseProtocol"):
         req = safe_request_data(response)
         text = response.text
 
@@ -133,7 +136,7 @@ class KisAPIError(KisException):
         """거래고유번호"""
         return self.gt_uid or "UNKNOWN"
 
-    def __init__(self, data: dict, response: Response):
+    def __init__(self, data: dict, response: "KisHTTPResponseProtocol"):
         rt_cd = data.get("rt_cd")
         rt_cd = int(rt_cd) if rt_cd else None
         tr_id = response.headers.get("tr_id")
@@ -159,3 +162,31 @@ class KisAPIError(KisException):
         self.gt_uid = gt_uid
         self.msg_cd = msg_cd
         self.msg1 = msg1
+
+
+class KisTimeoutError(TimeoutError):
+    """요청 제한 시간 초과 예외"""
+
+    elapsed: float
+    """요청 시작부터 경과한 시간(초)"""
+    timeout: float | None
+    """요청 제한 시간(초)"""
+    path: str | None
+    """API 경로"""
+
+    def __init__(self, message: str, elapsed: float, timeout: float | None = None, path: str | None = None):
+        super().__init__(f"{message} (경과: {elapsed:.3f}초, 제한: {'-' if timeout is None else f'{timeout:.3f}초'}, 경로: {path or '-'})")
+        self.elapsed = elapsed
+        self.timeout = timeout
+        self.path = path
+
+
+class KisNetworkError(ConnectionError):
+    """HTTP 전송 중 발생한 연결 오류 또는 응답 시간 초과"""
+
+    timed_out: bool
+    """응답 시간 초과 여부"""
+
+    def __init__(self, message: str, timed_out: bool = False):
+        super().__init__(message)
+        self.timed_out = timed_out
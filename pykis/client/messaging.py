@@ -34,6 +34,8 @@ class KisWebsocketRequest(KisForm, KisObjectBase):
     """요청 본문"""
     domain: Literal["real", "virtual"] | None = None
     """요청 도메인"""
+    approval_key: str | None = None
+    """웹소켓 접속 키. None일 경우 캐시된 도메인별 접속 키를 사용합니다."""
 
     def __init__(
         self,
@@ -41,23 +43,20 @@ class KisWebsocketRequest(KisForm, KisObjectBase):
         type: str,
         body: KisWebsocketForm | None = None,
         domain: Literal["real", "virtual"] | None = None,
+        approval_key: str | None = None,
     ):
         super().__init__()
         self.kis = kis
         self.type = type
         self.body = body
         self.domain = domain
+        self.approval_key = approval_key
 
     def build(self, dict: dict[str, Any] | None = None) -> dict[str, Any]:
-        from pykis.api.auth.websocket import websocket_approval_key
-
         dict = dict or {}
 
         dict["header"] = {
-            "approval_key": websocket_approval_key(
-                self.kis,
-                domain=self.domain,
-            ).approval_key,
+            "approval_key": self.approval_key or self.kis._get_approval_key(self.domain),
             "custtype": "P",
             "tr_type": self.type,
             "content-type": "utf-8",
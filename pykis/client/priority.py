@@ -0,0 +1,49 @@
+from typing import Literal
+
+__all__ = [
+    "REQUEST_PRIORITY_TYPE",
+    "REQUEST_PRIORITIES",
+    "get_request_priority",
+]
+
+REQUEST_PRIORITY_TYPE = Literal["order", "account", "quote", "chart"]
+"""API 요청 우선순위 레인"""
+
+REQUEST_PRIORITIES: dict[REQUEST_PRIORITY_TYPE, int] = {
+    "order": 0,
+    "account": 1,
+    "quote": 2,
+    "chart": 3,
+}
+"""API 요청 우선순위 (낮을수록 먼저 처리)"""
+
+
+def get_request_priority(path: str) -> REQUEST_PRIORITY_TYPE:
+    """
+    API 경로로부터 요청 우선순위 레인을 추론합니다.
+
+    - `order`: 주문, 정정, 취소 (`/trading/order-cash`, `/trading/order-rvsecncl`, ...) 및 인증 요청
+    - `account`: 잔고, 체결, 주문 가능 금액 등 계좌 조회 (`/trading/*`)
+    - `chart`: 차트 조회 (`/quotations/*chartprice`, `/quotations/dailyprice`)
+    - `quote`: 그 외 시세 조회 (`/quotations/*`)
+
+    Args:
+        path: API 경로
+    """
+    path = path.rstrip("/")
+    name = path.rsplit("/", 1)[-1]
+
+    if path.startswith("/oauth2/"):
+        # 접속 토큰이 없으면 다른 요청도 처리할 수 없으므로 가장 먼저 처리합니다.
+        return "order"
+
+    if "/trading/" in path:
+        if name.startswith("order") or name.startswith("daytime-order"):
+            return "order"
+
+        return "account"
+
+    if "chartprice" in name or name == "dailyprice":
+        return "chart"
+
+    return "quote"
@@ -0,0 +1,229 @@
+from dataclasses import dataclass
+from multiprocessing import Lock
+from multiprocessing.synchronize import Lock as LockType
+from threading import Thread, current_thread
+from typing import Literal
+from weakref import WeakKeyDictionary, finalize
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from pykis.__env__ import USER_AGENT
+
+__all__ = [
+    "SESSION_STRATEGY_TYPE",
+    "KisSessionConfig",
+    "KisSessionStats",
+    "KisSession",
+]
+
+SESSION_STRATEGY_TYPE = Literal["shared", "thread_local"]
+"""HTTP 세션 사용 방식"""
+
+
+@dataclass
+class KisSessionConfig:
+    """HTTP 세션 설정"""
+
+    pool_connections: int = 10
+    """호스트별 연결 풀 개수"""
+    pool_maxsize: int = 10
+    """호스트당 최대 유지 연결 수"""
+    pool_block: bool = False
+    """연결 풀이 모두 사용 중일 때 대기할지 여부. False인 경우 새 연결을 만들고 반환 시 폐기합니다."""
+    keep_alive: bool = True
+    """연결 재사용(Keep-Alive) 여부"""
+    strategy: SESSION_STRATEGY_TYPE = "shared"
+    """세션 사용 방식. `shared`는 모든 스레드가 하나의 세션을, `thread_local`은 스레드마다 별도의 세션을 사용합니다."""
+
+
+@dataclass
+class KisSessionStats:
+    """HTTP 연결 풀 통계"""
+
+    requests: int = 0
+    """보낸 요청 수"""
+    connections: int = 0
+    """새로 만든 연결 수"""
+    discarded: int = 0
+    """연결 풀이 가득 차 폐기한 연결 수"""
+
+    @property
+    def reused(self) -> int:
+        """재사용한 연결 수"""
+        return max(self.requests - self.connections, 0)
+
+
+class _KisStatsRecorder:
+    __slots__ = ["stats", "_lock"]
+
+    stats: KisSessionStats
+    """통계"""
+    _lock: LockType
+    """Lock 객체"""
+
+    def __init__(self):
+        self.stats = KisSessionStats()
+        self._lock = Lock()
+
+    def add(self, requests: int = 0, connections: int = 0, discarded: int = 0) -> None:
+        with self._lock:
+            self.stats.requests += requests
+            self.stats.connections += connections
+            self.stats.discarded += discarded
+
+    def snapshot(self) -> KisSessionStats:
+        with self._lock:
+            return KisSessionStats(
+                requests=self.stats.requests,
+                connections=self.stats.connections,
+                discarded=self.stats.discarded,
+            )
+
+
+class _KisStatsPoolMixin:
+    _recorder: _KisStatsRecorder
+    _keep_alive: bool
+
+    def _new_conn(self):
+        self._recorder.add(connections=1)
+        return super()._new_conn()  # type: ignore
+
+    def _put_conn(self, conn) -> None:
+        pool = self.pool  # type: ignore
+
+        if conn is not None and not self._keep_alive:
+            # 연결을 재사용하지 않고 닫은 뒤 빈 자리만 반환합니다.
+            conn.close()
+            conn = None
+
+        if conn is not None and pool is not None and pool.full():
+            self._recorder.add(discarded=1)
+
+        super()._put_conn(conn)  # type: ignore
+
+
+class _KisHTTPAdapter(HTTPAdapter):
+    """연결 통계를 기록하는 HTTP 어댑터"""
+
+    _recorder: _KisStatsRecorder
+    _keep_alive: bool
+
+    def __init__(self, recorder: _KisStatsRecorder, config: KisSessionConfig):
+        self._recorder = recorder
+        self._keep_alive = config.keep_alive
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+
+        attrs = {"_recorder": self._recorder, "_keep_alive": self._keep_alive}
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("KisHTTPConnectionPool", (_KisStatsPoolMixin, HTTPConnectionPool), attrs),
+            "https": type("KisHTTPSConnectionPool", (_KisStatsPoolMixin, HTTPSConnectionPool), attrs),
+        }
+
+    def send(self, *args, **kwargs) -> requests.Response:
+        self._recorder.add(requests=1)
+        return super().send(*args, **kwargs)
+
+
+class KisSession:
+    """
+    도메인별 HTTP 세션
+
+    `shared` 방식은 모든 스레드가 하나의 `requests.Session`을 공유하고,
+    `thread_local` 방식은 스레드마다 별도의 `requests.Session`을 생성합니다.
+    스레드별 세션은 스레드 객체가 해제될 때 함께 종료됩니다.
+    """
+
+    __slots__ = [
+        "config",
+        "_recorder",
+        "_shared",
+        "_sessions",
+        "_lock",
+    ]
+
+    config: KisSessionConfig
+    """HTTP 세션 설정"""
+
+    _recorder: _KisStatsRecorder
+    """연결 통계"""
+    _shared: requests.Session | None
+    """공유 세션"""
+    _sessions: "WeakKeyDictionary[Thread, requests.Session]"
+    """스레드별 세션"""
+    _lock: LockType
+    """Lock 객체"""
+
+    def __init__(self, config: KisSessionConfig | None = None):
+        """
+        HTTP 세션을 생성합니다.
+
+        Args:
+            config: HTTP 세션 설정
+        """
+        self.config = config or KisSessionConfig()
+        self._recorder = _KisStatsRecorder()
+        self._shared = None
+        self._sessions = WeakKeyDictionary()
+        self._lock = Lock()
+
+    def _create(self) -> requests.Session:
+        """세션을 생성합니다. Lock을 획득한 상태에서 호출해야 합니다."""
+        session = requests.Session()
+        session.headers.update({"User-Agent": USER_AGENT})
+
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+
+        adapter = _KisHTTPAdapter(self._recorder, self.config)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
+
+    def get(self) -> requests.Session:
+        """현재 스레드에서 사용할 세션을 반환합니다."""
+        if self.config.strategy == "thread_local":
+            thread = current_thread()
+
+            if (session := self._sessions.get(thread)) is None:
+                with self._lock:
+                    session = self._sessions[thread] = self._create()
+
+                # 종료된 스레드의 세션이 쌓이지 않도록 스레드 객체가 해제될 때 연결을 닫습니다.
+                finalize(thread, session.close)
+
+            return session
+
+        if (session := self._shared) is None:
+            with self._lock:
+                if (session := self._shared) is None:
+                    session = self._shared = self._create()
+
+        return session
+
+    @property
+    def stats(self) -> KisSessionStats:
+        """연결 풀 통계"""
+        return self._recorder.snapshot()
+
+    def close(self) -> None:
+        """생성된 모든 세션을 종료합니다."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions = WeakKeyDictionary()
+
+            if self._shared is not None:
+                sessions.append(self._shared)
+                self._shared = None
+
+        for session in sessions:
+            session.close()
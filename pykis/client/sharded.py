@@ -0,0 +1,247 @@
+from threading import Lock
+from typing import TYPE_CHECKING, Iterable
+
+from pykis import logging
+from pykis.__env__ import WEBSOCKET_MAX_SUBSCRIPTIONS
+from pykis.client.appkey import KisKey
+from pykis.client.dispatcher import KisDispatchConfig, KisDispatchStats
+from pykis.client.messaging import KisWebsocketTR
+from pykis.client.websocket import KisWebsocketClient, KisWebsocketClientBase
+from pykis.event.subscription import KisSubscribedEventArgs, KisSubscriptionEventArgs
+from pykis.utils.thread_safe import thread_safe
+
+if TYPE_CHECKING:
+    from pykis.kis import PyKis
+
+__all__ = [
+    "KisShardedWebsocketClient",
+]
+
+
+class KisShardedWebsocketClient(KisWebsocketClientBase):
+    """
+    한국투자증권 분산 실시간 클라이언트
+
+    앱 키 또는 접속 키마다 별도의 웹소켓 세션을 열고, 구독을 가장 적게 구독한 세션에 나누어 등록합니다.
+    세션당 최대 구독 수(`WEBSOCKET_MAX_SUBSCRIPTIONS`)를 넘어 구독할 수 있으며,
+    모든 세션의 이벤트는 하나의 `event`로 전달되므로 기존 `on(...)` API를 그대로 사용할 수 있습니다.
+
+    주 서버 구독(`primary=True`, 체결통보)은 항상 첫 번째 세션에 등록합니다.
+    """
+
+    shards: tuple[KisWebsocketClient, ...]
+    """웹소켓 세션 목록. 첫 번째 세션은 기본 앱 키를 사용합니다."""
+
+    _placements: dict[KisWebsocketTR, KisWebsocketClient]
+    """TR별 구독한 웹소켓 세션"""
+    _moving: set[tuple[KisWebsocketClient, bool, KisWebsocketTR]]
+    """세션 간 구독 이동 중 전달하지 않을 (세션, 구독 여부, TR) 구독 이벤트"""
+    _moving_lock: Lock
+    """구독 이동 목록 락. 구독 이벤트는 각 세션의 수신 스레드에서 발생합니다."""
+
+    def __init__(
+        self,
+        kis: "PyKis",
+        appkeys: Iterable[KisKey | str],
+        dispatch: KisDispatchConfig | None = None,
+    ):
+        """
+        분산 실시간 클라이언트를 생성합니다.
+
+        Args:
+            kis: 한국투자증권 API
+            appkeys: 추가 웹소켓 세션에 사용할 앱 키 또는 발급된 접속 키 목록
+            dispatch: 세션별 이벤트 전달 큐 설정
+        """
+        super().__init__(kis)
+        self.shards = (
+            KisWebsocketClient(kis, dispatch=dispatch),
+            *(KisWebsocketClient(kis, dispatch=dispatch, appkey=appkey) for appkey in appkeys),
+        )
+        self._placements = {}
+        self._moving = set()
+        self._moving_lock = Lock()
+
+        for shard in self.shards:
+            shard.subscribed_event += self._shard_subscribed_event
+            shard.unsubscribed_event += self._shard_unsubscribed_event
+            shard.event += self._shard_event
+
+    @property
+    def max_subscriptions(self) -> int:
+        """최대 구독 수"""
+        return WEBSOCKET_MAX_SUBSCRIPTIONS * len(self.shards)
+
+    @property
+    def subscriptions(self) -> set[KisWebsocketTR]:
+        return set().union(*(shard.subscriptions for shard in self.shards))
+
+    @property
+    def loads(self) -> tuple[int, ...]:
+        """웹소켓 세션별 구독 수"""
+        return tuple(len(shard._subscriptions) for shard in self.shards)
+
+    @property
+    def connected(self) -> bool:
+        return all(shard.connected for shard in self._active_shards())
+
+    @property
+    def conflated(self) -> int:
+        return super().conflated + sum(shard.conflated for shard in self.shards)
+
+    @property
+    def dispatch_stats(self) -> KisDispatchStats | None:
+        """웹소켓 세션별 이벤트 전달 큐 통계의 합계. 이벤트 전달 큐를 사용하지 않는 경우 None입니다."""
+        result = None
+
+        for shard in self.shards:
+            if (stats := shard.dispatch_stats) is not None:
+                if result is None:
+                    result = KisDispatchStats()
+
+                result.merge(stats)
+
+        return result
+
+    def _active_shards(self) -> list[KisWebsocketClient]:
+        """접속이 필요한 웹소켓 세션 목록"""
+        return [shard for i, shard in enumerate(self.shards) if i == 0 or shard._subscriptions]
+
+    def is_subscribed(self, id: str, key: str = "") -> bool:
+        return any(shard.is_subscribed(id, key) for shard in self.shards)
+
+    def connect(self):
+        """구독이 있는 웹소켓 세션에 접속합니다. (비동기)"""
+        for shard in self._active_shards():
+            shard.connect()
+
+    def ensure_connected(self, timeout: float | None = None):
+        """
+        구독이 있는 웹소켓 세션의 접속 상태를 동기적으로 보장합니다.
+
+        Args:
+            timeout (float | None): 세션별 타임아웃 (초)
+        """
+        for shard in self._active_shards():
+            shard.ensure_connected(timeout=timeout)
+
+    def disconnect(self):
+        """모든 웹소켓 세션의 연결을 해제합니다."""
+        for shard in self.shards:
+            shard.disconnect()
+
+        self._close_conflating_callbacks()
+
+    @thread_safe("subscriptions")
+    def subscribe(self, id: str, key: str, primary: bool = False):
+        """
+        TR을 가장 적게 구독한 웹소켓 세션에 구독합니다.
+
+        Args:
+            id (str): TR ID
+            key (str): TR Key
+            primary (bool): 주 서버에 구독할지 여부
+
+        Raises:
+            ValueError: 모든 세션이 최대 구독 수를 초과했습니다.
+        """
+        if primary:
+            self.shards[0].subscribe(id, key, primary=True)
+            return
+
+        tr = KisWebsocketTR(id, key)
+        self._discard_moving(tr)
+
+        if tr in self._placements:
+            return
+
+        shard = min(self.shards, key=lambda shard: len(shard._subscriptions))
+
+        if len(shard._subscriptions) >= WEBSOCKET_MAX_SUBSCRIPTIONS:
+            logging.logger.warning("RTC Maximum number of subscriptions reached on all %d sessions", len(self.shards))
+            raise ValueError("Maximum number of subscriptions reached")
+
+        shard.subscribe(id, key)
+        self._placements[tr] = shard
+
+    @thread_safe("subscriptions")
+    def unsubscribe(self, id: str, key: str, primary: bool = False):
+        """
+        TR 구독을 취소하고 세션 간 구독 수를 다시 맞춥니다.
+
+        Args:
+            id (str): TR ID
+            key (str): TR Key
+            primary (bool): 주 서버에 구독을 취소할지 여부
+        """
+        tr = KisWebsocketTR(id, key)
+        self._discard_moving(tr)
+
+        # 참조 해제로 취소하는 경우 주 서버 구독 여부를 알 수 없으므로, 나누어 등록하지 않은 TR은 첫 번째 세션에서 취소합니다.
+        if primary or (shard := self._placements.pop(tr, None)) is None:
+            self.shards[0].unsubscribe(id, key, primary=True)
+            return
+
+        shard.unsubscribe(id, key)
+        self._rebalance()
+
+    @thread_safe("subscriptions")
+    def unsubscribe_all(self):
+        """모든 TR 구독을 취소합니다."""
+        for shard in self.shards:
+            shard.unsubscribe_all()
+
+        self._placements.clear()
+
+        with self._moving_lock:
+            self._moving.clear()
+
+    def _rebalance(self):
+        """구독 수가 가장 많은 세션과 가장 적은 세션의 차이가 2 이상인 경우 구독을 옮깁니다."""
+        while True:
+            most = max(self.shards, key=lambda shard: len(shard._subscriptions))
+            least = min(self.shards, key=lambda shard: len(shard._subscriptions))
+
+            if len(most._subscriptions) - len(least._subscriptions) < 2:
+                return
+
+            tr = next((tr for tr, shard in self._placements.items() if shard is most), None)
+
+            if tr is None:
+                return
+
+            logging.logger.debug("RTC Moving subscription %s to rebalance sessions", tr)
+            # 이벤트가 끊기지 않도록 새 세션에 먼저 구독한 뒤 기존 세션의 구독을 취소합니다.
+            # 사용자가 요청한 구독 변경이 아니므로 두 세션의 구독 추가, 해제 이벤트는 전달하지 않습니다.
+            with self._moving_lock:
+                self._moving.add((least, True, tr))
+                self._moving.add((most, False, tr))
+
+            least.subscribe(tr.id, tr.key)
+            self._placements[tr] = least
+            most.unsubscribe(tr.id, tr.key)
+
+    def _discard_moving(self, tr: KisWebsocketTR):
+        """사용자가 구독을 변경한 TR의 이동 중 구독 이벤트 표시를 제거합니다."""
+        with self._moving_lock:
+            self._moving = {moving for moving in self._moving if moving[2] != tr}
+
+    def _is_moving(self, sender: KisWebsocketClient, subscribed: bool, tr: KisWebsocketTR) -> bool:
+        """세션 간 구독 이동으로 발생한 구독 이벤트인지 확인합니다."""
+        with self._moving_lock:
+            if (sender, subscribed, tr) not in self._moving:
+                return False
+
+            self._moving.remove((sender, subscribed, tr))
+            return True
+
+    def _shard_subscribed_event(self, sender: KisWebsocketClient, args: KisSubscribedEventArgs):
+        if not self._is_moving(sender, True, args.tr):
+            self.subscribed_event.invoke(self, args)
+
+    def _shard_unsubscribed_event(self, sender: KisWebsocketClient, args: KisSubscribedEventArgs):
+        if not self._is_moving(sender, False, args.tr):
+            self.unsubscribed_event.invoke(self, args)
+
+    def _shard_event(self, sender: KisWebsocketClient, args: KisSubscriptionEventArgs):
+        self.event.invoke(self, args)
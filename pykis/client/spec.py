@@ -0,0 +1,163 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generator,
+    Generic,
+    Iterable,
+    Literal,
+    TypeVar,
+)
+
+from pykis.client.form import KisForm
+from pykis.client.priority import REQUEST_PRIORITY_TYPE
+from pykis.responses.dynamic import RAW_RETENTION_TYPE
+from pykis.responses.types import KisDynamicDict
+
+__all__ = [
+    "KisRequestSpec",
+    "KisRequestPlan",
+    "execute_plan",
+    "execute_plan_async",
+]
+
+T = TypeVar("T")
+
+
+@dataclass
+class KisRequestSpec(Generic[T]):
+    """
+    API 요청 명세
+
+    동기(`PyKis`)와 비동기(`AsyncPyKis`) 클라이언트가 같은 명세로 `fetch`를 실행합니다.
+    """
+
+    path: str
+    """API 경로"""
+    api: str | None = None
+    """TR ID"""
+    method: Literal["GET", "POST"] = "GET"
+    """HTTP 메서드"""
+    params: dict[str, str] | None = None
+    """쿼리 파라미터"""
+    body: dict[str, str] | None = None
+    """요청 본문"""
+    form: Iterable[KisForm | None] | None = None
+    """요청 폼 (계좌번호, 페이지 등)"""
+    headers: dict[str, str] | None = None
+    """추가 헤더"""
+    domain: Literal["real", "virtual"] | None = None
+    """요청 도메인. None일 경우 모의투자 여부를 따릅니다."""
+    form_location: Literal["header", "params", "body"] | None = None
+    """요청 폼 위치"""
+    priority: REQUEST_PRIORITY_TYPE | None = None
+    """요청 우선순위. None일 경우 API 경로로 판단합니다."""
+    continuous: bool = False
+    """연속 조회 여부"""
+    response_type: Any = KisDynamicDict
+    """응답 타입"""
+    fields: Iterable[str] | None = None
+    """변환할 필드 이름"""
+    raw_retention: RAW_RETENTION_TYPE | None = None
+    """원본 응답 데이터 보관 방식"""
+    options: dict[str, Any] = field(default_factory=dict)
+    """기타 `fetch` 인자"""
+
+    def kwargs(self) -> dict[str, Any]:
+        """`fetch` 인자를 반환합니다."""
+        return dict(
+            method=self.method,
+            params=self.params,
+            body=self.body,
+            form=self.form,
+            headers=None if self.headers is None else dict(self.headers),
+            domain=self.domain,
+            form_location=self.form_location,
+            priority=self.priority,
+            api=self.api,
+            continuous=self.continuous,
+            response_type=self.response_type,
+            fields=self.fields,
+            raw_retention=self.raw_retention,
+            **self.options,
+        )
+
+
+KisRequestPlan = Generator[Any, Any, T]
+"""
+API 요청 계획
+
+요청 명세(`KisRequestSpec`), 다른 요청 계획, 또는 이들의 튜플을 yield하면 실행 결과를 돌려받습니다.
+튜플로 yield한 요청은 비동기 클라이언트에서 동시에 실행합니다. 요청이 실패한 경우 yield 위치에서 예외가 발생합니다.
+여러 번 호출하는 조회(연속 조회, 페이지네이션)와 캐시 처리를 두 클라이언트가 공유합니다.
+
+Example:
+    >>> def domestic_quote_plan(self: "PyKis", symbol: str) -> KisRequestPlan[KisDomesticQuote]:
+    ...     return (yield KisRequestSpec("/uapi/domestic-stock/v1/quotations/inquire-price", api="FHKST01010100", ...))
+    >>> kis.execute(domestic_quote_plan(kis, "005930"))
+    >>> await kis.aio.execute(domestic_quote_plan(kis, "005930"))
+"""
+
+
+def execute_plan(
+    plan: KisRequestSpec[T] | KisRequestPlan[T],
+    fetch: Callable[..., Any],
+) -> T:
+    """
+    요청 계획을 동기적으로 실행합니다.
+
+    Args:
+        plan: 요청 명세 또는 요청 계획
+        fetch: 요청 명세를 실행할 함수 (`PyKis.fetch`)
+    """
+    if isinstance(plan, KisRequestSpec):
+        return fetch(plan.path, **plan.kwargs())
+
+    if isinstance(plan, tuple):
+        return tuple(execute_plan(step, fetch) for step in plan)  # type: ignore
+
+    try:
+        step = plan.send(None)
+
+        while True:
+            try:
+                value = execute_plan(step, fetch)
+            except Exception as e:
+                step = plan.throw(e)
+            else:
+                step = plan.send(value)
+    except StopIteration as e:
+        return e.value
+
+
+async def execute_plan_async(
+    plan: KisRequestSpec[T] | KisRequestPlan[T],
+    fetch: Callable[..., Awaitable[Any]],
+) -> T:
+    """
+    요청 계획을 비동기로 실행합니다. 튜플로 yield한 요청은 동시에 실행합니다.
+
+    Args:
+        plan: 요청 명세 또는 요청 계획
+        fetch: 요청 명세를 실행할 함수 (`AsyncPyKis.fetch`)
+    """
+    if isinstance(plan, KisRequestSpec):
+        return await fetch(plan.path, **plan.kwargs())
+
+    if isinstance(plan, tuple):
+        return tuple(await asyncio.gather(*(execute_plan_async(step, fetch) for step in plan)))  # type: ignore
+
+    try:
+        step = plan.send(None)
+
+        while True:
+            try:
+                value = await execute_plan_async(step, fetch)
+            except Exception as e:
+                step = plan.throw(e)
+            else:
+                step = plan.send(value)
+    except StopIteration as e:
+        return e.value
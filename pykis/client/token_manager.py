@@ -0,0 +1,224 @@
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from multiprocessing import Lock
+from multiprocessing.synchronize import Lock as LockType
+from threading import Event, Thread, current_thread
+from typing import TYPE_CHECKING, Literal
+
+from pykis import logging
+from pykis.utils.timezone import TIMEZONE
+
+if TYPE_CHECKING:
+    from pykis.kis import PyKis
+
+__all__ = [
+    "TOKEN_REFRESH_MARGIN",
+    "KisTokenRefreshStatus",
+    "KisTokenManager",
+]
+
+TOKEN_REFRESH_MARGIN = timedelta(minutes=10)
+"""요청 시 API 접속 토큰을 재발급하는 남은 유효기간 기준"""
+
+
+@dataclass
+class KisTokenRefreshStatus:
+    """도메인별 API 접속 토큰 갱신 상태"""
+
+    next_refresh: datetime | None = None
+    """다음 갱신 예정 시각"""
+    last_refresh: datetime | None = None
+    """마지막 갱신 성공 시각"""
+    last_error: BaseException | None = None
+    """마지막 갱신 실패 예외"""
+    refreshes: int = 0
+    """갱신 성공 횟수"""
+    failures: int = 0
+    """연속 갱신 실패 횟수"""
+
+
+class KisTokenManager:
+    """
+    API 접속 토큰 자동 갱신 관리자
+
+    별도의 데몬 스레드에서 토큰 만료 `refresh_before` 전에 새 토큰을 발급받아 교체합니다.
+    요청 스레드는 Lock 없이 현재 토큰을 읽기만 하므로 토큰 갱신이 요청 경로를 막지 않습니다.
+    """
+
+    __slots__ = [
+        "refresh_before",
+        "retry_interval",
+        "_kis",
+        "_status",
+        "_attempts",
+        "_thread",
+        "_wakeup",
+        "_stopped",
+        "_lock",
+    ]
+
+    refresh_before: timedelta
+    """만료 전 갱신 시점"""
+    retry_interval: timedelta
+    """갱신 실패 또는 재발급 후 다음 시도까지의 최소 간격"""
+
+    _kis: "weakref.ref[PyKis]"
+    """PyKis 객체 약한 참조"""
+    _status: dict[Literal["real", "virtual"], KisTokenRefreshStatus]
+    """도메인별 갱신 상태"""
+    _attempts: dict[Literal["real", "virtual"], datetime]
+    """도메인별 마지막 갱신 시도 시각"""
+    _thread: Thread | None
+    """갱신 스레드"""
+    _wakeup: Event
+    """갱신 일정 재계산 이벤트"""
+    _stopped: Event
+    """중지 이벤트"""
+    _lock: LockType
+    """Lock 객체"""
+
+    def __init__(
+        self,
+        kis: "PyKis",
+        refresh_before: timedelta = timedelta(hours=1),
+        retry_interval: timedelta = timedelta(seconds=30),
+    ):
+        """
+        API 접속 토큰 자동 갱신 관리자를 생성합니다.
+
+        Args:
+            kis: PyKis 객체
+            refresh_before: 만료 전 갱신 시점
+            retry_interval: 갱신 실패 또는 재발급 후 다음 시도까지의 최소 간격
+        """
+        self.refresh_before = refresh_before
+        self.retry_interval = retry_interval
+        self._kis = weakref.ref(kis)
+        self._status = {}
+        self._attempts = {}
+        self._thread = None
+        self._wakeup = Event()
+        self._stopped = Event()
+        self._lock = Lock()
+
+    @property
+    def running(self) -> bool:
+        """갱신 스레드 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def status(self) -> dict[Literal["real", "virtual"], KisTokenRefreshStatus]:
+        """도메인별 갱신 상태"""
+        with self._lock:
+            return {
+                domain: KisTokenRefreshStatus(
+                    next_refresh=status.next_refresh,
+                    last_refresh=status.last_refresh,
+                    last_error=status.last_error,
+                    refreshes=status.refreshes,
+                    failures=status.failures,
+                )
+                for domain, status in self._status.items()
+            }
+
+    def start(self) -> None:
+        """갱신 스레드를 시작합니다."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._stopped.clear()
+            self._thread = Thread(target=self._run, name="pykis-token-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        갱신 스레드를 중지합니다.
+
+        Args:
+            timeout: 스레드 종료 대기 시간(초)
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+
+        self._stopped.set()
+        self._wakeup.set()
+
+        if thread is not None and thread.is_alive() and thread is not current_thread():
+            thread.join(timeout)
+
+    def invalidate(self) -> None:
+        """토큰이 폐기되었음을 알리고 갱신 일정을 즉시 다시 계산합니다."""
+        self._wakeup.set()
+
+    def _schedule(self, kis: "PyKis", now: datetime) -> tuple[Literal["real", "virtual"], datetime]:
+        domains: list[Literal["real", "virtual"]] = ["real", "virtual"] if kis.virtual else ["real"]
+        schedule: dict[Literal["real", "virtual"], datetime] = {}
+
+        with self._lock:
+            for domain in domains:
+                token = kis._token if domain == "real" else kis._virtual_token
+                at = now if token is None else token.expired_at - self.refresh_before
+
+                # 재발급한 토큰의 만료 시각이 바뀌지 않은 경우 반복 발급하지 않도록 최소 간격을 둡니다.
+                if (attempt := self._attempts.get(domain)) is not None:
+                    at = max(at, attempt + self.retry_interval)
+
+                schedule[domain] = at
+                self._status.setdefault(domain, KisTokenRefreshStatus()).next_refresh = at
+
+        return min(schedule.items(), key=lambda item: item[1])
+
+    def _refresh(self, kis: "PyKis", domain: Literal["real", "virtual"]) -> None:
+        with self._lock:
+            self._attempts[domain] = datetime.now(TIMEZONE)
+
+        try:
+            token = kis._issue_token(domain, remaining=self.refresh_before)
+        except Exception as e:
+            with self._lock:
+                status = self._status.setdefault(domain, KisTokenRefreshStatus())
+                status.last_error = e
+                status.failures += 1
+                failures = status.failures
+
+            logging.logger.error(
+                "%s API 접속 토큰 갱신에 실패했습니다. (%d회 연속): %s",
+                "실전도메인" if domain == "real" else "모의도메인",
+                failures,
+                e,
+            )
+            return
+
+        with self._lock:
+            status = self._status.setdefault(domain, KisTokenRefreshStatus())
+            status.last_refresh = datetime.now(TIMEZONE)
+            status.last_error = None
+            status.refreshes += 1
+            status.failures = 0
+
+        logging.logger.info(
+            "%s API 접속 토큰을 갱신했습니다. (만료: %s)",
+            "실전도메인" if domain == "real" else "모의도메인",
+            token.expired_at,
+        )
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            if (kis := self._kis()) is None:
+                break
+
+            now = datetime.now(TIMEZONE)
+            domain, at = self._schedule(kis, now)
+
+            if at > now:
+                del kis
+                # 토큰이 외부에서 교체될 수 있으므로 최대 1분마다 일정을 다시 계산합니다.
+                self._wakeup.wait(min((at - now).total_seconds(), 60))
+                self._wakeup.clear()
+                continue
+
+            self._refresh(kis, domain)
+            del kis
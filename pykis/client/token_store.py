@@ -0,0 +1,211 @@
+import os
+from multiprocessing import Lock
+from multiprocessing.synchronize import Lock as LockType
+from os import PathLike
+from pathlib import Path
+from time import monotonic
+from typing import Callable
+
+from pykis import logging
+from pykis.api.auth.token import KisAccessToken
+from pykis.utils.codec import KisJSONCodec
+from pykis.utils.file_lock import FileLock
+
+__all__ = [
+    "KisTokenStore",
+]
+
+
+class _KisTokenFile:
+    __slots__ = ["path", "lock", "mtime", "token", "stale", "checked_at"]
+
+    path: Path
+    """토큰 파일 경로"""
+    lock: FileLock
+    """토큰 파일 Lock"""
+    mtime: int | None
+    """마지막으로 읽은 파일 수정 시각"""
+    token: KisAccessToken | None
+    """마지막으로 읽은 토큰"""
+    stale: str | None
+    """폐기된 토큰"""
+    checked_at: float
+    """마지막 수정 시각 확인 시각"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = FileLock(path.with_name(f"{path.name}.lock"))
+        self.mtime = None
+        self.token = None
+        self.stale = None
+        self.checked_at = 0
+
+
+class KisTokenStore:
+    """
+    프로세스 간 공유 API 접속 토큰 저장소
+
+    토큰 파일마다 Lock 파일을 두어 여러 프로세스가 동시에 토큰을 발급하지 않도록 합니다.
+    Lock을 먼저 획득한 프로세스만 토큰을 발급하여 저장하고, 나머지 프로세스는 대기 후 저장된 토큰을 재사용합니다.
+    또한 파일 수정 시각을 확인하여 다른 프로세스가 갱신한 토큰을 발급 없이 불러옵니다.
+    """
+
+    __slots__ = [
+        "path",
+        "poll_interval",
+        "codec",
+        "_files",
+        "_lock",
+    ]
+
+    path: Path
+    """토큰 저장 폴더"""
+    poll_interval: float
+    """파일 수정 시각 확인 간격(초)"""
+    codec: KisJSONCodec | None
+    """토큰 파일 JSON 변환 객체"""
+
+    _files: dict[str, _KisTokenFile]
+    """토큰 파일"""
+    _lock: LockType
+    """Lock 객체"""
+
+    def __init__(self, path: str | PathLike[str], poll_interval: float = 1, codec: KisJSONCodec | None = None):
+        """
+        프로세스 간 공유 API 접속 토큰 저장소를 생성합니다.
+
+        Args:
+            path: 토큰 저장 폴더
+            poll_interval: 파일 수정 시각 확인 간격(초)
+            codec: 토큰 파일 JSON 변환 객체. None일 경우 기본 JSON 변환 객체를 사용합니다.
+        """
+        self.path = Path(path).expanduser().resolve()
+        self.poll_interval = poll_interval
+        self.codec = codec
+        self._files = {}
+        self._lock = Lock()
+
+    def _get_file(self, name: str) -> _KisTokenFile:
+        if (file := self._files.get(name)) is None:
+            with self._lock:
+                if (file := self._files.get(name)) is None:
+                    file = self._files[name] = _KisTokenFile(self.path / name)
+
+        return file
+
+    def _read(self, file: _KisTokenFile) -> KisAccessToken | None:
+        """파일이 변경된 경우 토큰을 다시 읽습니다."""
+        file.checked_at = monotonic()
+
+        try:
+            mtime = file.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        if mtime != file.mtime:
+            try:
+                file.token = KisAccessToken.load(file.path, self.codec)
+                file.mtime = mtime
+            except Exception:
+                # 다른 프로세스가 쓰는 중이거나 손상된 파일은 무시합니다.
+                return None
+
+        token = file.token
+
+        if token is not None and token.token == file.stale:
+            return None
+
+        return token
+
+    def _write(self, file: _KisTokenFile, token: KisAccessToken) -> None:
+        """다른 프로세스가 쓰는 중인 파일을 읽지 않도록 임시 파일에 저장한 뒤 교체합니다."""
+        file.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = file.path.with_name(f"{file.path.name}.{os.getpid()}.tmp")
+        token.save(temp, self.codec)
+        os.replace(temp, file.path)
+
+        file.token = token
+        file.mtime = file.path.stat().st_mtime_ns
+        file.stale = None
+
+    def load(self, name: str) -> KisAccessToken | None:
+        """
+        저장된 토큰을 불러옵니다.
+
+        Args:
+            name: 토큰 파일 이름
+        """
+        return self._read(self._get_file(name))
+
+    def poll(self, name: str) -> KisAccessToken | None:
+        """
+        `poll_interval`마다 파일 수정 시각을 확인하여 다른 프로세스가 갱신한 토큰을 반환합니다.
+        확인 간격이 지나지 않았거나 변경되지 않은 경우 None을 반환합니다.
+
+        Args:
+            name: 토큰 파일 이름
+        """
+        file = self._get_file(name)
+
+        if monotonic() - file.checked_at < self.poll_interval:
+            return None
+
+        previous = file.mtime
+        token = self._read(file)
+
+        return token if file.mtime != previous else None
+
+    def save(self, name: str, token: KisAccessToken) -> None:
+        """
+        토큰을 저장합니다.
+
+        Args:
+            name: 토큰 파일 이름
+            token: API 접속 토큰
+        """
+        file = self._get_file(name)
+
+        with file.lock:
+            self._write(file, token)
+
+    def invalidate(self, name: str, token: KisAccessToken | str | None = None) -> None:
+        """
+        토큰이 폐기되었음을 기록합니다. 폐기된 토큰은 파일에 남아 있더라도 재사용하지 않습니다.
+
+        Args:
+            name: 토큰 파일 이름
+            token: 폐기된 토큰. None인 경우 마지막으로 읽은 토큰
+        """
+        file = self._get_file(name)
+
+        if token is None:
+            token = file.token
+
+        if isinstance(token, KisAccessToken):
+            token = token.token
+
+        file.stale = token
+
+    def issue(self, name: str, issue: Callable[[], KisAccessToken], remaining: float = 0) -> KisAccessToken:
+        """
+        저장된 토큰의 남은 유효기간이 `remaining`초 이상인 경우 재사용하고, 그렇지 않은 경우 발급하여 저장합니다.
+        다른 프로세스가 발급 중인 경우 발급이 끝날 때까지 대기합니다.
+
+        Args:
+            name: 토큰 파일 이름
+            issue: 토큰 발급 함수
+            remaining: 재발급 기준 남은 유효기간(초)
+        """
+        file = self._get_file(name)
+
+        with file.lock:
+            token = self._read(file)
+
+            if token is not None and token.remaining.total_seconds() >= remaining:
+                logging.logger.debug("다른 프로세스가 발급한 API 접속 토큰을 불러왔습니다.")
+                return token
+
+            token = issue()
+            self._write(file, token)
+
+            return token
@@ -0,0 +1,379 @@
+import json
+from typing import Any, Literal, Mapping, Protocol, runtime_checkable
+
+import requests
+import urllib3
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout as RequestsTimeout
+
+from pykis.__env__ import USER_AGENT
+from pykis.client.exceptions import KisNetworkError
+from pykis.client.session import (
+    KisSession,
+    KisSessionConfig,
+    KisSessionStats,
+    _KisStatsPoolMixin,
+    _KisStatsRecorder,
+)
+
+__all__ = [
+    "TRANSPORT_TYPE",
+    "KisHTTPRequestProtocol",
+    "KisHTTPResponseProtocol",
+    "KisHTTPRequest",
+    "KisHTTPResponse",
+    "KisTransport",
+    "RequestsTransport",
+    "Urllib3Transport",
+    "create_transport",
+]
+
+TRANSPORT_TYPE = Literal["requests", "urllib3"]
+"""HTTP 전송 방식"""
+
+
+@runtime_checkable
+class KisHTTPRequestProtocol(Protocol):
+    """HTTP 요청 프로토콜. `requests.PreparedRequest`와 호환됩니다."""
+
+    @property
+    def method(self) -> str | None:
+        """요청 메소드"""
+        ...
+
+    @property
+    def url(self) -> str | None:
+        """요청 URL"""
+        ...
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """요청 헤더"""
+        ...
+
+    @property
+    def body(self) -> bytes | str | None:
+        """요청 본문"""
+        ...
+
+
+@runtime_checkable
+class KisHTTPResponseProtocol(Protocol):
+    """HTTP 응답 프로토콜. `requests.Response`와 호환됩니다."""
+
+    @property
+    def status_code(self) -> int:
+        """HTTP 상태 코드"""
+        ...
+
+    @property
+    def reason(self) -> str | None:
+        """HTTP 상태 메시지"""
+        ...
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """응답 헤더 (대소문자 구분 없음)"""
+        ...
+
+    @property
+    def content(self) -> bytes:
+        """응답 본문"""
+        ...
+
+    @property
+    def text(self) -> str:
+        """응답 본문 문자열"""
+        ...
+
+    @property
+    def ok(self) -> bool:
+        """성공 여부 (HTTP 상태 코드 400 미만)"""
+        ...
+
+    @property
+    def request(self) -> KisHTTPRequestProtocol:
+        """요청 객체"""
+        ...
+
+    def json(self) -> Any:
+        """응답 본문을 JSON으로 변환합니다."""
+        ...
+
+
+class KisHTTPRequest:
+    """HTTP 요청"""
+
+    __slots__ = ["method", "url", "headers", "body"]
+
+    method: str
+    """요청 메소드"""
+    url: str
+    """요청 URL (쿼리 문자열 포함)"""
+    headers: dict[str, str]
+    """요청 헤더"""
+    body: bytes | None
+    """요청 본문"""
+
+    def __init__(self, method: str, url: str, headers: dict[str, str] | None = None, body: bytes | None = None):
+        self.method = method
+        self.url = url
+        self.headers = headers or {}
+        self.body = body
+
+    def __repr__(self) -> str:
+        return f"<KisHTTPRequest [{self.method}] {self.url}>"
+
+
+class KisHTTPResponse:
+    """HTTP 응답"""
+
+    __slots__ = ["status_code", "reason", "headers", "content", "request", "encoding"]
+
+    status_code: int
+    """HTTP 상태 코드"""
+    reason: str | None
+    """HTTP 상태 메시지"""
+    headers: Mapping[str, str]
+    """응답 헤더 (대소문자 구분 없음)"""
+    content: bytes
+    """응답 본문"""
+    request: KisHTTPRequestProtocol
+    """요청 객체"""
+    encoding: str
+    """응답 본문 인코딩"""
+
+    def __init__(
+        self,
+        status_code: int,
+        reason: str | None,
+        headers: Mapping[str, str],
+        content: bytes,
+        request: KisHTTPRequestProtocol,
+        encoding: str | None = None,
+    ):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.request = request
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def url(self) -> str | None:
+        """요청 URL"""
+        return self.request.url
+
+    @property
+    def ok(self) -> bool:
+        """성공 여부 (HTTP 상태 코드 400 미만)"""
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        """응답 본문 문자열"""
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        """응답 본문을 JSON으로 변환합니다."""
+        return json.loads(self.content)
+
+    def __repr__(self) -> str:
+        return f"<KisHTTPResponse [{self.status_code}]>"
+
+
+class KisTransport(Protocol):
+    """
+    HTTP 전송 프로토콜
+
+    준비된 요청을 보내고 상태 코드, 헤더, 본문을 가진 응답을 반환합니다.
+    연결 오류와 응답 시간 초과는 `KisNetworkError`로 변환해야 합니다.
+    """
+
+    @property
+    def stats(self) -> KisSessionStats:
+        """연결 풀 통계"""
+        ...
+
+    def send(
+        self,
+        request: KisHTTPRequest,
+        timeout: float | tuple[float, float] | None = None,
+    ) -> KisHTTPResponseProtocol:
+        """
+        요청을 보냅니다.
+
+        Args:
+            request: HTTP 요청
+            timeout: (연결, 읽기) 제한 시간(초)
+
+        Raises:
+            KisNetworkError: 연결 오류 또는 응답 시간 초과
+        """
+        ...
+
+    def close(self) -> None:
+        """연결을 종료합니다."""
+        ...
+
+
+class RequestsTransport:
+    """`requests` 세션을 사용하는 HTTP 전송"""
+
+    __slots__ = ["session"]
+
+    session: KisSession
+    """HTTP 세션"""
+
+    def __init__(self, config: KisSessionConfig | None = None):
+        """
+        `requests` 세션을 사용하는 HTTP 전송을 생성합니다.
+
+        Args:
+            config: HTTP 세션 설정
+        """
+        self.session = KisSession(config)
+
+    @property
+    def stats(self) -> KisSessionStats:
+        """연결 풀 통계"""
+        return self.session.stats
+
+    def send(
+        self,
+        request: KisHTTPRequest,
+        timeout: float | tuple[float, float] | None = None,
+    ) -> requests.Response:
+        try:
+            return self.session.get().request(
+                method=request.method,
+                url=request.url,
+                headers=request.headers,
+                data=request.body,
+                timeout=timeout,
+            )
+        except RequestsTimeout as e:
+            raise KisNetworkError(str(e), timed_out=True) from e
+        except RequestsConnectionError as e:
+            raise KisNetworkError(str(e)) from e
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Transport:
+    """
+    `urllib3` 연결 풀을 직접 사용하는 HTTP 전송
+
+    `requests`의 세션, 어댑터, 응답 객체 생성 단계를 거치지 않아 요청당 오버헤드가 적습니다.
+    """
+
+    __slots__ = ["config", "_pool", "_recorder"]
+
+    config: KisSessionConfig
+    """HTTP 세션 설정"""
+
+    _pool: urllib3.PoolManager
+    """연결 풀 관리자"""
+    _recorder: _KisStatsRecorder
+    """연결 통계"""
+
+    def __init__(self, config: KisSessionConfig | None = None):
+        """
+        `urllib3` 연결 풀을 직접 사용하는 HTTP 전송을 생성합니다.
+
+        Args:
+            config: HTTP 세션 설정. `strategy`는 무시되며 연결 풀은 항상 스레드 간에 공유됩니다.
+        """
+        self.config = config = config or KisSessionConfig()
+        self._recorder = _KisStatsRecorder()
+
+        headers = {"User-Agent": USER_AGENT}
+
+        if not config.keep_alive:
+            headers["Connection"] = "close"
+
+        self._pool = urllib3.PoolManager(
+            num_pools=config.pool_connections,
+            maxsize=config.pool_maxsize,
+            block=config.pool_block,
+            headers=headers,
+            retries=False,
+        )
+
+        attrs = {"_recorder": self._recorder, "_keep_alive": config.keep_alive}
+        self._pool.pool_classes_by_scheme = {
+            "http": type("KisHTTPConnectionPool", (_KisStatsPoolMixin, urllib3.HTTPConnectionPool), attrs),
+            "https": type("KisHTTPSConnectionPool", (_KisStatsPoolMixin, urllib3.HTTPSConnectionPool), attrs),
+        }
+
+    @property
+    def stats(self) -> KisSessionStats:
+        """연결 풀 통계"""
+        return self._recorder.snapshot()
+
+    def send(
+        self,
+        request: KisHTTPRequest,
+        timeout: float | tuple[float, float] | None = None,
+    ) -> KisHTTPResponse:
+        if isinstance(timeout, tuple):
+            timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        elif timeout is not None:
+            timeout = urllib3.Timeout(connect=timeout, read=timeout)
+
+        self._recorder.add(requests=1)
+
+        try:
+            response = self._pool.urlopen(
+                request.method,
+                request.url,
+                body=request.body,
+                headers={**self._pool.headers, **request.headers},
+                timeout=timeout if timeout is not None else urllib3.Timeout(None),
+                redirect=False,
+            )
+        except urllib3.exceptions.NewConnectionError as e:
+            # urllib3 2.x에서 연결 실패는 ConnectTimeoutError를 상속하므로 응답 시간 초과보다 먼저 처리합니다.
+            raise KisNetworkError(str(e)) from e
+        except urllib3.exceptions.TimeoutError as e:
+            raise KisNetworkError(str(e), timed_out=True) from e
+        except urllib3.exceptions.HTTPError as e:
+            raise KisNetworkError(str(e)) from e
+
+        content_type = response.headers.get("Content-Type", "")
+        encoding = None
+
+        if "charset=" in content_type:
+            encoding = content_type.split("charset=", 1)[1].split(";", 1)[0].strip().strip('"') or None
+
+        return KisHTTPResponse(
+            status_code=response.status,
+            reason=response.reason,
+            headers=response.headers,
+            content=response.data,
+            request=request,
+            encoding=encoding,
+        )
+
+    def close(self) -> None:
+        self._pool.clear()
+
+
+def create_transport(type: TRANSPORT_TYPE, config: KisSessionConfig | None = None) -> KisTransport:
+    """
+    HTTP 전송 객체를 생성합니다.
+
+    Args:
+        type: HTTP 전송 방식
+        config: HTTP 세션 설정
+    """
+    match type:
+        case "requests":
+            return RequestsTransport(config)
+
+        case "urllib3":
+            return Urllib3Transport(config)
+
+        case _:
+            raise ValueError(f"지원하지 않는 HTTP 전송 방식입니다. ({type})")
@@ -0,0 +1,161 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal
+
+from pykis import logging
+from pykis.__env__ import REAL_DOMAIN, VIRTUAL_DOMAIN
+from pykis.client.transport import KisHTTPRequest
+
+if TYPE_CHECKING:
+    from pykis.api.stock.info import MARKET_INFO_TYPES
+    from pykis.kis import PyKis
+
+__all__ = [
+    "KisWarmupStep",
+    "KisWarmupResult",
+    "warmup",
+]
+
+
+@dataclass
+class KisWarmupStep:
+    """사전 준비 단계 결과"""
+
+    name: str
+    """단계 이름"""
+    elapsed: float
+    """소요 시간(초)"""
+    error: BaseException | None = None
+    """발생한 예외"""
+
+    @property
+    def ok(self) -> bool:
+        """성공 여부"""
+        return self.error is None
+
+
+@dataclass
+class KisWarmupResult:
+    """사전 준비 결과"""
+
+    steps: dict[str, KisWarmupStep] = field(default_factory=dict)
+    """단계별 결과"""
+    elapsed: float = 0
+    """전체 소요 시간(초)"""
+
+    @property
+    def ok(self) -> bool:
+        """모든 단계 성공 여부"""
+        return all(step.ok for step in self.steps.values())
+
+    @property
+    def errors(self) -> dict[str, BaseException]:
+        """실패한 단계의 예외"""
+        return {name: step.error for name, step in self.steps.items() if step.error is not None}
+
+
+def _run_steps(
+    steps: dict[str, Callable[[], Any]],
+    result: KisWarmupResult,
+    max_workers: int,
+) -> None:
+    def run(name: str, fn: Callable[[], Any]) -> KisWarmupStep:
+        start = time.perf_counter()
+
+        try:
+            fn()
+            return KisWarmupStep(name, time.perf_counter() - start)
+        except Exception as e:
+            logging.logger.warning("사전 준비 단계 %s에 실패했습니다: %s", name, e)
+            return KisWarmupStep(name, time.perf_counter() - start, e)
+
+    if not steps:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(steps)), thread_name_prefix="pykis-warmup") as executor:
+        for step in executor.map(lambda item: run(*item), steps.items()):
+            result.steps[step.name] = step
+
+
+def warmup(
+    self: "PyKis",
+    symbols: Iterable[str | tuple[str, "MARKET_INFO_TYPES"]] | None = None,
+    websocket: bool = True,
+    connections: int = 2,
+    timeout: float | None = 10,
+    max_workers: int = 8,
+) -> KisWarmupResult:
+    """
+    장 시작 전 연결, 토큰, 웹소켓, 종목 정보를 미리 준비합니다.
+
+    1단계에서 도메인별 연결 풀 연결, API 접속 토큰 발급, 웹소켓 접속 키 발급을 병렬로 수행하고,
+    2단계에서 웹소켓 접속과 종목 정보(`info`, `quotable_market`) 캐시 적재를 병렬로 수행합니다.
+    실패한 단계는 예외를 발생시키지 않고 결과에 기록합니다.
+
+    Args:
+        symbols (Iterable[str | tuple[str, MARKET_INFO_TYPES]], optional): 종목 정보를 미리 조회할 종목 목록. 종목코드 또는 (종목코드, 상품유형명)
+        websocket (bool, optional): 웹소켓 접속 키 발급 및 접속 여부
+        connections (int, optional): 도메인별로 미리 열어둘 연결 수
+        timeout (float | None, optional): 연결 및 웹소켓 접속 대기 시간(초)
+        max_workers (int, optional): 최대 병렬 작업 수
+
+    Examples:
+        >>> result = kis.warmup(symbols=["005930", ("AAPL", "NASDAQ")])
+        >>> result.steps["token:real"].elapsed
+        0.123
+    """
+    from pykis.api.stock.info import info
+
+    start = time.perf_counter()
+    result = KisWarmupResult()
+    domains: list[Literal["real", "virtual"]] = ["real", "virtual"] if self.virtual else ["real"]
+    use_websocket = websocket and self._websocket is not None
+
+    def connect(domain: Literal["real", "virtual"]) -> None:
+        url = REAL_DOMAIN if domain == "real" else VIRTUAL_DOMAIN
+
+        # 응답 코드와 상관없이 TLS 연결을 맺어 연결 풀에 반환합니다.
+        self._transports[domain].send(KisHTTPRequest("HEAD", url), timeout=timeout)
+
+    def connect_websocket() -> None:
+        self.websocket.ensure_connected(timeout=timeout)
+
+        if not self.websocket.connected:
+            raise TimeoutError("웹소켓 접속 시간이 초과되었습니다.")
+
+    steps: dict[str, Callable[[], Any]] = {}
+
+    for domain in domains:
+        for i in range(connections):
+            steps[f"connection:{domain}:{i}"] = lambda domain=domain: connect(domain)
+
+        steps[f"token:{domain}"] = (lambda: self.token) if domain == "real" else (lambda: self.primary_token)
+
+        if use_websocket:
+            steps[f"approval_key:{domain}"] = lambda domain=domain: self._get_approval_key(domain)
+
+    _run_steps(steps, result, max_workers)
+
+    steps = {}
+
+    if use_websocket:
+        steps["websocket"] = connect_websocket
+
+    for symbol in symbols or ():
+        # `kis.stock(symbol)`이 조회하는 캐시 키(market=None)와 같은 키로 적재합니다.
+        symbol, market = symbol if isinstance(symbol, tuple) else (symbol, None)
+        steps[f"info:{symbol}"] = lambda symbol=symbol, market=market: info(self, symbol, market=market)
+
+    _run_steps(steps, result, max_workers)
+
+    result.elapsed = time.perf_counter() - start
+
+    logging.logger.info(
+        "사전 준비를 완료했습니다. (%.3f초, %d/%d 성공)",
+        result.elapsed,
+        sum(step.ok for step in result.steps.values()),
+        len(result.steps),
+    )
+
+    return result
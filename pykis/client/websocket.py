@@ -1,11 +1,13 @@
 import base64
-import json
 import threading
 import time
+from abc import ABCMeta, abstractmethod
+from functools import partial
 from multiprocessing import Event, Lock
 from multiprocessing.synchronize import Event as EventType
 from multiprocessing.synchronize import Lock as LockType
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Literal
+from weakref import WeakSet
 
 from websocket import WebSocketApp, WebSocketConnectionClosedException
 
@@ -16,6 +18,12 @@ from pykis.__env__ import (
     WEBSOCKET_VIRTUAL_DOMAIN,
 )
 from pykis.api.websocket import WEBSOCKET_RESPONSES_MAP
+from pykis.client.appkey import KisKey
+from pykis.client.dispatcher import (
+    KisDispatchConfig,
+    KisDispatchStats,
+    KisEventDispatcher,
+)
 from pykis.client.messaging import (
     TR_SUBSCRIBE_TYPE,
     TR_UNSUBSCRIBE_TYPE,
@@ -25,6 +33,8 @@ from pykis.client.messaging import (
     KisWebsocketTR,
 )
 from pykis.client.object import KisObjectBase, kis_object_init
+from pykis.event.conflate import KisConflatingCallback
+from pykis.event.dispatch import KisSubscriptionEventHandler
 from pykis.event.filters.subscription import KisSubscriptionEventFilter
 from pykis.event.handler import (
     KisEventFilter,
@@ -41,23 +51,23 @@ if TYPE_CHECKING:
     from pykis.kis import PyKis
 
 __all__ = [
+    "KisWebsocketClientBase",
     "KisWebsocketClient",
 ]
 
+EXECUTION_TR_IDS = frozenset(("H0STCNI0", "H0STCNI9", "H0GSCNI0", "H0GSCNI9"))
+"""국내주식 실시간체결통보 실전, 모의 해외주식 실시간체결통보 실전, 모의"""
 
-class KisWebsocketClient:
-    """한국투자증권 실시간 클라이언트"""
 
-    kis: "PyKis"
-    """한국투자증권 API"""
+class KisWebsocketClientBase(metaclass=ABCMeta):
+    """
+    한국투자증권 실시간 클라이언트 기본 클래스
 
-    virtual: bool
-    """모의투자 서버 여부"""
+    구독 이벤트와 참조 카운터 기반 구독(`on`)을 제공하며, 접속과 TR 구독은 하위 클래스에서 구현합니다.
+    """
 
-    websocket: WebSocketApp | None = None
-    """웹소켓"""
-    thread: threading.Thread | None = None
-    """웹소켓 스레드"""
+    kis: "PyKis"
+    """한국투자증권 API"""
 
     subscribed_event: KisEventHandler["KisWebsocketClient", KisSubscribedEventArgs]
     """구독 추가 이벤트"""
@@ -67,6 +77,188 @@ class KisWebsocketClient:
     event: KisEventHandler["KisWebsocketClient", KisSubscriptionEventArgs]
     """구독 이벤트"""
 
+    _reference_store: ReferenceStore
+    """이벤트 참조 카운터"""
+    _conflating_callbacks: "WeakSet[KisConflatingCallback]"
+    """등록된 최신 값 이벤트 콜백 목록"""
+
+    def __init__(self, kis: "PyKis"):
+        self.kis = kis
+        self.subscribed_event = KisEventHandler()
+        self.unsubscribed_event = KisEventHandler()
+        self.event = KisSubscriptionEventHandler()
+        self._conflating_callbacks = WeakSet()
+        self._reference_store = ReferenceStore(callback=self._release_reference)
+
+    @abstractmethod
+    def is_subscribed(self, id: str, key: str = "") -> bool:
+        """
+        TR 구독 여부를 확인합니다.
+
+        Args:
+            id (str): TR ID
+            key (str): TR Key Default is "".
+
+        Returns:
+            bool: 구독 여부
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def subscriptions(self) -> set[KisWebsocketTR]:
+        """TR 구독 목록"""
+        pass
+
+    @property
+    @abstractmethod
+    def connected(self) -> bool:
+        """접속 여부"""
+        pass
+
+    @property
+    @abstractmethod
+    def dispatch_stats(self) -> KisDispatchStats | None:
+        """이벤트 전달 큐 통계. 이벤트 전달 큐를 사용하지 않는 경우 None입니다."""
+        pass
+
+    @property
+    def conflated(self) -> int:
+        """현재 등록된 최신 값 이벤트 콜백에서 최신 이벤트로 교체되어 전달되지 않은 이벤트 수"""
+        return sum(callback.conflated for callback in list(self._conflating_callbacks))
+
+    @abstractmethod
+    def connect(self):
+        """한국투자증권 웹소켓 서버에 접속합니다. (비동기)"""
+        pass
+
+    @abstractmethod
+    def ensure_connected(self, timeout: float | None = None):
+        """
+        접속 상태를 동기적으로 보장합니다.
+
+        Args:
+            timeout (float | None): 타임아웃 (초)
+        """
+        pass
+
+    @abstractmethod
+    def disconnect(self):
+        """한국투자증권 웹소켓 서버와 연결을 해제합니다."""
+        pass
+
+    def _close_conflating_callbacks(self):
+        """등록된 최신 값 이벤트 콜백의 작업 스레드를 중지합니다."""
+        for callback in list(self._conflating_callbacks):
+            callback.close()
+
+    @abstractmethod
+    def subscribe(self, id: str, key: str, primary: bool = False):
+        """
+        TR을 구독합니다.
+
+        Args:
+            id (str): TR ID
+            key (str): TR Key
+            primary (bool): 주 서버에 구독할지 여부
+        """
+        pass
+
+    @abstractmethod
+    def unsubscribe(self, id: str, key: str, primary: bool = False):
+        """
+        TR 구독을 취소합니다.
+
+        Args:
+            id (str): TR ID
+            key (str): TR Key
+            primary (bool): 주 서버에 구독을 취소할지 여부
+        """
+        pass
+
+    @abstractmethod
+    def unsubscribe_all(self):
+        """모든 TR 구독을 취소합니다."""
+        pass
+
+    def referenced_subscribe(self, id: str, key: str, primary: bool = False) -> ReferenceTicket:
+        """
+        래퍼런스 카운터를 사용하여 TR을 구독합니다.
+        카운터가 0일 때 구독을 취소합니다.
+
+        Args:
+            id (str): TR ID
+            key (str): TR Key
+            primary (bool): 주 서버에 구독할지 여부
+        """
+        self.subscribe(id, key, primary)
+        return self._reference_store.ticket(f"{id}:{key}")
+
+    def on(
+        self,
+        id: str,
+        key: str,
+        callback: Callable[["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]], None],
+        where: KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]] | None = None,
+        once: bool = False,
+        primary: bool = False,
+        conflate: bool = False,
+    ) -> KisEventTicket["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]]:
+        """
+        TR을 구독합니다.
+
+        Args:
+            id (str): TR ID
+            key (str): TR Key
+            callback (Callable[[TSender, TEventArgs], None]): 콜백 함수
+            where (KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]], optional): 이벤트 필터. Defaults to None.
+            primary (bool): 주 서버에 구독할지 여부
+            conflate (bool): 최신 값만 전달할지 여부. 콜백이 실행 중인 동안 같은 종목의 새 이벤트가 도착하면 전달되지 않은 이전 이벤트를 교체합니다.
+        """
+        subscription_filter = KisSubscriptionEventFilter(id)
+        release = None
+
+        if conflate and not isinstance(callback, KisConflatingCallback):
+            callback = KisConflatingCallback(callback)
+            # 직접 생성한 콜백은 구독을 해지할 때 작업 스레드를 중지합니다.
+            release = partial(callback.close, 0)
+
+        if isinstance(callback, KisConflatingCallback):
+            self._conflating_callbacks.add(callback)
+
+        return self.event.on(
+            handler=package_mathod(
+                callback,
+                ticket=self.referenced_subscribe(
+                    id=id,
+                    key=key,
+                    primary=primary,
+                ),
+                release=release,
+            ),
+            where=KisMultiEventFilter(subscription_filter, where) if where else subscription_filter,
+            once=once,
+        )
+
+    def _release_reference(self, key: str, value: int):
+        if value == 0:
+            id, key = key.split(":", 1)
+            self.unsubscribe(id, key)
+
+
+class KisWebsocketClient(KisWebsocketClientBase):
+    """한국투자증권 실시간 클라이언트"""
+
+    virtual: bool
+    """모의투자 서버 여부"""
+    appkey: KisKey | str | None
+    """웹소켓 접속에 사용할 앱 키 또는 발급된 접속 키. None일 경우 도메인의 앱 키를 사용합니다."""
+
+    websocket: WebSocketApp | None = None
+    """웹소켓"""
+    thread: threading.Thread | None = None
+    """웹소켓 스레드"""
+
     reconnect: bool = True
     """자동 재접속 여부"""
     reconnect_interval: float = 5
@@ -86,37 +278,53 @@ class KisWebsocketClient:
 
     _keychain: dict[KisWebsocketTR, KisWebsocketEncryptionKey]
     """암호화 키체인"""
-    _reference_store: ReferenceStore
-    """이벤트 참조 카운터"""
+    _approval_key: str | None = None
+    """현재 접속에 사용하는 웹소켓 접속 키"""
+    _approval_refreshed: bool = False
+    """현재 접속에서 웹소켓 접속 키 재발급 여부"""
+    _sent_approval_keys: dict[KisWebsocketTR, str]
+    """TR 구독 요청에 사용한 웹소켓 접속 키"""
 
     _primary_client: "KisWebsocketClient | None" = None
     """계좌 조회가 가능한 서버의 클라이언트 (모의투자에서만 사용)"""
 
-    def __init__(self, kis: "PyKis", virtual: bool = False):
-        self.kis = kis
+    _dispatch: KisDispatchConfig | None
+    """이벤트 전달 큐 설정"""
+    _dispatcher: KisEventDispatcher | None
+    """이벤트 전달 큐. None일 경우 수신 스레드에서 콜백을 실행합니다."""
+
+    def __init__(
+        self,
+        kis: "PyKis",
+        virtual: bool = False,
+        dispatch: KisDispatchConfig | None = None,
+        appkey: KisKey | str | None = None,
+    ):
+        """
+        실시간 클라이언트를 생성합니다.
+
+        Args:
+            kis: 한국투자증권 API
+            virtual: 모의투자 서버 여부
+            dispatch: 이벤트 전달 큐 설정. 설정할 경우 수신 스레드는 메시지 복호화와 파싱만 하고, 콜백은 작업 스레드에서 실행합니다.
+            appkey: 웹소켓 접속에 사용할 앱 키 또는 발급된 접속 키. None일 경우 도메인의 앱 키를 사용합니다.
+        """
+        super().__init__(kis)
         self.virtual = virtual
-        self.subscribed_event = KisEventHandler()
-        self.unsubscribed_event = KisEventHandler()
-        self.event = KisEventHandler()
+        self.appkey = appkey
+        self._dispatch = dispatch
+        self._dispatcher = (
+            KisEventDispatcher(dispatch, name=f"pykis-rtc-{'virtual' if virtual else 'real'}") if dispatch else None
+        )
         self._connect_lock = Lock()
         self._connect_event = Event()
         self._connected_event = Event()
         self._subscriptions = set()
         self._registered_subscriptions = set()
         self._keychain = dict()
-        self._reference_store = ReferenceStore(callback=self._release_reference)
+        self._sent_approval_keys = dict()
 
     def is_subscribed(self, id: str, key: str = "") -> bool:
-        """
-        TR 구독 여부를 확인합니다.
-
-        Args:
-            id (str): TR ID
-            key (str): TR Key Default is "".
-
-        Returns:
-            bool: 구독 여부
-        """
         return (KisWebsocketTR(id, key) in self._subscriptions) or (
             self._primary_client is not None and self._primary_client.is_subscribed(id, key)
         )
@@ -125,6 +333,20 @@ class KisWebsocketClient:
     def subscriptions(self) -> set[KisWebsocketTR]:
         return self._subscriptions | (self._primary_client.subscriptions if self._primary_client else set())
 
+    @property
+    def domain(self) -> Literal["real", "virtual"]:
+        """접속 도메인"""
+        return "virtual" if self.virtual else "real"
+
+    @property
+    def dispatch_stats(self) -> KisDispatchStats | None:
+        """이벤트 전달 큐 통계. 이벤트 전달 큐를 사용하지 않는 경우 None입니다."""
+        return self._dispatcher.stats if self._dispatcher else None
+
+    @property
+    def conflated(self) -> int:
+        return super().conflated + (self._primary_client.conflated if self._primary_client else 0)
+
     @property
     def connected(self) -> bool:
         return (
@@ -186,6 +408,11 @@ class KisWebsocketClient:
                 logging.logger.info("RTC Disconnecting from server")
                 self.websocket.close()
 
+        if self._dispatcher:
+            self._dispatcher.stop()
+
+        self._close_conflating_callbacks()
+
     def _request(self, type: str, body: KisWebsocketForm | None = None, force: bool = False) -> bool:
         """
         요청을 보냅니다.
@@ -202,16 +429,18 @@ class KisWebsocketClient:
             return False
 
         logging.logger.debug("RTC Sending request: %s %s", type, body)
-        self.websocket.send(
-            json.dumps(
-                KisWebsocketRequest(
-                    kis=self.kis,
-                    type=type,
-                    body=body,
-                    domain="virtual" if self.virtual else "real",
-                ).build()
-            )
-        )
+        request = KisWebsocketRequest(
+            kis=self.kis,
+            type=type,
+            body=body,
+            domain=self.domain,
+            approval_key=self._approval_key,
+        ).build()
+
+        if type == TR_SUBSCRIBE_TYPE and isinstance(body, KisWebsocketTR):
+            self._sent_approval_keys[body] = request["header"]["approval_key"]
+
+        self.websocket.send(self.kis.json_codec.dumps(request).decode())
 
         return True
 
@@ -283,58 +512,6 @@ class KisWebsocketClient:
         for tr in self._subscriptions.copy():
             self.unsubscribe(tr.id, tr.key)
 
-    def referenced_subscribe(self, id: str, key: str, primary: bool = False) -> ReferenceTicket:
-        """
-        래퍼런스 카운터를 사용하여 TR을 구독합니다.
-        카운터가 0일 때 구독을 취소합니다.
-
-        Args:
-            id (str): TR ID
-            key (str): TR Key
-            primary (bool): 주 서버에 구독할지 여부
-        """
-        self.subscribe(id, key, primary)
-        return self._reference_store.ticket(f"{id}:{key}")
-
-    def on(
-        self,
-        id: str,
-        key: str,
-        callback: Callable[["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]], None],
-        where: KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]] | None = None,
-        once: bool = False,
-        primary: bool = False,
-    ) -> KisEventTicket["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]]:
-        """
-        TR을 구독합니다.
-
-        Args:
-            id (str): TR ID
-            key (str): TR Key
-            callback (Callable[[TSender, TEventArgs], None]): 콜백 함수
-            where (KisEventFilter["KisWebsocketClient", KisSubscriptionEventArgs[TWebsocketResponse]], optional): 이벤트 필터. Defaults to None.
-            primary (bool): 주 서버에 구독할지 여부
-        """
-        subscription_filter = KisSubscriptionEventFilter(id)
-
-        return self.event.on(
-            handler=package_mathod(
-                callback,
-                ticket=self.referenced_subscribe(
-                    id=id,
-                    key=key,
-                    primary=primary,
-                ),
-            ),
-            where=KisMultiEventFilter(subscription_filter, where) if where else subscription_filter,
-            once=once,
-        )
-
-    def _release_reference(self, key: str, value: int):
-        if value == 0:
-            id, key = key.split(":", 1)
-            self.unsubscribe(id, key)
-
     @thread_safe("subscriptions")
     def _reset_session_state(self):
         """세션 상태를 초기화합니다."""
@@ -342,6 +519,8 @@ class KisWebsocketClient:
         self._registered_subscriptions.clear()
         # 암호화 키 초기화
         self._keychain.clear()
+        self._sent_approval_keys.clear()
+        self._approval_refreshed = False
 
     def _restore_subscriptions(self):
         """구독 목록을 복원합니다."""
@@ -410,6 +589,8 @@ class KisWebsocketClient:
 
         logging.logger.info("RTC Connected to %s server", "virtual" if self.virtual else "real")
         self._reset_session_state()
+        # 접속마다 한 번 캐시된 접속 키를 가져와 구독 복원 요청에 재사용합니다.
+        self._approval_key = self._get_approval_key()
         self._restore_subscriptions()
         self._connected_event.set()
 
@@ -439,7 +620,7 @@ class KisWebsocketClient:
                 case "0" | "1":  # 이벤트 데이터 (암호화여부)
                     self._handle_event(message)
                 case "{" | _:  # 제어 데이터
-                    self._handle_control(json.loads(message))
+                    self._handle_control(self.kis.json_codec.loads(message))
         except Exception as e:
             logging.logger.error("RTC failed to handle message: %s", e, exc_info=True)
 
@@ -455,7 +636,7 @@ class KisWebsocketClient:
 
         if id == "PINGPONG":
             # logging.logger.debug("RTC Received PINGPONG")
-            self.websocket.send(json.dumps(data))
+            self.websocket.send(self.kis.json_codec.dumps(data).decode())
             return
 
         if not body:
@@ -503,13 +684,52 @@ class KisWebsocketClient:
             case "OPSP0007":  # internal error
                 logging.logger.error("RTC Internal server error: %s %s", tr, message)
 
+            case "OPSP0011":  # invalid approval
+                self._handle_invalid_approval(tr, message)
+
             case _:
                 logging.logger.warning("RTC Unhandled control message: %s(%s) %s", tr, code, message)
 
+    def _get_approval_key(self, invalid: str | None = None) -> str:
+        """
+        웹소켓 접속 키를 반환합니다.
+
+        Args:
+            invalid: 거부된 접속 키
+        """
+        if isinstance(self.appkey, str):
+            return self.appkey
+
+        return self.kis._get_approval_key(self.domain, invalid=invalid, appkey=self.appkey)
+
+    def _handle_invalid_approval(self, tr: KisWebsocketTR, message: str):
+        """
+        거부된 웹소켓 접속 키를 재발급하고 구독 요청을 다시 보냅니다.
+        재발급은 접속마다 한 번만 시도하며, 재발급한 접속 키도 거부된 경우 다시 보내지 않습니다.
+        """
+        if (rejected := self._sent_approval_keys.pop(tr, None)) is None:
+            logging.logger.error("RTC Invalid approval key: %s %s", tr, message)
+            return
+
+        if rejected == self._approval_key:
+            if isinstance(self.appkey, str):
+                logging.logger.error("RTC Fixed approval key rejected: %s %s", tr, message)
+                return
+
+            if self._approval_refreshed:
+                logging.logger.error("RTC Approval key rejected after refresh: %s %s", tr, message)
+                return
+
+            logging.logger.warning("RTC Approval key rejected, refreshing: %s %s", tr, message)
+            self._approval_refreshed = True
+            self._approval_key = self._get_approval_key(invalid=rejected)
+
+        if tr in self._subscriptions:
+            self._request(TR_SUBSCRIBE_TYPE, tr, force=True)
+
     def _set_encryption_key(self, tr: KisWebsocketTR, body: dict):
         """암호화 키를 설정합니다."""
-        # 국내주식 실시간체결통보 실전, 모의 해외주식 실시간체결통보 실전, 모의
-        if tr.id in ("H0STCNI0", "H0STCNI9", "H0GSCNI0", "H0GSCNI9"):
+        if tr.id in EXECUTION_TR_IDS:
             # 체결통보의 경우 tr key를 사용하지 않음
             tr = KisWebsocketTR(tr.id, "")
 
@@ -555,24 +775,37 @@ class KisWebsocketClient:
                 if isinstance(response, KisObjectBase):
                     kis_object_init(self.kis, response)
 
-                try:
-                    self.event.invoke(
-                        self,
-                        KisSubscriptionEventArgs(
-                            tr=tr,
-                            response=response,
+                args = KisSubscriptionEventArgs(
+                    tr=tr,
+                    response=response,
+                )
+
+                if self._dispatcher:
+                    self._dispatcher.put(
+                        partial(self._emit_event, args),
+                        # 체결통보는 버리거나 교체하지 않고 순서대로 전달합니다.
+                        key=(
+                            None
+                            if id in EXECUTION_TR_IDS
+                            else (id, getattr(response, "symbol", None), getattr(response, "market", None))
                         ),
                     )
-                except Exception as e:
-                    logging.logger.exception("RTC Failed to emit event: %s %s", tr, e)
+                else:
+                    self._emit_event(args)
         except Exception as e:
             logging.logger.exception("RTC Failed to parse message: %s %s", tr, e)
             return
 
+    def _emit_event(self, args: KisSubscriptionEventArgs):
+        try:
+            self.event.invoke(self, args)
+        except Exception as e:
+            logging.logger.exception("RTC Failed to emit event: %s %s", args.tr, e)
+
     @thread_safe("primary_client")
     def _ensure_primary_client(self) -> "KisWebsocketClient":
         if self.kis.virtual and not self.virtual and not self._primary_client:
-            self._primary_client = KisWebsocketClient(self.kis, virtual=True)
+            self._primary_client = KisWebsocketClient(self.kis, virtual=True, dispatch=self._dispatch)
 
             self._primary_client.subscribed_event += self._primary_client_subscribed_event
             self._primary_client.unsubscribed_event += self._primary_client_unsubscribed_event
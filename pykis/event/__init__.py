@@ -1,3 +1,4 @@
+from pykis.event.conflate import KisConflatingCallback
 from pykis.event.handler import (
     EventCallback,
     KisEventArgs,
@@ -25,6 +26,7 @@ __all__ = [
     "KisLambdaEventCallback",
     "KisLambdaEventFilter",
     "KisMultiEventFilter",
+    "KisConflatingCallback",
     "KisSubscribedEventArgs",
     "KisUnsubscribedEventArgs",
     "KisSubscriptionEventArgs",
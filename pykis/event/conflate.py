@@ -0,0 +1,101 @@
+from functools import partial
+from typing import Callable, Generic, Hashable
+
+from pykis.client.dispatcher import KisDispatchConfig, KisDispatchStats, KisEventDispatcher
+from pykis.event.handler import TEventArgs, TSender
+
+__all__ = [
+    "KisConflatingCallback",
+]
+
+
+class KisConflatingCallback(Generic[TSender, TEventArgs]):
+    """
+    최신 값 이벤트 콜백
+
+    콜백은 별도의 작업 스레드에서 실행됩니다.
+    콜백이 실행 중인 동안 같은 키의 새 이벤트가 도착하면 아직 전달되지 않은 이전 이벤트를 교체하므로,
+    느린 콜백에도 대기열이 쌓이지 않고 항상 최신 상태를 전달받습니다.
+
+    기본 키는 (TR ID, 종목코드, 시장)입니다.
+
+    Example:
+        >>> callback = KisConflatingCallback(on_price)
+        >>> ticket = stock.on("price", callback)
+        >>> callback.conflated  # 교체된 이벤트 수
+    """
+
+    __slots__ = ["callback", "key", "_dispatcher", "__weakref__"]
+
+    callback: Callable[[TSender, TEventArgs], None]
+    """이벤트 콜백"""
+    key: Callable[[TEventArgs], Hashable]
+    """이벤트 키 함수"""
+
+    _dispatcher: KisEventDispatcher
+    """이벤트 전달 큐"""
+
+    def __init__(
+        self,
+        callback: Callable[[TSender, TEventArgs], None],
+        key: Callable[[TEventArgs], Hashable] | None = None,
+        maxsize: int = 1024,
+    ):
+        """
+        최신 값 이벤트 콜백을 생성합니다.
+
+        Args:
+            callback: 이벤트 콜백
+            key: 이벤트 키 함수. 기본값은 (TR ID, 종목코드, 시장)입니다.
+            maxsize: 최대 대기 키 수. 초과할 경우 가장 오래된 이벤트를 버립니다.
+        """
+        self.callback = callback
+        self.key = key or _default_key
+        self._dispatcher = KisEventDispatcher(
+            KisDispatchConfig(workers=1, maxsize=maxsize, overflow="conflate"),
+            name="pykis-conflate",
+        )
+
+    @property
+    def __name__(self) -> str:
+        return getattr(self.callback, "__name__", self.__class__.__name__)
+
+    @property
+    def conflated(self) -> int:
+        """최신 이벤트로 교체되어 전달되지 않은 이벤트 수"""
+        return self._dispatcher.stats.conflated
+
+    @property
+    def stats(self) -> KisDispatchStats:
+        """이벤트 전달 큐 통계"""
+        return self._dispatcher.stats
+
+    def close(self, timeout: float | None = None) -> None:
+        """대기 중인 이벤트를 모두 전달한 뒤 작업 스레드를 중지합니다."""
+        self._dispatcher.stop(timeout)
+
+    def __call__(self, sender: TSender, e: TEventArgs) -> None:
+        self._dispatcher.put(partial(self.callback, sender, e), key=self.key(e))
+
+    def __del__(self):
+        dispatcher = getattr(self, "_dispatcher", None)
+
+        if dispatcher is not None:
+            dispatcher.stop(0)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.callback!r})"
+
+    def __str__(self) -> str:
+        return repr(self)
+
+
+def _default_key(e) -> Hashable:
+    response = getattr(e, "response", None)
+    tr = getattr(e, "tr", None)
+
+    return (
+        tr.id if tr is not None else None,
+        getattr(response, "symbol", None),
+        getattr(response, "market", None),
+    )
@@ -0,0 +1,103 @@
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Iterable
+
+from pykis.event.filters.product import KisProductEventFilter
+from pykis.event.filters.subscription import KisSubscriptionEventFilter
+from pykis.event.handler import (
+    EventCallback,
+    KisEventHandler,
+    KisLambdaEventCallback,
+    KisMultiEventFilter,
+)
+from pykis.event.subscription import KisSubscriptionEventArgs
+
+if TYPE_CHECKING:
+    from pykis.client.websocket import KisWebsocketClient
+
+__all__ = [
+    "KisSubscriptionEventHandler",
+]
+
+_DispatchKey = tuple[str | None, str | None, str | None]
+"""(TR ID, 종목코드, 시장유형)"""
+
+
+def _collect(filter: Any, key: list[str | None]) -> None:
+    """이벤트를 전달하기 위해 반드시 통과해야 하는 기본 필터의 조건을 수집합니다."""
+    if type(filter) is KisSubscriptionEventFilter:
+        if key[0] is None:
+            key[0] = filter.id
+    elif type(filter) is KisProductEventFilter:
+        if key[1] is None:
+            product = filter.product
+            key[1], key[2] = product.symbol, product.market
+    elif type(filter) is KisMultiEventFilter and filter.gate == "or":
+        # `or` 필터는 하나라도 무시할 경우 이벤트를 무시하므로 모든 하위 필터를 통과해야 합니다.
+        for child in filter.filters:
+            _collect(child, key)
+
+
+def _dispatch_key(handler: EventCallback) -> _DispatchKey | None:
+    """
+    이벤트 핸들러의 색인 키를 반환합니다. 색인할 수 없는 경우 None을 반환합니다.
+
+    Args:
+        handler: 이벤트 핸들러
+    """
+    if type(handler) is not KisLambdaEventCallback or handler.where is None:
+        return None
+
+    key: list[str | None] = [None, None, None]
+    _collect(handler.where, key)
+
+    if key[0] is None and key[1] is None:
+        return None
+
+    return key[0], key[1], key[2]
+
+
+class KisSubscriptionEventHandler(KisEventHandler["KisWebsocketClient", KisSubscriptionEventArgs]):
+    """
+    TR 구독 이벤트 핸들러
+
+    TR ID, 종목코드, 시장유형 기본 필터를 사용하는 이벤트 핸들러를 색인하여 이벤트와 일치할 수 있는 이벤트 핸들러에만 이벤트를 전달합니다.
+    색인할 수 없는 필터를 사용하는 이벤트 핸들러에는 모든 이벤트를 전달합니다.
+    색인은 전달 대상을 줄이기만 하며, 선택된 이벤트 핸들러의 필터는 그대로 적용됩니다.
+    """
+
+    _index: tuple[dict[_DispatchKey, tuple[EventCallback, ...]], tuple[EventCallback, ...]]
+    """(색인된 이벤트 핸들러, 모든 이벤트를 전달할 이벤트 핸들러)"""
+
+    def _update(self) -> None:
+        super()._update()
+
+        index: dict[_DispatchKey, list[EventCallback]] = {}
+        generic: list[EventCallback] = []
+
+        for handler in self._handlers:
+            if (key := _dispatch_key(handler)) is None:
+                generic.append(handler)
+            else:
+                index.setdefault(key, []).append(handler)
+
+        # 이벤트 발생 중인 스레드가 일관된 색인을 읽도록 한 번에 교체합니다.
+        self._index = ({key: tuple(handlers) for key, handlers in index.items()}, tuple(generic))
+
+    def _select(self, e: KisSubscriptionEventArgs) -> Iterable[EventCallback]:
+        index, generic = self._index
+
+        if not index:
+            return generic
+
+        id = e.tr.id
+        response = e.response
+        symbol = getattr(response, "symbol", None)
+        market = getattr(response, "market", None)
+        empty = ()
+
+        return chain(
+            generic,
+            index.get((id, None, None), empty),
+            index.get((id, symbol, market), empty) if symbol is not None else empty,
+            index.get((None, symbol, market), empty) if symbol is not None else empty,
+        )
@@ -86,12 +86,19 @@ class KisProductEventFilter(KisEventFilterBase["KisWebsocketClient", KisSubscrip
         # if isinstance(e.response, KisProductProtocol):
         #     return False
 
+        # KisSimpleProductProtocol isinstance 검사와 같지만, 매 이벤트마다 프로토콜 검사를 하지 않습니다.
+        response = e.response
+
         return not (
-            isinstance(e.response, KisSimpleProductProtocol)
-            and e.response.symbol == self._product.symbol
-            and e.response.market == self._product.market
+            getattr(response, "symbol", None) == self._product.symbol
+            and getattr(response, "market", None) == self._product.market
         )
 
+    @property
+    def product(self) -> KisSimpleProductProtocol:
+        """필터링할 상품"""
+        return self._product
+
     def __hash__(self) -> int:
         return hash((self.__class__, self._product))
 
@@ -1,5 +1,7 @@
 import warnings
 from abc import ABCMeta, abstractmethod
+from multiprocessing import Lock
+from multiprocessing.synchronize import Lock as LockType
 from typing import (
     Callable,
     Generic,
@@ -110,8 +112,9 @@ class KisMultiEventFilter(KisEventFilterBase[TSender, TEventArgs]):
         self.gate = gate
 
     def __filter__(self, handler: "KisEventHandler", sender: TSender, e: TEventArgs) -> bool:
+        # runtime_checkable isinstance는 매 이벤트마다 비용이 크므로 `__filter__` 메소드 유무만 확인합니다.
         results = (
-            filter.__filter__(handler, sender, e) if isinstance(filter, KisEventFilter) else filter(sender, e)
+            filter.__filter__(handler, sender, e) if hasattr(filter, "__filter__") else filter(sender, e)
             for filter in self.filters
         )
 
@@ -171,7 +174,7 @@ class KisLambdaEventCallback(KisEventCallback[TSender, TEventArgs]):
         if self.where is None:
             return False
 
-        return self.where.__filter__(handler, sender, e) if isinstance(self.where, KisEventFilter) else self.where(sender, e)
+        return self.where.__filter__(handler, sender, e) if hasattr(self.where, "__filter__") else self.where(sender, e)
 
     def __callback__(self, handler: "KisEventHandler", sender: TSender, e: TEventArgs):
         if self.once:
@@ -295,12 +298,33 @@ class KisEventHandler(Generic[TSender, TEventArgs]):
     handlers: set[EventCallback[TSender, TEventArgs]]
     """이벤트 핸들러 목록"""
 
+    _handlers: tuple[EventCallback[TSender, TEventArgs], ...]
+    """이벤트 발생 시 사용하는 이벤트 핸들러 목록. 추가, 제거 시 새 튜플로 교체합니다."""
+    _lock: LockType
+    """Lock 객체"""
+
     def __init__(self, *handlers: EventCallback[TSender, TEventArgs]):
         self.handlers = set(handlers)
+        self._lock = Lock()
+        self._update()
+
+    def _update(self) -> None:
+        """
+        이벤트 핸들러 목록이 변경된 후 호출됩니다.
+        이벤트 발생 시 목록을 복사하지 않도록 변경될 때마다 새 튜플을 만듭니다.
+        """
+        self._handlers = tuple(self.handlers)
+
+    def _select(self, e: TEventArgs) -> Iterable[EventCallback[TSender, TEventArgs]]:
+        """이벤트를 전달할 이벤트 핸들러를 반환합니다. 반환된 이벤트 핸들러의 필터는 그대로 적용됩니다."""
+        return self._handlers
 
     def add(self, handler: EventCallback[TSender, TEventArgs]) -> KisEventTicket[TSender, TEventArgs]:
         """이벤트 핸들러를 추가합니다."""
-        self.handlers.add(handler)
+        with self._lock:
+            self.handlers.add(handler)
+            self._update()
+
         return KisEventTicket(self, handler)
 
     def on(
@@ -353,18 +377,23 @@ class KisEventHandler(Generic[TSender, TEventArgs]):
         else:
             release_method(handler)
 
-        try:
-            self.handlers.remove(handler)
-        except KeyError:
-            pass
+        with self._lock:
+            try:
+                self.handlers.remove(handler)
+            except KeyError:
+                return
+
+            self._update()
 
     def clear(self):
         """이벤트 핸들러를 모두 제거합니다."""
-        self.handlers.clear()
+        with self._lock:
+            self.handlers.clear()
+            self._update()
 
     def invoke(self, sender: TSender, e: TEventArgs):
         """이벤트를 발생시킵니다."""
-        for handler in self.handlers.copy():
+        for handler in self._select(e):
             if isinstance(handler, KisEventCallback):
                 if not handler.__filter__(self, sender, e):
                     handler.__callback__(self, sender, e)
@@ -1,10 +1,20 @@
-from pykis.client.exceptions import KisAPIError, KisException, KisHTTPError
+from pykis.client.exceptions import (
+    KisAPIError,
+    KisException,
+    KisHTTPError,
+    KisNetworkError,
+    KisTimeoutError,
+)
+from pykis.responses.dynamic import KisProjectionError
 from pykis.responses.exceptions import KisMarketNotOpenedError, KisNotFoundError
 
 __all__ = [
     "KisException",
     "KisHTTPError",
     "KisAPIError",
+    "KisTimeoutError",
+    "KisNetworkError",
     "KisMarketNotOpenedError",
     "KisNotFoundError",
+    "KisProjectionError",
 ]
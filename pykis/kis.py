@@ -1,19 +1,23 @@
 import hashlib
+import random
 from datetime import timedelta
 from os import PathLike
 from pathlib import Path
-from time import sleep
-from typing import Callable, Iterable, Literal, overload
-from urllib.parse import urljoin
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal, TypeVar, overload
+from urllib.parse import urlencode, urljoin
 
-import requests
-from requests import Response
 
 from pykis import logging
 from pykis.__env__ import (
+    API_REQUEST_TIMEOUT,
+    API_RETRY_BACKOFF,
+    API_RETRY_BACKOFF_MAX,
+    API_RETRY_LIMIT,
+    REAL_API_REQUEST_LIMIT,
     REAL_API_REQUEST_PER_SECOND,
     REAL_DOMAIN,
-    USER_AGENT,
+    VIRTUAL_API_REQUEST_LIMIT,
     VIRTUAL_API_REQUEST_PER_SECOND,
     VIRTUAL_DOMAIN,
 )
@@ -21,17 +25,52 @@ from pykis.api.auth.token import KisAccessToken
 from pykis.client.account import KisAccountNumber
 from pykis.client.appkey import KisKey
 from pykis.client.auth import KisAuth
-from pykis.client.cache import KisCacheStorage
-from pykis.client.exceptions import KisHTTPError
+from pykis.client.cache import RESPONSE_CACHE_TYPE, KisCacheStorage
+from pykis.client.coalesce import COALESCE_TYPE, get_coalesce_type
+from pykis.client.dispatcher import KisDispatchConfig
+from pykis.client.exceptions import KisHTTPError, KisNetworkError, KisTimeoutError
 from pykis.client.form import KisForm
 from pykis.client.object import KisObjectBase, kis_object_init
-from pykis.client.websocket import KisWebsocketClient
-from pykis.responses.dynamic import KisObject, TDynamic
-from pykis.responses.types import KisDynamicDict
-from pykis.utils.rate_limit import RateLimiter
-from pykis.utils.thread_safe import thread_safe
+from pykis.client.priority import (
+    REQUEST_PRIORITIES,
+    REQUEST_PRIORITY_TYPE,
+    get_request_priority,
+)
+from pykis.client.session import KisSessionConfig, KisSessionStats
+from pykis.client.sharded import KisShardedWebsocketClient
+from pykis.client.spec import KisRequestPlan, KisRequestSpec, execute_plan
+from pykis.client.token_manager import (
+    TOKEN_REFRESH_MARGIN,
+    KisTokenManager,
+    KisTokenRefreshStatus,
+)
+from pykis.client.token_store import KisTokenStore
+from pykis.client.transport import (
+    TRANSPORT_TYPE,
+    KisHTTPRequest,
+    KisHTTPResponseProtocol,
+    KisTransport,
+    create_transport,
+)
+from pykis.client.websocket import KisWebsocketClient, KisWebsocketClientBase
+from pykis.responses.dynamic import RAW_RETENTION_TYPE, KisObject, TDynamic
+from pykis.responses.types import KisDynamicDict, today_snapshot
+from pykis.utils.codec import JSON_CODEC_TYPE, KisJSONCodec, create_json_codec
+from pykis.utils.rate_limit import (
+    RATE_LIMITER_TYPE,
+    PriorityRateLimiter,
+    get_rate_limiter,
+)
+from pykis.utils.rate_quota import RateQuota, RateQuotaUsage
+from pykis.utils.single_flight import SingleFlight, SingleFlightStats
+from pykis.utils.thread_safe import get_lock, thread_safe
 from pykis.utils.workspace import get_cache_path
 
+if TYPE_CHECKING:
+    from pykis.aio.kis import AsyncPyKis
+
+T = TypeVar("T")
+
 
 class PyKis:
     """한국투자증권 API"""
@@ -50,25 +89,79 @@ class PyKis:
 
     cache: KisCacheStorage
     """캐시 저장소"""
-
-    _rate_limiters: dict[str, RateLimiter]
+    retry_limit: int | None
+    """요청 실패 시 최대 재시도 횟수"""
+    retry_timeout: float | None
+    """요청 재시도 제한 시간(초)"""
+    timeout: float | tuple[float, float] | None
+    """요청 기본 (연결, 읽기) 제한 시간(초)"""
+    deadline: float | None
+    """호출 유량 대기와 재시도를 포함한 요청 기본 전체 제한 시간(초)"""
+    coalesce: frozenset[COALESCE_TYPE]
+    """요청 병합 API 유형"""
+    response_cache: dict[RESPONSE_CACHE_TYPE, float]
+    """API별 응답 캐시 유지 시간(초)"""
+    lazy_decode: bool | None
+    """응답 필드 지연 변환 여부. None일 경우 응답 객체별 기본값을 따릅니다."""
+    raw_retention: RAW_RETENTION_TYPE
+    """응답 객체의 원본 응답 데이터 보관 방식"""
+    json_codec: KisJSONCodec
+    """JSON 변환 객체"""
+
+    _rate_limiters: dict[str, PriorityRateLimiter]
     """API 호출 제한"""
     _token: KisAccessToken | None
     """실전투자 API 접속 토큰"""
     _virtual_token: KisAccessToken | None
     """API 접속 토큰"""
-    _websocket: KisWebsocketClient | None
+    _websocket: KisWebsocketClientBase | None
     """웹소켓 클라이언트"""
     _keep_token: Path | None
     """API 접속 토큰 자동 저장 경로"""
-    _sessions: dict[Literal["real", "virtual"], requests.Session]
-    """API 세션"""
+    _token_store: KisTokenStore | None
+    """프로세스 간 공유 API 접속 토큰 저장소"""
+    _session_config: KisSessionConfig
+    """HTTP 세션 설정"""
+    _transports: dict[Literal["real", "virtual"], KisTransport]
+    """도메인별 HTTP 전송"""
+    _aio: "AsyncPyKis | None"
+    """비동기 API"""
+    _single_flight: SingleFlight
+    """요청 병합"""
+    _token_manager: KisTokenManager | None
+    """API 접속 토큰 자동 갱신 관리자"""
+    _approval_keys: dict[Literal["real", "virtual"] | None | tuple[Literal["real", "virtual"] | None, str], str]
+    """도메인별 웹소켓 접속 키. 별도의 앱 키로 발급한 접속 키는 (도메인, 앱 키)로 저장합니다."""
 
     @property
     def keep_token(self) -> bool:
         """API 접속 토큰 자동 저장 여부"""
         return self._keep_token is not None
 
+    @property
+    def rate_quota_usage(self) -> dict[Literal["real", "virtual"], dict[str, RateQuotaUsage]]:
+        """도메인별 레인 호출 유량 사용 통계. 레인별 호출 유량 예약을 사용하지 않는 경우 빈 딕셔너리를 반환합니다."""
+        return {
+            domain: limiter.quota.usage
+            for domain, limiter in self._rate_limiters.items()
+            if limiter.quota is not None
+        }
+
+    @property
+    def session_stats(self) -> dict[Literal["real", "virtual"], KisSessionStats]:
+        """도메인별 HTTP 연결 풀 통계"""
+        return {domain: transport.stats for domain, transport in self._transports.items()}
+
+    @property
+    def coalesce_stats(self) -> dict[str, SingleFlightStats]:
+        """API 유형별 요청 병합 통계"""
+        return self._single_flight.stats
+
+    @property
+    def effective_rates(self) -> dict[Literal["real", "virtual"], float]:
+        """도메인별 현재 적용 중인 초당 API 호출 횟수"""
+        return {domain: limiter.effective_rate / limiter.period for domain, limiter in self._rate_limiters.items()}
+
     @overload
     def __init__(
         self,
@@ -78,6 +171,22 @@ class PyKis:
         token: KisAccessToken | str | PathLike[str] | None = None,
         keep_token: bool | str | PathLike[str] | None = None,
         use_websocket: bool = True,
+        rate_limiter: RATE_LIMITER_TYPE = "token_bucket",
+        retry_limit: int | None = API_RETRY_LIMIT,
+        retry_timeout: float | None = None,
+        timeout: float | tuple[float, float] | None = API_REQUEST_TIMEOUT,
+        deadline: float | None = None,
+        rate_quotas: dict[REQUEST_PRIORITY_TYPE, float] | None = None,
+        coalesce: Iterable[COALESCE_TYPE] | None = None,
+        response_cache: dict[RESPONSE_CACHE_TYPE, float] | None = None,
+        session: KisSessionConfig | None = None,
+        transport: TRANSPORT_TYPE | KisTransport = "requests",
+        auto_refresh_token: bool = False,
+        lazy_decode: bool | None = None,
+        raw_retention: RAW_RETENTION_TYPE = "full",
+        json_codec: JSON_CODEC_TYPE | KisJSONCodec = "auto",
+        websocket_dispatch: KisDispatchConfig | None = None,
+        websocket_shards: Iterable[KisKey | str] | None = None,
     ):
         """
         `KisAuth` 인증 정보를 이용하여 실전투자용 한국투자증권 API를 생성합니다.
@@ -87,6 +196,22 @@ class PyKis:
             token (KisAccessToken | str | PathLike[str] | None, optional): 실전도메인 API 접속 토큰.
             keep_token (bool | str | PathLike[str] | None, optional): API 접속 토큰을 저장할지 여부. 기본 저장 폴더: `~/.pykis/` (신뢰할 수 없는 환경에서 사용하지 마세요)
             use_websocket (bool, optional): 웹소켓 사용 여부.
+            rate_limiter (RATE_LIMITER_TYPE, optional): API 호출 유량 제한 방식. `token_bucket`(기본값, GCRA), `fixed_window`(고정 윈도우), `adaptive`(호출 횟수 초과 응답에 따라 조절) 또는 `shared`(프로세스 간 공유)
+            retry_limit (int | None, optional): 요청 실패 시 최대 재시도 횟수. None일 경우 제한하지 않습니다.
+            retry_timeout (float | None, optional): 요청 재시도 제한 시간(초). None일 경우 제한하지 않습니다.
+            timeout (float | tuple[float, float] | None, optional): 요청 기본 제한 시간(초). (연결, 읽기) 튜플로 각각 지정할 수 있으며, None일 경우 제한하지 않습니다.
+            deadline (float | None, optional): 호출 유량 대기와 재시도를 포함한 요청 기본 전체 제한 시간(초). 초과 시 `KisTimeoutError`가 발생합니다. None일 경우 제한하지 않습니다.
+            rate_quotas (dict[REQUEST_PRIORITY_TYPE, float] | None, optional): 레인별 예약 초당 호출 횟수. 예) `{"order": 2, "account": 2}` 예약하지 않은 호출 유량은 모든 레인이 공유하며, 사용하지 않는 예약 호출 유량은 다른 레인이 빌려 사용합니다. 같은 AppKey를 사용하는 `PyKis` 객체는 같은 값을 사용해야 합니다.
+            coalesce (Iterable[COALESCE_TYPE] | None, optional): 동시에 들어온 같은 조회 요청을 하나로 병합할 API 유형. 예) `("quote", "orderbook", "info")`
+            response_cache (dict[RESPONSE_CACHE_TYPE, float] | None, optional): API별 응답 캐시 유지 시간(초). 예) `{"domestic_quote": 0.2, "domestic_orderbook": 0.2}`
+            session (KisSessionConfig | None, optional): HTTP 세션 설정. 연결 풀 크기, Keep-Alive, 스레드별 세션 사용 여부 등을 설정합니다.
+            transport (TRANSPORT_TYPE | KisTransport, optional): HTTP 전송 방식. `requests`(기본값), `urllib3`(연결 풀 직접 사용) 또는 `KisTransport` 구현 객체
+            auto_refresh_token (bool, optional): API 접속 토큰을 만료 전에 별도의 스레드에서 미리 갱신할지 여부.
+            lazy_decode (bool | None, optional): 응답 필드 지연 변환 여부. None일 경우 응답 객체별 기본값(`__lazy__`)을 따르며, False일 경우 모든 필드를 즉시 변환하여 검증합니다.
+            raw_retention (RAW_RETENTION_TYPE, optional): 응답 객체의 원본 응답 데이터 보관 방식. `data`일 경우 HTTP 응답 객체를, `none`일 경우 원본 응답 데이터도 보관하지 않아 메모리 사용량을 줄입니다. `full`이 아닐 경우 지연 변환을 사용하지 않습니다.
+            json_codec (JSON_CODEC_TYPE | KisJSONCodec, optional): JSON 변환 방식. `auto`(기본값, orjson, msgspec, json 중 설치된 패키지), `orjson`, `msgspec`, `json` 또는 `KisJSONCodec` 구현 객체. 응답 본문, 요청 본문, 웹소켓 제어 메시지, 토큰 및 인증 정보 파일에 사용합니다.
+            websocket_dispatch (KisDispatchConfig | None, optional): 실시간 이벤트 전달 큐 설정. 설정할 경우 웹소켓 수신 스레드는 메시지 복호화와 파싱만 하고, 콜백은 작업 스레드에서 실행합니다.
+            websocket_shards (Iterable[KisKey | str] | None, optional): 추가 웹소켓 세션에 사용할 앱 키 또는 발급된 웹소켓 접속 키 목록. 설정할 경우 구독을 여러 세션에 나누어 세션당 최대 구독 수를 넘어 구독할 수 있습니다.
 
         Examples:
 
@@ -125,6 +250,22 @@ class PyKis:
         virtual_token: KisAccessToken | str | PathLike[str] | None = None,
         keep_token: bool | str | PathLike[str] | None = None,
         use_websocket: bool = True,
+        rate_limiter: RATE_LIMITER_TYPE = "token_bucket",
+        retry_limit: int | None = API_RETRY_LIMIT,
+        retry_timeout: float | None = None,
+        timeout: float | tuple[float, float] | None = API_REQUEST_TIMEOUT,
+        deadline: float | None = None,
+        rate_quotas: dict[REQUEST_PRIORITY_TYPE, float] | None = None,
+        coalesce: Iterable[COALESCE_TYPE] | None = None,
+        response_cache: dict[RESPONSE_CACHE_TYPE, float] | None = None,
+        session: KisSessionConfig | None = None,
+        transport: TRANSPORT_TYPE | KisTransport = "requests",
+        auto_refresh_token: bool = False,
+        lazy_decode: bool | None = None,
+        raw_retention: RAW_RETENTION_TYPE = "full",
+        json_codec: JSON_CODEC_TYPE | KisJSONCodec = "auto",
+        websocket_dispatch: KisDispatchConfig | None = None,
+        websocket_shards: Iterable[KisKey | str] | None = None,
     ):
         """
         `KisAuth` 인증 정보를 이용하여 모의투자용 한국투자증권 API를 생성합니다.
@@ -136,6 +277,22 @@ class PyKis:
             virtual_token (KisAccessToken | str | PathLike[str] | None, optional): 모의도메인 API 접속 토큰.
             keep_token (bool | str | PathLike[str] | None, optional): API 접속 토큰을 저장할지 여부. 기본 저장 폴더: `~/.pykis/` (신뢰할 수 없는 환경에서 사용하지 마세요)
             use_websocket (bool, optional): 웹소켓 사용 여부.
+            rate_limiter (RATE_LIMITER_TYPE, optional): API 호출 유량 제한 방식. `token_bucket`(기본값, GCRA), `fixed_window`(고정 윈도우), `adaptive`(호출 횟수 초과 응답에 따라 조절) 또는 `shared`(프로세스 간 공유)
+            retry_limit (int | None, optional): 요청 실패 시 최대 재시도 횟수. None일 경우 제한하지 않습니다.
+            retry_timeout (float | None, optional): 요청 재시도 제한 시간(초). None일 경우 제한하지 않습니다.
+            timeout (float | tuple[float, float] | None, optional): 요청 기본 제한 시간(초). (연결, 읽기) 튜플로 각각 지정할 수 있으며, None일 경우 제한하지 않습니다.
+            deadline (float | None, optional): 호출 유량 대기와 재시도를 포함한 요청 기본 전체 제한 시간(초). 초과 시 `KisTimeoutError`가 발생합니다. None일 경우 제한하지 않습니다.
+            rate_quotas (dict[REQUEST_PRIORITY_TYPE, float] | None, optional): 레인별 예약 초당 호출 횟수. 예) `{"order": 2, "account": 2}` 예약하지 않은 호출 유량은 모든 레인이 공유하며, 사용하지 않는 예약 호출 유량은 다른 레인이 빌려 사용합니다. 같은 AppKey를 사용하는 `PyKis` 객체는 같은 값을 사용해야 합니다.
+            coalesce (Iterable[COALESCE_TYPE] | None, optional): 동시에 들어온 같은 조회 요청을 하나로 병합할 API 유형. 예) `("quote", "orderbook", "info")`
+            response_cache (dict[RESPONSE_CACHE_TYPE, float] | None, optional): API별 응답 캐시 유지 시간(초). 예) `{"domestic_quote": 0.2, "domestic_orderbook": 0.2}`
+            session (KisSessionConfig | None, optional): HTTP 세션 설정. 연결 풀 크기, Keep-Alive, 스레드별 세션 사용 여부 등을 설정합니다.
+            transport (TRANSPORT_TYPE | KisTransport, optional): HTTP 전송 방식. `requests`(기본값), `urllib3`(연결 풀 직접 사용) 또는 `KisTransport` 구현 객체
+            auto_refresh_token (bool, optional): API 접속 토큰을 만료 전에 별도의 스레드에서 미리 갱신할지 여부.
+            lazy_decode (bool | None, optional): 응답 필드 지연 변환 여부. None일 경우 응답 객체별 기본값(`__lazy__`)을 따르며, False일 경우 모든 필드를 즉시 변환하여 검증합니다.
+            raw_retention (RAW_RETENTION_TYPE, optional): 응답 객체의 원본 응답 데이터 보관 방식. `data`일 경우 HTTP 응답 객체를, `none`일 경우 원본 응답 데이터도 보관하지 않아 메모리 사용량을 줄입니다. `full`이 아닐 경우 지연 변환을 사용하지 않습니다.
+            json_codec (JSON_CODEC_TYPE | KisJSONCodec, optional): JSON 변환 방식. `auto`(기본값, orjson, msgspec, json 중 설치된 패키지), `orjson`, `msgspec`, `json` 또는 `KisJSONCodec` 구현 객체. 응답 본문, 요청 본문, 웹소켓 제어 메시지, 토큰 및 인증 정보 파일에 사용합니다.
+            websocket_dispatch (KisDispatchConfig | None, optional): 실시간 이벤트 전달 큐 설정. 설정할 경우 웹소켓 수신 스레드는 메시지 복호화와 파싱만 하고, 콜백은 작업 스레드에서 실행합니다.
+            websocket_shards (Iterable[KisKey | str] | None, optional): 추가 웹소켓 세션에 사용할 앱 키 또는 발급된 웹소켓 접속 키 목록. 설정할 경우 구독을 여러 세션에 나누어 세션당 최대 구독 수를 넘어 구독할 수 있습니다.
 
         Examples:
 
@@ -185,6 +342,22 @@ class PyKis:
         token: KisAccessToken | str | PathLike[str] | None = None,
         keep_token: bool | str | PathLike[str] | None = None,
         use_websocket: bool = True,
+        rate_limiter: RATE_LIMITER_TYPE = "token_bucket",
+        retry_limit: int | None = API_RETRY_LIMIT,
+        retry_timeout: float | None = None,
+        timeout: float | tuple[float, float] | None = API_REQUEST_TIMEOUT,
+        deadline: float | None = None,
+        rate_quotas: dict[REQUEST_PRIORITY_TYPE, float] | None = None,
+        coalesce: Iterable[COALESCE_TYPE] | None = None,
+        response_cache: dict[RESPONSE_CACHE_TYPE, float] | None = None,
+        session: KisSessionConfig | None = None,
+        transport: TRANSPORT_TYPE | KisTransport = "requests",
+        auto_refresh_token: bool = False,
+        lazy_decode: bool | None = None,
+        raw_retention: RAW_RETENTION_TYPE = "full",
+        json_codec: JSON_CODEC_TYPE | KisJSONCodec = "auto",
+        websocket_dispatch: KisDispatchConfig | None = None,
+        websocket_shards: Iterable[KisKey | str] | None = None,
     ):
         """
         실전투자용 한국투자증권 API를 생성합니다.
@@ -197,6 +370,22 @@ class PyKis:
             token (KisAccessToken | str | PathLike[str] | None, optional): 실전도메인 API 접속 토큰.
             keep_token (bool | str | PathLike[str] | None, optional): API 접속 토큰을 저장할지 여부. 기본 저장 폴더: `~/.pykis/` (신뢰할 수 없는 환경에서 사용하지 마세요)
             use_websocket (bool, optional): 웹소켓 사용 여부.
+            rate_limiter (RATE_LIMITER_TYPE, optional): API 호출 유량 제한 방식. `token_bucket`(기본값, GCRA), `fixed_window`(고정 윈도우), `adaptive`(호출 횟수 초과 응답에 따라 조절) 또는 `shared`(프로세스 간 공유)
+            retry_limit (int | None, optional): 요청 실패 시 최대 재시도 횟수. None일 경우 제한하지 않습니다.
+            retry_timeout (float | None, optional): 요청 재시도 제한 시간(초). None일 경우 제한하지 않습니다.
+            timeout (float | tuple[float, float] | None, optional): 요청 기본 제한 시간(초). (연결, 읽기) 튜플로 각각 지정할 수 있으며, None일 경우 제한하지 않습니다.
+            deadline (float | None, optional): 호출 유량 대기와 재시도를 포함한 요청 기본 전체 제한 시간(초). 초과 시 `KisTimeoutError`가 발생합니다. None일 경우 제한하지 않습니다.
+            rate_quotas (dict[REQUEST_PRIORITY_TYPE, float] | None, optional): 레인별 예약 초당 호출 횟수. 예) `{"order": 2, "account": 2}` 예약하지 않은 호출 유량은 모든 레인이 공유하며, 사용하지 않는 예약 호출 유량은 다른 레인이 빌려 사용합니다. 같은 AppKey를 사용하는 `PyKis` 객체는 같은 값을 사용해야 합니다.
+            coalesce (Iterable[COALESCE_TYPE] | None, optional): 동시에 들어온 같은 조회 요청을 하나로 병합할 API 유형. 예) `("quote", "orderbook", "info")`
+            response_cache (dict[RESPONSE_CACHE_TYPE, float] | None, optional): API별 응답 캐시 유지 시간(초). 예) `{"domestic_quote": 0.2, "domestic_orderbook": 0.2}`
+            session (KisSessionConfig | None, optional): HTTP 세션 설정. 연결 풀 크기, Keep-Alive, 스레드별 세션 사용 여부 등을 설정합니다.
+            transport (TRANSPORT_TYPE | KisTransport, optional): HTTP 전송 방식. `requests`(기본값), `urllib3`(연결 풀 직접 사용) 또는 `KisTransport` 구현 객체
+            auto_refresh_token (bool, optional): API 접속 토큰을 만료 전에 별도의 스레드에서 미리 갱신할지 여부.
+            lazy_decode (bool | None, optional): 응답 필드 지연 변환 여부. None일 경우 응답 객체별 기본값(`__lazy__`)을 따르며, False일 경우 모든 필드를 즉시 변환하여 검증합니다.
+            raw_retention (RAW_RETENTION_TYPE, optional): 응답 객체의 원본 응답 데이터 보관 방식. `data`일 경우 HTTP 응답 객체를, `none`일 경우 원본 응답 데이터도 보관하지 않아 메모리 사용량을 줄입니다. `full`이 아닐 경우 지연 변환을 사용하지 않습니다.
+            json_codec (JSON_CODEC_TYPE | KisJSONCodec, optional): JSON 변환 방식. `auto`(기본값, orjson, msgspec, json 중 설치된 패키지), `orjson`, `msgspec`, `json` 또는 `KisJSONCodec` 구현 객체. 응답 본문, 요청 본문, 웹소켓 제어 메시지, 토큰 및 인증 정보 파일에 사용합니다.
+            websocket_dispatch (KisDispatchConfig | None, optional): 실시간 이벤트 전달 큐 설정. 설정할 경우 웹소켓 수신 스레드는 메시지 복호화와 파싱만 하고, 콜백은 작업 스레드에서 실행합니다.
+            websocket_shards (Iterable[KisKey | str] | None, optional): 추가 웹소켓 세션에 사용할 앱 키 또는 발급된 웹소켓 접속 키 목록. 설정할 경우 구독을 여러 세션에 나누어 세션당 최대 구독 수를 넘어 구독할 수 있습니다.
 
         Examples:
 
@@ -231,6 +420,22 @@ class PyKis:
         virtual_token: KisAccessToken | str | PathLike[str] | None = None,
         keep_token: bool | str | PathLike[str] | None = None,
         use_websocket: bool = True,
+        rate_limiter: RATE_LIMITER_TYPE = "token_bucket",
+        retry_limit: int | None = API_RETRY_LIMIT,
+        retry_timeout: float | None = None,
+        timeout: float | tuple[float, float] | None = API_REQUEST_TIMEOUT,
+        deadline: float | None = None,
+        rate_quotas: dict[REQUEST_PRIORITY_TYPE, float] | None = None,
+        coalesce: Iterable[COALESCE_TYPE] | None = None,
+        response_cache: dict[RESPONSE_CACHE_TYPE, float] | None = None,
+        session: KisSessionConfig | None = None,
+        transport: TRANSPORT_TYPE | KisTransport = "requests",
+        auto_refresh_token: bool = False,
+        lazy_decode: bool | None = None,
+        raw_retention: RAW_RETENTION_TYPE = "full",
+        json_codec: JSON_CODEC_TYPE | KisJSONCodec = "auto",
+        websocket_dispatch: KisDispatchConfig | None = None,
+        websocket_shards: Iterable[KisKey | str] | None = None,
     ):
         """
         모의투자용 한국투자증권 API를 생성합니다.
@@ -247,6 +452,22 @@ class PyKis:
             virtual_token (KisAccessToken | str | PathLike[str] | None, optional): 모의도메인 API 접속 토큰.
             keep_token (bool | str | PathLike[str] | None, optional): API 접속 토큰을 저장할지 여부. 기본 저장 폴더: `~/.pykis/` (신뢰할 수 없는 환경에서 사용하지 마세요)
             use_websocket (bool, optional): 웹소켓 사용 여부.
+            rate_limiter (RATE_LIMITER_TYPE, optional): API 호출 유량 제한 방식. `token_bucket`(기본값, GCRA), `fixed_window`(고정 윈도우), `adaptive`(호출 횟수 초과 응답에 따라 조절) 또는 `shared`(프로세스 간 공유)
+            retry_limit (int | None, optional): 요청 실패 시 최대 재시도 횟수. None일 경우 제한하지 않습니다.
+            retry_timeout (float | None, optional): 요청 재시도 제한 시간(초). None일 경우 제한하지 않습니다.
+            timeout (float | tuple[float, float] | None, optional): 요청 기본 제한 시간(초). (연결, 읽기) 튜플로 각각 지정할 수 있으며, None일 경우 제한하지 않습니다.
+            deadline (float | None, optional): 호출 유량 대기와 재시도를 포함한 요청 기본 전체 제한 시간(초). 초과 시 `KisTimeoutError`가 발생합니다. None일 경우 제한하지 않습니다.
+            rate_quotas (dict[REQUEST_PRIORITY_TYPE, float] | None, optional): 레인별 예약 초당 호출 횟수. 예) `{"order": 2, "account": 2}` 예약하지 않은 호출 유량은 모든 레인이 공유하며, 사용하지 않는 예약 호출 유량은 다른 레인이 빌려 사용합니다. 같은 AppKey를 사용하는 `PyKis` 객체는 같은 값을 사용해야 합니다.
+            coalesce (Iterable[COALESCE_TYPE] | None, optional): 동시에 들어온 같은 조회 요청을 하나로 병합할 API 유형. 예) `("quote", "orderbook", "info")`
+            response_cache (dict[RESPONSE_CACHE_TYPE, float] | None, optional): API별 응답 캐시 유지 시간(초). 예) `{"domestic_quote": 0.2, "domestic_orderbook": 0.2}`
+            session (KisSessionConfig | None, optional): HTTP 세션 설정. 연결 풀 크기, Keep-Alive, 스레드별 세션 사용 여부 등을 설정합니다.
+            transport (TRANSPORT_TYPE | KisTransport, optional): HTTP 전송 방식. `requests`(기본값), `urllib3`(연결 풀 직접 사용) 또는 `KisTransport` 구현 객체
+            auto_refresh_token (bool, optional): API 접속 토큰을 만료 전에 별도의 스레드에서 미리 갱신할지 여부.
+            lazy_decode (bool | None, optional): 응답 필드 지연 변환 여부. None일 경우 응답 객체별 기본값(`__lazy__`)을 따르며, False일 경우 모든 필드를 즉시 변환하여 검증합니다.
+            raw_retention (RAW_RETENTION_TYPE, optional): 응답 객체의 원본 응답 데이터 보관 방식. `data`일 경우 HTTP 응답 객체를, `none`일 경우 원본 응답 데이터도 보관하지 않아 메모리 사용량을 줄입니다. `full`이 아닐 경우 지연 변환을 사용하지 않습니다.
+            json_codec (JSON_CODEC_TYPE | KisJSONCodec, optional): JSON 변환 방식. `auto`(기본값, orjson, msgspec, json 중 설치된 패키지), `orjson`, `msgspec`, `json` 또는 `KisJSONCodec` 구현 객체. 응답 본문, 요청 본문, 웹소켓 제어 메시지, 토큰 및 인증 정보 파일에 사용합니다.
+            websocket_dispatch (KisDispatchConfig | None, optional): 실시간 이벤트 전달 큐 설정. 설정할 경우 웹소켓 수신 스레드는 메시지 복호화와 파싱만 하고, 콜백은 작업 스레드에서 실행합니다.
+            websocket_shards (Iterable[KisKey | str] | None, optional): 추가 웹소켓 세션에 사용할 앱 키 또는 발급된 웹소켓 접속 키 목록. 설정할 경우 구독을 여러 세션에 나누어 세션당 최대 구독 수를 넘어 구독할 수 있습니다.
 
         Examples:
 
@@ -282,6 +503,22 @@ class PyKis:
         virtual_token: KisAccessToken | str | PathLike[str] | None = None,
         keep_token: bool | str | PathLike[str] | None = None,
         use_websocket: bool = True,
+        rate_limiter: RATE_LIMITER_TYPE = "token_bucket",
+        retry_limit: int | None = API_RETRY_LIMIT,
+        retry_timeout: float | None = None,
+        timeout: float | tuple[float, float] | None = API_REQUEST_TIMEOUT,
+        deadline: float | None = None,
+        rate_quotas: dict[REQUEST_PRIORITY_TYPE, float] | None = None,
+        coalesce: Iterable[COALESCE_TYPE] | None = None,
+        response_cache: dict[RESPONSE_CACHE_TYPE, float] | None = None,
+        session: KisSessionConfig | None = None,
+        transport: TRANSPORT_TYPE | KisTransport = "requests",
+        auto_refresh_token: bool = False,
+        lazy_decode: bool | None = None,
+        raw_retention: RAW_RETENTION_TYPE = "full",
+        json_codec: JSON_CODEC_TYPE | KisJSONCodec = "auto",
+        websocket_dispatch: KisDispatchConfig | None = None,
+        websocket_shards: Iterable[KisKey | str] | None = None,
     ):
         """
         `KisAuth` 인증 정보를 이용하여 모의투자용 한국투자증권 API를 생성합니다.
@@ -296,6 +533,22 @@ class PyKis:
             virtual_token (KisAccessToken | str | PathLike[str] | None, optional): 모의도메인 API 접속 토큰.
             keep_token (bool | str | PathLike[str] | None, optional): API 접속 토큰을 저장할지 여부. 기본 저장 폴더: `~/.pykis/` (신뢰할 수 없는 환경에서 사용하지 마세요)
             use_websocket (bool, optional): 웹소켓 사용 여부.
+            rate_limiter (RATE_LIMITER_TYPE, optional): API 호출 유량 제한 방식. `token_bucket`(기본값, GCRA), `fixed_window`(고정 윈도우), `adaptive`(호출 횟수 초과 응답에 따라 조절) 또는 `shared`(프로세스 간 공유)
+            retry_limit (int | None, optional): 요청 실패 시 최대 재시도 횟수. None일 경우 제한하지 않습니다.
+            retry_timeout (float | None, optional): 요청 재시도 제한 시간(초). None일 경우 제한하지 않습니다.
+            timeout (float | tuple[float, float] | None, optional): 요청 기본 제한 시간(초). (연결, 읽기) 튜플로 각각 지정할 수 있으며, None일 경우 제한하지 않습니다.
+            deadline (float | None, optional): 호출 유량 대기와 재시도를 포함한 요청 기본 전체 제한 시간(초). 초과 시 `KisTimeoutError`가 발생합니다. None일 경우 제한하지 않습니다.
+            rate_quotas (dict[REQUEST_PRIORITY_TYPE, float] | None, optional): 레인별 예약 초당 호출 횟수. 예) `{"order": 2, "account": 2}` 예약하지 않은 호출 유량은 모든 레인이 공유하며, 사용하지 않는 예약 호출 유량은 다른 레인이 빌려 사용합니다. 같은 AppKey를 사용하는 `PyKis` 객체는 같은 값을 사용해야 합니다.
+            coalesce (Iterable[COALESCE_TYPE] | None, optional): 동시에 들어온 같은 조회 요청을 하나로 병합할 API 유형. 예) `("quote", "orderbook", "info")`
+            response_cache (dict[RESPONSE_CACHE_TYPE, float] | None, optional): API별 응답 캐시 유지 시간(초). 예) `{"domestic_quote": 0.2, "domestic_orderbook": 0.2}`
+            session (KisSessionConfig | None, optional): HTTP 세션 설정. 연결 풀 크기, Keep-Alive, 스레드별 세션 사용 여부 등을 설정합니다.
+            transport (TRANSPORT_TYPE | KisTransport, optional): HTTP 전송 방식. `requests`(기본값), `urllib3`(연결 풀 직접 사용) 또는 `KisTransport` 구현 객체
+            auto_refresh_token (bool, optional): API 접속 토큰을 만료 전에 별도의 스레드에서 미리 갱신할지 여부.
+            lazy_decode (bool | None, optional): 응답 필드 지연 변환 여부. None일 경우 응답 객체별 기본값(`__lazy__`)을 따르며, False일 경우 모든 필드를 즉시 변환하여 검증합니다.
+            raw_retention (RAW_RETENTION_TYPE, optional): 응답 객체의 원본 응답 데이터 보관 방식. `data`일 경우 HTTP 응답 객체를, `none`일 경우 원본 응답 데이터도 보관하지 않아 메모리 사용량을 줄입니다. `full`이 아닐 경우 지연 변환을 사용하지 않습니다.
+            json_codec (JSON_CODEC_TYPE | KisJSONCodec, optional): JSON 변환 방식. `auto`(기본값, orjson, msgspec, json 중 설치된 패키지), `orjson`, `msgspec`, `json` 또는 `KisJSONCodec` 구현 객체. 응답 본문, 요청 본문, 웹소켓 제어 메시지, 토큰 및 인증 정보 파일에 사용합니다.
+            websocket_dispatch (KisDispatchConfig | None, optional): 실시간 이벤트 전달 큐 설정. 설정할 경우 웹소켓 수신 스레드는 메시지 복호화와 파싱만 하고, 콜백은 작업 스레드에서 실행합니다.
+            websocket_shards (Iterable[KisKey | str] | None, optional): 추가 웹소켓 세션에 사용할 앱 키 또는 발급된 웹소켓 접속 키 목록. 설정할 경우 구독을 여러 세션에 나누어 세션당 최대 구독 수를 넘어 구독할 수 있습니다.
 
         Examples:
 
@@ -343,10 +596,28 @@ class PyKis:
         virtual_token: KisAccessToken | str | PathLike[str] | None = None,
         use_websocket: bool = True,
         keep_token: bool | str | PathLike[str] | None = None,
+        rate_limiter: RATE_LIMITER_TYPE = "token_bucket",
+        retry_limit: int | None = API_RETRY_LIMIT,
+        retry_timeout: float | None = None,
+        timeout: float | tuple[float, float] | None = API_REQUEST_TIMEOUT,
+        deadline: float | None = None,
+        rate_quotas: dict[REQUEST_PRIORITY_TYPE, float] | None = None,
+        coalesce: Iterable[COALESCE_TYPE] | None = None,
+        response_cache: dict[RESPONSE_CACHE_TYPE, float] | None = None,
+        session: KisSessionConfig | None = None,
+        transport: TRANSPORT_TYPE | KisTransport = "requests",
+        auto_refresh_token: bool = False,
+        lazy_decode: bool | None = None,
+        raw_retention: RAW_RETENTION_TYPE = "full",
+        json_codec: JSON_CODEC_TYPE | KisJSONCodec = "auto",
+        websocket_dispatch: KisDispatchConfig | None = None,
+        websocket_shards: Iterable[KisKey | str] | None = None,
     ):
+        self.json_codec = create_json_codec(json_codec) if isinstance(json_codec, str) else json_codec
+
         if auth is not None:
             if not isinstance(auth, KisAuth):
-                auth = KisAuth.load(auth)
+                auth = KisAuth.load(auth, self.json_codec)
 
             if auth.virtual:
                 raise ValueError("auth에는 실전도메인 인증 정보를 입력해야 합니다.")
@@ -357,7 +628,7 @@ class PyKis:
 
         if virtual_auth is not None:
             if not isinstance(virtual_auth, KisAuth):
-                virtual_auth = KisAuth.load(virtual_auth)
+                virtual_auth = KisAuth.load(virtual_auth, self.json_codec)
 
             if not virtual_auth.virtual:
                 raise ValueError("virtual_auth에는 모의도메인 인증 정보를 입력해야 합니다.")
@@ -409,35 +680,80 @@ class PyKis:
 
         self.primary_account = account
 
-        self._websocket = KisWebsocketClient(self) if use_websocket else None
+        self._websocket = (
+            (
+                KisShardedWebsocketClient(self, websocket_shards, dispatch=websocket_dispatch)
+                if websocket_shards
+                else KisWebsocketClient(self, dispatch=websocket_dispatch)
+            )
+            if use_websocket
+            else None
+        )
+        self._aio = None
         self.cache = KisCacheStorage()
+        self.retry_limit = retry_limit
+        self.retry_timeout = retry_timeout
+        self.timeout = timeout
+        self.deadline = deadline
+        self.coalesce = frozenset(coalesce or ())
+        self.response_cache = dict(response_cache or {})
+        self.lazy_decode = lazy_decode
+        self.raw_retention = raw_retention
+        self._single_flight = SingleFlight()
+        self._approval_keys = {}
+
+        real_rate = REAL_API_REQUEST_LIMIT if rate_limiter == "adaptive" else REAL_API_REQUEST_PER_SECOND
+        virtual_rate = VIRTUAL_API_REQUEST_LIMIT if rate_limiter == "adaptive" else VIRTUAL_API_REQUEST_PER_SECOND
 
         self._rate_limiters = {
-            "real": RateLimiter(REAL_API_REQUEST_PER_SECOND, 1),
-            "virtual": RateLimiter(VIRTUAL_API_REQUEST_PER_SECOND, 1),
+            "real": get_rate_limiter(
+                rate_limiter,
+                self._get_rate_limiter_name(self.appkey, "real"),
+                real_rate,
+                1,
+                quota=self._create_rate_quota(rate_quotas, real_rate, 1),
+            ),
+            "virtual": get_rate_limiter(
+                rate_limiter,
+                self._get_rate_limiter_name(self.virtual_appkey or self.appkey, "virtual"),
+                virtual_rate,
+                1,
+                quota=self._create_rate_quota(rate_quotas, virtual_rate, 1),
+            ),
         }
-        self._token = token if isinstance(token, KisAccessToken) else KisAccessToken.load(token) if token else None
+
+        self._token = token if isinstance(token, KisAccessToken) else KisAccessToken.load(token, self.json_codec) if token else None
         self._virtual_token = (
             virtual_token
             if isinstance(virtual_token, KisAccessToken)
-            else KisAccessToken.load(virtual_token) if self.virtual and virtual_token else None
+            else KisAccessToken.load(virtual_token, self.json_codec) if self.virtual and virtual_token else None
         )
-        self._sessions = {
-            "real": requests.Session(),
-            "virtual": requests.Session(),
-        }
+        self._session_config = session or KisSessionConfig()
+
+        if isinstance(transport, str):
+            self._transports = {
+                "real": create_transport(transport, self._session_config),
+                "virtual": create_transport(transport, self._session_config),
+            }
+        else:
+            self._transports = {"real": transport, "virtual": transport}
 
-        for session in self._sessions.values():
-            session.headers.update({"User-Agent": USER_AGENT})
+        self._token_manager = None
 
         if keep_token:
             if keep_token is True:
                 keep_token = get_cache_path()
 
             self._keep_token = Path(keep_token).resolve()
+            self._token_store = KisTokenStore(self._keep_token, codec=self.json_codec)
             self._load_cached_token(self._keep_token)
         else:
             self._keep_token = None
+            self._token_store = None
+
+        if auto_refresh_token:
+            self._token_manager = KisTokenManager(self)
+            self._token_manager.start()
 
     def _get_hashed_token_name(self, domain: Literal["real", "virtual"]) -> str:
         appkey = self.appkey if domain == "real" else self.virtual_appkey
@@ -449,29 +765,54 @@ class PyKis:
 
         return f"token_{domain}_{self.appkey.id}_{hash}.json"
 
-    def _load_cached_token(self, token_dir: str | PathLike[str] | Path) -> None:
-        if not isinstance(token_dir, Path):
-            token_dir = Path(token_dir)
+    @staticmethod
+    def _get_rate_limiter_name(appkey: KisKey, domain: Literal["real", "virtual"]) -> str:
+        hash = hashlib.sha1(f"pykis{appkey.appkey}ratelimit".encode()).hexdigest()
 
-        token_dir = token_dir.resolve()
-        virtual_token_path = token_dir / self._get_hashed_token_name("real")
+        return f"ratelimit_{domain}_{hash}"
 
-        if virtual_token_path.exists():
-            try:
-                self.token = KisAccessToken.load(virtual_token_path)
-                logging.logger.debug(f"실전도메인 API 접속 토큰을 불러왔습니다.")
-            except:
-                pass
+    @staticmethod
+    def _create_rate_quota(
+        rate_quotas: dict[REQUEST_PRIORITY_TYPE, float] | None,
+        rate: float,
+        period: float,
+    ) -> RateQuota | None:
+        if not rate_quotas:
+            return None
 
-        if self.virtual:
-            virtual_token_path = token_dir / self._get_hashed_token_name("virtual")
+        for lane, value in rate_quotas.items():
+            if lane not in REQUEST_PRIORITIES:
+                raise ValueError(
+                    f"지원하지 않는 호출 유량 예약 레인입니다. ({lane}) 사용 가능한 레인: {', '.join(REQUEST_PRIORITIES)}"
+                )
+
+            if value <= 0:
+                raise ValueError("예약 호출 횟수는 0보다 커야 합니다.")
+
+        # 도메인 호출 유량보다 큰 경우 비율에 맞게 줄입니다.
+        scale = min(rate / sum(rate_quotas.values()), 1)
+
+        return RateQuota(rate, period, {lane: value * scale for lane, value in rate_quotas.items()})
+
+    def _get_token_store(self, token_dir: str | PathLike[str] | Path) -> KisTokenStore:
+        token_dir = Path(token_dir).resolve()
+
+        if self._token_store is not None and self._token_store.path == token_dir:
+            return self._token_store
 
-            if virtual_token_path.exists():
-                try:
-                    self.primary_token = KisAccessToken.load(virtual_token_path)
-                    logging.logger.debug(f"모의도메인 API 접속 토큰을 불러왔습니다.")
-                except:
-                    pass
+        return KisTokenStore(token_dir, codec=self.json_codec)
+
+    def _load_cached_token(self, token_dir: str | PathLike[str] | Path) -> None:
+        store = self._get_token_store(token_dir)
+
+        if token := store.load(self._get_hashed_token_name("real")):
+            self.token = token
+            logging.logger.debug(f"실전도메인 API 접속 토큰을 불러왔습니다.")
+
+        if self.virtual:
+            if token := store.load(self._get_hashed_token_name("virtual")):
+                self.primary_token = token
+                logging.logger.debug(f"모의도메인 API 접속 토큰을 불러왔습니다.")
 
     def _save_cached_token(
         self,
@@ -479,30 +820,26 @@ class PyKis:
         domain: Literal["real", "virtual"] | None = None,
         force: bool = False,
     ):
-        if not isinstance(token_dir, Path):
-            token_dir = Path(token_dir)
-
-        token_dir = token_dir.resolve()
-        token_dir.mkdir(parents=True, exist_ok=True)
+        store = self._get_token_store(token_dir)
 
         if domain is None or domain == "real":
             token = self.token if force else self._token
 
             if token is not None:
-                token.save(token_dir / self._get_hashed_token_name("real"))
+                store.save(self._get_hashed_token_name("real"), token)
                 logging.logger.debug(f"실전도메인 API 접속 토큰을 저장했습니다.")
 
         if self.virtual and (domain is None or domain == "virtual"):
             virtual_token = self.primary_token if force else self._virtual_token
 
             if virtual_token is not None:
-                virtual_token.save(token_dir / self._get_hashed_token_name("virtual"))
+                store.save(self._get_hashed_token_name("virtual"), virtual_token)
                 logging.logger.debug(f"모의도메인 API 접속 토큰을 저장했습니다.")
 
     def _rate_limit_exceeded(self) -> None:
         logging.logger.warning("API 호출 횟수를 초과하여 호출 유량 획득까지 대기합니다.")
 
-    def request(
+    def _prepare_request(
         self,
         path: str,
         *,
@@ -514,8 +851,13 @@ class PyKis:
         domain: Literal["real", "virtual"] | None = None,
         appkey_location: Literal["header", "body"] | None = "header",
         form_location: Literal["header", "params", "body"] | None = None,
-        auth: bool = True,
-    ) -> Response:
+    ) -> tuple[Literal["real", "virtual"], str, dict[str, str], dict[str, str] | None, dict[str, str] | None]:
+        """
+        요청 정보를 생성합니다.
+
+        Returns:
+            tuple: (도메인, URL, 헤더, 파라미터, 본문)
+        """
         if method == "GET":
             if body is not None:
                 raise ValueError("GET 요청에는 body를 입력할 수 없습니다.")
@@ -530,8 +872,6 @@ class PyKis:
         if domain is None:
             domain = "virtual" if self.virtual else "real"
 
-        session = self._sessions[domain]
-
         if appkey_location:
             appkey = self.appkey if domain == "real" else self.virtual_appkey
 
@@ -550,48 +890,379 @@ class PyKis:
                 if f is not None:
                     f.build(dist)
 
+        return (
+            domain,
+            urljoin(REAL_DOMAIN if domain == "real" else VIRTUAL_DOMAIN, path),
+            request_headers,
+            params,
+            body,
+        )
+
+    def _handle_error_response(self, response: KisHTTPResponseProtocol, domain: Literal["real", "virtual"]) -> float:
+        """
+        실패한 응답을 처리합니다.
+
+        Returns:
+            float: 재시도 전 대기 시간 (초)
+
+        Raises:
+            KisHTTPError: 재시도할 수 없는 오류인 경우
+        """
+        try:
+            data = self.json_codec.loads(response.content)
+        except Exception:
+            data = None
+
+        error_code = data.get("msg_cd") if isinstance(data, dict) else None
+
+        match error_code:
+            case "EGW00201":
+                # Rate limit exceeded
+                logging.logger.warning("API 호출 횟수를 초과하였습니다.")
+                self._rate_limiters[domain].on_rate_limited()
+                return 0.1
+
+            case "EGW00123":
+                # Token expired
+                if self._token_store is not None:
+                    # 만료된 토큰이 파일에 남아 있더라도 다시 불러오지 않습니다.
+                    self._token_store.invalidate(
+                        self._get_hashed_token_name(domain),
+                        self._token if domain == "real" else self._virtual_token,
+                    )
+
+                if domain == "real":
+                    self._token = None
+                else:
+                    self._virtual_token = None
+
+                if self._token_manager is not None:
+                    self._token_manager.invalidate()
+
+                return 0
+
+            case _:
+                raise KisHTTPError(response=response)
+
+    def request(
+        self,
+        path: str,
+        *,
+        method: Literal["GET", "POST"] = "GET",
+        params: dict[str, str] | None = None,
+        body: dict[str, str] | None = None,
+        form: Iterable[KisForm | None] | None = None,
+        headers: dict[str, str] | None = None,
+        domain: Literal["real", "virtual"] | None = None,
+        appkey_location: Literal["header", "body"] | None = "header",
+        form_location: Literal["header", "params", "body"] | None = None,
+        auth: bool = True,
+        priority: REQUEST_PRIORITY_TYPE | None = None,
+        timeout: float | tuple[float, float] | None = None,
+        deadline: float | None = None,
+    ) -> KisHTTPResponseProtocol:
+        """
+        API 요청을 보냅니다.
+
+        Args:
+            timeout: 요청 (연결, 읽기) 제한 시간(초). None일 경우 `PyKis.timeout`을 사용합니다.
+            deadline: 호출 유량 대기와 재시도를 포함한 전체 제한 시간(초). None일 경우 `PyKis.deadline`을 사용합니다.
+
+        Raises:
+            KisTimeoutError: 전체 제한 시간을 초과했거나 재시도할 수 없는 요청의 응답 시간이 초과된 경우
+            KisHTTPError: 재시도할 수 없는 오류 응답을 받은 경우
+        """
+        domain, url, request_headers, params, body = self._prepare_request(
+            path,
+            method=method,
+            params=params,
+            body=body,
+            form=form,
+            headers=headers,
+            domain=domain,
+            appkey_location=appkey_location,
+            form_location=form_location,
+        )
+
+        transport = self._transports[domain]
         rate_limit = self._rate_limiters[domain]
+        lane = priority or get_request_priority(path)
+        start = monotonic()
+        deadline = self.deadline if deadline is None else deadline
+        end = None if deadline is None else start + deadline
+        retry_deadline = self._retry_deadline()
+        retries = 0
 
         while True:
-            rate_limit.acquire(blocking_callback=self._rate_limit_exceeded)
+            if not rate_limit.acquire(
+                blocking_callback=self._rate_limit_exceeded,
+                priority=REQUEST_PRIORITIES[lane],
+                lane=lane,
+                timeout=None if end is None else max(end - monotonic(), 0),
+            ):
+                raise KisTimeoutError("호출 유량 대기 중 요청 제한 시간이 초과되었습니다.", monotonic() - start, deadline, path)
 
             if auth:
                 (self.token if domain == "real" else self.primary_token).build(request_headers)
 
-            resp = session.request(
-                method=method,
-                url=urljoin(REAL_DOMAIN if domain == "real" else VIRTUAL_DOMAIN, path),
-                headers=request_headers,
-                params=params,
-                json=body,
-            )
+            try:
+                resp = transport.send(
+                    self._build_http_request(method, url, request_headers, params, body),
+                    timeout=self._attempt_timeout(timeout, end),
+                )
+            except KisNetworkError as e:
+                retries += 1
+                delay = self._handle_network_error(
+                    e,
+                    method=method,
+                    path=path,
+                    retries=retries,
+                    timed_out=e.timed_out,
+                    start=start,
+                    end=end,
+                    retry_deadline=retry_deadline,
+                )
+                sleep(delay)
+                continue
 
             if resp.ok:
+                rate_limit.on_success()
                 return resp
 
-            try:
-                data = resp.json()
-            except Exception:
-                data = None
+            delay = self._handle_error_response(resp, domain)
+            retries += 1
+            self._check_retry(resp, retries, retry_deadline, delay)
+            self._check_deadline(path, delay, start, end)
+
+            if delay:
+                sleep(delay)
+
+    def _build_http_request(
+        self,
+        method: Literal["GET", "POST"],
+        url: str,
+        headers: dict[str, str],
+        params: dict[str, str] | None,
+        body: dict[str, str] | None,
+    ) -> KisHTTPRequest:
+        """전송할 HTTP 요청을 생성합니다. 쿼리 문자열과 JSON 본문을 직렬화합니다."""
+        headers = headers.copy()
+
+        if params:
+            url = f"{url}?{urlencode(params)}"
+
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+            return KisHTTPRequest(method, url, headers, self.json_codec.dumps(body))
+
+        return KisHTTPRequest(method, url, headers)
+
+    def _attempt_timeout(
+        self,
+        timeout: float | tuple[float, float] | None,
+        end: float | None,
+    ) -> float | tuple[float, float] | None:
+        """요청 1회의 (연결, 읽기) 제한 시간을 전체 제한 시각까지 남은 시간 이내로 반환합니다."""
+        timeout = self.timeout if timeout is None else timeout
+
+        if end is None:
+            return timeout
+
+        remaining = max(end - monotonic(), 0.001)
+
+        if timeout is None:
+            return remaining
+
+        if isinstance(timeout, tuple):
+            return min(timeout[0], remaining), min(timeout[1], remaining)
+
+        return min(timeout, remaining)
+
+    def _check_deadline(self, path: str, delay: float, start: float, end: float | None) -> None:
+        """
+        재시도 대기 후 전체 제한 시간을 초과하는지 확인합니다.
+
+        Raises:
+            KisTimeoutError: 전체 제한 시간을 초과하는 경우
+        """
+        if end is not None and monotonic() + delay >= end:
+            raise KisTimeoutError("요청 제한 시간이 초과되었습니다.", monotonic() - start, end - start, path)
+
+    def _handle_network_error(
+        self,
+        error: Exception,
+        *,
+        method: Literal["GET", "POST"],
+        path: str,
+        retries: int,
+        timed_out: bool,
+        start: float,
+        end: float | None,
+        retry_deadline: float | None,
+    ) -> float:
+        """
+        네트워크 오류를 처리합니다. 멱등한 GET 요청만 지수 백오프와 무작위 지연(Full Jitter)으로 재시도합니다.
+
+        Returns:
+            float: 재시도 전 대기 시간 (초)
+
+        Raises:
+            KisTimeoutError: 응답 시간이 초과되었거나 전체 제한 시간을 초과한 경우
+            Exception: 재시도할 수 없는 네트워크 오류인 경우
+        """
+        elapsed = monotonic() - start
+        delay = random.uniform(0, min(API_RETRY_BACKOFF * 2 ** (retries - 1), API_RETRY_BACKOFF_MAX))
+
+        if (
+            method != "GET"
+            or (self.retry_limit is not None and retries > self.retry_limit)
+            or (retry_deadline is not None and monotonic() + delay > retry_deadline)
+            or (end is not None and monotonic() + delay >= end)
+        ):
+            if timed_out:
+                raise KisTimeoutError("요청 응답 시간이 초과되었습니다.", elapsed, None if end is None else end - start, path) from error
+
+            raise error
+
+        logging.logger.warning(f"API 요청 중 네트워크 오류가 발생하여 {delay:.3f}초 후 재시도합니다. ({retries}회): {error}")
+        return delay
+
+    def _retry_deadline(self) -> float | None:
+        """요청 재시도 제한 시각을 반환합니다."""
+        return None if self.retry_timeout is None else monotonic() + self.retry_timeout
+
+    def _check_retry(self, response: KisHTTPResponseProtocol, retries: int, deadline: float | None, delay: float) -> None:
+        """
+        요청을 재시도할 수 있는지 확인합니다.
+
+        Raises:
+            KisHTTPError: 최대 재시도 횟수 또는 재시도 제한 시간을 초과한 경우
+        """
+        if self.retry_limit is not None and retries > self.retry_limit:
+            logging.logger.error(f"API 요청 재시도 횟수({self.retry_limit}회)를 초과했습니다.")
+            raise KisHTTPError(response)
+
+        if deadline is not None and monotonic() + delay > deadline:
+            logging.logger.error(f"API 요청 재시도 제한 시간({self.retry_timeout}초)을 초과했습니다.")
+            raise KisHTTPError(response)
+
+    def _get_response_cache(
+        self,
+        type: RESPONSE_CACHE_TYPE,
+        *args: Any,
+        fields: Iterable[str] | None = None,
+    ) -> tuple[str, float] | None:
+        """
+        API 응답 캐시 키와 유지 시간을 반환합니다. 응답 캐시를 사용하지 않는 API인 경우 None을 반환합니다.
+
+        Args:
+            fields: 변환할 필드 이름. 선택한 필드가 다른 응답은 따로 캐시합니다.
+
+        Returns:
+            tuple: (캐시 키, 유지 시간(초))
+        """
+        if not (ttl := self.response_cache.get(type)):
+            return None
+
+        key = f"response:{type}:{':'.join(map(str, args))}"
+
+        if fields is not None:
+            key += f":{','.join(sorted([fields] if isinstance(fields, str) else fields))}"
+
+        return key, ttl
+
+    def _get_coalesce_key(
+        self,
+        path: str,
+        *,
+        method: Literal["GET", "POST"],
+        params: dict[str, str] | None,
+        form: Iterable[KisForm | None] | None,
+        headers: dict[str, str] | None,
+        domain: Literal["real", "virtual"] | None,
+        response_type: Any,
+        fields: Iterable[str] | None = None,
+        raw_retention: RAW_RETENTION_TYPE | None = None,
+    ) -> tuple[COALESCE_TYPE, tuple] | None:
+        """
+        요청 병합 키를 반환합니다. 병합할 수 없는 요청인 경우 None을 반환합니다.
+
+        Returns:
+            tuple: (요청 병합 유형, 요청 병합 키)
+        """
+        if method != "GET" or form is not None or not self.coalesce:
+            return None
 
-            error_code = data.get("msg_cd") if data is not None else None
+        group = get_coalesce_type(path)
 
-            match error_code:
-                case "EGW00201":
-                    # Rate limit exceeded
-                    logging.logger.warning("API 호출 횟수를 초과하였습니다.")
-                    sleep(0.1)
-                    continue
+        if group is None or group not in self.coalesce:
+            return None
 
-                case "EGW00123":
-                    # Token expired
-                    if domain == "real":
-                        self._token = None
-                    else:
-                        self._virtual_token = None
+        return group, (
+            domain,
+            path,
+            tuple(sorted(headers.items())) if headers else (),
+            tuple(sorted(params.items())) if params else (),
+            response_type if isinstance(response_type, type) else type(response_type),
+            None if fields is None else frozenset([fields] if isinstance(fields, str) else fields),
+            raw_retention or self.raw_retention,
+        )
 
-                case _:
-                    raise KisHTTPError(response=resp)
+    def _transform_response(
+        self,
+        response: KisHTTPResponseProtocol,
+        *,
+        path: str,
+        params: dict[str, str] | None = None,
+        body: dict[str, str] | None = None,
+        api: str | None = None,
+        response_type: TDynamic | type[TDynamic] | Callable[[], TDynamic] = KisDynamicDict,
+        verbose: bool = True,
+        lazy: bool | None = None,
+        fields: Iterable[str] | None = None,
+        raw_retention: RAW_RETENTION_TYPE | None = None,
+    ) -> TDynamic:
+        """응답 데이터를 응답 객체로 변환합니다."""
+        # 응답 본문을 문자열로 변환하지 않고 바로 변환합니다.
+        data = self.json_codec.loads(response.content)
+        data["__response__"] = response
+
+        if verbose:
+            logging.logger.debug(
+                f"API [%s]: %s, %s -> %s:%s (%s)",
+                api or path,
+                params or ".",
+                body or ".",
+                data.get("rt_cd", "."),
+                data.get("msg_cd", "."),
+                data.get("msg1", ".").strip(),
+            )
+
+        if raw_retention is None:
+            raw_retention = self.raw_retention
+
+        if raw_retention != "full":
+            # 지연 변환은 원본 응답 데이터가 필요하므로 모든 필드를 즉시 변환합니다.
+            lazy = False
+        elif lazy is None:
+            lazy = self.lazy_decode
+
+        with today_snapshot(), KisObject.collect_() as objects:
+            response_object = KisObject.transform_(
+                data=data,
+                transform_type=response_type,
+                ignore_missing_fields={"__response__"},
+                lazy=lazy,
+                fields=fields,
+            )
+
+        if isinstance(response_object, KisObjectBase):
+            kis_object_init(self, response_object)
+
+        # 응답 객체 초기화에 원본 응답 데이터를 사용하므로 초기화가 끝난 뒤 정리합니다.
+        KisObject.release_(objects, raw_retention)
+
+        return response_object  # type: ignore
 
     def fetch(
         self,
@@ -606,10 +1277,16 @@ class PyKis:
         appkey_location: Literal["header", "body"] | None = "header",
         form_location: Literal["header", "params", "body"] | None = None,
         auth: bool = True,
+        priority: REQUEST_PRIORITY_TYPE | None = None,
+        timeout: float | tuple[float, float] | None = None,
+        deadline: float | None = None,
         api: str | None = None,
         continuous: bool = False,
         response_type: TDynamic | type[TDynamic] | Callable[[], TDynamic] = KisDynamicDict,
         verbose: bool = True,
+        lazy: bool | None = None,
+        fields: Iterable[str] | None = None,
+        raw_retention: RAW_RETENTION_TYPE | None = None,
     ) -> TDynamic:
         if api is not None:
             if headers is None:
@@ -623,58 +1300,165 @@ class PyKis:
 
             headers["tr_cont"] = "N"
 
-        response = self.request(
+        def fetch() -> TDynamic:
+            response = self.request(
+                path,
+                method=method,
+                params=params,
+                body=body,
+                form=form,
+                headers=headers,
+                domain=domain,
+                appkey_location=appkey_location,
+                form_location=form_location,
+                auth=auth,
+                priority=priority,
+                timeout=timeout,
+                deadline=deadline,
+            )
+
+            return self._transform_response(
+                response,
+                path=path,
+                params=params,
+                body=body,
+                api=api,
+                response_type=response_type,
+                verbose=verbose,
+                lazy=lazy,
+                fields=fields,
+                raw_retention=raw_retention,
+            )
+
+        if coalesce := self._get_coalesce_key(
             path,
             method=method,
             params=params,
-            body=body,
             form=form,
             headers=headers,
             domain=domain,
-            appkey_location=appkey_location,
-            form_location=form_location,
-            auth=auth,
-        )
+            response_type=response_type,
+            fields=fields,
+            raw_retention=raw_retention,
+        ):
+            group, key = coalesce
+            return self._single_flight.do(key, fetch, group=group)
 
-        data = response.json()
-        data["__response__"] = response
+        return fetch()
 
-        if verbose:
+    def execute(self, plan: KisRequestSpec[T] | KisRequestPlan[T]) -> T:
+        """
+        API 요청 명세 또는 요청 계획을 실행합니다.
+
+        비동기 API(`AsyncPyKis.execute`)와 같은 요청 계획을 공유합니다.
+
+        Args:
+            plan: 요청 명세 또는 요청 계획
+        """
+        return execute_plan(plan, self.fetch)
+
+    def _issue_token(
+        self,
+        domain: Literal["real", "virtual"],
+        remaining: timedelta = TOKEN_REFRESH_MARGIN,
+    ) -> KisAccessToken:
+        """
+        API 접속 토큰의 남은 유효기간이 `remaining`보다 짧은 경우 새로 발급하여 교체합니다.
+
+        Args:
+            domain: 도메인
+            remaining: 재발급 기준 남은 유효기간
+        """
+        with get_lock(self, "token" if domain == "real" else "primary_token"):
+            token = self._token if domain == "real" else self._virtual_token
+
+            # 다른 스레드가 이미 발급한 경우 다시 발급하지 않습니다.
+            if token is not None and token.remaining >= remaining:
+                return token
+
+            from pykis.api.auth.token import token_issue
+
+            if self._token_store is not None:
+                # 다른 프로세스가 발급 중인 경우 대기 후 저장된 토큰을 재사용합니다.
+                token = self._token_store.issue(
+                    self._get_hashed_token_name(domain),
+                    lambda: token_issue(self, domain=domain),
+                    remaining=remaining.total_seconds(),
+                )
+            else:
+                token = token_issue(self, domain=domain)
+
+            if domain == "real":
+                self._token = token
+                logging.logger.debug(f"실전도메인 API 접속 토큰을 발급했습니다.")
+            else:
+                self._virtual_token = token
+                logging.logger.debug(f"모의도메인 API 접속 토큰을 발급했습니다.")
+
+            return token
+
+    def _get_approval_key(
+        self,
+        domain: Literal["real", "virtual"] | None = None,
+        invalid: str | None = None,
+        appkey: KisKey | None = None,
+    ) -> str:
+        """
+        웹소켓 접속 키를 반환합니다. 발급된 접속 키가 없거나 `invalid`와 같은 경우에만 새로 발급합니다.
+
+        Args:
+            domain: 도메인
+            invalid: 거부된 접속 키. 여러 스레드가 같은 접속 키의 거부를 알려도 한 번만 재발급합니다.
+            appkey: 접속 키를 발급할 앱 키. 기본값은 도메인의 앱 키입니다.
+        """
+        cache_key = domain if appkey is None else (domain, appkey.appkey)
+
+        if (key := self._approval_keys.get(cache_key)) is not None and key != invalid:
+            return key
+
+        with get_lock(self, "approval_key"):
+            if (key := self._approval_keys.get(cache_key)) is not None and key != invalid:
+                return key
+
+            from pykis.api.auth.websocket import websocket_approval_key
+
+            key = self._approval_keys[cache_key] = websocket_approval_key(
+                self,
+                domain=domain,
+                appkey=appkey,
+            ).approval_key
             logging.logger.debug(
-                f"API [%s]: %s, %s -> %s:%s (%s)",
-                api or path,
-                params or ".",
-                body or ".",
-                data.get("rt_cd", "."),
-                data.get("msg_cd", "."),
-                data.get("msg1", ".").strip(),
+                "%s 웹소켓 접속 키를 발급했습니다.",
+                "실전도메인" if domain == "real" else "모의도메인",
             )
 
-        response_object = KisObject.transform_(
-            data=data,
-            transform_type=response_type,
-            ignore_missing_fields={"__response__"},
-        )
+            return key
 
-        if isinstance(response_object, KisObjectBase):
-            kis_object_init(self, response_object)
+    def _poll_token_store(self, domain: Literal["real", "virtual"]) -> None:
+        """다른 프로세스가 갱신한 API 접속 토큰이 있는 경우 교체합니다."""
+        if self._token_store is None:
+            return
 
-        return response_object  # type: ignore
+        if (token := self._token_store.poll(self._get_hashed_token_name(domain))) is None:
+            return
+
+        if domain == "real":
+            self._token = token
+        else:
+            self._virtual_token = token
+
+        logging.logger.debug("다른 프로세스가 갱신한 %s API 접속 토큰을 불러왔습니다.", "실전도메인" if domain == "real" else "모의도메인")
 
     @property
-    @thread_safe("token")
     def token(self) -> KisAccessToken:
         """실전도메인 API 접속 토큰을 반환합니다."""
-        if self._token is None or self._token.remaining < timedelta(minutes=10):
-            from pykis.api.auth.token import token_issue
+        self._poll_token_store("real")
 
-            self._token = token_issue(self, domain="real")
-            logging.logger.debug(f"실전도메인 API 접속 토큰을 발급했습니다.")
+        # 토큰 교체는 참조 대입으로 이루어지므로 Lock 없이 현재 토큰을 읽습니다.
+        if (token := self._token) is not None and token.remaining >= TOKEN_REFRESH_MARGIN:
+            return token
 
-            if self._keep_token:
-                self._save_cached_token(self._keep_token, domain="real", force=False)
-
-        return self._token
+        return self._issue_token("real")
 
     @token.setter
     @thread_safe("token")
@@ -682,23 +1466,21 @@ class PyKis:
         """API 접속 토큰을 설정합니다."""
         self._token = token
 
+        if self._token_manager is not None:
+            self._token_manager.invalidate()
+
     @property
-    @thread_safe("primary_token")
     def primary_token(self) -> KisAccessToken:
         """API 접속 토큰을 반환합니다."""
         if not self.virtual:
             return self.token
 
-        if self._virtual_token is None or self._virtual_token.remaining < timedelta(minutes=10):
-            from pykis.api.auth.token import token_issue
-
-            self._virtual_token = token_issue(self, domain="virtual")
-            logging.logger.debug(f"모의도메인 API 접속 토큰을 발급했습니다.")
+        self._poll_token_store("virtual")
 
-            if self._keep_token:
-                self._save_cached_token(self._keep_token, domain="virtual", force=False)
+        if (token := self._virtual_token) is not None and token.remaining >= TOKEN_REFRESH_MARGIN:
+            return token
 
-        return self._virtual_token
+        return self._issue_token("virtual")
 
     @primary_token.setter
     @thread_safe("primary_token")
@@ -706,16 +1488,37 @@ class PyKis:
         """API 접속 토큰을 설정합니다."""
         self._virtual_token = token
 
+        if self._token_manager is not None:
+            self._token_manager.invalidate()
+
+    @property
+    def token_manager(self) -> KisTokenManager | None:
+        """API 접속 토큰 자동 갱신 관리자. `auto_refresh_token`을 사용하지 않는 경우 None입니다."""
+        return self._token_manager
+
+    @property
+    def token_refresh_status(self) -> dict[Literal["real", "virtual"], KisTokenRefreshStatus]:
+        """도메인별 API 접속 토큰 자동 갱신 상태"""
+        return {} if self._token_manager is None else self._token_manager.status
+
     def discard(self, domain: Literal["real", "virtual"] | None = None) -> None:
         """API 접속 토큰을 폐기합니다."""
         from pykis.api.auth.token import token_revoke
 
         if self._token is not None and (domain is None or domain == "real"):
             token_revoke(self, self._token.token)
+
+            if self._token_store is not None:
+                self._token_store.invalidate(self._get_hashed_token_name("real"), self._token)
+
             self._token = None
 
         if self._virtual_token is not None and (domain is None or (domain == "virtual" and self.virtual)):
             token_revoke(self, self._virtual_token.token)
+
+            if self._token_store is not None:
+                self._token_store.invalidate(self._get_hashed_token_name("virtual"), self._virtual_token)
+
             self._virtual_token = None
 
     @property
@@ -732,22 +1535,42 @@ class PyKis:
         return self.primary_account
 
     @property
-    def websocket(self) -> KisWebsocketClient:
+    def websocket(self) -> KisWebsocketClientBase:
         """웹소켓 클라이언트를 반환합니다."""
         if self._websocket is None:
             raise ValueError("웹소켓 클라이언트가 초기화되지 않았습니다.")
 
         return self._websocket
 
+    @property
+    def aio(self) -> "AsyncPyKis":
+        """
+        인증 정보를 공유하는 비동기 API를 반환합니다.
+
+        Raises:
+            ImportError: httpx 패키지가 설치되지 않은 경우
+        """
+        if self._aio is None:
+            from pykis.aio.kis import AsyncPyKis
+
+            self._aio = AsyncPyKis(self)
+
+        return self._aio
+
     def close(self) -> None:
         """API 세션을 종료합니다."""
-        for session in self._sessions.values():
-            session.close()
+        if (token_manager := getattr(self, "_token_manager", None)) is not None:
+            token_manager.stop()
+
+        # 생성자에서 예외가 발생한 경우 세션이 없습니다.
+        for transport in set(getattr(self, "_transports", {}).values()):
+            transport.close()
 
     def __del__(self) -> None:
         """API 세션을 종료합니다."""
         self.close()
 
     from pykis.api.stock.trading_hours import trading_hours
+    from pykis.client.warmup import warmup
     from pykis.scope.account import account
     from pykis.scope.stock import stock
@@ -1,17 +1,25 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import RLock
 from types import EllipsisType, NoneType
 from typing import (
     Any,
     Callable,
     Generic,
+    Iterable,
+    Iterator,
+    Literal,
     Protocol,
     TypeVar,
     get_args,
     runtime_checkable,
 )
+from weakref import WeakKeyDictionary
 
 from pykis import logging
 
 __all__ = [
+    "RAW_RETENTION_TYPE",
     "KisType",
     "TType",
     "KisDynamicScopedPath",
@@ -20,14 +28,55 @@ __all__ = [
     "KisTransform",
     "TListItem",
     "KisList",
+    "KisTransformField",
+    "KisTransformPlan",
+    "KisLazyFields",
     "KisObject",
     "KisNoneValueError",
+    "KisProjectionError",
 ]
 
 T = TypeVar("T")
 
 empty = object()
 
+RAW_RETENTION_TYPE = Literal["full", "data", "none"]
+"""
+원본 응답 데이터 보관 방식
+
+- `full`: 원본 응답 데이터와 HTTP 응답 객체를 모두 보관합니다.
+- `data`: 원본 응답 데이터만 보관하고 HTTP 응답 객체는 보관하지 않습니다.
+- `none`: 원본 응답 데이터와 HTTP 응답 객체를 모두 보관하지 않습니다. `raw()` 호출 시 예외가 발생합니다.
+"""
+
+_lazy: ContextVar[bool | None] = ContextVar("pykis_lazy", default=None)
+"""하위 응답 객체에도 적용되는 지연 변환 여부 강제 설정"""
+_fields: ContextVar[dict[str, Any] | None] = ContextVar("pykis_fields", default=None)
+"""변환 중인 필드의 하위 응답 객체에 적용할 필드 선택"""
+_collected: ContextVar[list[Any] | None] = ContextVar("pykis_collected", default=None)
+"""원본 응답 데이터 보관 방식을 적용할 응답 객체 목록"""
+_validated: ContextVar[set[type] | None] = ContextVar("pykis_validated", default=None)
+"""변환 중 데이터 변환 계획의 유효성을 확인한 타입"""
+
+
+def _project(fields: Iterable[str]) -> dict[str, Any]:
+    """
+    필드 이름 목록을 필드별 하위 필드 선택으로 변환합니다.
+
+    `indicator.eps`와 같이 점으로 하위 응답 객체의 필드를 지정하며, 하위 필드가 없는 경우 None입니다.
+    """
+    nested: dict[str, list[str] | None] = {}
+
+    for name in fields:
+        head, _, rest = name.partition(".")
+
+        if not rest:
+            nested[head] = None
+        elif (children := nested.setdefault(head, [])) is not None:
+            children.append(rest)
+
+    return {head: None if children is None else _project(children) for head, children in nested.items()}
+
 
 class KisTypeMeta(type, Generic[T]):
     def __getitem__(self, args: str | None | tuple[str | None, T | None | object]) -> T:
@@ -90,6 +139,22 @@ class KisType(Generic[T]):
         """응답 데이터를 변환합니다."""
         raise NotImplementedError
 
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        # 지연 변환 중이거나 필드 선택에서 제외된 필드는 인스턴스 속성이 없으므로 접근할 때 이곳으로 위임됩니다.
+        if instance is None or (attributes := getattr(instance, "__dict__", None)) is None:
+            return self
+
+        if (state := attributes.get("__lazy_fields__")) is not None:
+            if (value := state.resolve(instance, self)) is not empty:
+                return value
+
+        if (unselected := attributes.get("__unselected_fields__")) is not None and (
+            name := unselected.get(id(self))
+        ) is not None:
+            raise KisProjectionError(type(instance), name)
+
+        return self
+
     @classmethod
     def default_type(cls) -> "KisType[Any]":
         if cls.__default__ is None:
@@ -161,9 +226,18 @@ class KisDynamic:
     """응답 데이터 변환 함수"""
     __path__: KisDynamicScopedPath | str | None = None
     """응답 데이터 위치 지정"""
+    __lazy__: bool = False
+    """
+    지연 변환 여부
+
+    지연 변환일 경우, 필드 값은 처음 접근할 때 변환되어 저장됩니다.
+    필드 누락은 응답 객체 생성 시 검사하지만, 값 변환 오류는 해당 필드에 접근할 때 발생합니다.
+    """
 
     __data__: dict[str, Any] = None  # type: ignore
     """원본 응답 데이터"""
+    __raw_retention__: RAW_RETENTION_TYPE = "full"
+    """원본 응답 데이터 보관 방식"""
 
     def __pre_init__(self, data: dict[str, Any]) -> None:
         pass
@@ -172,8 +246,16 @@ class KisDynamic:
         pass
 
     def raw(self) -> dict[str, Any] | None:
-        """원본 응답 데이터의 복사본을 반환합니다."""
+        """
+        원본 응답 데이터의 복사본을 반환합니다.
+
+        Raises:
+            ValueError: 원본 응답 데이터를 보관하지 않도록 설정된 경우
+        """
         if self.__data__ is None:
+            if self.__raw_retention__ == "none":
+                raise ValueError("원본 응답 데이터를 보관하지 않도록 설정되어 있습니다. (raw_retention='none')")
+
             return None
 
         data = self.__data__.copy()
@@ -219,6 +301,260 @@ class KisList(Generic[TListItem], KisType[list[Any]], metaclass=KisTypeMeta[list
             return [KisObject.transform_(item, self.type) for item in data]
 
 
+class KisTransformField:
+    """응답 데이터 변환 계획의 필드"""
+
+    __slots__ = ["name", "type", "field", "default", "nullable", "absolute", "scope", "lazy", "descriptor"]
+
+    name: str
+    """속성 이름"""
+    type: KisType[Any]
+    """응답 타입"""
+    field: str | None
+    """응답 필드. None일 경우 응답 데이터 전체를 변환합니다."""
+    default: Any
+    """기본값"""
+    nullable: bool | None
+    """None 허용 여부"""
+    absolute: bool
+    """절대 경로 여부"""
+    scope: str | None
+    """응답 범위"""
+    lazy: bool
+    """지연 변환 가능 여부"""
+    descriptor: bool
+    """클래스 속성이 응답 타입 객체인지 여부. 타입 클래스로 지정된 필드는 접근 시 변환하거나 검사할 수 없습니다."""
+
+    def __init__(self, name: str, type: KisType[Any], anno: Any, lazy: bool = True):
+        self.name = name
+        self.type = type
+        self.field = None if isinstance(type, KisTransform) else type.field or name
+        self.default = type.default
+        self.nullable = NoneType in get_args(anno) if anno else None
+        self.absolute = type.absolute
+        self.scope = type.scope
+        self.lazy = lazy
+        self.descriptor = lazy
+
+    def value(self, data: dict[str, Any]) -> Any:
+        """응답 데이터에서 변환할 값을 가져옵니다. 값과 기본값이 모두 없을 경우 `empty`를 반환합니다."""
+        field = self.field
+
+        if field is None:
+            return data
+
+        if field in data:
+            return data[field]
+
+        if self.default is empty:
+            return empty
+
+        return self.default() if callable(self.default) else self.default
+
+    def convert(self, object_type: type, value: Any) -> Any:
+        """값을 변환합니다."""
+        result = empty
+
+        if value is not None:
+            try:
+                result = self.type.transform(value)
+            except KisNoneValueError:
+                pass
+            except Exception as e:
+                raise ValueError(
+                    f"{object_type.__name__}.{self.name} 필드를 변환하는 중 오류가 발생했습니다.\n→ {type(e).__name__}: {e}"
+                ) from e
+
+        if result is empty:
+            if self.nullable:
+                result = None
+            else:
+                raise ValueError(f"{object_type.__name__}.{self.name} 필드의 값이 빈 값입니다.")
+
+        return result
+
+    def __repr__(self) -> str:
+        return f"KisTransformField(name={self.name!r}, field={self.field!r}, type={self.type!r})"
+
+
+class KisTransformPlan:
+    """
+    응답 객체 타입별 데이터 변환 계획
+
+    MRO의 어노테이션 병합, 필드 탐색, 기본 타입 해석 결과를 타입마다 한 번만 계산하여 재사용합니다.
+    계산 이후 클래스의 필드가 추가, 제거, 교체된 경우 `valid`가 False를 반환합니다.
+    """
+
+    __slots__ = ["fields", "ignore_missing", "verbose_missing", "scoped_path", "lazy", "_names", "_fingerprint"]
+
+    fields: tuple[KisTransformField, ...]
+    """변환할 필드"""
+    ignore_missing: bool
+    """데이터에 정의된 필드가 없을 경우 예외 무시 여부"""
+    verbose_missing: bool
+    """정의된 필드가 아닌 데이터가 있을 경우 경고 여부"""
+    scoped_path: KisDynamicScopedPath | None
+    """응답 데이터 위치"""
+    lazy: bool
+    """지연 변환 여부"""
+
+    _names: tuple[str, ...]
+    """변경을 확인할 클래스 속성 이름"""
+    _fingerprint: tuple[Any, ...]
+    """계산 당시의 클래스 상태"""
+
+    def __init__(self, object_type: type):
+        annotations = {
+            key: value
+            for obj in object_type.__mro__
+            if (annotations := getattr(obj, "__annotations__", None)) is not None
+            for key, value in annotations.items()
+        }
+        fields = []
+        counts: dict[int, int] = {}
+
+        for key in dir(object_type):
+            if key.startswith("_") and not key.endswith("_"):
+                continue
+
+            type_ = getattr(object_type, key, None)
+            lazy = True
+
+            if isinstance(type_, type) and issubclass(type_, KisType):
+                if (getattr(type_, "__default__", None)) is None:
+                    raise ValueError(
+                        f"{object_type.__name__}의 {key} 필드에 {type_.__name__}은 간접적으로 타입을 지정할 수 없습니다."
+                    )
+
+                type_ = type_.default_type()
+                # 클래스 속성이 타입 클래스이므로 접근 시 변환할 수 없습니다.
+                lazy = False
+            elif not isinstance(type_, KisType):
+                continue
+
+            counts[id(type_)] = counts.get(id(type_), 0) + 1
+            fields.append(KisTransformField(key, type_, annotations.get(key, None), lazy=lazy))
+
+        for field in fields:
+            # 여러 필드가 같은 타입 객체를 공유하는 경우 접근한 필드를 구분할 수 없습니다.
+            if counts[id(field.type)] > 1:
+                field.lazy = False
+
+        self.fields = tuple(fields)
+        self.ignore_missing = getattr(object_type, "__ignore_missing__", False)
+        self.verbose_missing = getattr(object_type, "__verbose_missing__", False)
+        self.scoped_path = KisDynamicScopedPath.get_scope(object_type)
+        self.lazy = getattr(object_type, "__lazy__", False)
+        self._names = (*(field.name for field in fields), *_PLAN_ATTRIBUTES)
+        self._fingerprint = self._snapshot(object_type)
+
+    def _snapshot(self, object_type: type) -> tuple[Any, ...]:
+        return (
+            # 클래스 속성이 추가, 제거된 경우 MRO 중 하나의 속성 수가 달라집니다.
+            tuple(len(type_.__dict__) for type_ in object_type.__mro__),
+            tuple(getattr(object_type, name, None) for name in self._names),
+        )
+
+    def valid(self, object_type: type) -> bool:
+        """계산 이후 클래스의 필드 또는 변환 설정이 변경되지 않았는지 여부를 반환합니다."""
+        return self._fingerprint == self._snapshot(object_type)
+
+    def __repr__(self) -> str:
+        return f"KisTransformPlan(fields={[field.name for field in self.fields]!r})"
+
+
+_PLAN_ATTRIBUTES = ("__path__", "__lazy__", "__ignore_missing__", "__verbose_missing__")
+"""변환 계획에 영향을 주는 클래스 속성"""
+
+
+class KisLazyFields:
+    """응답 객체의 변환되지 않은 필드"""
+
+    __slots__ = ["object_type", "data", "parsing_data", "fields", "lazy", "projection", "_index", "_lock"]
+
+    object_type: type
+    """응답 객체 타입"""
+    data: dict[str, Any]
+    """원본 응답 데이터"""
+    parsing_data: dict[str, Any]
+    """응답 데이터 위치의 데이터"""
+    fields: dict[str, KisTransformField]
+    """변환되지 않은 필드"""
+    lazy: bool | None
+    """하위 응답 객체 지연 변환 여부 강제 설정"""
+    projection: dict[str, Any] | None
+    """필드 선택"""
+
+    _index: dict[int, KisTransformField]
+    """필드 타입별 변환되지 않은 필드"""
+    _lock: RLock
+    """필드 변환 잠금"""
+
+    def __init__(
+        self,
+        object_type: type,
+        data: dict[str, Any],
+        parsing_data: dict[str, Any],
+        fields: dict[str, KisTransformField],
+        lazy: bool | None = None,
+        projection: dict[str, Any] | None = None,
+    ):
+        self.object_type = object_type
+        self.data = data
+        self.parsing_data = parsing_data
+        self.fields = fields
+        self.lazy = lazy
+        self.projection = projection
+        self._index = {}
+        self._lock = RLock()
+
+        for step in fields.values():
+            self._index.setdefault(id(step.type), step)
+
+    def resolve(self, instance: Any, type: KisType[Any]) -> Any:
+        """필드를 변환하여 인스턴스에 저장하고 반환합니다. 지연 변환 중인 필드가 아닌 경우 `empty`를 반환합니다."""
+        if (step := self._index.get(id(type))) is None:
+            return empty
+
+        return self._resolve(instance, step)
+
+    def _resolve(self, instance: Any, step: KisTransformField) -> Any:
+        attributes = instance.__dict__
+
+        # 다른 스레드가 먼저 변환한 경우 저장된 값을 반환합니다.
+        if (result := attributes.get(step.name, empty)) is not empty:
+            return result
+
+        with self._lock:
+            if (result := attributes.get(step.name, empty)) is not empty:
+                return result
+
+            lazy_token = _lazy.set(self.lazy)
+            fields_token = _fields.set(self.projection.get(step.name) if self.projection else None)
+
+            try:
+                result = step.convert(self.object_type, step.value(self.data if step.absolute else self.parsing_data))
+            finally:
+                _fields.reset(fields_token)
+                _lazy.reset(lazy_token)
+
+            attributes[step.name] = result
+            self.fields.pop(step.name, None)
+
+        return result
+
+    def resolve_all(self, instance: Any) -> None:
+        """변환되지 않은 모든 필드를 변환합니다."""
+        for step in tuple(self.fields.values()):
+            self._resolve(instance, step)
+
+    def __repr__(self) -> str:
+        return f"KisLazyFields(type={self.object_type.__name__}, fields={list(self.fields)!r})"
+
+
+_plans: "WeakKeyDictionary[type, KisTransformPlan]" = WeakKeyDictionary()
+
+
 class KisObject(Generic[TDynamic], KisType[TDynamic], metaclass=KisTypeMeta):
     type_: type[TDynamic] | Callable[[], TDynamic]
 
@@ -229,6 +565,99 @@ class KisObject(Generic[TDynamic], KisType[TDynamic], metaclass=KisTypeMeta):
     def transform(self, data: Any) -> TDynamic:
         return self.transform_(data, self.type_)
 
+    @staticmethod
+    def plan(object_type: type) -> KisTransformPlan:
+        """
+        타입의 데이터 변환 계획을 반환합니다. 처음 호출될 때 계산하여 캐시합니다.
+
+        캐시된 계획은 클래스가 변경되었는지 확인한 뒤 반환하며, 변경된 경우 다시 계산합니다.
+        `transform_` 중에는 하위 응답 객체를 포함하여 타입마다 한 번만 확인합니다.
+        """
+        validated = _validated.get()
+
+        if (plan := _plans.get(object_type)) is not None:
+            if validated is not None and object_type in validated:
+                return plan
+
+            if not plan.valid(object_type):
+                plan = None
+
+        if plan is None:
+            plan = _plans[object_type] = KisTransformPlan(object_type)
+
+        if validated is not None:
+            validated.add(object_type)
+
+        return plan
+
+    @staticmethod
+    def invalidate_plan(object_type: type | None = None) -> None:
+        """
+        캐시된 데이터 변환 계획을 제거합니다. 클래스 변경은 자동으로 감지되므로 일반적으로 호출할 필요가 없습니다.
+
+        Args:
+            object_type: 제거할 타입. None일 경우 모든 타입의 계획을 제거합니다.
+        """
+        if object_type is None:
+            _plans.clear()
+        else:
+            for type_ in [type_ for type_ in list(_plans.keys()) if issubclass(type_, object_type)]:
+                _plans.pop(type_, None)
+
+    @staticmethod
+    def resolve_(object: Any) -> Any:
+        """
+        지연 변환 중인 응답 객체의 모든 필드를 변환합니다. 변환할 수 없는 필드가 있을 경우 예외가 발생합니다.
+
+        Args:
+            object: 응답 객체
+        """
+        if (state := getattr(object, "__dict__", {}).get("__lazy_fields__")) is not None:
+            state.resolve_all(object)
+
+        return object
+
+    @staticmethod
+    @contextmanager
+    def collect_() -> Iterator[list[Any]]:
+        """
+        변환되는 응답 객체를 하위 응답 객체를 포함하여 수집합니다.
+        `__transform__`으로 변환되는 응답 객체는 수집하지 않습니다.
+        """
+        collected = []
+        token = _collected.set(collected)
+
+        try:
+            yield collected
+        finally:
+            _collected.reset(token)
+
+    @staticmethod
+    def release_(objects: Iterable[Any], retention: RAW_RETENTION_TYPE) -> None:
+        """
+        원본 응답 데이터 보관 방식에 따라 응답 객체의 원본 응답 데이터를 정리합니다.
+        `__post_init__`과 같은 초기화 단계에서 원본 응답 데이터를 사용하므로 초기화가 끝난 뒤 호출해야 합니다.
+
+        Args:
+            objects: 응답 객체
+            retention: 원본 응답 데이터 보관 방식
+        """
+        if retention == "full":
+            return
+
+        for object in objects:
+            attributes = object.__dict__
+
+            if "__response__" in attributes:
+                attributes["__response__"] = None
+
+            if retention == "none":
+                attributes["__data__"] = None
+                attributes["__raw_retention__"] = retention
+            elif (data := attributes.get("__data__")) is not None:
+                data.pop("__response__", None)
+                attributes["__raw_retention__"] = retention
+
     @classmethod
     def transform_(
         cls,
@@ -240,6 +669,89 @@ class KisObject(Generic[TDynamic], KisType[TDynamic], metaclass=KisTypeMeta):
         pre_init: bool = True,
         post_init: bool = True,
         scope: str | None = None,
+        lazy: bool | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> TDynamic:
+        """
+        응답 데이터를 응답 객체로 변환합니다.
+
+        Args:
+            lazy: 지연 변환 여부. 하위 응답 객체에도 적용되며, None일 경우 상위 변환의 설정 또는 응답 객체의 `__lazy__`를 따릅니다.
+            fields: 변환할 필드 이름. 선택하지 않은 필드는 변환하지 않습니다.
+                `indicator.eps`와 같이 하위 응답 객체의 필드를 지정할 수 있으며, `*`는 해당 단계의 모든 필드를 선택합니다.
+                `__response__`와 같은 `__` 로 시작하는 필드는 항상 변환합니다.
+        """
+        if _validated.get() is None:
+            token = _validated.set(set())
+
+            try:
+                return cls.transform_(
+                    data,
+                    transform_type,
+                    ignore_missing,
+                    ignore_missing_fields,
+                    ignore_path,
+                    pre_init,
+                    post_init,
+                    scope,
+                    lazy,
+                    fields,
+                )
+            finally:
+                _validated.reset(token)
+
+        if fields is None:
+            projection = _fields.get()
+        else:
+            projection = _project([fields] if isinstance(fields, str) else fields)
+
+        if projection is None and (lazy is None or _lazy.get() is lazy):
+            return cls._transform(
+                data,
+                transform_type,
+                ignore_missing,
+                ignore_missing_fields,
+                ignore_path,
+                pre_init,
+                post_init,
+                scope,
+                None,
+            )
+
+        lazy_token = _lazy.set(lazy) if lazy is not None else None
+        # 하위 필드 선택은 해당 필드를 변환하는 동안에만 적용됩니다.
+        fields_token = _fields.set(None)
+
+        try:
+            return cls._transform(
+                data,
+                transform_type,
+                ignore_missing,
+                ignore_missing_fields,
+                ignore_path,
+                pre_init,
+                post_init,
+                scope,
+                projection,
+            )
+        finally:
+            _fields.reset(fields_token)
+
+            if lazy_token is not None:
+                _lazy.reset(lazy_token)
+
+    @classmethod
+    def _transform(
+        cls,
+        data: Any,
+        transform_type: TDynamic | type[TDynamic] | Callable[[], TDynamic],
+        ignore_missing: bool,
+        ignore_missing_fields: set[str] | None,
+        ignore_path: bool,
+        pre_init: bool,
+        post_init: bool,
+        scope: str | None,
+        projection: dict[str, Any] | None,
     ) -> TDynamic:
         if not isinstance(data, dict):
             raise TypeError(f"dict 형을 기대하였지만, {type(data).__name__} 형이 입력되었습니다.")
@@ -261,87 +773,103 @@ class KisObject(Generic[TDynamic], KisType[TDynamic], metaclass=KisTypeMeta):
             object.__pre_init__(data)
 
         parsing_data = data
+        plan = cls.plan(object_type)
 
-        if not ignore_path:
-            scoped_path = KisDynamicScopedPath.get_scope(object_type)
+        if not ignore_path and (scoped_path := plan.scoped_path) is not None:
+            parsing_data = scoped_path(data)
 
-            if scoped_path is not None:
-                parsing_data = scoped_path(data)
+        ignore_missing = ignore_missing or plan.ignore_missing
+        missing = None
+        pending: dict[str, KisTransformField] | None = None
 
-        ignore_missing = ignore_missing or getattr(object_type, "__ignore_missing__", False)
-        annotations = {
-            key: value
-            for obj in object_type.__mro__
-            if (annotations := getattr(obj, "__annotations__", None)) is not None
-            for key, value in annotations.items()
-        }
-        missing = set(parsing_data.keys())
-        missing.discard("__response__")
-
-        for key, type_, anno in (
-            (field, type_, annotations.get(field, None))
-            for field in dir(object_type)
-            if (not field.startswith("_") or field.endswith("_"))
-            and (
-                isinstance(type_ := getattr(object_type, field, None), KisType)
-                or (isinstance(type_, type) and issubclass(type_, KisType))
-            )
-        ):
-            if isinstance(type_, type):
-                if (getattr(type_, "__default__", None)) is None:
-                    raise ValueError(
-                        f"{object_type.__name__}의 {key} 필드에 {type_.__name__}은 간접적으로 타입을 지정할 수 없습니다."
-                    )
+        if (override := _lazy.get()) is None:
+            lazy = plan.lazy
+        else:
+            lazy = override
 
-                type_ = type_.default_type()
+        attributes = object.__dict__
+        # 같은 객체를 다시 변환하는 경우 이전 응답 데이터의 필드가 남지 않도록 합니다.
+        attributes.pop("__lazy_fields__", None)
 
-            if scope is not None and type_.scope != scope:
+        if lazy:
+            pending = {}
+
+        if plan.verbose_missing:
+            missing = set(parsing_data.keys())
+            missing.discard("__response__")
+
+        select_all = projection is None or "*" in projection
+        unselected: dict[int, str] | None = None
+        attributes.pop("__unselected_fields__", None)
+
+        for step in plan.fields:
+            if scope is not None and step.scope != scope:
                 continue
 
-            field = None if isinstance(type_, KisTransform) else type_.field or key
-            nullable = NoneType in get_args(anno) if anno else None
-            target_data = data if type_.absolute else parsing_data
+            field = step.field
+            target_data = data if step.absolute else parsing_data
 
-            if field is not None and target_data is parsing_data:
+            if missing is not None and field is not None and target_data is parsing_data:
                 missing.discard(field)
 
-            if field is None:
-                value = target_data
-            elif field not in target_data:
-                if type_.default is empty:
+            if not select_all and step.name not in projection and not step.name.startswith("__"):  # type: ignore
+                if step.descriptor:
+                    # 선택하지 않은 필드에 접근하면 `KisProjectionError`가 발생합니다.
+                    if unselected is None:
+                        unselected = {}
+
+                    unselected[id(step.type)] = step.name
+                    attributes.pop(step.name, None)
+                    continue
+
+                # 타입 클래스로 지정된 필드는 접근을 감지할 수 없으므로 항상 변환합니다.
+
+            if pending is not None and step.lazy:
+                # 누락된 필드는 즉시 검사하고, 값 변환은 처음 접근할 때까지 미룹니다.
+                if field is not None and field not in target_data and step.default is empty:
                     if ignore_missing:
                         continue
 
-                    raise KeyError(f"{object_type.__name__}.{key} 필드의 {field}값이 존재하지 않습니다. ({type_!r})")
+                    raise KeyError(
+                        f"{object_type.__name__}.{step.name} 필드의 {field}값이 존재하지 않습니다. ({step.type!r})"
+                    )
 
-                if callable(type_.default):
-                    value = type_.default()
-                else:
-                    value = type_.default
-            else:
-                value = target_data[field]
+                pending[step.name] = step
+                attributes.pop(step.name, None)
+                continue
 
-            result = empty
+            value = step.value(target_data)
 
-            if value is not None:
-                try:
-                    result = type_.transform(value)
-                except KisNoneValueError:
-                    pass
-                except Exception as e:
-                    raise ValueError(
-                        f"{object_type.__name__}.{key} 필드를 변환하는 중 오류가 발생했습니다.\n→ {type(e).__name__}: {e}"
-                    ) from e
+            if value is empty:
+                if ignore_missing:
+                    continue
+
+                raise KeyError(f"{object_type.__name__}.{step.name} 필드의 {field}값이 존재하지 않습니다. ({step.type!r})")
 
-            if result is empty:
-                if nullable:
-                    result = None
-                else:
-                    raise ValueError(f"{object_type.__name__}.{key} 필드의 값이 빈 값입니다.")
+            if projection is not None and (children := projection.get(step.name)) is not None:
+                token = _fields.set(children)
 
-            setattr(object, key, result)
+                try:
+                    setattr(object, step.name, step.convert(object_type, value))
+                finally:
+                    _fields.reset(token)
+            else:
+                setattr(object, step.name, step.convert(object_type, value))
+
+        if unselected:
+            attributes["__unselected_fields__"] = unselected
+
+        if pending:
+            attributes["__lazy_fields__"] = KisLazyFields(
+                object_type,
+                data,
+                parsing_data,
+                pending,
+                override,
+                projection,
+            )
 
-        if missing and getattr(object_type, "__verbose_missing__", False):
+        if missing:
             if ignore_missing_fields is not None:
                 missing -= ignore_missing_fields
 
@@ -350,6 +878,9 @@ class KisObject(Generic[TDynamic], KisType[TDynamic], metaclass=KisTypeMeta):
 
         setattr(object, "__data__", data)
 
+        if (collected := _collected.get()) is not None:
+            collected.append(object)
+
         if post_init and hasattr(object, "__post_init__"):
             object.__post_init__()
 
@@ -360,3 +891,20 @@ class KisNoneValueError(Exception):
     """빈 값이 입력되었을 때 발생하는 예외"""
 
     pass
+
+
+class KisProjectionError(AttributeError):
+    """`fields`로 선택하지 않아 변환되지 않은 필드에 접근한 경우"""
+
+    object_type: type
+    """응답 객체 타입"""
+    field: str
+    """필드 이름"""
+
+    def __init__(self, object_type: type, field: str):
+        super().__init__(
+            f"{object_type.__name__}.{field} 필드는 fields로 선택되지 않아 변환되지 않았습니다. "
+            f"필드를 사용하려면 fields에 {field!r}를 추가하세요."
+        )
+        self.object_type = object_type
+        self.field = field
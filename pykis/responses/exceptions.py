@@ -1,8 +1,7 @@
 from typing import Any
 
-from requests import Response
-
 from pykis.client.exceptions import KisAPIError, KisException
+from pykis.client.transport import KisHTTPResponseProtocol
 
 __all__ = [
     "KisNotFoundError",
@@ -19,7 +18,7 @@ class KisNotFoundError(KisException):
     def __init__(
         self,
         data: dict,
-        response: Response,
+        response: KisHTTPResponseProtocol,
         message: str | None = None,
         fields: dict[str, Any] = {},
     ):
@@ -34,5 +33,5 @@ class KisNotFoundError(KisException):
 class KisMarketNotOpenedError(KisAPIError):
     """시장이 열리지 않은 경우"""
 
-    def __init__(self, data: dict, response: Response):
+    def __init__(self, data: dict, response: KisHTTPResponseProtocol):
         super().__init__(data, response)
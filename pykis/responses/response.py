@@ -1,10 +1,9 @@
 from typing import Any, Protocol, runtime_checkable
 
-from requests import Response
-
 from pykis.client.exceptions import KisAPIError
 from pykis.client.object import KisObjectBase, KisObjectProtocol
 from pykis.client.page import KisPage, KisPageStatus, to_page_status
+from pykis.client.transport import KisHTTPResponseProtocol
 from pykis.responses.dynamic import (
     KisDynamic,
     KisDynamicProtocol,
@@ -51,7 +50,7 @@ class KisResponseProtocol(KisDynamicProtocol, KisObjectProtocol, Protocol):
     """KIS 응답 결과 프로토콜"""
 
     @property
-    def __response__(self) -> Response | None:
+    def __response__(self) -> KisHTTPResponseProtocol | None:
         """원본 응답 데이터"""
         ...
 
@@ -69,7 +68,7 @@ class KisResponseProtocol(KisDynamicProtocol, KisObjectProtocol, Protocol):
 class KisResponse(KisDynamic, KisObjectBase):
     """KIS 응답 결과"""
 
-    __response__: Response | None = KisAny(lambda r: r)("__response__", absolute=True)
+    __response__: KisHTTPResponseProtocol | None = KisAny(lambda r: r)("__response__", absolute=True)
     """원본 응답 데이터"""
     __message__: str = KisAny(lambda s: s.strip())("msg1", absolute=True)
     """응답 메시지"""
@@ -86,8 +85,16 @@ class KisResponse(KisDynamic, KisObjectBase):
             )
 
     def raw(self) -> dict[str, Any] | None:
-        """원본 응답 데이터의 복사본을 반환합니다."""
+        """
+        원본 응답 데이터의 복사본을 반환합니다.
+
+        Raises:
+            ValueError: 원본 응답 데이터를 보관하지 않도록 설정된 경우
+        """
         if self.__data__ is None:
+            if self.__raw_retention__ == "none":
+                raise ValueError("원본 응답 데이터를 보관하지 않도록 설정되어 있습니다. (raw_retention='none')")
+
             return None
 
         data = self.__data__.copy()
@@ -148,7 +155,7 @@ class KisPaginationAPIResponse(KisAPIResponse):
     def __pre_init__(self, data: dict[str, Any]) -> None:
         super().__pre_init__(data)
 
-        response: Response = data["__response__"]
+        response: KisHTTPResponseProtocol = data["__response__"]
 
         self.page_status = to_page_status(response.headers["tr_cont"])
         self.next_page = KisObject.transform_(
@@ -1,6 +1,9 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, time, tzinfo
 from decimal import Decimal
-from typing import Any, Callable
+from functools import lru_cache
+from typing import Any, Callable, Iterator
 
 from pykis.responses.dynamic import KisDynamic, KisNoneValueError, KisType, KisTypeMeta
 from pykis.utils.repr import dict_repr
@@ -19,8 +22,103 @@ __all__ = [
     "KisDatetime",
     "KisDict",
     "KisTimeToDatetime",
+    "DECODER_CACHE_SIZE",
+    "parse_decimal",
+    "parse_date",
+    "parse_time",
+    "parse_datetime",
+    "today",
+    "today_snapshot",
 ]
 
+DECODER_CACHE_SIZE = 4096
+"""변환 결과 캐시 크기. 차트, 주문내역 등에서 반복되는 날짜, 가격 문자열의 변환 결과를 재사용합니다."""
+
+_today: ContextVar[dict[tzinfo | None, date] | None] = ContextVar("pykis_today", default=None)
+"""타임존별 당일 날짜 스냅샷"""
+
+
+def _strptime(data: str, format: str) -> datetime:
+    """자주 사용하는 고정 길이 포맷은 `strptime` 없이 문자열을 잘라 변환합니다."""
+    if isinstance(data, str) and data.isascii() and data.isdigit():
+        length = len(data)
+
+        try:
+            if format == "%Y%m%d" and length == 8:
+                return datetime(int(data[:4]), int(data[4:6]), int(data[6:]))
+
+            if format == "%H%M%S" and length == 6:
+                return datetime(1900, 1, 1, int(data[:2]), int(data[2:4]), int(data[4:]))
+
+            if format == "%Y%m%d%H%M%S" and length == 14:
+                return datetime(
+                    int(data[:4]),
+                    int(data[4:6]),
+                    int(data[6:8]),
+                    int(data[8:10]),
+                    int(data[10:12]),
+                    int(data[12:]),
+                )
+        except ValueError:
+            # 잘못된 값은 `strptime`과 같은 예외 메시지를 내도록 합니다.
+            pass
+
+    return datetime.strptime(data, format)
+
+
+@lru_cache(maxsize=DECODER_CACHE_SIZE)
+def parse_decimal(data: str) -> Decimal:
+    """문자열을 정규화된 Decimal로 변환합니다."""
+    return Decimal(data).normalize()
+
+
+@lru_cache(maxsize=DECODER_CACHE_SIZE)
+def parse_date(data: str, format: str = "%Y%m%d") -> date:
+    """문자열을 날짜로 변환합니다."""
+    return _strptime(data, format).date()
+
+
+@lru_cache(maxsize=DECODER_CACHE_SIZE)
+def parse_time(data: str, format: str = "%H%M%S") -> time:
+    """문자열을 시간으로 변환합니다."""
+    return _strptime(data, format).time()
+
+
+@lru_cache(maxsize=DECODER_CACHE_SIZE)
+def parse_datetime(data: str, format: str = "%Y%m%d%H%M%S", timezone: tzinfo | None = None) -> datetime:
+    """문자열을 날짜/시간으로 변환합니다."""
+    return _strptime(data, format).replace(tzinfo=timezone)
+
+
+def today(timezone: tzinfo | None = TIMEZONE) -> date:
+    """당일 날짜를 반환합니다. `today_snapshot` 안에서는 타임존별로 처음 계산한 날짜를 재사용합니다."""
+    if (snapshot := _today.get()) is None:
+        return datetime.now(timezone).date()
+
+    if (value := snapshot.get(timezone)) is None:
+        value = snapshot[timezone] = datetime.now(timezone).date()
+
+    return value
+
+
+@contextmanager
+def today_snapshot() -> Iterator[None]:
+    """
+    블록 안에서 당일 날짜를 한 번만 계산합니다.
+
+    하나의 응답을 변환하는 동안 행마다 현재 시각을 조회하지 않으며, 자정 전후로 날짜가 달라지지 않습니다.
+    """
+    if _today.get() is not None:
+        yield
+        return
+
+    token = _today.set({})
+
+    try:
+        yield
+    finally:
+        _today.reset(token)
+
 
 class KisDynamicDict(KisDynamic):
     __transform__ = lambda type, _: type()
@@ -115,6 +213,9 @@ class KisDecimal(KisType[Decimal], metaclass=KisTypeMeta[Decimal]):
         if data == "":
             raise KisNoneValueError
 
+        if type(data) is str:
+            return parse_decimal(data)
+
         return Decimal(data).normalize()
 
 
@@ -159,7 +260,7 @@ class KisDate(KisType[date], metaclass=KisTypeMeta[date]):
         if data == "":
             raise KisNoneValueError
 
-        return datetime.strptime(data, self.format).replace(tzinfo=self.timezone).date()
+        return parse_date(data, self.format)
 
 
 class KisTime(KisType[time], metaclass=KisTypeMeta[time]):
@@ -182,7 +283,7 @@ class KisTime(KisType[time], metaclass=KisTypeMeta[time]):
         if data == "":
             raise KisNoneValueError
 
-        return datetime.strptime(data, self.format).replace(tzinfo=self.timezone).time()
+        return parse_time(data, self.format)
 
 
 class KisDatetime(KisType[datetime], metaclass=KisTypeMeta[datetime]):
@@ -205,7 +306,7 @@ class KisDatetime(KisType[datetime], metaclass=KisTypeMeta[datetime]):
         if data == "":
             raise KisNoneValueError
 
-        return datetime.strptime(data, self.format).replace(tzinfo=self.timezone)
+        return parse_datetime(data, self.format, self.timezone)
 
 
 class KisDict(KisType[dict[str, Any]], metaclass=KisTypeMeta[dict[str, Any]]):
@@ -242,7 +343,7 @@ class KisTimeToDatetime(KisType[datetime], metaclass=KisTypeMeta[datetime]):
             raise KisNoneValueError
 
         return datetime.combine(
-            datetime.now(self.timezone).date(),
-            datetime.strptime(data, self.format).time(),
+            today(self.timezone),
+            parse_time(data, self.format),
             tzinfo=self.timezone,
         )
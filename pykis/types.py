@@ -72,7 +72,9 @@ from pykis.client.messaging import (
 )
 from pykis.client.object import KisObjectProtocol
 from pykis.client.page import KisPage, KisPageStatus
-from pykis.client.websocket import KisWebsocketClient
+from pykis.client.sharded import KisShardedWebsocketClient
+from pykis.client.websocket import KisWebsocketClient, KisWebsocketClientBase
+from pykis.event.conflate import KisConflatingCallback
 from pykis.event.filters.order import KisOrderNumberEventFilter
 from pykis.event.filters.product import KisProductEventFilter
 from pykis.event.filters.subscription import KisSubscriptionEventFilter
@@ -144,7 +146,9 @@ __all__ = [
     "KisWebsocketRequest",
     "KisWebsocketTR",
     "KisWebsocketEncryptionKey",
+    "KisWebsocketClientBase",
     "KisWebsocketClient",
+    "KisShardedWebsocketClient",
     ################################
     ##            Events          ##
     ################################
@@ -157,6 +161,7 @@ __all__ = [
     "KisLambdaEventCallback",
     "KisLambdaEventFilter",
     "KisMultiEventFilter",
+    "KisConflatingCallback",
     "KisSubscribedEventArgs",
     "KisUnsubscribedEventArgs",
     "KisSubscriptionEventArgs",
@@ -0,0 +1,160 @@
+import json
+from typing import Any, Literal, Protocol
+
+__all__ = [
+    "JSON_CODEC_TYPE",
+    "KisJSONCodec",
+    "StdJSONCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "create_json_codec",
+    "get_json_codec",
+]
+
+JSON_CODEC_TYPE = Literal["auto", "orjson", "msgspec", "json"]
+"""JSON 변환 방식. `auto`일 경우 설치된 패키지 중 orjson, msgspec, json 순서로 사용합니다."""
+
+
+class KisJSONCodec(Protocol):
+    """JSON 변환 프로토콜"""
+
+    @property
+    def name(self) -> str:
+        """변환 방식 이름"""
+        ...
+
+    def loads(self, data: bytes | str) -> Any:
+        """
+        JSON 데이터를 변환합니다.
+
+        Raises:
+            ValueError: 올바르지 않은 JSON 데이터인 경우
+        """
+        ...
+
+    def dumps(self, obj: Any) -> bytes:
+        """객체를 UTF-8 JSON 데이터로 변환합니다."""
+        ...
+
+
+class StdJSONCodec:
+    """표준 라이브러리 `json`을 사용하는 JSON 변환"""
+
+    __slots__ = []
+
+    name = "json"
+    """변환 방식 이름"""
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class OrjsonCodec:
+    """
+    `orjson`을 사용하는 JSON 변환
+
+    응답 본문을 문자열로 변환하지 않고 바이트에서 바로 변환합니다.
+    64비트 범위를 벗어난 정수는 실수로 변환됩니다.
+    """
+
+    __slots__ = ["_loads", "_dumps"]
+
+    name = "orjson"
+    """변환 방식 이름"""
+
+    def __init__(self):
+        import orjson  # type: ignore
+
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._loads(data)
+        except ValueError:
+            # orjson이 지원하지 않는 데이터는 표준 라이브러리로 변환합니다.
+            return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+
+class MsgspecCodec:
+    """
+    `msgspec`을 사용하는 JSON 변환
+
+    응답 본문을 문자열로 변환하지 않고 바이트에서 바로 변환합니다.
+    """
+
+    __slots__ = ["_decoder", "_encoder", "_error"]
+
+    name = "msgspec"
+    """변환 방식 이름"""
+
+    def __init__(self):
+        import msgspec  # type: ignore
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self._error = msgspec.DecodeError
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._error:
+            # msgspec이 지원하지 않는 데이터는 표준 라이브러리로 변환합니다.
+            return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+def create_json_codec(type: JSON_CODEC_TYPE = "auto") -> KisJSONCodec:
+    """
+    JSON 변환 객체를 생성합니다.
+
+    Args:
+        type: JSON 변환 방식
+
+    Raises:
+        ImportError: 선택한 변환 방식의 패키지가 설치되어 있지 않은 경우
+    """
+    match type:
+        case "auto":
+            for codec in (OrjsonCodec, MsgspecCodec):
+                try:
+                    return codec()
+                except ImportError:
+                    pass
+
+            return StdJSONCodec()
+
+        case "orjson" | "msgspec":
+            try:
+                return OrjsonCodec() if type == "orjson" else MsgspecCodec()
+            except ImportError as e:
+                raise ImportError(
+                    f"{type} 패키지가 설치되어 있지 않습니다.\n{type}을 설치하려면 `pip install {type}`을 실행해주세요."
+                ) from e
+
+        case "json":
+            return StdJSONCodec()
+
+        case _:
+            raise ValueError(f"지원하지 않는 JSON 변환 방식입니다. ({type})")
+
+
+_default: KisJSONCodec | None = None
+
+
+def get_json_codec() -> KisJSONCodec:
+    """설치된 패키지 중 가장 빠른 기본 JSON 변환 객체를 반환합니다."""
+    global _default
+
+    if _default is None:
+        _default = create_json_codec("auto")
+
+    return _default
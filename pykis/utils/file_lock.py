@@ -0,0 +1,161 @@
+import os
+import sys
+import time
+from multiprocessing import Lock
+from multiprocessing.synchronize import Lock as LockType
+from os import PathLike
+from pathlib import Path
+
+__all__ = [
+    "FileLock",
+]
+
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK은 약 10초 후 실패하므로 다시 시도합니다.
+                time.sleep(0.01)
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileLock:
+    """
+    파일 기반 프로세스 간 Lock 입니다.
+
+    같은 프로세스의 스레드 사이에서도 상호 배제를 보장합니다.
+    Lock 파일은 프로세스마다 한 번만 열고, 획득과 해제 시에는 파일 Lock만 변경합니다.
+
+    Examples:
+        >>> with FileLock("~/.pykis/cache/example.lock"):
+        ...     ...
+    """
+
+    __slots__ = [
+        "path",
+        "_fd",
+        "_pid",
+        "_locked",
+        "_lock",
+    ]
+
+    path: Path
+    """Lock 파일 경로"""
+
+    _fd: int | None
+    """Lock 파일 디스크립터"""
+    _pid: int
+    """Lock 파일을 연 프로세스 ID"""
+    _locked: bool
+    """Lock 획득 여부"""
+    _lock: LockType
+    """스레드 Lock 객체"""
+
+    def __init__(self, path: str | PathLike[str]):
+        """
+        파일 기반 프로세스 간 Lock을 생성합니다.
+
+        Args:
+            path: Lock 파일 경로. 상위 폴더가 없는 경우 생성합니다.
+        """
+        self.path = Path(path).expanduser().resolve()
+        self._fd = None
+        self._pid = 0
+        self._locked = False
+        self._lock = Lock()
+
+    def _open(self) -> int:
+        """현재 프로세스에서 연 Lock 파일 디스크립터를 반환합니다. 스레드 Lock을 획득한 상태에서 호출해야 합니다."""
+        if self._fd is not None and self._pid == os.getpid():
+            return self._fd
+
+        # 포크된 프로세스는 부모 프로세스와 파일 Lock을 공유하지 않도록 새로 엽니다.
+        self._close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._pid = os.getpid()
+
+        return self._fd
+
+    def _replaced(self, fd: int) -> bool:
+        """Lock 파일이 삭제되거나 다른 파일로 교체되었는지 여부를 반환합니다."""
+        try:
+            return os.fstat(fd).st_ino != os.stat(self.path).st_ino
+        except FileNotFoundError:
+            return True
+
+    def acquire(self) -> None:
+        """Lock을 획득합니다."""
+        self._lock.acquire()
+
+        try:
+            while True:
+                fd = self._open()
+                _lock(fd)
+
+                if not self._replaced(fd):
+                    break
+
+                # 다른 프로세스와 같은 파일을 잠그도록 다시 엽니다.
+                _unlock(fd)
+                self._close()
+
+            self._locked = True
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def release(self) -> None:
+        """Lock을 해제합니다."""
+        if not self._locked or self._fd is None:
+            raise RuntimeError("Lock을 획득하지 않았습니다.")
+
+        self._locked = False
+
+        try:
+            _unlock(self._fd)
+        finally:
+            self._lock.release()
+
+    def _close(self) -> None:
+        fd = self._fd
+        self._fd = None
+
+        if fd is not None:
+            os.close(fd)
+
+    def close(self) -> None:
+        """Lock 파일을 닫습니다. 이후 Lock을 획득하면 다시 엽니다."""
+        with self._lock:
+            self._close()
+
+    def __del__(self) -> None:
+        if getattr(self, "_fd", None) is not None:
+            self._close()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
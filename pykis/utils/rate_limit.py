@@ -1,15 +1,237 @@
+import asyncio
+import heapq
+import itertools
+import math
+import mmap
+import os
+import struct
 import time
+from abc import ABCMeta, abstractmethod
 from multiprocessing import Lock
 from multiprocessing.synchronize import Lock as LockType
-from typing import Callable
+from os import PathLike
+from pathlib import Path
+from threading import Condition
+from typing import TYPE_CHECKING, Callable, Literal, Protocol, runtime_checkable
+from weakref import WeakValueDictionary
+
+from pykis.utils.file_lock import FileLock
+from pykis.utils.workspace import get_cache_path
+
+if TYPE_CHECKING:
+    from pykis.utils.rate_quota import RateQuota
 
 __all__ = [
+    "RATE_LIMITER_TYPE",
+    "RateLimiterProtocol",
     "RateLimiter",
+    "TokenBucketRateLimiter",
+    "AdaptiveRateLimiter",
+    "SharedRateLimiter",
+    "PriorityRateLimiter",
+    "create_rate_limiter",
+    "get_rate_limiter",
 ]
 
+RATE_LIMITER_TYPE = Literal["token_bucket", "fixed_window", "adaptive", "shared"]
+"""호출 유량 제한 방식"""
+
+
+@runtime_checkable
+class RateLimiterProtocol(Protocol):
+    """호출 유량 제한 프로토콜"""
+
+    @property
+    def rate(self) -> float:
+        """기간 호출 횟수"""
+        ...
+
+    @property
+    def period(self) -> float:
+        """기간"""
+        ...
+
+    @property
+    def count(self) -> int:
+        """기간 호출 횟수를 반환합니다."""
+        ...
+
+    @property
+    def effective_rate(self) -> float:
+        """현재 적용 중인 기간 호출 횟수"""
+        ...
+
+    def on_success(self) -> None:
+        """호출이 성공했음을 알립니다."""
+        ...
+
+    def on_rate_limited(self) -> None:
+        """서버에서 호출 횟수 초과 응답을 받았음을 알립니다."""
+        ...
+
+    def reserve(self) -> float:
+        """
+        호출 유량을 예약합니다.
+
+        Returns:
+            예약된 호출까지 대기해야 하는 시간(초)
+        """
+        ...
+
+    def try_acquire(self) -> bool:
+        """대기 없이 호출 유량을 획득합니다. 획득하지 못한 경우 False를 반환합니다."""
+        ...
+
+    def time_until_available(self) -> float:
+        """다음 호출 유량을 획득할 수 있을 때까지 남은 시간(초)을 반환합니다."""
+        ...
+
+    def acquire(
+        self,
+        blocking: bool = True,
+        blocking_callback: Callable[[], None] | None = None,
+        priority: int = 0,
+        lane: str = "",
+        timeout: float | None = None,
+    ) -> bool:
+        """호출 유량을 획득합니다."""
+        ...
+
+    async def acquire_async(
+        self,
+        blocking_callback: Callable[[], None] | None = None,
+        priority: int = 0,
+        lane: str = "",
+        timeout: float | None = None,
+    ) -> bool:
+        """asyncio 이벤트 루프를 점유하지 않고 호출 유량을 획득합니다."""
+        ...
+
+
+class RateLimiterMixin(metaclass=ABCMeta):
+    """예약 기반 호출 유량 획득 구현"""
+
+    __slots__ = []
+
+    @property
+    @abstractmethod
+    def count(self) -> int:
+        """기간 호출 횟수를 반환합니다."""
+        pass
+
+    @abstractmethod
+    def reserve(self) -> float:
+        """
+        호출 유량을 예약합니다.
+
+        Returns:
+            예약된 호출까지 대기해야 하는 시간(초)
+        """
+        pass
+
+    @abstractmethod
+    def try_acquire(self) -> bool:
+        """대기 없이 호출 유량을 획득합니다. 획득하지 못한 경우 False를 반환합니다."""
+        pass
+
+    @abstractmethod
+    def time_until_available(self) -> float:
+        """다음 호출 유량을 획득할 수 있을 때까지 남은 시간(초)을 반환합니다."""
+        pass
+
+    def _exceeded(self, delay: float) -> bool:
+        """대기 시간이 호출 횟수 초과로 인한 것인지 여부를 반환합니다."""
+        return delay > 0
+
+    @property
+    def effective_rate(self) -> float:
+        """현재 적용 중인 기간 호출 횟수"""
+        return self.rate  # type: ignore
 
-class RateLimiter:
-    """호출 유량을 제한하는 클래스입니다."""
+    def on_success(self) -> None:
+        """호출이 성공했음을 알립니다."""
+
+    def on_rate_limited(self) -> None:
+        """서버에서 호출 횟수 초과 응답을 받았음을 알립니다."""
+
+    def _reserve(self, timeout: float | None) -> float | None:
+        """호출 유량을 예약합니다. timeout 안에 획득할 수 없는 경우 예약하지 않고 None을 반환합니다."""
+        if timeout is not None and self.time_until_available() > timeout:
+            return None
+
+        return self.reserve()
+
+    def acquire(
+        self,
+        blocking: bool = True,
+        blocking_callback: Callable[[], None] | None = None,
+        priority: int = 0,
+        lane: str = "",
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        호출 유량을 획득합니다.
+
+        대기는 Lock 밖에서 이루어지므로, 대기 중인 스레드는 예약한 순서대로 호출 유량을 획득합니다.
+        우선순위와 레인은 `PriorityRateLimiter`에서만 사용합니다.
+
+        Args:
+            blocking: 호출 횟수가 초과되었을 때 대기 여부
+            blocking_callback: blocking=True일 경우 호출 횟수 초과 시 호출할 함수
+            priority: 우선순위 (낮을수록 먼저 처리)
+            lane: 호출 유량 예약 레인
+            timeout: 최대 대기 시간(초). None일 경우 제한하지 않습니다.
+
+        Returns:
+            호출 유량 획득 여부, blocking=True이고 timeout이 None일 경우 항상 True
+        """
+        if not blocking:
+            return self.try_acquire()
+
+        if (delay := self._reserve(timeout)) is None:
+            return False
+
+        if delay > 0:
+            if blocking_callback is not None and self._exceeded(delay):
+                blocking_callback()
+
+            time.sleep(delay)
+
+        return True
+
+    async def acquire_async(
+        self,
+        blocking_callback: Callable[[], None] | None = None,
+        priority: int = 0,
+        lane: str = "",
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        asyncio 이벤트 루프를 점유하지 않고 호출 유량을 획득합니다.
+
+        Args:
+            blocking_callback: 호출 횟수 초과 시 호출할 함수
+            priority: 우선순위 (낮을수록 먼저 처리)
+            lane: 호출 유량 예약 레인
+            timeout: 최대 대기 시간(초). None일 경우 제한하지 않습니다.
+
+        Returns:
+            호출 유량 획득 여부, timeout이 None일 경우 항상 True
+        """
+        if (delay := self._reserve(timeout)) is None:
+            return False
+
+        if delay > 0:
+            if blocking_callback is not None and self._exceeded(delay):
+                blocking_callback()
+
+            await asyncio.sleep(delay)
+
+        return True
+
+
+class RateLimiter(RateLimiterMixin):
+    """고정 윈도우 방식으로 호출 유량을 제한하는 클래스입니다."""
 
     __slots__ = [
         "rate",
@@ -17,6 +239,7 @@ class RateLimiter:
         "_count",
         "_last",
         "_lock",
+        "__weakref__",
     ]
 
     rate: int
@@ -27,12 +250,12 @@ class RateLimiter:
     _count: int
     """호출 횟수"""
     _last: float
-    """마지막 호출 시간"""
+    """윈도우 시작 시간"""
     _lock: LockType
     """Lock 객체"""
 
     def __init__(self, rate: int, period: float):
-        """호출 유량을 제한하는 클래스를 생성합니다.
+        """고정 윈도우 방식으로 호출 유량을 제한하는 클래스를 생성합니다.
 
         Args:
             rate: 초당 호출 횟수
@@ -50,32 +273,770 @@ class RateLimiter:
         with self._lock:
             return 0 if time.time() - self._last > self.period else self._count
 
-    def acquire(self, blocking: bool = True, blocking_callback: Callable[[], None] | None = None) -> bool:
-        """
-        호출 유량을 획득합니다.
+    def _wait_time(self, now: float) -> float:
+        if now - self._last > self.period:
+            return 0
 
-        Args:
-            blocking: 호출 횟수가 초과되었을 때 대기 여부
-            blocking_callback: blocking=True일 경우 호출 횟수 초과 시 호출할 함수
+        if self._count >= self.rate:
+            return max(self._last + self.period + 0.05 - now, 0)
 
-        Returns:
-            호출 횟수 초과 여부, blocking=True일 경우 항상 True
-        """
+        # 예약된 다음 윈도우가 시작되기 전일 수 있습니다.
+        return max(self._last - now, 0)
+
+    def reserve(self) -> float:
         with self._lock:
             now = time.time()
+
             if now - self._last > self.period:
                 self._count = 0
                 self._last = now
+
             if self._count >= self.rate:
-                if not blocking:
-                    return False
+                # 다음 윈도우의 호출 유량을 예약합니다.
+                self._count = 0
+                self._last = max(self._last + self.period + 0.05, now)
 
-                if blocking_callback is not None:
-                    blocking_callback()
+            self._count += 1
+            return max(self._last - now, 0)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            now = time.time()
+
+            if self._wait_time(now) > 0:
+                return False
 
-                time.sleep(max(self.period - (time.time() - self._last) + 0.05, 0))
+            if now - self._last > self.period:
                 self._count = 0
-                self._last = time.time()
+                self._last = now
 
             self._count += 1
             return True
+
+    def time_until_available(self) -> float:
+        with self._lock:
+            return self._wait_time(time.time())
+
+
+class TokenBucketRateLimiter(RateLimiterMixin):
+    """
+    GCRA(Generic Cell Rate Algorithm) 방식으로 호출 유량을 제한하는 클래스입니다.
+
+    `period / rate` 간격으로 호출 유량이 소수 단위로 채워지며, 최대 `burst`회까지 연속 호출을 허용합니다.
+    각 호출은 Lock 안에서 호출 시각을 예약하고 Lock 밖에서 대기하므로, 대기 중인 스레드는 예약한 순서(FIFO)대로 호출 유량을 획득합니다.
+    """
+
+    __slots__ = [
+        "rate",
+        "period",
+        "burst",
+        "_interval",
+        "_tolerance",
+        "_tat",
+        "_lock",
+        "__weakref__",
+    ]
+
+    rate: float
+    """기간 호출 횟수"""
+    period: float
+    """기간"""
+    burst: int
+    """연속 호출 허용 횟수"""
+
+    _interval: float
+    """호출 간격"""
+    _tolerance: float
+    """연속 호출 허용 시간"""
+    _tat: float
+    """이론상 다음 호출 시각 (TAT)"""
+    _lock: LockType
+    """Lock 객체"""
+
+    def __init__(self, rate: float, period: float, burst: int = 1):
+        """GCRA 방식으로 호출 유량을 제한하는 클래스를 생성합니다.
+
+        Args:
+            rate: 기간 호출 횟수
+            period: 기간(초)
+            burst: 연속 호출 허용 횟수
+        """
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate와 period는 0보다 커야 합니다.")
+
+        if burst < 1:
+            raise ValueError("burst는 1 이상이어야 합니다.")
+
+        self.rate = rate
+        self.period = period
+        self.burst = burst
+        self._interval = period / rate
+        self._tolerance = self._interval * (burst - 1)
+        self._tat = 0
+        self._lock = Lock()
+
+    @property
+    def count(self) -> int:
+        """예약되어 있는 호출 횟수를 반환합니다."""
+        with self._lock:
+            return max(math.ceil((self._tat - time.monotonic()) / self._interval), 0)
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            tat = max(self._tat, now)
+            self._tat = tat + self._interval
+
+            return max(tat - self._tolerance - now, 0)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            tat = max(self._tat, now)
+
+            if tat - self._tolerance > now:
+                return False
+
+            self._tat = tat + self._interval
+            return True
+
+    def _exceeded(self, delay: float) -> bool:
+        # 호출 간격을 맞추기 위한 짧은 대기는 초과로 보지 않습니다.
+        return delay >= self.period
+
+    def time_until_available(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+
+            return max(max(self._tat, now) - self._tolerance - now, 0)
+
+
+class AdaptiveRateLimiter(TokenBucketRateLimiter):
+    """
+    서버의 호출 횟수 초과 응답에 따라 호출 유량을 조절하는 GCRA 호출 유량 제한 클래스입니다. (AIMD)
+
+    호출 횟수 초과 응답을 받으면 현재 호출 유량을 `decrease` 배로 줄이고,
+    `rate`회 연속으로 성공하면 `increase`만큼 늘립니다. 호출 유량은 `min_rate` 이상 `rate` 이하로 유지됩니다.
+    """
+
+    __slots__ = [
+        "min_rate",
+        "increase",
+        "decrease",
+        "_current",
+        "_successes",
+        "_decreased",
+    ]
+
+    min_rate: float
+    """최소 기간 호출 횟수"""
+    increase: float
+    """성공 시 증가량"""
+    decrease: float
+    """호출 횟수 초과 시 감소 배율"""
+
+    _current: float
+    """현재 기간 호출 횟수"""
+    _successes: int
+    """연속 성공 횟수"""
+    _decreased: float
+    """마지막 감소 시각"""
+
+    def __init__(
+        self,
+        rate: float,
+        period: float,
+        burst: int = 1,
+        min_rate: float | None = None,
+        increase: float = 1,
+        decrease: float = 0.5,
+    ):
+        """서버 응답에 따라 호출 유량을 조절하는 클래스를 생성합니다.
+
+        Args:
+            rate: 최대 기간 호출 횟수
+            period: 기간(초)
+            burst: 연속 호출 허용 횟수
+            min_rate: 최소 기간 호출 횟수. 기본값: `rate`의 10%
+            increase: 연속 성공 시 증가량
+            decrease: 호출 횟수 초과 시 감소 배율 (0 초과 1 미만)
+        """
+        super().__init__(rate, period, burst)
+
+        if not 0 < decrease < 1:
+            raise ValueError("decrease는 0보다 크고 1보다 작아야 합니다.")
+
+        if increase <= 0:
+            raise ValueError("increase는 0보다 커야 합니다.")
+
+        self.min_rate = min(rate * 0.1 if min_rate is None else min_rate, rate)
+
+        if self.min_rate <= 0:
+            raise ValueError("min_rate는 0보다 커야 합니다.")
+
+        self.increase = increase
+        self.decrease = decrease
+        self._current = rate
+        self._successes = 0
+        self._decreased = 0
+
+    @property
+    def effective_rate(self) -> float:
+        """현재 적용 중인 기간 호출 횟수"""
+        return self._current
+
+    def _set_rate(self, rate: float) -> None:
+        self._current = rate
+        self._interval = self.period / rate
+        self._tolerance = self._interval * (self.burst - 1)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self._current >= self.rate:
+                return
+
+            self._successes += 1
+
+            if self._successes >= self.rate:
+                self._successes = 0
+                self._set_rate(min(self._current + self.increase, self.rate))
+
+    def on_rate_limited(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._successes = 0
+
+            # 이미 예약된 호출들의 초과 응답으로 연쇄 감소하지 않도록 기간당 한 번만 감소합니다.
+            if now - self._decreased < self.period:
+                return
+
+            self._decreased = now
+            self._set_rate(max(self._current * self.decrease, self.min_rate))
+            self._tat = max(self._tat, now + self._interval)
+
+
+class SharedRateLimiter(RateLimiterMixin):
+    """
+    같은 호스트의 여러 프로세스가 공유하는 GCRA 호출 유량 제한 클래스입니다.
+
+    이론상 다음 호출 시각(TAT)을 mmap 파일에 저장하고, 파일 Lock으로 프로세스 간 예약을 직렬화합니다.
+    같은 `name`을 사용하는 모든 프로세스는 하나의 호출 유량을 나누어 사용합니다.
+    """
+
+    __slots__ = [
+        "rate",
+        "period",
+        "burst",
+        "name",
+        "path",
+        "_interval",
+        "_tolerance",
+        "_file_lock",
+        "_fd",
+        "_mmap",
+        "__weakref__",
+    ]
+
+    rate: float
+    """기간 호출 횟수"""
+    period: float
+    """기간"""
+    burst: int
+    """연속 호출 허용 횟수"""
+    name: str
+    """공유 이름"""
+    path: Path
+    """상태 파일 경로"""
+
+    _interval: float
+    """호출 간격"""
+    _tolerance: float
+    """연속 호출 허용 시간"""
+    _file_lock: FileLock
+    """프로세스 간 Lock 객체"""
+    _fd: int
+    """상태 파일 디스크립터"""
+    _mmap: mmap.mmap
+    """상태 파일 메모리 맵"""
+
+    _STATE = struct.Struct("<d")
+
+    def __init__(
+        self,
+        rate: float,
+        period: float,
+        name: str,
+        burst: int = 1,
+        path: str | PathLike[str] | None = None,
+    ):
+        """같은 호스트의 여러 프로세스가 공유하는 호출 유량 제한 클래스를 생성합니다.
+
+        Args:
+            rate: 기간 호출 횟수
+            period: 기간(초)
+            name: 공유 이름. 같은 이름을 사용하는 프로세스끼리 호출 유량을 공유합니다.
+            burst: 연속 호출 허용 횟수
+            path: 상태 파일을 저장할 폴더. 기본값: `~/.pykis/cache/ratelimit/`
+        """
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate와 period는 0보다 커야 합니다.")
+
+        if burst < 1:
+            raise ValueError("burst는 1 이상이어야 합니다.")
+
+        self.rate = rate
+        self.period = period
+        self.burst = burst
+        self.name = name
+        self.path = (Path(path) if path else get_cache_path() / "ratelimit").resolve() / f"{name}.bin"
+        self._interval = period / rate
+        self._tolerance = self._interval * (burst - 1)
+        self._file_lock = FileLock(self.path.with_suffix(".lock"))
+
+        with self._file_lock:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+
+            if os.fstat(self._fd).st_size < self._STATE.size:
+                os.ftruncate(self._fd, self._STATE.size)
+
+        self._mmap = mmap.mmap(self._fd, self._STATE.size)
+
+    def _get_tat(self) -> float:
+        return self._STATE.unpack_from(self._mmap)[0]
+
+    def _set_tat(self, value: float) -> None:
+        self._STATE.pack_into(self._mmap, 0, value)
+
+    @property
+    def count(self) -> int:
+        """모든 프로세스에서 예약되어 있는 호출 횟수를 반환합니다."""
+        with self._file_lock:
+            return max(math.ceil((self._get_tat() - time.time()) / self._interval), 0)
+
+    def reserve(self) -> float:
+        with self._file_lock:
+            now = time.time()
+            tat = max(self._get_tat(), now)
+            self._set_tat(tat + self._interval)
+
+            return max(tat - self._tolerance - now, 0)
+
+    def try_acquire(self) -> bool:
+        with self._file_lock:
+            now = time.time()
+            tat = max(self._get_tat(), now)
+
+            if tat - self._tolerance > now:
+                return False
+
+            self._set_tat(tat + self._interval)
+            return True
+
+    def _exceeded(self, delay: float) -> bool:
+        return delay >= self.period
+
+    def time_until_available(self) -> float:
+        with self._file_lock:
+            now = time.time()
+
+            return max(max(self._get_tat(), now) - self._tolerance - now, 0)
+
+    def close(self) -> None:
+        """상태 파일을 닫습니다."""
+        if not self._mmap.closed:
+            self._mmap.close()
+            os.close(self._fd)
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class PriorityRateLimiter(RateLimiterMixin):
+    """
+    대기 중인 호출 중 우선순위가 가장 높은 호출에 다음 호출 유량을 할당하는 클래스입니다.
+
+    호출 시각을 미리 예약하지 않고, 호출 유량을 획득할 수 있을 때 대기열의 맨 앞(우선순위가 가장 높고 먼저 들어온) 호출에 할당합니다.
+    따라서 우선순위가 높은 호출은 같은 호출 유량 안에서 이미 대기 중인 낮은 우선순위 호출을 앞지릅니다.
+
+    `quota`가 설정된 경우, 레인별 예약 호출 유량을 가진 호출 중 우선순위가 가장 높은 호출에 할당합니다.
+
+    스레드 호출은 Condition으로, asyncio 호출은 호출별 `asyncio.Event`로 차례가 되었음을 알립니다.
+    """
+
+    __slots__ = [
+        "limiter",
+        "quota",
+        "_cond",
+        "_waiters",
+        "_events",
+        "_sequence",
+        "__weakref__",
+    ]
+
+    limiter: RateLimiterMixin
+    """호출 유량 제한 객체"""
+    quota: "RateQuota | None"
+    """레인별 호출 유량 예약"""
+
+    _cond: Condition
+    """대기열 Condition 객체"""
+    _waiters: list[tuple[int, int, str]]
+    """대기열 (우선순위, 순번, 레인)"""
+    _events: dict[tuple[int, int, str], tuple[asyncio.AbstractEventLoop, asyncio.Event]]
+    """asyncio 호출별 알림 이벤트"""
+    _sequence: "itertools.count[int]"
+    """대기열 순번"""
+
+    def __init__(self, limiter: RateLimiterMixin, quota: "RateQuota | None" = None):
+        """우선순위 호출 유량 제한 클래스를 생성합니다.
+
+        Args:
+            limiter: 호출 유량 제한 객체
+            quota: 레인별 호출 유량 예약
+        """
+        self.limiter = limiter
+        self.quota = quota
+        self._cond = Condition()
+        self._waiters = []
+        self._events = {}
+        self._sequence = itertools.count()
+
+    @property
+    def rate(self) -> float:
+        """기간 호출 횟수"""
+        return self.limiter.rate  # type: ignore
+
+    @property
+    def period(self) -> float:
+        """기간"""
+        return self.limiter.period  # type: ignore
+
+    @property
+    def count(self) -> int:
+        """기간 호출 횟수를 반환합니다."""
+        return self.limiter.count  # type: ignore
+
+    @property
+    def waiting(self) -> int:
+        """대기 중인 호출 수"""
+        return len(self._waiters)
+
+    @property
+    def effective_rate(self) -> float:
+        """현재 적용 중인 기간 호출 횟수"""
+        return self.limiter.effective_rate
+
+    def on_success(self) -> None:
+        self.limiter.on_success()
+
+    def on_rate_limited(self) -> None:
+        self.limiter.on_rate_limited()
+
+    def reserve(self) -> float:
+        return self.limiter.reserve()
+
+    def try_acquire(self, priority: int = 0, lane: str = "") -> bool:
+        """
+        대기하지 않고 호출 유량 획득을 시도합니다.
+
+        Args:
+            priority: 우선순위 (낮을수록 먼저 처리). 같거나 높은 우선순위의 호출이 대기 중인 경우 획득하지 않습니다.
+            lane: 호출 유량 예약 레인
+        """
+        with self._cond:
+            if self._waiters and self._waiters[0][0] <= priority:
+                return False
+
+            waiting = {waiter[2] for waiter in self._waiters}
+
+            if self.quota is not None and self.quota.time_until_available(lane, waiting) > 0:
+                return False
+
+            if not self.limiter.try_acquire():
+                return False
+
+            if self.quota is not None:
+                self.quota.acquire(lane, waiting)
+
+            return True
+
+    def time_until_available(self) -> float:
+        return self.limiter.time_until_available()
+
+    def _notify(self, entry: tuple[int, int, str] | None = None) -> None:
+        """
+        대기 중인 스레드 호출과 차례인 asyncio 호출을 깨웁니다. Condition을 획득한 상태에서 호출해야 합니다.
+
+        Args:
+            entry: 깨울 asyncio 호출. None일 경우 대기열의 맨 앞 호출을 깨웁니다.
+        """
+        self._cond.notify_all()
+
+        if entry is None:
+            if not self._waiters:
+                return
+
+            entry = self._waiters[0]
+
+        if (waiter := self._events.get(entry)) is not None:
+            loop, event = waiter
+
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료되었습니다.
+                pass
+
+    def _enqueue(self, priority: int, lane: str) -> tuple[int, int, str]:
+        entry = (priority, next(self._sequence), lane)
+        heapq.heappush(self._waiters, entry)
+        self._notify()
+        return entry
+
+    def _dequeue(self, entry: tuple[int, int, str]) -> None:
+        if self._waiters[0] is entry:
+            heapq.heappop(self._waiters)
+        else:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+
+        self._events.pop(entry, None)
+        self._notify()
+
+    def _poll(self, entry: tuple[int, int, str]) -> float | None:
+        """
+        호출 유량을 할당받을 차례인 경우 호출 유량 획득을 시도합니다.
+
+        Returns:
+            획득한 경우 0, 차례이지만 획득하지 못한 경우 대기 시간(초), 차례가 아닌 경우 None
+        """
+        if self.quota is None:
+            if self._waiters[0] is not entry:
+                return None
+
+            delay = self.limiter.time_until_available()
+
+            if delay <= 0:
+                if self.limiter.try_acquire():
+                    return 0
+
+                # 다른 프로세스가 먼저 획득한 경우 다시 확인합니다.
+                delay = self.limiter.time_until_available()
+
+            return max(delay, 0.001)
+
+        delay = self.limiter.time_until_available()
+
+        if delay > 0:
+            return delay
+
+        waiting = {waiter[2] for waiter in self._waiters}
+        delays = []
+
+        for waiter in sorted(self._waiters):
+            quota_delay = self.quota.time_until_available(waiter[2], waiting)
+
+            if quota_delay > 0:
+                delays.append(quota_delay)
+                continue
+
+            if waiter is not entry:
+                # 차례인 호출을 깨웁니다.
+                self._notify(waiter)
+                return None
+
+            if self.limiter.try_acquire():
+                self.quota.acquire(entry[2], waiting)
+                return 0
+
+            return max(self.limiter.time_until_available(), 0.001)
+
+        return max(min(delays), 0.001)
+
+    def acquire(
+        self,
+        blocking: bool = True,
+        blocking_callback: Callable[[], None] | None = None,
+        priority: int = 0,
+        lane: str = "",
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        호출 유량을 획득합니다.
+
+        Args:
+            blocking: 호출 횟수가 초과되었을 때 대기 여부
+            blocking_callback: blocking=True일 경우 호출 횟수 초과 시 호출할 함수
+            priority: 우선순위 (낮을수록 먼저 처리)
+            lane: 호출 유량 예약 레인
+            timeout: 최대 대기 시간(초). None일 경우 제한하지 않습니다.
+
+        Returns:
+            호출 유량 획득 여부, blocking=True이고 timeout이 None일 경우 항상 True
+        """
+        if not blocking:
+            return self.try_acquire(priority, lane)
+
+        notified = False
+        end = None if timeout is None else time.monotonic() + timeout
+
+        with self._cond:
+            entry = self._enqueue(priority, lane)
+
+            try:
+                while (delay := self._poll(entry)) != 0:
+                    if delay is not None and not notified and self.limiter._exceeded(delay):
+                        notified = True
+
+                        if blocking_callback is not None:
+                            blocking_callback()
+
+                    if end is not None:
+                        if (remaining := end - time.monotonic()) <= 0:
+                            return False
+
+                        delay = remaining if delay is None else min(delay, remaining)
+
+                    self._cond.wait(delay)
+
+                return True
+            finally:
+                self._dequeue(entry)
+
+    async def acquire_async(
+        self,
+        blocking_callback: Callable[[], None] | None = None,
+        priority: int = 0,
+        lane: str = "",
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        asyncio 이벤트 루프를 점유하지 않고 호출 유량을 획득합니다.
+
+        Args:
+            blocking_callback: 호출 횟수 초과 시 호출할 함수
+            priority: 우선순위 (낮을수록 먼저 처리)
+            lane: 호출 유량 예약 레인
+            timeout: 최대 대기 시간(초). None일 경우 제한하지 않습니다.
+
+        Returns:
+            호출 유량 획득 여부, timeout이 None일 경우 항상 True
+        """
+        notified = False
+        end = None if timeout is None else time.monotonic() + timeout
+        event = asyncio.Event()
+
+        with self._cond:
+            entry = self._enqueue(priority, lane)
+            self._events[entry] = (asyncio.get_running_loop(), event)
+
+        try:
+            while True:
+                with self._cond:
+                    # 확인 이후의 알림을 놓치지 않도록 Condition 안에서 초기화합니다.
+                    event.clear()
+                    delay = self._poll(entry)
+
+                if delay == 0:
+                    return True
+
+                if delay is not None and not notified and self.limiter._exceeded(delay):
+                    notified = True
+
+                    if blocking_callback is not None:
+                        blocking_callback()
+
+                if end is not None:
+                    if (remaining := end - time.monotonic()) <= 0:
+                        return False
+
+                    delay = remaining if delay is None else min(delay, remaining)
+
+                # 차례가 아닌 경우 대기열의 맨 앞이 바뀔 때까지 대기합니다.
+                try:
+                    await asyncio.wait_for(event.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._cond:
+                self._dequeue(entry)
+
+
+def create_rate_limiter(
+    type: RATE_LIMITER_TYPE,
+    rate: float,
+    period: float,
+    name: str | None = None,
+) -> RateLimiterProtocol:
+    """
+    호출 유량 제한 객체를 생성합니다.
+
+    Args:
+        type: 호출 유량 제한 방식
+        rate: 기간 호출 횟수
+        period: 기간(초)
+        name: 공유 이름. `shared` 방식에서 필요합니다.
+    """
+    match type:
+        case "token_bucket":
+            return TokenBucketRateLimiter(rate, period)
+
+        case "fixed_window":
+            return RateLimiter(int(rate), period)
+
+        case "adaptive":
+            return AdaptiveRateLimiter(rate, period)
+
+        case "shared":
+            if not name:
+                raise ValueError("shared 호출 유량 제한 방식에는 name이 필요합니다.")
+
+            return SharedRateLimiter(rate, period, name)
+
+        case _:
+            raise ValueError(f"지원하지 않는 호출 유량 제한 방식입니다. ({type})")
+
+
+_rate_limiters: "WeakValueDictionary[tuple[str, str, float, float], PriorityRateLimiter]" = WeakValueDictionary()
+_rate_limiters_lock = Lock()
+
+
+def get_rate_limiter(
+    type: RATE_LIMITER_TYPE,
+    name: str,
+    rate: float,
+    period: float,
+    quota: "RateQuota | None" = None,
+) -> PriorityRateLimiter:
+    """
+    프로세스 내에서 공유되는 호출 유량 제한 객체를 반환합니다.
+
+    같은 방식과 이름(AppKey)으로 요청한 경우 같은 객체를 반환하므로, 같은 AppKey를 사용하는 `PyKis` 객체들은 호출 유량을 공유합니다.
+    반환되는 객체는 우선순위 대기열(`PriorityRateLimiter`)로 감싸져 있습니다.
+
+    Args:
+        type: 호출 유량 제한 방식
+        name: 공유 이름
+        rate: 기간 호출 횟수
+        period: 기간(초)
+        quota: 레인별 호출 유량 예약. 호출 유량을 공유하는 모든 객체가 같은 예약을 사용해야 합니다.
+
+    Raises:
+        ValueError: 이미 다른 호출 유량 예약으로 생성된 객체가 있습니다.
+    """
+    key = (type, name, rate, period)
+
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+
+        if limiter is None:
+            limiter = PriorityRateLimiter(create_rate_limiter(type, rate, period, name=name), quota)  # type: ignore
+            _rate_limiters[key] = limiter
+        elif quota is not None and limiter.quota != quota:
+            # 공유 중인 객체의 예약을 바꾸면 다른 `PyKis` 객체의 호출 유량 배분이 바뀝니다.
+            raise ValueError("같은 AppKey에 이미 다른 호출 유량 예약이 설정되어 있습니다.")
+
+        return limiter
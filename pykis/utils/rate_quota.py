@@ -0,0 +1,232 @@
+import math
+from dataclasses import dataclass
+from multiprocessing import Lock
+from multiprocessing.synchronize import Lock as LockType
+from typing import Literal
+
+from pykis.utils.rate_limit import TokenBucketRateLimiter
+
+__all__ = [
+    "RATE_QUOTA_SOURCE",
+    "RateQuotaUsage",
+    "RateQuota",
+]
+
+RATE_QUOTA_SOURCE = Literal["reserved", "shared", "borrowed"]
+"""호출 유량 출처"""
+
+
+@dataclass
+class RateQuotaUsage:
+    """레인별 호출 유량 사용 통계"""
+
+    reserved: float
+    """예약된 기간 호출 횟수"""
+    used: int = 0
+    """예약된 호출 유량으로 처리한 호출 횟수"""
+    shared: int = 0
+    """공유 호출 유량으로 처리한 호출 횟수"""
+    borrowed: int = 0
+    """다른 레인의 예약된 호출 유량을 빌려 처리한 호출 횟수"""
+    lent: int = 0
+    """다른 레인에 빌려준 호출 횟수"""
+
+    @property
+    def total(self) -> int:
+        """처리한 전체 호출 횟수"""
+        return self.used + self.shared + self.borrowed
+
+
+class RateQuota:
+    """
+    레인별 호출 유량 예약 클래스입니다.
+
+    각 레인은 예약된 호출 유량을 독점하고, 남은 호출 유량(`rate - 예약 합계`)은 모든 레인이 공유합니다.
+    대기 중인 호출이 없는 레인의 남은 예약 호출 유량은 다른 레인이 빌려 사용할 수 있습니다.
+
+    전체 호출 유량 제한은 별도의 호출 유량 제한 객체가 담당하며, 이 클래스는 어느 레인이 호출할 수 있는지만 결정합니다.
+    """
+
+    __slots__ = [
+        "rate",
+        "period",
+        "borrow",
+        "_reserved",
+        "_shared",
+        "_usage",
+        "_lock",
+    ]
+
+    rate: float
+    """기간 호출 횟수"""
+    period: float
+    """기간"""
+    borrow: bool
+    """사용하지 않는 예약 호출 유량 빌림 허용 여부"""
+
+    _reserved: dict[str, TokenBucketRateLimiter]
+    """레인별 예약 호출 유량"""
+    _shared: TokenBucketRateLimiter | None
+    """공유 호출 유량"""
+    _usage: dict[str, RateQuotaUsage]
+    """레인별 사용 통계"""
+    _lock: LockType
+    """Lock 객체"""
+
+    def __init__(
+        self,
+        rate: float,
+        period: float,
+        reserved: dict[str, float],
+        borrow: bool = True,
+    ):
+        """레인별 호출 유량 예약 클래스를 생성합니다.
+
+        Args:
+            rate: 기간 호출 횟수
+            period: 기간(초)
+            reserved: 레인별 예약 기간 호출 횟수
+            borrow: 사용하지 않는 예약 호출 유량 빌림 허용 여부
+        """
+        if any(value <= 0 for value in reserved.values()):
+            raise ValueError("예약 호출 횟수는 0보다 커야 합니다.")
+
+        total = sum(reserved.values())
+
+        if total > rate:
+            raise ValueError(f"예약 호출 횟수의 합({total})이 기간 호출 횟수({rate})보다 큽니다.")
+
+        self.rate = rate
+        self.period = period
+        self.borrow = borrow
+        self._reserved = {
+            lane: TokenBucketRateLimiter(value, period, burst=max(math.floor(value), 1))
+            for lane, value in reserved.items()
+        }
+        shared = rate - total
+        self._shared = TokenBucketRateLimiter(shared, period, burst=max(math.floor(shared), 1)) if shared > 0 else None
+        self._usage = {lane: RateQuotaUsage(reserved=value) for lane, value in reserved.items()}
+        self._lock = Lock()
+
+    @property
+    def reserved(self) -> dict[str, float]:
+        """레인별 예약 기간 호출 횟수"""
+        return {lane: bucket.rate for lane, bucket in self._reserved.items()}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RateQuota):
+            return NotImplemented
+
+        return (self.rate, self.period, self.borrow, self.reserved) == (
+            other.rate,
+            other.period,
+            other.borrow,
+            other.reserved,
+        )
+
+    __hash__ = None  # type: ignore
+
+    def _get_usage(self, lane: str) -> RateQuotaUsage:
+        usage = self._usage.get(lane)
+
+        if usage is None:
+            usage = self._usage[lane] = RateQuotaUsage(reserved=0)
+
+        return usage
+
+    def _lenders(self, lane: str, waiting: set[str]) -> list[TokenBucketRateLimiter]:
+        """호출 유량을 빌려줄 수 있는 레인의 예약 호출 유량 목록"""
+        if not self.borrow:
+            return []
+
+        # 대기 중인 호출이 있는 레인의 예약 호출 유량은 빌리지 않습니다.
+        return [bucket for other, bucket in self._reserved.items() if other != lane and other not in waiting]
+
+    def _lender(self, lane: str, waiting: set[str]) -> str | None:
+        """남은 예약 호출 유량이 가장 많은 레인을 반환합니다. 빌릴 수 있는 호출 유량이 없는 경우 None을 반환합니다."""
+        if not self.borrow:
+            return None
+
+        lender = None
+        count = 0
+
+        for other, bucket in self._reserved.items():
+            if other == lane or other in waiting or bucket.time_until_available() > 0:
+                continue
+
+            if lender is None or bucket.count < count:
+                lender = other
+                count = bucket.count
+
+        return lender
+
+    def time_until_available(self, lane: str, waiting: set[str] | None = None) -> float:
+        """
+        레인이 호출 유량을 획득할 수 있을 때까지 남은 시간(초)을 반환합니다.
+
+        Args:
+            lane: 레인
+            waiting: 호출을 기다리고 있는 레인 목록. 해당 레인에서는 호출 유량을 빌리지 않습니다.
+        """
+        with self._lock:
+            delays = []
+
+            if bucket := self._reserved.get(lane):
+                delays.append(bucket.time_until_available())
+
+            if self._shared:
+                delays.append(self._shared.time_until_available())
+
+            delays.extend(bucket.time_until_available() for bucket in self._lenders(lane, waiting or set()))
+
+            return min(delays) if delays else self.period
+
+    def acquire(self, lane: str, waiting: set[str] | None = None) -> RATE_QUOTA_SOURCE | None:
+        """
+        대기 없이 레인의 호출 유량을 획득합니다.
+
+        Args:
+            lane: 레인
+            waiting: 호출을 기다리고 있는 레인 목록. 해당 레인에서는 호출 유량을 빌리지 않습니다.
+
+        Returns:
+            획득한 호출 유량의 출처, 획득하지 못한 경우 None
+        """
+        with self._lock:
+            usage = self._get_usage(lane)
+
+            if (bucket := self._reserved.get(lane)) and bucket.try_acquire():
+                usage.used += 1
+                return "reserved"
+
+            if self._shared and self._shared.try_acquire():
+                usage.shared += 1
+                return "shared"
+
+            if (lender := self._lender(lane, waiting or set())) and self._reserved[lender].try_acquire():
+                usage.borrowed += 1
+                self._get_usage(lender).lent += 1
+                return "borrowed"
+
+            return None
+
+    @property
+    def usage(self) -> dict[str, RateQuotaUsage]:
+        """레인별 사용 통계"""
+        with self._lock:
+            return {
+                lane: RateQuotaUsage(
+                    reserved=usage.reserved,
+                    used=usage.used,
+                    shared=usage.shared,
+                    borrowed=usage.borrowed,
+                    lent=usage.lent,
+                )
+                for lane, usage in self._usage.items()
+            }
+
+    def reset_usage(self) -> None:
+        """사용 통계를 초기화합니다."""
+        with self._lock:
+            for usage in self._usage.values():
+                usage.used = usage.shared = usage.borrowed = usage.lent = 0
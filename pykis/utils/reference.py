@@ -80,7 +80,7 @@ class ReferenceTicket:
         self.release()
 
 
-def package_mathod(func: Callable, ticket: ReferenceTicket):
+def package_mathod(func: Callable, ticket: ReferenceTicket, release: Callable[[], None] | None = None):
     def _(*args, **kwargs):
         return func(*args, **kwargs)
 
@@ -89,6 +89,7 @@ def package_mathod(func: Callable, ticket: ReferenceTicket):
     _.__name__ = func.__name__
     _.__is_kis_reference_method__ = True
     _.__reference_ticket__ = ticket
+    _.__release_callback__ = release
 
     return _
 
@@ -99,4 +100,7 @@ def release_method(func: Callable):
 
     getattr(func.__reference_ticket__, "release")()
 
+    if (release := getattr(func, "__release_callback__", None)) is not None:
+        release()
+
     return True
@@ -0,0 +1,165 @@
+import asyncio
+from dataclasses import dataclass
+from multiprocessing import Lock
+from multiprocessing.synchronize import Lock as LockType
+from threading import Event
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+__all__ = [
+    "SingleFlightStats",
+    "SingleFlight",
+]
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """요청 병합 통계"""
+
+    calls: int = 0
+    """실제로 실행한 호출 횟수"""
+    hits: int = 0
+    """진행 중인 호출의 결과를 공유받은 횟수"""
+
+
+class _Call:
+    __slots__ = ["event", "result", "error"]
+
+    event: Event
+    """완료 이벤트"""
+    result: Any
+    """호출 결과"""
+    error: BaseException | None
+    """호출 예외"""
+
+    def __init__(self):
+        self.event = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나로 병합하는 클래스입니다.
+
+    첫 번째 호출만 실행하고, 실행 중에 같은 키로 들어온 호출은 그 결과(또는 예외)를 그대로 공유받습니다.
+    호출이 끝나면 키는 즉시 제거되므로 결과를 캐시하지 않습니다.
+    """
+
+    __slots__ = [
+        "_calls",
+        "_async_calls",
+        "_stats",
+        "_lock",
+    ]
+
+    _calls: dict[Hashable, _Call]
+    """진행 중인 호출"""
+    _async_calls: dict[Hashable, asyncio.Future]
+    """진행 중인 비동기 호출"""
+    _stats: dict[str, SingleFlightStats]
+    """그룹별 통계"""
+    _lock: LockType
+    """Lock 객체"""
+
+    def __init__(self):
+        self._calls = {}
+        self._async_calls = {}
+        self._stats = {}
+        self._lock = Lock()
+
+    def _get_stats(self, group: str) -> SingleFlightStats:
+        stats = self._stats.get(group)
+
+        if stats is None:
+            stats = self._stats[group] = SingleFlightStats()
+
+        return stats
+
+    def do(self, key: Hashable, fn: Callable[[], T], group: str = "") -> T:
+        """
+        호출을 병합하여 실행합니다.
+
+        Args:
+            key: 호출 키
+            fn: 실행할 함수
+            group: 통계 그룹
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = self._calls[key] = _Call()
+                self._get_stats(group).calls += 1
+            else:
+                self._get_stats(group).hits += 1
+
+        if not leader:
+            call.event.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            call.event.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[T]], group: str = "") -> T:
+        """
+        비동기 호출을 병합하여 실행합니다. 같은 이벤트 루프의 호출끼리만 병합합니다.
+
+        Args:
+            key: 호출 키
+            fn: 실행할 코루틴 함수
+            group: 통계 그룹
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+
+        with self._lock:
+            future = self._async_calls.get(key)
+            leader = future is None
+
+            if leader:
+                future = self._async_calls[key] = loop.create_future()
+                self._get_stats(group).calls += 1
+            else:
+                self._get_stats(group).hits += 1
+
+        if not leader:
+            # 대기 중인 호출이 취소되어도 진행 중인 호출은 취소하지 않습니다.
+            return await asyncio.shield(future)
+
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 공유받을 호출이 없는 경우 경고가 출력되지 않도록 예외를 확인 처리합니다.
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                del self._async_calls[key]
+
+    @property
+    def stats(self) -> dict[str, SingleFlightStats]:
+        """그룹별 통계"""
+        with self._lock:
+            return {group: SingleFlightStats(calls=stats.calls, hits=stats.hits) for group, stats in self._stats.items()}
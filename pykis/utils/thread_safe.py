@@ -29,10 +29,11 @@ def thread_safe(name: str | None = None):
 
 
 def get_lock(self, name: str):
-    key = f"__thread_safe_{name}_lock"
+    with global_lock:
+        key = f"__thread_safe_{name}_lock"
 
-    if not (lock := getattr(self, key, None)):
-        lock = Lock()
-        setattr(self, key, lock)
+        if not (lock := getattr(self, key, None)):
+            lock = Lock()
+            setattr(self, key, lock)
 
     return lock
@@ -0,0 +1,108 @@
+"""
+응답 필드 변환기 벤치마크
+
+    python tests/benchmark/bench_decoders.py
+
+`before`는 이전 변환 방식(`strptime`, 값마다 `Decimal.normalize`, `datetime.now`), `decoder`는 고정 길이 변환과 변환 결과 캐시를 사용하는 현재 변환 방식입니다.
+`cold`는 캐시를 비운 뒤 서로 다른 값을 처음 변환하는 경우입니다.
+"""
+
+import timeit
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable
+
+from pykis.responses.types import (
+    KisDate,
+    KisDatetime,
+    KisDecimal,
+    KisTime,
+    KisTimeToDatetime,
+    parse_date,
+    parse_datetime,
+    parse_decimal,
+    parse_time,
+    today_snapshot,
+)
+from pykis.utils.timezone import TIMEZONE
+
+ROWS = 120
+
+dates = [(date(2024, 1, 1) + timedelta(days=i)).strftime("%Y%m%d") for i in range(ROWS)]
+times = [f"{9 + i // 60:02d}{i % 60:02d}00" for i in range(ROWS)]
+datetimes = [d + t for d, t in zip(dates, times)]
+prices = [str(71000 + (i % 12) * 100) for i in range(ROWS)]
+
+
+def clear() -> None:
+    for fn in (parse_decimal, parse_date, parse_time, parse_datetime):
+        fn.cache_clear()
+
+
+def bench(name: str, fn: Callable[[], Any], number: int = 200, setup: Callable[[], Any] | None = None) -> float:
+    def run() -> None:
+        if setup is not None:
+            setup()
+
+        fn()
+
+    elapsed = min(timeit.repeat(run, number=number, repeat=5)) / number
+    print(f"{name:<40} {elapsed * 1e6:8.1f} us")
+    return elapsed
+
+
+def compare(name: str, old: Callable[[], Any], new: Callable[[], Any]) -> None:
+    before = bench(f"{name} before", old)
+    cold = bench(f"{name} decoder cold", new, setup=clear)
+    warm = bench(f"{name} decoder", new)
+    print(f"{'':<40} {before / cold:8.2f}x / {before / warm:.2f}x")
+
+
+def main() -> None:
+    date_type = KisDate()
+    time_type = KisTime()
+    datetime_type = KisDatetime()
+    time_to_datetime_type = KisTimeToDatetime()
+    decimal_type = KisDecimal()
+
+    compare(
+        f"KisDate ({ROWS} rows)",
+        lambda: [datetime.strptime(x, "%Y%m%d").replace(tzinfo=TIMEZONE).date() for x in dates],
+        lambda: [date_type.transform(x) for x in dates],
+    )
+    compare(
+        f"KisTime ({ROWS} rows)",
+        lambda: [datetime.strptime(x, "%H%M%S").replace(tzinfo=TIMEZONE).time() for x in times],
+        lambda: [time_type.transform(x) for x in times],
+    )
+    compare(
+        f"KisDatetime ({ROWS} rows)",
+        lambda: [datetime.strptime(x, "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE) for x in datetimes],
+        lambda: [datetime_type.transform(x) for x in datetimes],
+    )
+
+    def time_to_datetime() -> None:
+        with today_snapshot():
+            [time_to_datetime_type.transform(x) for x in times]
+
+    compare(
+        f"KisTimeToDatetime ({ROWS} rows)",
+        lambda: [
+            datetime.combine(
+                datetime.now(TIMEZONE).date(),
+                datetime.strptime(x, "%H%M%S").time(),
+                tzinfo=TIMEZONE,
+            )
+            for x in times
+        ],
+        time_to_datetime,
+    )
+    compare(
+        f"KisDecimal ({ROWS} rows)",
+        lambda: [Decimal(x).normalize() for x in prices],
+        lambda: [decimal_type.transform(x) for x in prices],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+실시간 이벤트 전달 벤치마크
+
+    python tests/benchmark/bench_dispatch.py
+
+종목 40개에 `KisWebsocketClient.on`과 같은 형태(TR ID 필터와 종목 필터)로 콜백 200개를 등록하고 이벤트 하나를 전달하는 시간입니다.
+`scan`은 모든 이벤트 핸들러의 필터를 검사하는 `KisEventHandler`, `indexed`는 색인된 이벤트 핸들러만 검사하는 `KisSubscriptionEventHandler`입니다.
+"""
+
+import timeit
+from typing import Any
+
+from pykis.client.messaging import KisWebsocketTR
+from pykis.event.dispatch import KisSubscriptionEventHandler
+from pykis.event.filters import KisProductEventFilter, KisSubscriptionEventFilter
+from pykis.event.handler import KisEventHandler, KisMultiEventFilter
+from pykis.event.subscription import KisSubscriptionEventArgs
+
+SYMBOLS = [f"{i:06d}" for i in range(40)]
+IDS = ["H0STCNT0", "H0STASP0"]
+CALLBACKS = 200
+
+
+class Response:
+    __slots__ = ["symbol", "market"]
+
+    def __init__(self, symbol: str, market: str):
+        self.symbol = symbol
+        self.market = market
+
+
+def register(handler: KisEventHandler) -> list[Any]:
+    tickets = []
+
+    for i in range(CALLBACKS):
+        where = KisMultiEventFilter(
+            KisSubscriptionEventFilter(IDS[i % len(IDS)]),
+            KisProductEventFilter(SYMBOLS[i % len(SYMBOLS)], "KRX"),
+        )
+        ticket = handler.on(lambda sender, e: None, where=where)
+        ticket.suppress()
+        tickets.append(ticket)
+
+    return tickets
+
+
+def main() -> None:
+    events = [
+        KisSubscriptionEventArgs(KisWebsocketTR(IDS[i % len(IDS)], ""), Response(SYMBOLS[i % len(SYMBOLS)], "KRX"))
+        for i in range(100)
+    ]
+    results = {}
+
+    for name, handler in [("scan", KisEventHandler()), ("indexed", KisSubscriptionEventHandler())]:
+        register(handler)
+
+        def invoke() -> None:
+            for e in events:
+                handler.invoke(None, e)
+
+        elapsed = min(timeit.repeat(invoke, number=20, repeat=5)) / (20 * len(events))
+        results[name] = elapsed
+        print(f"{name:<40} {elapsed * 1e6:8.1f} us/event")
+
+    print(f"{'':<40} {results['scan'] / results['indexed']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+응답 본문 JSON 변환 벤치마크
+
+    python tests/benchmark/bench_json.py
+
+`text`는 이전 변환 방식(응답 본문을 문자열로 변환한 뒤 표준 라이브러리 `json`으로 변환),
+나머지는 응답 본문 바이트에서 바로 변환하는 `KisJSONCodec` 구현입니다.
+"""
+
+import json
+import timeit
+from typing import Any, Callable
+
+from bench_transform import balance_data, daily_chart_data
+
+from pykis.utils.codec import create_json_codec
+
+
+def bench(name: str, fn: Callable[[], Any], number: int = 500) -> float:
+    elapsed = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"{name:<40} {elapsed * 1e6:8.1f} us")
+    return elapsed
+
+
+def main() -> None:
+    codecs = []
+
+    for type in ("json", "orjson", "msgspec"):
+        try:
+            codecs.append(create_json_codec(type))  # type: ignore
+        except ImportError:
+            print(f"{type} 패키지가 설치되어 있지 않아 제외합니다.")
+
+    for name, make_data in [
+        ("KisDomesticBalance (100 rows)", balance_data),
+        ("KisDomesticDailyChart (120 bars)", daily_chart_data),
+    ]:
+        data = make_data()
+        data.pop("__response__")
+        content = json.dumps(data).encode()
+
+        text = bench(f"{name} text", lambda: json.loads(content.decode("utf-8")))
+
+        for codec in codecs:
+            elapsed = bench(f"{name} {codec.name}", lambda: codec.loads(content))
+            print(f"{'':<40} {text / elapsed:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+응답 객체 변환(`KisObject.transform_`) 벤치마크
+
+    python tests/benchmark/bench_transform.py
+
+`cold`는 객체마다 변환 계획을 다시 계산하는 경우(이전 동작), `cached`는 캐시된 변환 계획을 사용하는 경우입니다.
+`eager`는 모든 필드를 즉시 변환하는 경우, `lazy`는 지연 변환 후 일부 필드만 접근하는 경우,
+`projected`는 접근할 필드만 선택하여 변환하는 경우입니다.
+"""
+
+import timeit
+from datetime import date, timedelta
+from typing import Any, Callable
+
+from pykis.api.account.balance import KisDomesticBalance
+from pykis.api.stock.daily_chart import KisDomesticDailyChart
+from pykis.api.stock.quote import KisDomesticQuote
+from pykis.client.account import KisAccountNumber
+from pykis.client.transport import KisHTTPRequest, KisHTTPResponse
+from pykis.responses.dynamic import KisObject, KisTransformPlan
+
+
+def _response(data: dict[str, Any]) -> dict[str, Any]:
+    data.update(rt_cd="0", msg_cd="MCA00000", msg1="정상처리 되었습니다.")
+    data["__response__"] = KisHTTPResponse(200, "OK", {"tr_cont": "D"}, b"", KisHTTPRequest("GET", "http://localhost"))
+    return data
+
+
+def balance_data(rows: int = 100) -> dict[str, Any]:
+    return _response(
+        {
+            "ctx_area_fk100": "",
+            "ctx_area_nk100": "",
+            "output1": [
+                {
+                    "pdno": f"{i:06d}",
+                    "prdt_name": f"종목{i}",
+                    "prpr": "71200",
+                    "hldg_qty": "12",
+                    "ord_psbl_qty": "12",
+                    "pchs_amt": "843600",
+                }
+                for i in range(rows)
+            ],
+            "output2": [{"dnca_tot_amt": "1532000"}],
+        }
+    )
+
+
+def daily_chart_data(rows: int = 120) -> dict[str, Any]:
+    start = date(2024, 1, 1)
+
+    return _response(
+        {
+            "output1": {"stck_prpr": "71200"},
+            "output2": [
+                {
+                    "stck_bsop_date": (start + timedelta(days=i)).strftime("%Y%m%d"),
+                    "stck_oprc": "71000",
+                    "stck_clpr": "71200",
+                    "stck_hgpr": "71800",
+                    "stck_lwpr": "70500",
+                    "acml_vol": "12345678",
+                    "acml_tr_pbmn": "879012345678",
+                    "prdy_vrss": "200",
+                    "prdy_vrss_sign": "2",
+                    "flng_cls_code": "00",
+                    "prtt_rate": "0.00",
+                }
+                for i in range(rows)
+            ],
+        }
+    )
+
+
+def quote_data() -> dict[str, Any]:
+    return _response(
+        {
+            "output": {
+                "stck_shrn_iscd": "005930",
+                "bstp_kor_isnm": "전기.전자",
+                "stck_prpr": "71200",
+                "acml_vol": "12345678",
+                "acml_tr_pbmn": "879012345678",
+                "hts_avls": "4250432",
+                "prdy_vrss_sign": "2",
+                "mrkt_warn_cls_code": "00",
+                "temp_stop_yn": "N",
+                "short_over_yn": "N",
+                "stck_sdpr": "71000",
+                "prdy_vrss_vol_rate": "87.51",
+                "prdy_vrss": "200",
+                "stck_oprc": "71000",
+                "stck_hgpr": "71800",
+                "stck_lwpr": "70500",
+                "stck_mxpr": "92300",
+                "stck_llam": "49700",
+                "aspr_unit": "100",
+                "eps": "2131.00",
+                "bps": "52002.00",
+                "per": "33.41",
+                "pbr": "1.37",
+                "w52_hgpr": "88800",
+                "w52_lwpr": "64300",
+                "w52_hgpr_date": "20240711",
+                "w52_lwpr_date": "20231115",
+            }
+        }
+    )
+
+
+def bench(name: str, fn: Callable[[], Any], number: int) -> float:
+    elapsed = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"{name:<40} {elapsed * 1e3:8.3f} ms")
+    return elapsed
+
+
+def main() -> None:
+    account = KisAccountNumber("00000000-01")
+    cases = [
+        ("KisDomesticBalance (100 rows)", balance_data, lambda: KisDomesticBalance(account)),
+        ("KisDomesticDailyChart (120 bars)", daily_chart_data, lambda: KisDomesticDailyChart("005930")),
+    ]
+
+    for name, make_data, make_object in cases:
+
+        def transform() -> None:
+            KisObject.transform_(make_data(), make_object(), ignore_missing_fields={"__response__"})
+
+        plan = KisObject.plan
+        # 캐시 없이 객체마다 변환 계획을 계산합니다.
+        KisObject.plan = staticmethod(KisTransformPlan)  # type: ignore
+        cold = bench(f"{name} cold", transform, 50)
+        KisObject.plan = plan  # type: ignore
+
+        cached = bench(f"{name} cached", transform, 50)
+        print(f"{'':<40} {cold / cached:8.2f}x")
+
+    fields = ("price", "volume", "high_limit", "low_limit")
+
+    def quote(lazy: bool, projected: bool = False) -> None:
+        # 시세 조회 후 일반적으로 사용하는 필드만 접근합니다.
+        quote = KisObject.transform_(
+            quote_data(),
+            KisDomesticQuote("005930", "KRX"),
+            ignore_missing_fields={"__response__"},
+            lazy=lazy,
+            fields=fields if projected else None,
+        )
+        quote.price, quote.volume, quote.high_limit, quote.low_limit
+
+    eager = bench("KisDomesticQuote (4 fields) eager", lambda: quote(False), 500)
+    lazy = bench("KisDomesticQuote (4 fields) lazy", lambda: quote(True), 500)
+    print(f"{'':<40} {eager / lazy:8.2f}x")
+    projected = bench("KisDomesticQuote (4 fields) projected", lambda: quote(False, True), 500)
+    print(f"{'':<40} {eager / projected:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
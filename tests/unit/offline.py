@@ -0,0 +1,176 @@
+"""
+인증 정보 없이 실행하는 단위 테스트용 도구
+
+`FakeTransport`는 `KisTransport` 프로토콜을 구현하며, 네트워크 요청 없이 경로별 응답을 반환합니다.
+"""
+
+import json
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Callable
+
+from pykis import PyKis
+from pykis.api.auth.token import KisAccessToken
+from pykis.client.session import KisSessionStats
+from pykis.client.transport import KisHTTPRequest, KisHTTPResponse
+from pykis.responses.dynamic import KisObject
+
+__all__ = [
+    "FakeTransport",
+    "access_token",
+    "create_kis",
+    "foreign_pending_order_output",
+    "ok",
+    "quote_output",
+    "token_data",
+]
+
+Handler = Callable[[KisHTTPRequest], tuple[int, dict[str, str], Any]]
+
+
+def ok(data: dict[str, Any] | None = None, **headers: str) -> tuple[int, dict[str, str], Any]:
+    """성공 응답을 만듭니다."""
+    return (
+        200,
+        {"tr_cont": "D", "gt_uid": "test", **headers},
+        {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다.", **(data or {})},
+    )
+
+
+class FakeTransport:
+    """경로별 응답을 반환하는 HTTP 전송"""
+
+    routes: dict[str, Handler]
+    """경로별 응답 함수"""
+    requests: list[KisHTTPRequest]
+    """받은 요청"""
+    timeouts: list[float | tuple[float, float] | None]
+    """요청별 제한 시간"""
+
+    def __init__(self, routes: dict[str, Handler | tuple[int, dict[str, str], Any]] | None = None):
+        self.routes = {
+            path: route if callable(route) else (lambda request, route=route: route)
+            for path, route in (routes or {}).items()
+        }
+        self.requests = []
+        self.timeouts = []
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> KisSessionStats:
+        return KisSessionStats()
+
+    def calls(self, path: str | None = None) -> int:
+        """받은 요청 수"""
+        with self._lock:
+            return sum(1 for request in self.requests if path is None or path in request.url)
+
+    def send(self, request: KisHTTPRequest, timeout: float | tuple[float, float] | None = None) -> KisHTTPResponse:
+        with self._lock:
+            self.requests.append(request)
+            self.timeouts.append(timeout)
+
+        for path, handler in self.routes.items():
+            if path in request.url:
+                status, headers, body = handler(request)
+                break
+        else:
+            raise AssertionError(f"예상하지 않은 요청입니다: {request.method} {request.url}")
+
+        content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        return KisHTTPResponse(status, "OK" if status < 400 else "Error", headers, content, request)
+
+    def close(self) -> None:
+        pass
+
+
+def token_data(token: str = "token", expired_at: datetime | None = None) -> dict[str, Any]:
+    """API 접속 토큰 발급 응답. 만료 시각을 지정하지 않은 경우 만료되지 않는 토큰입니다."""
+    return {
+        "access_token": token,
+        "token_type": "Bearer",
+        "access_token_token_expired": (
+            "2099-01-01 00:00:00" if expired_at is None else expired_at.strftime("%Y-%m-%d %H:%M:%S")
+        ),
+        "expires_in": 86400,
+    }
+
+
+def access_token(token: str = "token", expired_at: datetime | None = None) -> KisAccessToken:
+    """API 접속 토큰. 만료 시각을 지정하지 않은 경우 만료되지 않는 토큰입니다."""
+    return KisObject.transform_(token_data(token, expired_at), KisAccessToken)
+
+
+def create_kis(transport: FakeTransport, **kwargs: Any) -> PyKis:
+    """
+    네트워크 없이 동작하는 PyKis를 생성합니다.
+
+    앱 키를 지정하지 않은 경우 새로 만들어, 앱 키별로 공유되는 호출 유량 제한 객체를 다른 테스트와 공유하지 않습니다.
+    """
+    appkey = kwargs.pop("appkey", None) or uuid.uuid4().hex + uuid.uuid4().hex[:4]
+    kwargs.setdefault("use_websocket", False)
+    kwargs.setdefault("token", access_token())
+
+    return PyKis(
+        id="soju06",
+        account="00000000-01",
+        appkey=appkey,
+        secretkey="S" * 180,
+        transport=transport,
+        **kwargs,
+    )
+
+
+def quote_output(symbol: str = "005930") -> dict[str, Any]:
+    """국내주식 현재가 응답"""
+    return {
+        "output": {
+            "stck_shrn_iscd": symbol,
+            "bstp_kor_isnm": "전기.전자",
+            "stck_prpr": "71200",
+            "acml_vol": "12345678",
+            "acml_tr_pbmn": "879012345678",
+            "hts_avls": "4250432",
+            "prdy_vrss_sign": "2",
+            "mrkt_warn_cls_code": "00",
+            "temp_stop_yn": "N",
+            "short_over_yn": "N",
+            "stck_sdpr": "71000",
+            "prdy_vrss_vol_rate": "87.51",
+            "prdy_vrss": "200",
+            "stck_oprc": "71000",
+            "stck_hgpr": "71800",
+            "stck_lwpr": "70500",
+            "stck_mxpr": "92300",
+            "stck_llam": "49700",
+            "aspr_unit": "100",
+            "eps": "2131.00",
+            "bps": "52002.00",
+            "per": "33.41",
+            "pbr": "1.37",
+            "w52_hgpr": "88800",
+            "w52_lwpr": "64300",
+            "w52_hgpr_date": "20240711",
+            "w52_lwpr_date": "20231115",
+        }
+    }
+
+
+def foreign_pending_order_output(symbol: str = "AAPL", number: str = "0000012345") -> dict[str, str]:
+    """해외주식 미체결 주문 응답"""
+    return {
+        "pdno": symbol,
+        "ovrs_excg_cd": "NASD",
+        "sll_buy_dvsn_cd": "02",
+        "ft_ccld_unpr3": "0",
+        "ft_ord_unpr3": "190.5",
+        "ft_ord_qty": "3",
+        "ft_ccld_qty": "0",
+        "nccs_qty": "3",
+        "rjct_rson": "",
+        "rjct_rson_name": "",
+        "ord_tmd": "093000",
+        "ord_gno_brno": "01790",
+        "odno": number,
+    }
@@ -0,0 +1,250 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+from unittest import TestCase
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+from pykis.api.account.balance import balance, domestic_balance
+from pykis.api.account.order import KisSimpleOrderNumber, domestic_order
+from pykis.api.account.order_modify import cancel_order
+from pykis.api.account.pending_order import domestic_pending_orders, pending_orders
+from pykis.client.account import KisAccountNumber
+from pykis.client.exceptions import KisAPIError
+from pykis.client.transport import KisHTTPRequest
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis, foreign_pending_order_output, ok
+else:
+    from offline import FakeTransport, create_kis, foreign_pending_order_output, ok
+
+ACCOUNT = KisAccountNumber("00000000-01")
+
+
+def error(code: str, message: str = "오류가 발생했습니다.") -> tuple[int, dict[str, str], Any]:
+    """API 오류 응답"""
+    return 200, {"tr_cont": "D", "gt_uid": "test"}, {"rt_cd": "1", "msg_cd": code, "msg1": message}
+
+
+def paged(pages: list[dict[str, Any]], size: int = 100):
+    """요청마다 다음 페이지를 반환하는 응답 함수. 마지막 페이지가 아니면 `tr_cont`는 `M`입니다."""
+    responses = iter(pages)
+
+    def handler(request: KisHTTPRequest):
+        page = next(responses)
+        last = page is pages[-1]
+        return ok(
+            {
+                **page,
+                f"ctx_area_fk{size}": "" if last else "FK",
+                f"ctx_area_nk{size}": "" if last else "NK",
+            },
+            tr_cont="D" if last else "M",
+        )
+
+    return handler
+
+
+def query(request: KisHTTPRequest) -> dict[str, str]:
+    """요청 URL의 쿼리 문자열"""
+    return {key: values[0] for key, values in parse_qs(urlparse(request.url).query, keep_blank_values=True).items()}
+
+
+def domestic_stock(symbol: str, quantity: str = "10") -> dict[str, str]:
+    """국내주식 잔고 응답"""
+    return {
+        "pdno": symbol,
+        "prdt_name": "삼성전자",
+        "prpr": "71200",
+        "hldg_qty": quantity,
+        "ord_psbl_qty": quantity,
+        "pchs_amt": "700000",
+    }
+
+
+def domestic_pending_order(symbol: str, number: str) -> dict[str, str]:
+    """국내주식 미체결 주문 응답"""
+    return {
+        "pdno": symbol,
+        "ord_dvsn_cd": "00",
+        "sll_buy_dvsn_cd": "02",
+        "ord_unpr": "70000",
+        "ord_qty": "10",
+        "tot_ccld_qty": "0",
+        "psbl_qty": "10",
+        "ord_tmd": "091500",
+        "ord_gno_brno": "06010",
+        "odno": number,
+    }
+
+
+class SkipProductInfoMixin(TestCase):
+    def setUp(self) -> None:
+        # 주문번호 프로토콜 검사에서 발생하는 상품정보 조회를 생략합니다.
+        for target in ("pykis.api.stock.info.info", "pykis.scope.stock._info"):
+            patcher = patch(target)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class BalanceTests(TestCase):
+    def test_domestic_pages(self):
+        transport = FakeTransport(
+            {
+                "trading/inquire-balance": paged(
+                    [
+                        {"output1": [domestic_stock("005930")], "output2": [{"dnca_tot_amt": "1000000"}]},
+                        {"output1": [domestic_stock("000660", "3")], "output2": [{"dnca_tot_amt": "1000000"}]},
+                    ]
+                )
+            }
+        )
+        result = domestic_balance(create_kis(transport), ACCOUNT)
+
+        self.assertEqual([stock.symbol for stock in result.stocks], ["005930", "000660"])
+        self.assertEqual(result.stocks[1].quantity, Decimal(3))
+        self.assertEqual(result.deposits["KRW"].amount, Decimal(1000000))
+
+        # 두 번째 요청은 연속조회 키를 보냅니다.
+        first, second = transport.requests
+        self.assertEqual(first.headers.get("tr_id"), "TTTC8434R")
+        self.assertEqual(second.headers.get("tr_cont"), "N")
+        self.assertEqual(query(second)["ctx_area_fk100"], "FK")
+        self.assertEqual(query(first)["CANO"], "00000000")
+
+    def test_country(self):
+        transport = FakeTransport(
+            {"trading/inquire-balance": paged([{"output1": [], "output2": [{"dnca_tot_amt": "0"}]}])}
+        )
+        result = balance(create_kis(transport), ACCOUNT, country="KR")
+
+        self.assertEqual(result.stocks, [])
+        self.assertEqual(transport.calls(), 1)
+
+    def test_invalid_account(self):
+        transport = FakeTransport()
+
+        with self.assertRaises(ValueError):
+            domestic_balance(create_kis(transport), "0000")
+
+        self.assertEqual(transport.calls(), 0)
+
+
+class OrderTests(TestCase):
+    def setUp(self) -> None:
+        self.transport = FakeTransport(
+            {
+                "trading/order-cash": lambda request: ok(
+                    {"output": {"KRX_FWDG_ORD_ORGNO": "06010", "ODNO": "0000011111", "ORD_TMD": "091500"}}
+                )
+            }
+        )
+        self.kis = create_kis(self.transport)
+
+    def test_limit_order(self):
+        result = domestic_order(self.kis, ACCOUNT, "005930", "buy", price=71000, qty=10)
+
+        self.assertEqual(result.number, "0000011111")
+        self.assertEqual(result.branch, "06010")
+
+        (request,) = self.transport.requests
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.headers.get("tr_id"), "TTTC0802U")
+        self.assertIn(b'"ORD_QTY":"10"', request.body.replace(b" ", b""))
+        self.assertIn(b'"ORD_UNPR":"71000"', request.body.replace(b" ", b""))
+
+    def test_validation(self):
+        # 잘못된 인자는 요청을 보내기 전 호출 즉시 예외가 발생합니다.
+        for kwargs in ({"symbol": ""}, {"symbol": "005930", "qty": 0}):
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                domestic_order(self.kis, ACCOUNT, price=71000, **kwargs)
+
+        self.assertEqual(self.transport.calls(), 0)
+
+
+class CancelOrderTests(SkipProductInfoMixin):
+    def order(self, kis, market: str = "NASDAQ") -> KisSimpleOrderNumber:
+        return KisSimpleOrderNumber.from_number(
+            kis,
+            symbol="AAPL" if market != "KRX" else "005930",
+            market=market,  # type: ignore
+            account_number=ACCOUNT,
+            branch="01790",
+            number="0000012345",
+        )
+
+    def routes(self, cancel) -> dict[str, Any]:
+        return {
+            "trading/daytime-order-rvsecncl": ok(
+                {"output": {"KRX_FWDG_ORD_ORGNO": "01790", "ODNO": "0000054321", "ORD_TMD": "093000"}}
+            ),
+            "trading/order-rvsecncl": cancel,
+            "trading/inquire-nccs": ok(
+                {"output": [foreign_pending_order_output()], "ctx_area_fk200": "", "ctx_area_nk200": ""}
+            ),
+        }
+
+    def test_domestic(self):
+        transport = FakeTransport(
+            self.routes(
+                ok({"output": {"KRX_FWDG_ORD_ORGNO": "01790", "ODNO": "0000054321", "ORD_TMD": "093000"}})
+            )
+        )
+        kis = create_kis(transport)
+        result = cancel_order(kis, self.order(kis, "KRX"))
+
+        self.assertEqual(result.number, "0000054321")
+        self.assertEqual(transport.requests[0].headers.get("tr_id"), "TTTC0803U")
+        self.assertEqual(transport.calls(), 1)
+
+    def test_daytime_fallback(self):
+        # 정규장 취소 API에서 APBK0918 오류가 발생하면 주간거래 취소 API로 다시 요청합니다.
+        transport = FakeTransport(self.routes(error("APBK0918", "주간거래 주문입니다.")))
+        kis = create_kis(transport)
+        result = cancel_order(kis, self.order(kis))
+
+        self.assertEqual(result.number, "0000054321")
+        self.assertEqual(transport.calls("overseas-stock/v1/trading/order-rvsecncl"), 1)
+        self.assertEqual(transport.calls("trading/inquire-nccs"), 1)
+        self.assertEqual(transport.calls("trading/daytime-order-rvsecncl"), 1)
+
+    def test_other_error(self):
+        transport = FakeTransport(self.routes(error("APBK0919")))
+        kis = create_kis(transport)
+
+        with self.assertRaises(KisAPIError) as context:
+            cancel_order(kis, self.order(kis))
+
+        self.assertEqual(context.exception.error_code, "APBK0919")
+        self.assertEqual(transport.calls("trading/daytime-order-rvsecncl"), 0)
+
+
+class PendingOrderTests(SkipProductInfoMixin):
+    def test_domestic_pages(self):
+        transport = FakeTransport(
+            {
+                "trading/inquire-psbl-rvsecncl": paged(
+                    [
+                        {"output": [domestic_pending_order("005930", "0000000001")]},
+                        {"output": [domestic_pending_order("000660", "0000000002")]},
+                    ]
+                )
+            }
+        )
+        result = domestic_pending_orders(create_kis(transport), ACCOUNT)
+
+        self.assertEqual([order.symbol for order in result.orders], ["005930", "000660"])
+        self.assertEqual(result.orders[0].order_number.number, "0000000001")
+        self.assertEqual(transport.requests[1].headers.get("tr_cont"), "N")
+
+    def test_integrated(self):
+        transport = FakeTransport(
+            {
+                "trading/inquire-psbl-rvsecncl": paged([{"output": [domestic_pending_order("005930", "0000000001")]}]),
+                "trading/inquire-nccs": paged([{"output": [foreign_pending_order_output()]}], size=200),
+            }
+        )
+        result = pending_orders(create_kis(transport), ACCOUNT)
+
+        self.assertEqual({order.symbol for order in result.orders}, {"005930", "AAPL"})
+        self.assertEqual(transport.calls("inquire-psbl-rvsecncl"), 1)
+        self.assertEqual(transport.calls("inquire-nccs"), 1)
@@ -0,0 +1,144 @@
+import asyncio
+from typing import TYPE_CHECKING
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+import httpx
+
+from pykis.api.account.order import KisSimpleOrderNumber
+from pykis.api.stock.quote import quote
+from pykis.client.account import KisAccountNumber
+from pykis.client.spec import KisRequestSpec, execute_plan, execute_plan_async
+from pykis.client.transport import KisHTTPRequest
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis, foreign_pending_order_output, ok, quote_output
+else:
+    from offline import FakeTransport, create_kis, foreign_pending_order_output, ok, quote_output
+
+
+def mock_transport(transport: FakeTransport) -> httpx.MockTransport:
+    """`FakeTransport`의 경로별 응답을 비동기 클라이언트에서 사용합니다."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = transport.send(
+            KisHTTPRequest(
+                request.method,
+                str(request.url),
+                dict(request.headers),
+                request.content or None,
+            )
+        )
+        return httpx.Response(response.status_code, headers=response.headers, content=response.content)
+
+    return httpx.MockTransport(handler)
+
+
+class RequestPlanTests(IsolatedAsyncioTestCase):
+    def plan(self):
+        a, b = yield (KisRequestSpec("/a"), KisRequestSpec("/b"))
+
+        try:
+            yield KisRequestSpec("/error")
+        except RuntimeError:
+            c = yield KisRequestSpec("/c")
+
+        return a + b + c
+
+    def test_sync(self):
+        calls = []
+
+        def fetch(path, **kwargs):
+            calls.append(path)
+
+            if path == "/error":
+                raise RuntimeError(path)
+
+            return path
+
+        self.assertEqual(execute_plan(self.plan(), fetch), "/a/b/c")
+        self.assertEqual(calls, ["/a", "/b", "/error", "/c"])
+
+    async def test_async(self):
+        started = []
+        barrier = asyncio.Event()
+
+        async def fetch(path, **kwargs):
+            started.append(path)
+
+            if path in ("/a", "/b"):
+                # 튜플로 묶은 두 요청이 모두 시작되어야 진행합니다.
+                if len(started) == 2:
+                    barrier.set()
+
+                await asyncio.wait_for(barrier.wait(), 1)
+
+            if path == "/error":
+                raise RuntimeError(path)
+
+            return path
+
+        self.assertEqual(await execute_plan_async(self.plan(), fetch), "/a/b/c")
+
+
+class AsyncPyKisTests(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.transport = FakeTransport({"quotations/inquire-price": ok(quote_output())})
+        self.kis = create_kis(self.transport)
+
+        for domain in ("real", "virtual"):
+            self.kis.aio._clients[domain] = httpx.AsyncClient(transport=mock_transport(self.transport))
+
+    async def asyncTearDown(self) -> None:
+        await self.kis.aio.close()
+
+    async def test_quote_parity(self):
+        expected = quote(self.kis, "005930", "KRX")
+        actual = await self.kis.aio.quote("005930", "KRX")
+
+        self.assertEqual(actual.price, expected.price)
+        self.assertEqual(actual.volume, expected.volume)
+        self.assertEqual(self.transport.calls("inquire-price"), 2)
+
+    async def test_request_spec(self):
+        requests = self.transport.requests
+        quote(self.kis, "005930", "KRX")
+        await self.kis.aio.quote("005930", "KRX")
+
+        # 두 클라이언트가 같은 요청을 보냅니다.
+        self.assertEqual(requests[0].url, requests[1].url)
+        self.assertEqual(requests[0].headers.get("tr_id"), requests[1].headers.get("tr_id"))
+
+    async def test_cancel_daytime_fallback(self):
+        # 정규장 취소 API에서 APBK0918 오류가 발생하면 주간거래 취소 API로 다시 요청합니다.
+        self.transport.routes = FakeTransport(
+            {
+                "trading/daytime-order-rvsecncl": ok(
+                    {"output": {"KRX_FWDG_ORD_ORGNO": "01790", "ODNO": "0000012345", "ORD_TMD": "093000"}}
+                ),
+                "trading/order-rvsecncl": (
+                    200,
+                    {"tr_cont": "D", "gt_uid": "test"},
+                    {"rt_cd": "1", "msg_cd": "APBK0918", "msg1": "주간거래 주문입니다."},
+                ),
+                "trading/inquire-nccs": ok(
+                    {"output": [foreign_pending_order_output()], "ctx_area_fk200": "", "ctx_area_nk200": ""}
+                ),
+            }
+        ).routes
+        order = KisSimpleOrderNumber.from_number(
+            self.kis,
+            symbol="AAPL",
+            market="NASDAQ",
+            account_number=KisAccountNumber("00000000-01"),
+            branch="01790",
+            number="0000012345",
+        )
+
+        # 미체결 주문 검색 시 주문번호 프로토콜 검사에서 발생하는 상품정보 조회를 생략합니다.
+        with patch("pykis.api.stock.info.info"), patch("pykis.scope.stock._info"):
+            result = await self.kis.aio.cancel_order(order)
+
+        self.assertEqual(result.number, "0000012345")
+        self.assertEqual(self.transport.calls("trading/daytime-order-rvsecncl"), 1)
+        self.assertEqual(self.transport.calls("trading/inquire-nccs"), 1)
@@ -0,0 +1,159 @@
+import itertools
+import json
+import threading
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis.client.messaging import KisWebsocketTR
+from pykis.client.websocket import KisWebsocketClient
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis
+else:
+    from offline import FakeTransport, create_kis
+
+
+class FakeWebSocket:
+    """보낸 메시지를 기록하는 웹소켓"""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, data: str):
+        self.sent.append(json.loads(data))
+
+    def approval_keys(self) -> list[str]:
+        """보낸 메시지의 웹소켓 접속 키"""
+        return [message["header"]["approval_key"] for message in self.sent]
+
+
+def approval_transport() -> FakeTransport:
+    """요청마다 새 웹소켓 접속 키를 발급하는 HTTP 전송"""
+    counter = itertools.count(1)
+    return FakeTransport({"oauth2/Approval": lambda request: (200, {}, {"approval_key": f"key{next(counter)}"})})
+
+
+def invalid_approval(tr: KisWebsocketTR) -> str:
+    """웹소켓 접속 키 거부 제어 메시지"""
+    return json.dumps(
+        {
+            "header": {"tr_id": tr.id, "tr_key": tr.key, "encrypt": "N"},
+            "body": {"rt_cd": "1", "msg_cd": "OPSP0011", "msg1": "invalid approval : NOT FOUND"},
+        }
+    )
+
+
+class ApprovalKeyCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.transport = approval_transport()
+        self.kis = create_kis(self.transport)
+
+    def test_cached(self):
+        self.assertEqual(self.kis._get_approval_key("real"), "key1")
+        self.assertEqual(self.kis._get_approval_key("real"), "key1")
+        self.assertEqual(self.transport.calls("oauth2/Approval"), 1)
+
+    def test_invalid(self):
+        self.kis._get_approval_key("real")
+
+        # 이미 교체된 접속 키의 거부는 무시합니다.
+        self.assertEqual(self.kis._get_approval_key("real", invalid="old"), "key1")
+        self.assertEqual(self.kis._get_approval_key("real", invalid="key1"), "key2")
+        self.assertEqual(self.transport.calls("oauth2/Approval"), 2)
+
+    def test_concurrent_invalid(self):
+        self.kis._get_approval_key("real")
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.kis._get_approval_key("real", invalid="key1")))
+            for _ in range(8)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(results, ["key2"] * 8)
+        self.assertEqual(self.transport.calls("oauth2/Approval"), 2)
+
+    def test_appkey(self):
+        self.kis._get_approval_key("real")
+        appkey = self.kis.appkey
+
+        # 앱 키를 지정한 경우 도메인 기본 접속 키와 따로 캐시합니다.
+        self.assertEqual(self.kis._get_approval_key("real", appkey=appkey), "key2")
+        self.assertEqual(self.kis._get_approval_key("real", appkey=appkey), "key2")
+        self.assertEqual(self.transport.calls("oauth2/Approval"), 2)
+
+
+class WebsocketApprovalKeyTests(TestCase):
+    def setUp(self) -> None:
+        self.transport = approval_transport()
+        self.client = KisWebsocketClient(create_kis(self.transport))
+        self.trs = [KisWebsocketTR("H0STCNT0", symbol) for symbol in ("005930", "000660", "035420")]
+        self.client._subscriptions.update(self.trs)
+
+    def open(self, client: KisWebsocketClient | None = None) -> FakeWebSocket:
+        """웹소켓 서버에 접속한 것처럼 접속 이벤트를 발생시킵니다."""
+        client = client or self.client
+        client.websocket = websocket = FakeWebSocket()  # type: ignore
+        client._on_open(websocket)  # type: ignore
+        return websocket
+
+    def test_restore(self):
+        websocket = self.open()
+
+        self.assertEqual(websocket.approval_keys(), ["key1"] * 3)
+        self.assertEqual(self.transport.calls("oauth2/Approval"), 1)
+
+        # 재접속할 때는 캐시된 접속 키를 재사용합니다.
+        websocket = self.open()
+
+        self.assertEqual(websocket.approval_keys(), ["key1"] * 3)
+        self.assertEqual(self.transport.calls("oauth2/Approval"), 1)
+
+    def test_invalid_approval(self):
+        websocket = self.open()
+        websocket.sent.clear()
+
+        with self.assertLogs("pykis", level="WARNING"):
+            for tr in self.trs:
+                self.client._on_message(websocket, invalid_approval(tr))  # type: ignore
+
+        # 같은 접속 키의 거부는 한 번만 재발급하고 거부된 구독을 다시 보냅니다.
+        self.assertEqual(self.transport.calls("oauth2/Approval"), 2)
+        self.assertEqual(websocket.approval_keys(), ["key2"] * 3)
+        self.assertEqual(
+            [message["body"]["input"]["tr_key"] for message in websocket.sent],
+            [tr.key for tr in self.trs],
+        )
+
+    def test_rejected_after_refresh(self):
+        websocket = self.open()
+        tr = self.trs[0]
+
+        with self.assertLogs("pykis", level="WARNING"):
+            self.client._on_message(websocket, invalid_approval(tr))  # type: ignore
+
+        websocket.sent.clear()
+
+        with self.assertLogs("pykis", level="ERROR") as logs:
+            self.client._on_message(websocket, invalid_approval(tr))  # type: ignore
+
+        self.assertEqual(websocket.sent, [])
+        self.assertEqual(self.transport.calls("oauth2/Approval"), 2)
+        self.assertIn("Approval key rejected after refresh", logs.output[0])
+
+    def test_fixed_key(self):
+        client = KisWebsocketClient(self.client.kis, appkey="fixed")
+        client._subscriptions.update(self.trs)
+        websocket = self.open(client)
+
+        self.assertEqual(websocket.approval_keys(), ["fixed"] * 3)
+
+        with self.assertLogs("pykis", level="ERROR"):
+            client._on_message(websocket, invalid_approval(self.trs[0]))  # type: ignore
+
+        self.assertEqual(self.transport.calls(), 0)
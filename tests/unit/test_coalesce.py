@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis.api.stock.quote import domestic_quote
+from pykis.utils.single_flight import SingleFlight
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis, ok, quote_output
+else:
+    from offline import FakeTransport, create_kis, ok, quote_output
+
+
+def wait_until(predicate, timeout: float = 5) -> bool:
+    """조건이 참이 될 때까지 대기합니다."""
+    end = time.monotonic() + timeout
+
+    while time.monotonic() < end:
+        if predicate():
+            return True
+
+        time.sleep(0.005)
+
+    return False
+
+
+class SingleFlightTests(TestCase):
+    def test_do(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            release.wait(5)
+            return len(calls)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("key", fn, group="g"))) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        self.assertTrue(wait_until(lambda: flight.stats.get("g") and flight.stats["g"].hits == 3))
+        release.set()
+
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(results, [1, 1, 1, 1])
+        self.assertEqual(flight.stats["g"].calls, 1)
+
+        # 호출이 끝나면 결과를 캐시하지 않습니다.
+        self.assertEqual(flight.do("key", fn, group="g"), 2)
+
+    def test_error(self):
+        flight = SingleFlight()
+
+        def fn():
+            raise RuntimeError("error")
+
+        with self.assertRaises(RuntimeError):
+            flight.do("key", fn)
+
+        self.assertEqual(flight._calls, {})
+
+    def test_do_async(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def main():
+            return await asyncio.gather(*(flight.do_async("key", fn, group="g") for _ in range(5)))
+
+        self.assertEqual(asyncio.run(main()), ["result"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats["g"].hits, 4)
+
+
+class CoalesceTests(TestCase):
+    def setUp(self) -> None:
+        self.release = threading.Event()
+
+        def handler(request):
+            self.release.wait(5)
+            return ok(quote_output())
+
+        self.transport = FakeTransport({"quotations/inquire-price": handler})
+
+    def run_threads(self, target, count: int) -> tuple[list, list[threading.Thread]]:
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(target())) for _ in range(count)]
+
+        for thread in threads:
+            thread.start()
+
+        return results, threads
+
+    def test_coalesce(self):
+        kis = create_kis(self.transport, coalesce=("quote",))
+        results, threads = self.run_threads(lambda: domestic_quote(kis, "005930"), 5)
+
+        self.assertTrue(wait_until(lambda: "quote" in kis.coalesce_stats and kis.coalesce_stats["quote"].hits == 4))
+        self.release.set()
+
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(self.transport.calls(), 1)
+        self.assertEqual([quote.price for quote in results], [71200] * 5)
+
+    def test_disabled(self):
+        kis = create_kis(self.transport)
+        self.release.set()
+
+        domestic_quote(kis, "005930")
+        domestic_quote(kis, "005930")
+
+        self.assertEqual(self.transport.calls(), 2)
+        self.assertEqual(kis.coalesce_stats, {})
+
+    def test_different_params(self):
+        kis = create_kis(self.transport, coalesce=("quote",))
+        results, threads = self.run_threads(lambda: domestic_quote(kis, "005930"), 1)
+        other, other_threads = self.run_threads(lambda: domestic_quote(kis, "000660"), 1)
+
+        self.assertTrue(wait_until(lambda: self.transport.calls() == 2))
+        self.release.set()
+
+        for thread in threads + other_threads:
+            thread.join(5)
+
+        self.assertEqual(kis.coalesce_stats["quote"].hits, 0)
@@ -0,0 +1,167 @@
+import json
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest import TestCase, skipUnless
+
+from pykis.api.auth.token import KisAccessToken
+from pykis.api.stock.quote import domestic_quote
+from pykis.client.auth import KisAuth
+from pykis.utils.codec import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdJSONCodec,
+    create_json_codec,
+    get_json_codec,
+)
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, access_token, create_kis, ok, quote_output
+else:
+    from offline import FakeTransport, access_token, create_kis, ok, quote_output
+
+
+def installed(name: str) -> bool:
+    """패키지 설치 여부"""
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+
+    return True
+
+
+class RecordingCodec(StdJSONCodec):
+    """변환 횟수를 기록하는 JSON 변환"""
+
+    __slots__ = ["loaded", "dumped"]
+
+    name = "recording"
+
+    def __init__(self):
+        self.loaded = 0
+        self.dumped = 0
+
+    def loads(self, data: bytes | str) -> Any:
+        self.loaded += 1
+        return super().loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        self.dumped += 1
+        return super().dumps(obj)
+
+
+DATA = {
+    "rt_cd": "0",
+    "msg1": "정상처리 되었습니다.",
+    "output": [{"stck_prpr": "71200"}],
+    "count": 3,
+    "ok": True,
+}
+
+
+class CodecTests(TestCase):
+    def codecs(self):
+        codecs = [StdJSONCodec()]
+
+        if installed("orjson"):
+            codecs.append(OrjsonCodec())
+
+        if installed("msgspec"):
+            codecs.append(MsgspecCodec())
+
+        for codec in codecs:
+            with self.subTest(codec=codec.name):
+                yield codec
+
+    def test_round_trip(self):
+        for codec in self.codecs():
+            data = codec.dumps(DATA)
+
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(json.loads(data), DATA)
+            self.assertEqual(codec.loads(data), DATA)
+            self.assertEqual(codec.loads(data.decode()), DATA)
+
+    def test_invalid(self):
+        for codec in self.codecs():
+            with self.assertRaises(ValueError):
+                codec.loads(b'{"rt_cd": ')
+
+    def test_create(self):
+        self.assertIsInstance(create_json_codec("json"), StdJSONCodec)
+        self.assertEqual(create_json_codec("auto").name, get_json_codec().name)
+
+        with self.assertRaises(ValueError):
+            create_json_codec("ujson")  # type: ignore
+
+    @skipUnless(installed("orjson"), "orjson이 설치되어 있지 않습니다.")
+    def test_auto_prefers_orjson(self):
+        self.assertIsInstance(create_json_codec("auto"), OrjsonCodec)
+
+    @skipUnless(not installed("msgspec"), "msgspec이 설치되어 있습니다.")
+    def test_missing_package(self):
+        with self.assertRaises(ImportError):
+            create_json_codec("msgspec")
+
+
+class KisCodecTests(TestCase):
+    def test_response(self):
+        codec = RecordingCodec()
+        kis = create_kis(
+            FakeTransport({"quotations/inquire-price": lambda request: ok(quote_output())}),
+            json_codec=codec,
+        )
+
+        self.assertEqual(kis.json_codec.name, "recording")
+        self.assertEqual(domestic_quote(kis, "005930").symbol, "005930")
+        self.assertEqual(codec.loaded, 1)
+
+    def test_request_body(self):
+        codec = RecordingCodec()
+        transport = FakeTransport({"hashkey": lambda request: ok()})
+        kis = create_kis(transport, json_codec=codec)
+
+        kis.fetch("/uapi/hashkey", method="POST", body={"PDNO": "005930"}, domain="real")
+
+        self.assertEqual(codec.dumped, 1)
+        self.assertEqual(json.loads(transport.requests[0].body), {"PDNO": "005930"})
+
+    def test_name(self):
+        self.assertEqual(create_kis(FakeTransport(), json_codec="json").json_codec.name, "json")
+
+
+class FileCodecTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_token(self):
+        codec = RecordingCodec()
+        access_token("saved").save(self.path / "token.json", codec)
+
+        self.assertEqual(KisAccessToken.load(self.path / "token.json", codec).token, "saved")
+        self.assertEqual((codec.dumped, codec.loaded), (1, 1))
+
+    def test_legacy_token(self):
+        # 이전 버전은 표준 라이브러리로 들여쓰기하여 저장했습니다.
+        with open(self.path / "token.json", "w") as f:
+            json.dump(access_token("legacy").raw(), f, indent=4)
+
+        self.assertEqual(KisAccessToken.load(self.path / "token.json").token, "legacy")
+
+    def test_auth(self):
+        auth = KisAuth(
+            id="soju06",
+            appkey="A" * 36,
+            secretkey="S" * 180,
+            account="00000000-01",
+            virtual=False,
+        )
+        auth.save(self.path / "auth.json")
+
+        self.assertEqual(KisAuth.load(self.path / "auth.json"), auth)
+        self.assertEqual(KisAuth.load(self.path / "auth.json", StdJSONCodec()), auth)
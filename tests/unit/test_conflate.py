@@ -0,0 +1,114 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+from unittest import TestCase
+
+from pykis.client.websocket import KisWebsocketClient
+from pykis.event.conflate import KisConflatingCallback
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis
+else:
+    from offline import FakeTransport, create_kis
+
+
+class Response:
+    def __init__(self, symbol: str, value: int):
+        self.symbol = symbol
+        self.market = "KRX"
+        self.value = value
+
+
+class Tr:
+    id = "H0STCNT0"
+
+
+class EventArgs:
+    tr = Tr()
+
+    def __init__(self, symbol: str, value: int):
+        self.response = Response(symbol, value)
+
+
+def worker(callback: KisConflatingCallback) -> threading.Thread | None:
+    return callback._dispatcher._shards[0].thread
+
+
+class ConflatingCallbackTests(TestCase):
+    def test_latest_value(self):
+        received: list[tuple[str, int]] = []
+        started = threading.Event()
+
+        def slow(sender: Any, e: EventArgs):
+            started.set()
+            time.sleep(0.05)
+            received.append((e.response.symbol, e.response.value))
+
+        callback = KisConflatingCallback(slow)
+        callback(None, EventArgs("A", 0))
+        started.wait(1)
+
+        for i in range(1, 50):
+            callback(None, EventArgs("A", i))
+            callback(None, EventArgs("B", i))
+
+        callback.close()
+
+        # 실행 중인 동안 도착한 이벤트는 종목별 최신 값으로 교체됩니다.
+        self.assertEqual(received[0], ("A", 0))
+        self.assertEqual(sorted(received[1:]), [("A", 49), ("B", 49)])
+        self.assertEqual(callback.conflated, 96)
+
+    def test_close(self):
+        callback = KisConflatingCallback(lambda sender, e: None)
+        callback(None, EventArgs("A", 0))
+        thread = worker(callback)
+        callback.close()
+
+        self.assertIsNotNone(thread)
+        self.assertFalse(thread.is_alive())  # type: ignore
+
+
+class WebsocketConflateTests(TestCase):
+    def setUp(self) -> None:
+        self.client = KisWebsocketClient(create_kis(FakeTransport()))
+        # 서버에 접속하지 않습니다.
+        self.client.subscribe = lambda *args, **kwargs: None  # type: ignore
+        self.client.unsubscribe = lambda *args, **kwargs: None  # type: ignore
+
+    def callback(self) -> KisConflatingCallback:
+        return next(iter(self.client._conflating_callbacks))
+
+    def test_ticket_release(self):
+        ticket = self.client.on("H0STCNT0", "005930", lambda sender, e: None, conflate=True)
+        callback = self.callback()
+        callback(self.client, EventArgs("005930", 0))
+        thread = worker(callback)
+
+        ticket.unsubscribe()
+        thread.join(1)  # type: ignore
+
+        # 구독을 해지하면 가비지 컬렉션을 기다리지 않고 작업 스레드를 중지합니다.
+        self.assertIsNone(worker(callback))
+        self.assertFalse(thread.is_alive())  # type: ignore
+
+    def test_disconnect(self):
+        ticket = self.client.on("H0STCNT0", "005930", lambda sender, e: None, conflate=True)
+        callback = self.callback()
+        callback(self.client, EventArgs("005930", 0))
+
+        self.client.disconnect()
+
+        self.assertIsNone(worker(callback))
+        ticket.unsubscribe()
+
+    def test_user_callback_not_closed(self):
+        callback = KisConflatingCallback(lambda sender, e: None)
+        ticket = self.client.on("H0STCNT0", "005930", callback)
+        callback(self.client, EventArgs("005930", 0))
+
+        ticket.unsubscribe()
+
+        # 직접 생성한 콜백은 다른 구독에서 사용할 수 있으므로 중지하지 않습니다.
+        self.assertIsNotNone(worker(callback))
+        callback.close()
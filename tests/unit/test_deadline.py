@@ -0,0 +1,99 @@
+import time
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis import KisTimeoutError
+from pykis.api.stock.quote import domestic_quote
+from pykis.client.exceptions import KisNetworkError
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis, ok, quote_output
+else:
+    from offline import FakeTransport, create_kis, ok, quote_output
+
+
+def failing(count: int, timed_out: bool = False):
+    """`count`번 네트워크 오류를 발생시킨 뒤 현재가를 응답합니다."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+
+        if count < 0 or len(calls) <= count:
+            raise KisNetworkError("connection error", timed_out=timed_out)
+
+        return ok(quote_output())
+
+    return handler
+
+
+class NetworkRetryTests(TestCase):
+    def test_get_retried(self):
+        transport = FakeTransport({"quotations/inquire-price": failing(2)})
+        kis = create_kis(transport)
+
+        with self.assertLogs("pykis", level="WARNING") as logs:
+            quote = domestic_quote(kis, "005930")
+
+        self.assertEqual(quote.price, 71200)
+        self.assertEqual(transport.calls(), 3)
+        self.assertEqual(len(logs.output), 2)
+
+    def test_post_not_retried(self):
+        transport = FakeTransport({"trading/order-cash": failing(1)})
+        kis = create_kis(transport)
+
+        with self.assertRaises(KisNetworkError):
+            kis.request("/uapi/domestic-stock/v1/trading/order-cash", method="POST", body={"PDNO": "005930"})
+
+        self.assertEqual(transport.calls(), 1)
+
+    def test_post_timed_out(self):
+        transport = FakeTransport({"trading/order-cash": failing(1, timed_out=True)})
+        kis = create_kis(transport)
+
+        with self.assertRaises(KisTimeoutError) as context:
+            kis.request("/uapi/domestic-stock/v1/trading/order-cash", method="POST", body={"PDNO": "005930"})
+
+        self.assertEqual(context.exception.path, "/uapi/domestic-stock/v1/trading/order-cash")
+        self.assertEqual(transport.calls(), 1)
+
+    def test_retry_limit(self):
+        transport = FakeTransport({"quotations/inquire-price": failing(-1)})
+        kis = create_kis(transport, retry_limit=1)
+
+        with self.assertLogs("pykis", level="WARNING"), self.assertRaises(KisNetworkError):
+            domestic_quote(kis, "005930")
+
+        self.assertEqual(transport.calls(), 2)
+
+
+class DeadlineTests(TestCase):
+    def test_deadline(self):
+        transport = FakeTransport({"quotations/inquire-price": failing(-1, timed_out=True)})
+        kis = create_kis(transport, retry_limit=None, deadline=0.3)
+        start = time.monotonic()
+
+        with self.assertLogs("pykis", level="WARNING"), self.assertRaises(KisTimeoutError) as context:
+            domestic_quote(kis, "005930")
+
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertAlmostEqual(context.exception.timeout, 0.3)
+
+    def test_attempt_timeout(self):
+        transport = FakeTransport({"quotations/inquire-price": ok(quote_output())})
+        kis = create_kis(transport, deadline=1)
+        domestic_quote(kis, "005930")
+
+        # 요청 1회의 제한 시간은 전체 제한 시각까지 남은 시간 이내입니다.
+        connect, read = transport.timeouts[0]
+        self.assertLessEqual(connect, 1)
+        self.assertLessEqual(read, 1)
+
+    def test_default_timeout(self):
+        transport = FakeTransport({"quotations/inquire-price": ok(quote_output())})
+        kis = create_kis(transport, timeout=5)
+        domestic_quote(kis, "005930")
+        kis.request("/uapi/domestic-stock/v1/quotations/inquire-price", timeout=(1, 2))
+
+        self.assertEqual(transport.timeouts, [5, (1, 2)])
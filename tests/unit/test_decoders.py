@@ -0,0 +1,120 @@
+from datetime import date, datetime, time
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+
+from pykis.responses.types import (
+    KisDate,
+    KisDecimal,
+    parse_date,
+    parse_datetime,
+    parse_decimal,
+    parse_time,
+    today,
+    today_snapshot,
+)
+from pykis.utils.timezone import TIMEZONE
+
+
+class CountingDatetime(datetime):
+    """`now` 호출 횟수를 세는 datetime"""
+
+    calls = 0
+
+    @classmethod
+    def now(cls, tz=None):
+        cls.calls += 1
+        return super().now(tz)
+
+
+class DecoderTests(TestCase):
+    def assertSameError(self, func, data: str, format: str):
+        """빠른 변환 경로의 예외가 `strptime`과 같은지 확인합니다."""
+        with self.assertRaises(ValueError) as expected:
+            datetime.strptime(data, format)
+
+        with self.assertRaises(ValueError) as context:
+            func(data, format)
+
+        self.assertEqual(str(context.exception), str(expected.exception))
+
+    def test_parse_date(self):
+        for data in ("20240229", "19991231", "00010101"):
+            with self.subTest(data=data):
+                self.assertEqual(parse_date(data), datetime.strptime(data, "%Y%m%d").date())
+
+        # 길이가 다른 값은 `strptime`으로 변환합니다.
+        self.assertEqual(parse_date("2024022"), datetime.strptime("2024022", "%Y%m%d").date())
+        # 빠른 변환 경로를 사용하지 않는 포맷도 지원합니다.
+        self.assertEqual(parse_date("2024-02-29", "%Y-%m-%d"), date(2024, 2, 29))
+
+    def test_parse_time(self):
+        for data in ("000000", "093000", "235959"):
+            with self.subTest(data=data):
+                self.assertEqual(parse_time(data), datetime.strptime(data, "%H%M%S").time())
+
+        self.assertEqual(parse_time("0930", "%H%M"), time(9, 30))
+
+    def test_parse_datetime(self):
+        self.assertEqual(parse_datetime("20240229153000"), datetime(2024, 2, 29, 15, 30))
+        self.assertEqual(
+            parse_datetime("20240229153000", timezone=TIMEZONE),
+            datetime(2024, 2, 29, 15, 30, tzinfo=TIMEZONE),
+        )
+        self.assertEqual(parse_datetime("20240229", "%Y%m%d", TIMEZONE), datetime(2024, 2, 29, tzinfo=TIMEZONE))
+
+    def test_invalid(self):
+        self.assertSameError(parse_date, "20230229", "%Y%m%d")
+        self.assertSameError(parse_date, "2024022x", "%Y%m%d")
+        self.assertSameError(parse_date, "２０２４０２２９", "%Y%m%d")
+        self.assertSameError(parse_time, "246000", "%H%M%S")
+        self.assertSameError(parse_datetime, "20241301000000", "%Y%m%d%H%M%S")
+
+    def test_parse_decimal(self):
+        self.assertEqual(parse_decimal("000123.4500"), Decimal("123.45"))
+        self.assertEqual(str(parse_decimal("70000.00")), "7E+4")
+        self.assertEqual(parse_decimal("-0.10"), Decimal("-0.1"))
+
+    def test_memoized(self):
+        parse_date.cache_clear()
+        parse_date("20240102")
+        parse_date("20240102")
+
+        self.assertEqual(parse_date.cache_info().hits, 1)
+        self.assertEqual(parse_date.cache_info().misses, 1)
+
+    def test_types(self):
+        self.assertEqual(KisDecimal().transform("1500.00"), Decimal("1.5E+3"))
+        self.assertEqual(KisDecimal().transform(3), Decimal(3))
+        self.assertEqual(KisDate().transform("20240102"), date(2024, 1, 2))
+        self.assertEqual(KisDate("%Y/%m/%d").transform("2024/01/02"), date(2024, 1, 2))
+
+
+class TodaySnapshotTests(TestCase):
+    def setUp(self) -> None:
+        CountingDatetime.calls = 0
+        patcher = patch("pykis.responses.types.datetime", CountingDatetime)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_without_snapshot(self):
+        today()
+        today()
+
+        self.assertEqual(CountingDatetime.calls, 2)
+
+    def test_snapshot(self):
+        with today_snapshot():
+            first = today()
+            # 중첩된 블록은 바깥 스냅샷을 그대로 사용합니다.
+            with today_snapshot():
+                second = today()
+
+            today(None)
+
+        self.assertEqual(first, second)
+        # 타임존별로 한 번씩만 계산합니다.
+        self.assertEqual(CountingDatetime.calls, 2)
+
+        today()
+        self.assertEqual(CountingDatetime.calls, 3)
@@ -0,0 +1,119 @@
+import threading
+from unittest import TestCase
+
+from pykis.client.dispatcher import KisDispatchConfig, KisEventDispatcher
+
+
+class EventDispatcherTests(TestCase):
+    def block(self, dispatcher: KisEventDispatcher, key=None) -> threading.Event:
+        """작업 스레드를 멈추는 이벤트를 추가합니다. 반환된 이벤트를 설정하면 다시 실행합니다."""
+        started = threading.Event()
+        resume = threading.Event()
+
+        def callback():
+            started.set()
+            resume.wait(5)
+
+        dispatcher.put(callback, key=key)
+        self.assertTrue(started.wait(5))
+        self.addCleanup(resume.set)
+        return resume
+
+    def test_order(self):
+        dispatcher = KisEventDispatcher(KisDispatchConfig(workers=4))
+        results = {}
+
+        for i in range(200):
+            key = i % 8
+            dispatcher.put(lambda key=key, i=i: results.setdefault(key, []).append(i), key=key)
+
+        dispatcher.stop(5)
+
+        for key, values in results.items():
+            self.assertEqual(values, sorted(values))
+
+        self.assertEqual(sum(len(values) for values in results.values()), 200)
+        self.assertEqual(dispatcher.stats.dispatched, 200)
+        self.assertEqual(dispatcher.stats.depth, 0)
+
+    def test_drop_oldest(self):
+        dispatcher = KisEventDispatcher(KisDispatchConfig(maxsize=2, overflow="drop_oldest"))
+        results = []
+        resume = self.block(dispatcher, key="block")
+
+        for i in range(5):
+            dispatcher.put(lambda i=i: results.append(i), key=i)
+
+        resume.set()
+        dispatcher.stop(5)
+
+        self.assertEqual(results, [3, 4])
+        self.assertEqual(dispatcher.stats.dropped, 3)
+        self.assertEqual(dispatcher.stats.max_depth, 2)
+
+    def test_conflate(self):
+        dispatcher = KisEventDispatcher(KisDispatchConfig(overflow="conflate"))
+        results = []
+        resume = self.block(dispatcher)
+
+        for i in range(5):
+            dispatcher.put(lambda i=i: results.append(("A", i)), key="A")
+            dispatcher.put(lambda i=i: results.append(("B", i)), key="B")
+
+        resume.set()
+        dispatcher.stop(5)
+
+        # 대기 순서는 유지하고 값만 최신 이벤트로 교체합니다.
+        self.assertEqual(results, [("A", 4), ("B", 4)])
+        self.assertEqual(dispatcher.stats.conflated, 8)
+
+    def test_keyless_events_are_kept(self):
+        dispatcher = KisEventDispatcher(KisDispatchConfig(maxsize=1, overflow="drop_oldest"))
+        results = []
+        resume = self.block(dispatcher)
+        dispatcher.put(lambda: results.append(1))
+        thread = threading.Thread(target=dispatcher.put, args=(lambda: results.append(2),))
+        thread.start()
+
+        # 버릴 수 있는 이벤트가 없으므로 자리가 날 때까지 대기합니다.
+        thread.join(0.1)
+        self.assertTrue(thread.is_alive())
+
+        resume.set()
+        thread.join(5)
+        dispatcher.stop(5)
+
+        self.assertEqual(results, [1, 2])
+        self.assertEqual(dispatcher.stats.dropped, 0)
+
+    def test_callback_error(self):
+        dispatcher = KisEventDispatcher()
+        results = []
+
+        def fail():
+            raise RuntimeError("callback error")
+
+        with self.assertLogs("pykis", level="ERROR") as logs:
+            dispatcher.put(fail)
+            dispatcher.put(lambda: results.append(1))
+            dispatcher.stop(5)
+
+        self.assertEqual(results, [1])
+        self.assertIn("RTC Failed to dispatch event", logs.output[0])
+
+    def test_restart(self):
+        dispatcher = KisEventDispatcher()
+        results = []
+        dispatcher.put(lambda: results.append(1))
+        dispatcher.stop(5)
+        dispatcher.put(lambda: results.append(2))
+        dispatcher.stop(5)
+
+        self.assertEqual(results, [1, 2])
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            KisEventDispatcher(KisDispatchConfig(workers=0))
+
+        with self.assertRaises(ValueError):
+            KisEventDispatcher(KisDispatchConfig(maxsize=0))
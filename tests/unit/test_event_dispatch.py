@@ -0,0 +1,127 @@
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis.client.messaging import KisWebsocketTR
+from pykis.client.websocket import KisWebsocketClient
+from pykis.event.dispatch import KisSubscriptionEventHandler
+from pykis.event.filters import KisProductEventFilter, KisSubscriptionEventFilter
+from pykis.event.handler import (
+    KisEventHandler,
+    KisLambdaEventFilter,
+    KisMultiEventFilter,
+)
+from pykis.event.subscription import KisSubscriptionEventArgs
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis
+else:
+    from offline import FakeTransport, create_kis
+
+
+class Response:
+    """실시간 체결가 응답"""
+
+    __slots__ = ["symbol", "market"]
+
+    def __init__(self, symbol: str, market: str):
+        self.symbol = symbol
+        self.market = market
+
+
+FILTERS = {
+    "none": None,
+    "tr": KisSubscriptionEventFilter("H0STCNT0"),
+    "tr_key": KisSubscriptionEventFilter("H0STCNT0", "005930"),
+    "product": KisProductEventFilter("005930", "KRX"),
+    "tr_product": KisMultiEventFilter(
+        KisSubscriptionEventFilter("H0STCNT0"),
+        KisProductEventFilter("005930", "KRX"),
+    ),
+    "nested": KisMultiEventFilter(
+        KisMultiEventFilter(KisSubscriptionEventFilter("H0STASP0"), KisLambdaEventFilter(lambda s, e: False)),
+        KisProductEventFilter("000660", "KRX"),
+    ),
+    "and": KisMultiEventFilter(
+        KisSubscriptionEventFilter("H0STCNT0"),
+        KisProductEventFilter("000660", "KRX"),
+        gate="and",
+    ),
+    "lambda": KisLambdaEventFilter(lambda sender, e: e.response.symbol != "000660"),
+}
+
+EVENTS = [
+    KisSubscriptionEventArgs(KisWebsocketTR(id, key), Response(symbol, market))
+    for id in ("H0STCNT0", "H0STASP0")
+    for key, symbol, market in (
+        ("005930", "005930", "KRX"),
+        ("000660", "000660", "KRX"),
+        ("DNASAAPL", "AAPL", "NASDAQ"),
+    )
+]
+
+
+def deliveries(handler: KisEventHandler) -> list[tuple[str, str, str]]:
+    """모든 필터로 이벤트 핸들러를 등록하고 전달된 (필터, TR ID, 종목코드) 목록을 반환합니다."""
+    results = []
+
+    for name, where in FILTERS.items():
+        callback = lambda sender, e, name=name: results.append((name, e.tr.id, e.response.symbol))
+        handler.on(callback, where=where).suppress()
+
+    for e in EVENTS:
+        handler.invoke(None, e)
+
+    return sorted(results)
+
+
+class SubscriptionEventHandlerTests(TestCase):
+    def test_same_delivery(self):
+        # 색인은 전달 대상을 줄이기만 하므로 모든 이벤트 핸들러를 검사할 때와 결과가 같아야 합니다.
+        expected = deliveries(KisEventHandler())
+
+        self.assertEqual(deliveries(KisSubscriptionEventHandler()), expected)
+        self.assertIn(("tr_product", "H0STCNT0", "005930"), expected)
+        self.assertIn(("nested", "H0STASP0", "000660"), expected)
+        self.assertIn(("and", "H0STASP0", "000660"), expected)
+
+    def test_index(self):
+        handler = KisSubscriptionEventHandler()
+        tickets = {name: handler.on(lambda sender, e: None, where=where) for name, where in FILTERS.items()}
+        index, generic = handler._index
+
+        self.assertEqual(
+            set(index),
+            {
+                ("H0STCNT0", None, None),
+                (None, "005930", "KRX"),
+                ("H0STCNT0", "005930", "KRX"),
+                ("H0STASP0", "000660", "KRX"),
+            },
+        )
+        # `and` 필터와 람다 필터는 색인하지 않습니다.
+        self.assertEqual(len(generic), 3)
+
+        selected = set(handler._select(EVENTS[2]))
+
+        self.assertIn(tickets["lambda"].callback, selected)
+        self.assertNotIn(tickets["tr_product"].callback, selected)
+        self.assertNotIn(tickets["nested"].callback, selected)
+
+        for ticket in tickets.values():
+            ticket.unsubscribe()
+
+        self.assertEqual(handler._index, ({}, ()))
+
+    def test_once(self):
+        handler = KisSubscriptionEventHandler()
+        results = []
+        handler.once(lambda sender, e: results.append(e.response.symbol), where=FILTERS["tr_product"]).suppress()
+
+        for e in EVENTS * 2:
+            handler.invoke(None, e)
+
+        self.assertEqual(results, ["005930"])
+        self.assertEqual(len(handler), 0)
+
+    def test_websocket_client(self):
+        self.assertIsInstance(KisWebsocketClient(create_kis(FakeTransport())).event, KisSubscriptionEventHandler)
@@ -0,0 +1,94 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import TestCase, skipIf
+
+from pykis.utils.file_lock import FileLock
+
+
+def _increment(path: str, count: int) -> None:
+    lock = FileLock(f"{path}.lock")
+
+    for _ in range(count):
+        with lock:
+            value = int(Path(path).read_text() or 0)
+            Path(path).write_text(str(value + 1))
+
+
+class FileLockTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "sub" / "test.lock"
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_reuse_descriptor(self):
+        lock = FileLock(self.path)
+
+        with lock:
+            fd = lock._fd
+
+        with lock:
+            # 다시 획득할 때 Lock 파일을 다시 열지 않습니다.
+            self.assertEqual(lock._fd, fd)
+
+        lock.close()
+        self.assertIsNone(lock._fd)
+
+    def test_release_without_acquire(self):
+        with self.assertRaises(RuntimeError):
+            FileLock(self.path).release()
+
+    def test_threads(self):
+        lock = FileLock(self.path)
+        inside = []
+        overlapped = []
+
+        def run():
+            for _ in range(20):
+                with lock:
+                    inside.append(1)
+                    overlapped.append(len(inside) > 1)
+                    time.sleep(0.0005)
+                    inside.pop()
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertFalse(any(overlapped))
+
+    def test_replaced_file(self):
+        lock = FileLock(self.path)
+
+        with lock:
+            pass
+
+        os.remove(self.path)
+
+        with lock:
+            # 삭제된 파일이 아닌 새 Lock 파일을 잠급니다.
+            self.assertEqual(os.fstat(lock._fd).st_ino, os.stat(self.path).st_ino)  # type: ignore
+
+    @skipIf(os.name == "nt", "fork 방식이 필요합니다.")
+    def test_processes(self):
+        path = Path(self.directory.name) / "counter"
+        path.write_text("0")
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=_increment, args=(str(path), 50)) for _ in range(4)]
+
+        for process in processes:
+            process.start()
+
+        for process in processes:
+            process.join()
+
+        self.assertEqual(int(path.read_text()), 200)
@@ -0,0 +1,61 @@
+import threading
+import time
+from unittest import TestCase
+
+from pykis.responses.dynamic import KisDynamic, KisObject, KisType
+from pykis.responses.types import KisAny, KisInt
+
+
+class SlowObject:
+    pass
+
+
+def slow_transform(data):
+    time.sleep(0.05)
+    return SlowObject()
+
+
+class LazyResponse(KisDynamic):
+    __lazy__ = True
+
+    value: SlowObject = KisAny(slow_transform)["value"]
+    number: int = KisInt["number"]
+
+
+class LazyFieldsTests(TestCase):
+    def test_resolve_on_access(self):
+        response = KisObject.transform_({"value": 1, "number": "3"}, LazyResponse)
+
+        self.assertIn("__lazy_fields__", response.__dict__)
+        self.assertNotIn("number", response.__dict__)
+        self.assertEqual(response.number, 3)
+        self.assertEqual(response.__dict__["number"], 3)
+
+    def test_resolve_all(self):
+        response = KisObject.resolve_(KisObject.transform_({"value": 1, "number": "3"}, LazyResponse))
+
+        self.assertIsInstance(response.__dict__["value"], SlowObject)
+        self.assertEqual(response.__dict__["number"], 3)
+
+    def test_concurrent_resolve(self):
+        response = KisObject.transform_({"value": 1, "number": "3"}, LazyResponse)
+        barrier = threading.Barrier(8)
+        results = []
+
+        def access():
+            barrier.wait()
+            results.append(response.value)
+
+        threads = [threading.Thread(target=access) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 8)
+        self.assertFalse(any(isinstance(result, KisType) for result in results))
+        # 모든 스레드가 한 번만 변환된 같은 객체를 받아야 합니다.
+        self.assertEqual(len({id(result) for result in results}), 1)
+        self.assertIs(results[0], response.value)
@@ -0,0 +1,48 @@
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis import KisProjectionError
+from pykis.api.stock.quote import domestic_quote
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis, ok, quote_output
+else:
+    from offline import FakeTransport, create_kis, ok, quote_output
+
+
+class ProjectionTests(TestCase):
+    def setUp(self) -> None:
+        self.transport = FakeTransport({"quotations/inquire-price": ok(quote_output())})
+        self.kis = create_kis(self.transport)
+
+    def test_selected_field(self):
+        quote = domestic_quote(self.kis, "005930", fields={"price"})
+
+        self.assertEqual(quote.price, 71200)
+
+    def test_unselected_field(self):
+        quote = domestic_quote(self.kis, "005930", fields={"price"})
+
+        for field in ("volume", "halt"):
+            with self.assertRaises(KisProjectionError) as context:
+                getattr(quote, field)
+
+            self.assertEqual(context.exception.field, field)
+            self.assertFalse(hasattr(quote, field))
+
+        # prev_price는 선택되지 않은 change 필드로 계산됩니다.
+        with self.assertRaises(KisProjectionError) as context:
+            quote.prev_price
+
+        self.assertEqual(context.exception.field, "change")
+
+    def test_unselected_field_is_attribute_error(self):
+        quote = domestic_quote(self.kis, "005930", fields={"price"})
+
+        self.assertIsNone(getattr(quote, "volume", None))
+
+    def test_without_projection(self):
+        quote = domestic_quote(self.kis, "005930")
+
+        self.assertEqual(quote.volume, 12345678)
+        self.assertFalse(quote.halt)
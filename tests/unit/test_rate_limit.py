@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+from pykis.utils.rate_limit import (
+    AdaptiveRateLimiter,
+    PriorityRateLimiter,
+    RateLimiter,
+    RateLimiterMixin,
+    RateLimiterProtocol,
+    TokenBucketRateLimiter,
+    create_rate_limiter,
+)
+
+
+class RateLimiterTests(TestCase):
+    def test_abstract(self):
+        class Incomplete(RateLimiterMixin):
+            def reserve(self) -> float:
+                return 0
+
+        with self.assertRaises(TypeError):
+            Incomplete()  # type: ignore
+
+    def test_protocol(self):
+        for type in ("token_bucket", "fixed_window", "adaptive"):
+            self.assertIsInstance(create_rate_limiter(type, 10, 1), RateLimiterProtocol)  # type: ignore
+
+    def test_token_bucket_interval(self):
+        limiter = TokenBucketRateLimiter(20, 1)
+        start = time.monotonic()
+
+        for _ in range(5):
+            limiter.acquire()
+
+        # 첫 호출 이후 50ms 간격으로 획득합니다.
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_try_acquire(self):
+        limiter = TokenBucketRateLimiter(1, 1)
+
+        self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+        self.assertFalse(limiter.acquire(blocking=False))
+
+    def test_timeout(self):
+        limiter = TokenBucketRateLimiter(1, 10)
+        limiter.acquire()
+        start = time.monotonic()
+
+        self.assertFalse(limiter.acquire(timeout=0.05, priority=1, lane="order"))
+        self.assertLess(time.monotonic() - start, 0.05)
+        # 획득하지 못한 호출은 호출 유량을 예약하지 않습니다.
+        self.assertAlmostEqual(limiter.time_until_available(), 10, delta=0.1)
+
+    def test_fixed_window(self):
+        limiter = RateLimiter(2, 10)
+
+        self.assertTrue(limiter.try_acquire())
+        self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+        self.assertEqual(limiter.count, 2)
+
+    def test_adaptive(self):
+        limiter = AdaptiveRateLimiter(10, 1)
+        limiter.on_rate_limited()
+
+        self.assertLess(limiter.effective_rate, 10)
+
+    def test_acquire_async(self):
+        limiter = TokenBucketRateLimiter(1, 10)
+
+        async def main():
+            self.assertTrue(await limiter.acquire_async())
+            self.assertFalse(await limiter.acquire_async(timeout=0.01))
+
+        asyncio.run(main())
+
+
+class CountingPriorityRateLimiter(PriorityRateLimiter):
+    __slots__ = ["polls"]
+
+    def __init__(self, limiter, quota=None):
+        super().__init__(limiter, quota)
+        self.polls = 0
+
+    def _poll(self, entry):
+        self.polls += 1
+        return super()._poll(entry)
+
+
+class PriorityRateLimiterTests(TestCase):
+    def test_priority(self):
+        limiter = PriorityRateLimiter(TokenBucketRateLimiter(20, 1))
+        limiter.acquire()
+        order = []
+
+        def run(priority: int):
+            limiter.acquire(priority=priority)
+            order.append(priority)
+
+        threads = [threading.Thread(target=run, args=(priority,)) for priority in (3, 2, 1)]
+
+        for thread in threads:
+            thread.start()
+            time.sleep(0.005)
+
+        for thread in threads:
+            thread.join()
+
+        # 호출 유량이 채워지기 전에 모두 대기하므로 우선순위 순서대로 획득합니다.
+        self.assertEqual(order, [1, 2, 3])
+
+    def test_async_priority(self):
+        limiter = PriorityRateLimiter(TokenBucketRateLimiter(20, 1))
+        order = []
+
+        async def run(priority: int):
+            await limiter.acquire_async(priority=priority)
+            order.append(priority)
+
+        async def main():
+            limiter.acquire()
+            await asyncio.gather(*(run(priority) for priority in (3, 2, 1)))
+
+        asyncio.run(main())
+
+        self.assertEqual(order, [1, 2, 3])
+
+    def test_async_no_polling(self):
+        limiter = CountingPriorityRateLimiter(TokenBucketRateLimiter(10, 1))
+
+        async def main():
+            await asyncio.gather(*(limiter.acquire_async() for _ in range(6)))
+
+        start = time.monotonic()
+        asyncio.run(main())
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.45)
+        # 차례가 아닌 호출은 맨 앞이 바뀔 때만 깨어납니다.
+        self.assertLess(limiter.polls, 40)
+        self.assertEqual(limiter.waiting, 0)
+
+    def test_async_thread_mixed(self):
+        limiter = PriorityRateLimiter(TokenBucketRateLimiter(20, 1))
+        done = []
+
+        def run():
+            limiter.acquire()
+            done.append("thread")
+
+        async def main():
+            limiter.acquire()
+            thread = threading.Thread(target=run)
+            thread.start()
+            await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+            done.append("async")
+            await asyncio.to_thread(thread.join)
+
+        asyncio.run(asyncio.wait_for(main(), 2))
+
+        self.assertEqual(sorted(done), ["async", "thread"])
+
+    def test_async_timeout(self):
+        limiter = PriorityRateLimiter(TokenBucketRateLimiter(1, 10))
+        limiter.acquire()
+
+        async def main():
+            return await limiter.acquire_async(timeout=0.05)
+
+        self.assertFalse(asyncio.run(main()))
+        self.assertEqual(limiter.waiting, 0)
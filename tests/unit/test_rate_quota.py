@@ -0,0 +1,105 @@
+import time
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis.utils.rate_limit import (
+    PriorityRateLimiter,
+    TokenBucketRateLimiter,
+    get_rate_limiter,
+)
+from pykis.utils.rate_quota import RateQuota
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis
+else:
+    from offline import FakeTransport, create_kis
+
+
+def measure(limiter: PriorityRateLimiter, lane: str, duration: float) -> float:
+    start = time.monotonic()
+    count = 0
+
+    while time.monotonic() - start < duration:
+        limiter.acquire(lane=lane)
+        count += 1
+
+    return count / (time.monotonic() - start)
+
+
+class RateQuotaTests(TestCase):
+    def test_reserved(self):
+        quota = RateQuota(10, 1, {"order": 4})
+
+        self.assertEqual(quota.acquire("order"), "reserved")
+        self.assertEqual(quota.acquire("chart"), "shared")
+
+    def test_borrow_partial_bucket(self):
+        quota = RateQuota(2, 1, {"order": 2})
+
+        # 예약 호출 유량 일부를 사용한 레인에서도 남은 호출 유량을 빌립니다.
+        self.assertEqual(quota.acquire("order"), "reserved")
+        self.assertEqual(quota.acquire("chart"), "borrowed")
+        self.assertIsNone(quota.acquire("chart"))
+
+    def test_no_borrow_from_waiting_lane(self):
+        quota = RateQuota(2, 1, {"order": 2})
+
+        self.assertIsNone(quota.acquire("chart", waiting={"order"}))
+        self.assertEqual(quota.acquire("order", waiting={"order"}), "reserved")
+
+    def test_borrow_disabled(self):
+        quota = RateQuota(2, 1, {"order": 2}, borrow=False)
+
+        self.assertIsNone(quota.acquire("chart"))
+
+    def test_unreserved_lane_throughput(self):
+        limiter = PriorityRateLimiter(TokenBucketRateLimiter(10, 1), RateQuota(10, 1, {"order": 4}))
+        # 초기 연속 호출 허용량을 소진한 뒤 측정합니다.
+        measure(limiter, "chart", 1)
+
+        self.assertGreater(measure(limiter, "chart", 2), 9.5)
+        self.assertGreater(limiter.quota.usage["chart"].borrowed, 0)  # type: ignore
+
+    def test_non_blocking_lane(self):
+        limiter = PriorityRateLimiter(TokenBucketRateLimiter(2, 1, burst=2), RateQuota(2, 1, {"order": 1}, borrow=False))
+
+        # 대기하지 않는 호출도 레인의 예약 호출 유량을 사용합니다.
+        self.assertTrue(limiter.acquire(blocking=False, lane="order"))
+        self.assertTrue(limiter.acquire(blocking=False, lane="chart"))
+        self.assertFalse(limiter.acquire(blocking=False, lane="order"))
+        self.assertEqual(limiter.quota.usage["order"].used, 1)  # type: ignore
+
+
+class RateQuotaRegistryTests(TestCase):
+    def test_shared_quota(self):
+        transport = FakeTransport()
+        appkey = "Q" * 36
+        kis = create_kis(transport, appkey=appkey, rate_quotas={"order": 4})
+        same = create_kis(transport, appkey=appkey, rate_quotas={"order": 4})
+        default = create_kis(transport, appkey=appkey)
+
+        self.assertIs(same._rate_limiters["real"], kis._rate_limiters["real"])
+        self.assertIs(default._rate_limiters["real"], kis._rate_limiters["real"])
+        self.assertIsNotNone(kis._rate_limiters["real"].quota)
+
+        with self.assertRaises(ValueError):
+            create_kis(transport, appkey=appkey, rate_quotas={"order": 2})
+
+    def test_invalid_quota(self):
+        for rate_quotas in ({"order": 0}, {"order": -1}, {"bogus": 4}):
+            with self.subTest(rate_quotas=rate_quotas), self.assertRaises(ValueError):
+                create_kis(FakeTransport(), rate_quotas=rate_quotas)
+
+    def test_conflicting_quota(self):
+        limiter = get_rate_limiter("token_bucket", "test_conflicting_quota", 10, 1, quota=RateQuota(10, 1, {"order": 4}))
+
+        self.assertIs(get_rate_limiter("token_bucket", "test_conflicting_quota", 10, 1), limiter)
+        self.assertIs(
+            get_rate_limiter("token_bucket", "test_conflicting_quota", 10, 1, quota=RateQuota(10, 1, {"order": 4})),
+            limiter,
+        )
+
+        with self.assertRaises(ValueError):
+            get_rate_limiter("token_bucket", "test_conflicting_quota", 10, 1, quota=RateQuota(10, 1, {"order": 2}))
+
+        self.assertEqual(limiter.quota, RateQuota(10, 1, {"order": 4}))
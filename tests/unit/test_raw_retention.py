@@ -0,0 +1,95 @@
+import json
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis.api.stock.quote import KisDomesticQuote, domestic_quote
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis, ok, quote_output, token_data
+else:
+    from offline import FakeTransport, create_kis, ok, quote_output, token_data
+
+
+class RawRetentionTests(TestCase):
+    def setUp(self) -> None:
+        self.transport = FakeTransport({"quotations/inquire-price": lambda request: ok(quote_output())})
+
+    def fetch(self, kis, **kwargs):
+        return kis.fetch(
+            "/uapi/domestic-stock/v1/quotations/inquire-price",
+            api="FHKST01010100",
+            params={"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": "005930"},
+            response_type=KisDomesticQuote("005930", "KRX"),
+            domain="real",
+            **kwargs,
+        )
+
+    def test_full(self):
+        quote = domestic_quote(create_kis(self.transport), "005930")
+
+        self.assertIsNotNone(quote.__response__)
+        self.assertEqual(quote.raw()["output"]["stck_prpr"], "71200")
+        self.assertEqual(quote.indicator.raw()["eps"], "2131.00")
+
+    def test_data(self):
+        quote = domestic_quote(create_kis(self.transport, raw_retention="data"), "005930")
+
+        self.assertIsNone(quote.__response__)
+        self.assertNotIn("__response__", quote.__data__)
+        self.assertEqual(quote.raw()["output"]["stck_prpr"], "71200")
+        self.assertEqual(quote.price, Decimal("71200"))
+
+    def test_none(self):
+        quote = domestic_quote(create_kis(self.transport, raw_retention="none"), "005930")
+
+        # 지연 변환 응답 객체도 모든 필드를 미리 변환합니다.
+        self.assertEqual(quote.price, Decimal("71200"))
+        self.assertEqual(quote.indicator.eps, Decimal("2131"))
+        self.assertIsNone(quote.__response__)
+
+        # 하위 응답 객체의 원본 응답 데이터도 보관하지 않습니다.
+        for object in (quote, quote.indicator):
+            with self.assertRaises(ValueError):
+                object.raw()
+
+    def test_per_call(self):
+        kis = create_kis(self.transport, raw_retention="none")
+
+        self.assertEqual(self.fetch(kis, raw_retention="full").raw()["output"]["stck_prpr"], "71200")
+
+        with self.assertRaises(ValueError):
+            self.fetch(kis).raw()
+
+    def test_coalesce_key(self):
+        kis = create_kis(self.transport, coalesce=("quote",))
+        params = dict(
+            path="/uapi/domestic-stock/v1/quotations/inquire-price",
+            method="GET",
+            params={"FID_INPUT_ISCD": "005930"},
+            form=None,
+            headers={"tr_id": "FHKST01010100"},
+            domain="real",
+            response_type=KisDomesticQuote,
+        )
+
+        self.assertIsNotNone(kis._get_coalesce_key(**params))
+        # 보관 방식이 다른 요청은 병합하지 않습니다.
+        self.assertNotEqual(
+            kis._get_coalesce_key(**params, raw_retention="none"),
+            kis._get_coalesce_key(**params),
+        )
+
+    def test_token_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            transport = FakeTransport({"oauth2/tokenP": (200, {}, token_data("issued"))})
+            kis = create_kis(transport, token=None, keep_token=directory, raw_retention="none")
+
+            # 토큰 파일은 원본 응답 데이터로 저장하므로 항상 보관합니다.
+            self.assertEqual(kis.token.raw()["access_token"], "issued")
+
+            files = list(Path(directory).glob("*.json"))
+            self.assertEqual(len(files), 1)
+            self.assertEqual(json.loads(files[0].read_text())["access_token"], "issued")
@@ -0,0 +1,55 @@
+import time
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis.api.stock.quote import domestic_quote
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis, ok, quote_output
+else:
+    from offline import FakeTransport, create_kis, ok, quote_output
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.transport = FakeTransport({"quotations/inquire-price": lambda request: ok(quote_output())})
+
+    def test_cached(self):
+        kis = create_kis(self.transport, response_cache={"domestic_quote": 60})
+        first = domestic_quote(kis, "005930")
+        second = domestic_quote(kis, "005930")
+
+        self.assertIs(first, second)
+        self.assertEqual(self.transport.calls(), 1)
+
+    def test_key(self):
+        kis = create_kis(self.transport, response_cache={"domestic_quote": 60})
+        domestic_quote(kis, "005930")
+        domestic_quote(kis, "000660")
+        # 선택한 필드가 다른 응답은 따로 캐시합니다.
+        domestic_quote(kis, "005930", fields={"price"})
+        domestic_quote(kis, "005930", fields=["price"])
+
+        self.assertEqual(self.transport.calls(), 3)
+
+    def test_expired(self):
+        kis = create_kis(self.transport, response_cache={"domestic_quote": 0.05})
+        domestic_quote(kis, "005930")
+        time.sleep(0.1)
+        domestic_quote(kis, "005930")
+
+        self.assertEqual(self.transport.calls(), 2)
+
+    def test_disabled(self):
+        kis = create_kis(self.transport)
+        domestic_quote(kis, "005930")
+        domestic_quote(kis, "005930")
+
+        self.assertEqual(self.transport.calls(), 2)
+
+    def test_other_api(self):
+        kis = create_kis(self.transport, response_cache={"domestic_orderbook": 60})
+        domestic_quote(kis, "005930")
+        domestic_quote(kis, "005930")
+
+        self.assertEqual(self.transport.calls(), 2)
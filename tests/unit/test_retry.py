@@ -0,0 +1,97 @@
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis import KisHTTPError
+from pykis.api.stock.quote import domestic_quote
+from pykis.utils.rate_limit import AdaptiveRateLimiter
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis, ok, quote_output
+else:
+    from offline import FakeTransport, create_kis, ok, quote_output
+
+
+RATE_LIMITED = (500, {}, {"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."})
+
+
+class AdaptiveRateLimiterTests(TestCase):
+    def test_decrease_once_per_period(self):
+        limiter = AdaptiveRateLimiter(20, 1)
+        limiter.on_rate_limited()
+        limiter.on_rate_limited()
+
+        # 이미 예약된 호출의 초과 응답은 호출 유량을 다시 줄이지 않습니다.
+        self.assertEqual(limiter.effective_rate, 10)
+
+    def test_increase(self):
+        limiter = AdaptiveRateLimiter(4, 1)
+        limiter.on_rate_limited()
+
+        for _ in range(4):
+            limiter.on_success()
+
+        self.assertEqual(limiter.effective_rate, 3)
+
+        for _ in range(8):
+            limiter.on_success()
+
+        self.assertEqual(limiter.effective_rate, 4)
+
+    def test_min_rate(self):
+        limiter = AdaptiveRateLimiter(20, 1, min_rate=15)
+        limiter.on_rate_limited()
+
+        self.assertEqual(limiter.effective_rate, 15)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            AdaptiveRateLimiter(20, 1, decrease=1)
+
+        with self.assertRaises(ValueError):
+            AdaptiveRateLimiter(20, 1, increase=0)
+
+
+class RetryBudgetTests(TestCase):
+    def test_rate_limited_feedback(self):
+        responses = [RATE_LIMITED, ok(quote_output())]
+        transport = FakeTransport({"quotations/inquire-price": lambda request: responses.pop(0)})
+        kis = create_kis(transport, rate_limiter="adaptive")
+
+        with self.assertLogs("pykis", level="WARNING"):
+            quote = domestic_quote(kis, "005930")
+
+        self.assertEqual(quote.price, 71200)
+        self.assertEqual(transport.calls(), 2)
+        self.assertEqual(kis.effective_rates["real"], 10)
+
+    def test_retry_limit(self):
+        transport = FakeTransport({"quotations/inquire-price": RATE_LIMITED})
+        kis = create_kis(transport, retry_limit=2)
+
+        with self.assertLogs("pykis", level="WARNING") as logs, self.assertRaises(KisHTTPError):
+            domestic_quote(kis, "005930")
+
+        # 최초 요청과 2회 재시도 후 마지막 응답으로 예외가 발생합니다.
+        self.assertEqual(transport.calls(), 3)
+        self.assertIn("재시도 횟수(2회)를 초과", logs.output[-1])
+
+    def test_retry_timeout(self):
+        transport = FakeTransport({"quotations/inquire-price": RATE_LIMITED})
+        kis = create_kis(transport, retry_limit=None, retry_timeout=0.25)
+
+        with self.assertLogs("pykis", level="WARNING") as logs, self.assertRaises(KisHTTPError):
+            domestic_quote(kis, "005930")
+
+        self.assertLessEqual(transport.calls(), 4)
+        self.assertIn("재시도 제한 시간", logs.output[-1])
+
+    def test_error_not_retried(self):
+        transport = FakeTransport(
+            {"quotations/inquire-price": (500, {}, {"rt_cd": "1", "msg_cd": "EGW00000", "msg1": "error"})}
+        )
+        kis = create_kis(transport)
+
+        with self.assertRaises(KisHTTPError):
+            domestic_quote(kis, "005930")
+
+        self.assertEqual(transport.calls(), 1)
@@ -0,0 +1,55 @@
+import gc
+import threading
+import weakref
+from unittest import TestCase
+
+from pykis.client.session import KisSession, KisSessionConfig
+
+
+class SessionTests(TestCase):
+    def test_shared(self):
+        session = KisSession(KisSessionConfig(strategy="shared"))
+        sessions = []
+
+        thread = threading.Thread(target=lambda: sessions.append(session.get()))
+        thread.start()
+        thread.join()
+
+        self.assertIs(sessions[0], session.get())
+
+    def test_thread_local(self):
+        session = KisSession(KisSessionConfig(strategy="thread_local"))
+        sessions = []
+
+        thread = threading.Thread(target=lambda: sessions.append(session.get()))
+        thread.start()
+        thread.join()
+
+        self.assertIs(session.get(), session.get())
+        self.assertIsNot(sessions[0], session.get())
+
+    def test_thread_local_released(self):
+        session = KisSession(KisSessionConfig(strategy="thread_local"))
+        references = []
+
+        def run():
+            references.append(weakref.ref(session.get()))
+
+        for _ in range(20):
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+
+        del thread
+        gc.collect()
+
+        # 종료된 스레드의 세션은 남아있지 않아야 합니다.
+        self.assertEqual(len(session._sessions), 0)
+        self.assertTrue(all(reference() is None for reference in references))
+
+    def test_close(self):
+        session = KisSession(KisSessionConfig(strategy="thread_local"))
+        first = session.get()
+        session.close()
+
+        self.assertIsNot(session.get(), first)
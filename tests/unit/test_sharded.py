@@ -0,0 +1,100 @@
+from typing import TYPE_CHECKING
+from unittest import TestCase
+from unittest.mock import patch
+
+from pykis import KisShardedWebsocketClient, KisWebsocketClientBase
+from pykis.client.messaging import KisWebsocketTR
+from pykis.client.websocket import KisWebsocketClient
+from pykis.event.subscription import KisSubscribedEventArgs
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis
+else:
+    from offline import FakeTransport, create_kis
+
+
+def fake_subscribe(self: KisWebsocketClient, id: str, key: str, primary: bool = False):
+    """접속하지 않고 구독한 뒤 서버 응답처럼 구독 추가 이벤트를 발생시킵니다."""
+    tr = KisWebsocketTR(id, key)
+
+    if tr in self._subscriptions:
+        return
+
+    self._subscriptions.add(tr)
+    self.subscribed_event.invoke(self, KisSubscribedEventArgs(tr))
+
+
+def fake_unsubscribe(self: KisWebsocketClient, id: str, key: str, primary: bool = False):
+    """접속하지 않고 구독을 취소한 뒤 서버 응답처럼 구독 해제 이벤트를 발생시킵니다."""
+    tr = KisWebsocketTR(id, key)
+
+    if tr not in self._subscriptions:
+        return
+
+    self._subscriptions.remove(tr)
+    self.unsubscribed_event.invoke(self, KisSubscribedEventArgs(tr))
+
+
+class ShardedWebsocketClientTests(TestCase):
+    def setUp(self) -> None:
+        patcher = patch.multiple(KisWebsocketClient, subscribe=fake_subscribe, unsubscribe=fake_unsubscribe)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.kis = create_kis(FakeTransport())
+        self.client = KisShardedWebsocketClient(self.kis, ["A" * 36, "B" * 36])
+        self.subscribed = []
+        self.unsubscribed = []
+        self.tickets = [
+            self.client.subscribed_event.on(lambda sender, e: self.subscribed.append(e.tr)),
+            self.client.unsubscribed_event.on(lambda sender, e: self.unsubscribed.append(e.tr)),
+        ]
+
+        for ticket in self.tickets:
+            self.addCleanup(ticket.unsubscribe)
+
+    def test_base(self):
+        self.assertIsInstance(self.client, KisWebsocketClientBase)
+        self.assertNotIsInstance(self.client, KisWebsocketClient)
+
+    def test_placement(self):
+        for i in range(7):
+            self.client.subscribe("H0STCNT0", f"{i:06d}")
+
+        self.assertEqual(self.client.loads, (3, 2, 2))
+        self.assertEqual(len(self.client.subscriptions), 7)
+        self.assertTrue(self.client.is_subscribed("H0STCNT0", "000006"))
+        self.assertEqual(len(self.subscribed), 7)
+
+    def test_rebalance_events(self):
+        for i in range(6):
+            self.client.subscribe("H0STCNT0", f"{i:06d}")
+
+        self.subscribed.clear()
+        self.assertEqual(self.client.loads, (2, 2, 2))
+        # 두 번째 세션의 구독을 모두 취소하면 다른 세션의 구독을 옮깁니다.
+        second = [tr for tr, shard in self.client._placements.items() if shard is self.client.shards[1]]
+
+        for tr in second:
+            self.client.unsubscribe(tr.id, tr.key)
+
+        self.assertEqual(max(self.client.loads) - min(self.client.loads), 1)
+        self.assertEqual(len(self.client.subscriptions), 4)
+        # 사용자가 취소한 구독만 전달되고, 세션 간 이동은 전달되지 않습니다.
+        self.assertEqual(self.subscribed, [])
+        self.assertEqual(self.unsubscribed, second)
+        self.assertEqual(self.client._moving, set())
+
+    def test_max_subscriptions(self):
+        with patch("pykis.client.sharded.WEBSOCKET_MAX_SUBSCRIPTIONS", 1):
+            for i in range(3):
+                self.client.subscribe("H0STCNT0", f"{i:06d}")
+
+            with self.assertRaises(ValueError):
+                self.client.subscribe("H0STCNT0", "000003")
+
+    def test_primary(self):
+        self.client.subscribe("H0STCNI0", "soju06", primary=True)
+
+        self.assertEqual(self.client.loads, (1, 0, 0))
+        self.assertEqual(self.client._placements, {})
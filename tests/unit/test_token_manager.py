@@ -0,0 +1,92 @@
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis.utils.timezone import TIMEZONE
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, access_token, create_kis, token_data
+else:
+    from offline import FakeTransport, access_token, create_kis, token_data
+
+
+def refreshed(kis, attr: str, count: int = 1) -> bool:
+    """실전도메인 토큰 갱신 상태의 횟수를 확인합니다."""
+    status = kis.token_refresh_status.get("real")
+    return status is not None and getattr(status, attr) == count
+
+
+def wait_until(predicate, timeout: float = 5) -> bool:
+    """조건이 참이 될 때까지 대기합니다."""
+    end = time.monotonic() + timeout
+
+    while time.monotonic() < end:
+        if predicate():
+            return True
+
+        time.sleep(0.01)
+
+    return False
+
+
+class TokenManagerTests(TestCase):
+    def create(self, transport: FakeTransport, expired_at: datetime):
+        kis = create_kis(transport, token=access_token("old", expired_at), auto_refresh_token=True)
+        self.addCleanup(kis.token_manager.stop, 5)
+        return kis
+
+    def test_refresh_before_expiry(self):
+        transport = FakeTransport({"oauth2/tokenP": (200, {}, token_data("new"))})
+        kis = self.create(transport, datetime.now(TIMEZONE) + timedelta(minutes=30))
+
+        self.assertTrue(kis.token_manager.running)
+        self.assertTrue(wait_until(lambda: refreshed(kis, "refreshes")))
+        self.assertEqual(kis._token.token, "new")
+        self.assertEqual(transport.calls("oauth2/tokenP"), 1)
+
+        status = kis.token_refresh_status["real"]
+        self.assertIsNotNone(status.last_refresh)
+        self.assertIsNone(status.last_error)
+
+    def test_not_expiring(self):
+        transport = FakeTransport()
+        kis = self.create(transport, datetime.now(TIMEZONE) + timedelta(hours=3))
+
+        self.assertTrue(wait_until(lambda: "real" in kis.token_refresh_status))
+        status = kis.token_refresh_status["real"]
+
+        # 만료 1시간 전에 갱신하도록 예약합니다.
+        self.assertAlmostEqual(
+            (status.next_refresh - datetime.now(TIMEZONE)).total_seconds(),
+            timedelta(hours=2).total_seconds(),
+            delta=60,
+        )
+        self.assertEqual(status.refreshes, 0)
+        self.assertEqual(transport.calls(), 0)
+
+    def test_refresh_failure(self):
+        transport = FakeTransport(
+            {"oauth2/tokenP": (403, {}, {"error_code": "EGW00133", "error_description": "잠시 후 다시 시도하세요."})}
+        )
+
+        with self.assertLogs("pykis", level="ERROR") as logs:
+            kis = self.create(transport, datetime.now(TIMEZONE) + timedelta(minutes=30))
+            self.assertTrue(wait_until(lambda: refreshed(kis, "failures")))
+
+        status = kis.token_refresh_status["real"]
+        self.assertIsNotNone(status.last_error)
+        self.assertEqual(kis._token.token, "old")
+        self.assertIn("API 접속 토큰 갱신에 실패했습니다", logs.output[0])
+
+    def test_stop(self):
+        kis = self.create(FakeTransport(), datetime.now(TIMEZONE) + timedelta(hours=3))
+        kis.token_manager.stop(5)
+
+        self.assertFalse(kis.token_manager.running)
+
+    def test_disabled(self):
+        kis = create_kis(FakeTransport())
+
+        self.assertIsNone(kis.token_manager)
+        self.assertEqual(kis.token_refresh_status, {})
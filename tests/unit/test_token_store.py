@@ -0,0 +1,117 @@
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+from pykis.client.token_store import KisTokenStore
+from pykis.utils.timezone import TIMEZONE
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, access_token, create_kis, token_data
+else:
+    from offline import FakeTransport, access_token, create_kis, token_data
+
+
+class TokenStoreTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        self.issued = []
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def issue(self, token: str = "token", expired_at: datetime | None = None):
+        def issue():
+            self.issued.append(token)
+            return access_token(token, expired_at)
+
+        return issue
+
+    def test_reuse(self):
+        KisTokenStore(self.path).issue("token.json", self.issue("first"))
+        # 다른 프로세스의 저장소는 저장된 토큰을 발급 없이 재사용합니다.
+        token = KisTokenStore(self.path).issue("token.json", self.issue("second"), remaining=600)
+
+        self.assertEqual(token.token, "first")
+        self.assertEqual(self.issued, ["first"])
+        self.assertEqual(list(self.path.glob("*.tmp")), [])
+
+    def test_reissue_expiring(self):
+        store = KisTokenStore(self.path)
+        store.issue("token.json", self.issue("first", datetime.now(TIMEZONE) + timedelta(minutes=5)))
+        token = store.issue("token.json", self.issue("second"), remaining=600)
+
+        self.assertEqual(token.token, "second")
+        self.assertEqual(store.load("token.json").token, "second")
+
+    def test_invalidate(self):
+        store = KisTokenStore(self.path)
+        store.issue("token.json", self.issue("first"))
+        store.invalidate("token.json")
+
+        self.assertIsNone(store.load("token.json"))
+        self.assertEqual(store.issue("token.json", self.issue("second")).token, "second")
+
+    def test_poll(self):
+        store = KisTokenStore(self.path, poll_interval=0)
+        store.issue("token.json", self.issue("first"))
+
+        self.assertIsNone(store.poll("token.json"))
+
+        # 파일 수정 시각이 바뀌도록 잠시 대기합니다.
+        time.sleep(0.01)
+        KisTokenStore(self.path).save("token.json", access_token("second"))
+
+        self.assertEqual(store.poll("token.json").token, "second")
+        self.assertIsNone(store.poll("token.json"))
+
+    def test_poll_interval(self):
+        store = KisTokenStore(self.path, poll_interval=60)
+        store.load("token.json")
+        KisTokenStore(self.path).save("token.json", access_token("second"))
+
+        self.assertIsNone(store.poll("token.json"))
+
+    def test_concurrent_issue(self):
+        stores = [KisTokenStore(self.path) for _ in range(4)]
+        results = []
+
+        def issue():
+            time.sleep(0.05)
+            return self.issue("token")()
+
+        threads = [
+            threading.Thread(target=lambda store=store: results.append(store.issue("token.json", issue, remaining=600)))
+            for store in stores
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(self.issued, ["token"])
+
+
+class KeepTokenTests(TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.transport = FakeTransport({"oauth2/tokenP": (200, {}, token_data("issued"))})
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_shared_token(self):
+        appkey = "A" * 36
+        first = create_kis(self.transport, appkey=appkey, token=None, keep_token=self.directory.name)
+        second = create_kis(self.transport, appkey=appkey, token=None, keep_token=self.directory.name)
+
+        self.assertEqual(first.token.token, "issued")
+        self.assertEqual(second.token.token, "issued")
+        self.assertEqual(self.transport.calls("oauth2/tokenP"), 1)
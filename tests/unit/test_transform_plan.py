@@ -0,0 +1,60 @@
+import gc
+import weakref
+from unittest import TestCase
+
+from pykis.responses.dynamic import KisDynamic, KisObject, _plans
+from pykis.responses.types import KisInt, KisString
+
+
+def create_type() -> type:
+    class Response(KisDynamic):
+        name: str = KisString["name"]
+
+    return Response
+
+
+class TransformPlanTests(TestCase):
+    def test_cached(self):
+        type_ = create_type()
+
+        self.assertIs(KisObject.plan(type_), KisObject.plan(type_))
+
+    def test_field_added(self):
+        type_ = create_type()
+        KisObject.transform_({"name": "a", "count": "1"}, type_)
+
+        setattr(type_, "count", KisInt["count"])
+        response = KisObject.transform_({"name": "a", "count": "1"}, type_)
+
+        self.assertEqual(response.count, 1)
+
+    def test_field_replaced(self):
+        type_ = create_type()
+        KisObject.transform_({"name": "a", "title": "b"}, type_)
+
+        setattr(type_, "name", KisString["title"])
+        response = KisObject.transform_({"name": "a", "title": "b"}, type_)
+
+        self.assertEqual(response.name, "b")
+
+    def test_base_field_added(self):
+        base = create_type()
+        derived = type("Derived", (base,), {})
+        KisObject.transform_({"name": "a", "count": "1"}, derived)
+
+        setattr(base, "count", KisInt["count"])
+
+        self.assertEqual(KisObject.transform_({"name": "a", "count": "1"}, derived).count, 1)
+
+    def test_weak_cache(self):
+        type_ = create_type()
+        KisObject.plan(type_)
+        reference = weakref.ref(type_)
+
+        self.assertIn(type_, _plans)
+
+        del type_
+        gc.collect()
+
+        # 캐시가 타입을 참조하지 않아야 합니다.
+        self.assertIsNone(reference())
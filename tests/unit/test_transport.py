@@ -0,0 +1,137 @@
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+
+from pykis.client.exceptions import KisNetworkError
+from pykis.client.session import KisSessionConfig
+from pykis.client.transport import (
+    KisHTTPRequest,
+    RequestsTransport,
+    Urllib3Transport,
+    create_transport,
+)
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """요청 메소드, 경로, 헤더, 본문을 JSON으로 응답하는 로컬 HTTP 서버 처리기"""
+
+    def _respond(self):
+        if self.path.startswith("/slow"):
+            time.sleep(0.5)
+
+        length = int(self.headers.get("Content-Length") or 0)
+        content = json.dumps(
+            {
+                "method": self.command,
+                "path": self.path,
+                "tr_id": self.headers.get("tr_id"),
+                "body": self.rfile.read(length).decode() if length else None,
+            }
+        ).encode()
+
+        self.send_response(404 if self.path.startswith("/missing") else 200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("tr_cont", "M")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+def unused_port() -> int:
+    """사용하지 않는 로컬 포트를 반환합니다."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TransportTests(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        cls.server.daemon_threads = True
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def transports(self):
+        for transport in (RequestsTransport(), Urllib3Transport()):
+            with self.subTest(transport=type(transport).__name__):
+                self.addCleanup(transport.close)
+                yield transport
+
+    def test_get(self):
+        for transport in self.transports():
+            response = transport.send(KisHTTPRequest("GET", f"{self.url}/get?a=1", {"tr_id": "FHKST01010100"}), timeout=5)
+
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.ok)
+            # 응답 헤더는 대소문자를 구분하지 않습니다.
+            self.assertEqual(response.headers["TR_CONT"], "M")
+            self.assertEqual(
+                response.json(),
+                {"method": "GET", "path": "/get?a=1", "tr_id": "FHKST01010100", "body": None},
+            )
+
+    def test_post(self):
+        for transport in self.transports():
+            response = transport.send(
+                KisHTTPRequest("POST", f"{self.url}/post", {"Content-Type": "application/json"}, b'{"PDNO": "005930"}'),
+                timeout=5,
+            )
+
+            self.assertEqual(response.json()["body"], '{"PDNO": "005930"}')
+
+    def test_error_status(self):
+        for transport in self.transports():
+            response = transport.send(KisHTTPRequest("GET", f"{self.url}/missing"), timeout=5)
+
+            self.assertEqual(response.status_code, 404)
+            self.assertFalse(response.ok)
+
+    def test_connection_error(self):
+        url = f"http://127.0.0.1:{unused_port()}/"
+
+        for transport in self.transports():
+            with self.assertRaises(KisNetworkError) as context:
+                transport.send(KisHTTPRequest("GET", url), timeout=1)
+
+            self.assertFalse(context.exception.timed_out)
+
+    def test_read_timeout(self):
+        for transport in self.transports():
+            with self.assertRaises(KisNetworkError) as context:
+                transport.send(KisHTTPRequest("GET", f"{self.url}/slow"), timeout=(1, 0.1))
+
+            self.assertTrue(context.exception.timed_out)
+
+    def test_urllib3_stats(self):
+        transport = Urllib3Transport(KisSessionConfig())
+        self.addCleanup(transport.close)
+
+        for _ in range(3):
+            transport.send(KisHTTPRequest("GET", f"{self.url}/get"), timeout=5)
+
+        self.assertEqual(transport.stats.requests, 3)
+        self.assertEqual(transport.stats.connections, 1)
+        self.assertEqual(transport.stats.reused, 2)
+
+    def test_create_transport(self):
+        self.assertIsInstance(create_transport("requests"), RequestsTransport)
+        self.assertIsInstance(create_transport("urllib3"), Urllib3Transport)
+
+        with self.assertRaises(ValueError):
+            create_transport("httpx")  # type: ignore
@@ -0,0 +1,64 @@
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+if TYPE_CHECKING:
+    from .offline import FakeTransport, create_kis, ok, quote_output
+else:
+    from offline import FakeTransport, create_kis, ok, quote_output
+
+
+def info_output(symbol: str = "005930") -> dict:
+    return {
+        "output": {
+            "shtn_pdno": symbol,
+            "std_pdno": "KR7005930003",
+            "prdt_abrv_name": "삼성전자",
+            "prdt_name120": "삼성전자보통주",
+            "prdt_eng_abrv_name": "SAMSUNG ELECTRONICS",
+            "prdt_eng_name120": "SAMSUNG ELECTRONICS CO., LTD",
+            "prdt_type_cd": "300",
+        }
+    }
+
+
+class WarmupTests(TestCase):
+    def setUp(self) -> None:
+        self.transport = FakeTransport(
+            {
+                "quotations/inquire-price": ok(quote_output()),
+                "quotations/search-info": ok(info_output()),
+            }
+        )
+        self.kis = create_kis(self.transport)
+
+    def test_warmup_symbol(self):
+        result = self.kis.warmup(symbols=["005930"], websocket=False, connections=0)
+
+        self.assertTrue(result.ok, result.errors)
+        self.assertIn("info:005930", result.steps)
+
+        calls = self.transport.calls()
+        stock = self.kis.stock("005930")
+
+        # 사전 준비한 종목은 HTTP 요청 없이 조회되어야 합니다.
+        self.assertEqual(self.transport.calls(), calls)
+        self.assertEqual(stock.symbol, "005930")
+        self.assertEqual(stock.market, "KRX")
+
+    def test_stock_cache(self):
+        self.kis.stock("005930")
+        calls = self.transport.calls()
+
+        self.kis.stock("005930")
+
+        self.assertEqual(self.transport.calls(), calls)
+
+    def test_warmup_errors(self):
+        def refuse(request):
+            raise ConnectionError("refused")
+
+        kis = create_kis(FakeTransport({"quotations/": refuse}), retry_limit=0)
+        result = kis.warmup(symbols=["999999"], websocket=False, connections=0)
+
+        self.assertFalse(result.ok)
+        self.assertIn("info:999999", result.errors)